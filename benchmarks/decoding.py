@@ -0,0 +1,117 @@
+"""
+Decoding benchmark.
+
+Compares building entities from raw payloads with the `json` decoder, against the `msgspec` decoder.
+
+Run with `python -m benchmarks.decoding` from the root of the repository.
+"""
+
+from __future__ import annotations
+
+import timeit
+import typing
+
+import mock
+import orjson
+
+from ongaku.builders import EntityBuilder
+from ongaku.internal.converters import json_loads
+
+if typing.TYPE_CHECKING:
+    from ongaku.session import Session
+
+ITERATIONS: typing.Final[int] = 200
+
+
+def _track_payload(index: int) -> typing.Mapping[str, typing.Any]:
+    return {
+        "encoded": "QAAAjQIAJVJpY2sgQXN0bGV5IC0gTmV2ZXIgR29ubmEgR2l2ZSBZb3UgVXAADlJpY2tBc3RsZXlWRVZPAAAAAAADPCAAC2RRdzR3OVdnWGNRAAEAK2h0dHBzOi8vd3d3LnlvdXR1YmUuY29tL3dhdGNoP3Y9ZFF3NHc5V2dYY1EAB3lvdXR1YmUAAAAAAAAAAA==",
+        "info": {
+            "identifier": f"identifier-{index}",
+            "isSeekable": True,
+            "author": "author",
+            "length": 212000,
+            "isStream": False,
+            "position": 0,
+            "title": f"title {index}",
+            "uri": f"https://www.youtube.com/watch?v={index}",
+            "artworkUrl": f"https://i.ytimg.com/vi/{index}/maxresdefault.jpg",
+            "isrc": None,
+            "sourceName": "youtube",
+        },
+        "pluginInfo": {},
+        "userData": {},
+    }
+
+
+PLAYLIST_PAYLOAD: typing.Final[bytes] = orjson.dumps(
+    {
+        "loadType": "playlist",
+        "data": {
+            "info": {"name": "playlist", "selectedTrack": -1},
+            "pluginInfo": {},
+            "tracks": [_track_payload(index) for index in range(1000)],
+        },
+    }
+)
+
+STATS_PAYLOAD: typing.Final[str] = orjson.dumps(
+    {
+        "op": "stats",
+        "players": 5000,
+        "playingPlayers": 4200,
+        "uptime": 123456789,
+        "memory": {
+            "free": 123456789,
+            "used": 123456789,
+            "allocated": 123456789,
+            "reservable": 123456789,
+        },
+        "cpu": {"cores": 16, "systemLoad": 0.5, "lavalinkLoad": 0.25},
+        "frameStats": {"sent": 6000, "nulled": 10, "deficit": -3010},
+    }
+).decode()
+
+
+def _dict_path(builder: EntityBuilder, session: Session) -> None:
+    # The previous behaviour, loading into a mapping, then walking the mapping.
+    builder.build_load_result(json_loads(PLAYLIST_PAYLOAD))
+
+    for _ in range(100):
+        builder.build_statistics_event(json_loads(STATS_PAYLOAD), session)
+
+
+def _struct_path(builder: EntityBuilder, session: Session) -> None:
+    builder.build_load_result(PLAYLIST_PAYLOAD)
+
+    for _ in range(100):
+        builder.build_statistics_event(STATS_PAYLOAD, session)
+
+
+def main() -> None:
+    session: Session = mock.Mock()
+
+    json_builder = EntityBuilder()
+    msgspec_builder = EntityBuilder(decoder="msgspec")
+
+    results: dict[str, float] = {}
+
+    for name, function, builder in (
+        ("json", _dict_path, json_builder),
+        ("msgspec", _struct_path, msgspec_builder),
+    ):
+        results[name] = min(
+            timeit.repeat(
+                lambda: function(builder, session), number=ITERATIONS, repeat=5
+            )
+        )
+
+        print(
+            f"{name:>8}: {results[name] / ITERATIONS * 1000:.3f}ms per playlist (1000 tracks) + 100 stats payloads"
+        )
+
+    print(f" speedup: {results['json'] / results['msgspec']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
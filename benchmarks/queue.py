@@ -0,0 +1,101 @@
+"""
+Queue benchmark.
+
+Compares positional operations (and summing the lengths of tracks) on a `Queue` of 100k tracks,
+against the plain list the player used before.
+
+Run with `python -m benchmarks.queue` from the root of the repository.
+"""
+
+from __future__ import annotations
+
+import timeit
+import typing
+
+from ongaku.impl.track import Track
+from ongaku.impl.track import TrackInfo
+from ongaku.queue import Queue
+
+if typing.TYPE_CHECKING:
+    from ongaku.abc import track as track_
+
+TRACKS: typing.Final[int] = 100_000
+
+ITERATIONS: typing.Final[int] = 1000
+
+
+def _tracks() -> list[track_.Track]:
+    info = TrackInfo(
+        "identifier",
+        True,
+        "author",
+        212000,
+        False,
+        0,
+        "title",
+        "youtube",
+        "https://www.youtube.com/watch?v=identifier",
+        None,
+        None,
+    )
+
+    return [Track(f"encoded-{index}", info, {}, {}, None) for index in range(TRACKS)]
+
+
+def _operations(
+    queue: typing.MutableSequence[track_.Track],
+) -> typing.Mapping[str, typing.Callable[[], typing.Any]]:
+    track = queue[0]
+
+    def move() -> None:
+        queue.insert(3, queue.pop(742))
+
+    def insert_remove() -> None:
+        queue.insert(10, track)
+        del queue[50_000]
+
+    def page() -> None:
+        queue[40_000:40_010]
+
+    def head() -> None:
+        queue.insert(0, queue.pop(0))
+
+    def duration() -> None:
+        if isinstance(queue, Queue):
+            queue.duration(40_000)
+        else:
+            sum(track.info.length for track in queue[:40_000])
+
+    return {
+        "move 742 to 3": move,
+        "insert + remove": insert_remove,
+        "page at 40000": page,
+        "pop + push head": head,
+        "time until 40000": duration,
+    }
+
+
+def main() -> None:
+    tracks = _tracks()
+
+    list_operations = _operations(list(tracks))
+    queue_operations = _operations(Queue(tracks))
+
+    for name in list_operations:
+        results: dict[str, float] = {}
+
+        for kind, operation in (
+            ("list", list_operations[name]),
+            ("queue", queue_operations[name]),
+        ):
+            results[kind] = min(timeit.repeat(operation, number=ITERATIONS, repeat=5))
+
+        print(
+            f"{name:>16}: list {results['list'] / ITERATIONS * 1_000_000:.2f}us, "
+            f"queue {results['queue'] / ITERATIONS * 1_000_000:.2f}us "
+            f"({results['list'] / results['queue']:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Rest benchmark.
+
+Measures the per-request overhead of `Session.request` against a local stub server, compared with the previous request path.
+
+Run with `python -m benchmarks.rest` from the root of the repository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import typing
+
+import aiohttp
+import mock
+import orjson
+from aiohttp import web
+from aiohttp.test_utils import unused_port
+
+from ongaku.client import Client
+from ongaku.internal.converters import json_loads
+from ongaku.session import Session
+
+REQUESTS: typing.Final[int] = 1000
+
+REPEAT: typing.Final[int] = 5
+
+STATS_PAYLOAD: typing.Final[bytes] = orjson.dumps(
+    {
+        "players": 5000,
+        "playingPlayers": 4200,
+        "uptime": 123456789,
+        "memory": {
+            "free": 123456789,
+            "used": 123456789,
+            "allocated": 123456789,
+            "reservable": 123456789,
+        },
+        "cpu": {"cores": 16, "systemLoad": 0.5, "lavalinkLoad": 0.25},
+        "frameStats": {"sent": 6000, "nulled": 10, "deficit": -3010},
+    }
+)
+
+PLAYER_UPDATE: typing.Final[typing.Mapping[str, typing.Any]] = {
+    "volume": 50,
+    "paused": False,
+    "filters": {"timescale": {"speed": 1.2, "pitch": 1.0, "rate": 1.0}},
+}
+
+
+async def _stats(request: web.Request) -> web.Response:
+    return web.Response(body=STATS_PAYLOAD, content_type="application/json")
+
+
+async def _update(request: web.Request) -> web.Response:
+    await request.read()
+
+    return web.Response(status=204)
+
+
+async def _previous_request(
+    session: Session,
+    method: str,
+    path: str,
+    return_type: typing.Type[typing.Any] | None,
+    *,
+    headers: typing.Mapping[str, typing.Any] = {},
+    json: typing.Mapping[str, typing.Any] = {},
+    params: typing.Mapping[str, typing.Any] = {},
+) -> typing.Any:
+    # The previous behaviour: copied headers and params, stdlib json bodies, and text responses parsed again.
+    new_headers: typing.MutableMapping[str, typing.Any] = dict(headers)
+    new_headers.update(session.auth_headers)
+
+    new_params: typing.MutableMapping[str, typing.Any] = dict(params)
+
+    response = await session._get_client_session().request(
+        method,
+        f"{session.base_uri}/v4{path}",
+        headers=new_headers,
+        json=json,
+        params=new_params,
+    )
+
+    if return_type is None:
+        return None
+
+    return return_type(json_loads(await response.text()))
+
+
+async def _time(
+    name: str, function: typing.Callable[[], typing.Awaitable[typing.Any]]
+) -> float:
+    for _ in range(100):
+        await function()
+
+    timings: list[float] = []
+
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+
+        for _ in range(REQUESTS):
+            await function()
+
+        timings.append(time.perf_counter() - start)
+
+    elapsed = min(timings)
+
+    print(f"{name:>24}: {elapsed / REQUESTS * 1_000_000:.1f}us per request")
+
+    return elapsed
+
+
+async def main() -> None:
+    app = web.Application()
+    app.router.add_route("GET", "/v4/stats", _stats)
+    app.router.add_route("PATCH", "/v4/sessions/session/players/1", _update)
+
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+
+    port = unused_port()
+
+    site = web.TCPSite(runner, "127.0.0.1", port)
+    await site.start()
+
+    client = Client(mock.Mock())
+
+    session = Session(client, "benchmark", False, "127.0.0.1", port, "password", 3)
+
+    path = "/sessions/session/players/1"
+
+    results: dict[str, float] = {}
+
+    results["previous get"] = await _time(
+        "previous get", lambda: _previous_request(session, "GET", "/stats", dict)
+    )
+    results["current get"] = await _time(
+        "current get", lambda: session.request("GET", "/stats", bytes)
+    )
+    results["previous patch"] = await _time(
+        "previous patch",
+        lambda: _previous_request(session, "PATCH", path, None, json=PLAYER_UPDATE),
+    )
+    results["current patch"] = await _time(
+        "current patch",
+        lambda: session.request("PATCH", path, None, json=PLAYER_UPDATE),
+    )
+
+    print(
+        f"{'get speedup':>24}: {results['previous get'] / results['current get']:.2f}x"
+    )
+    print(
+        f"{'patch speedup':>24}: {results['previous patch'] / results['current patch']:.2f}x"
+    )
+
+    client_session: aiohttp.ClientSession = client._get_client_session()
+    await client_session.close()
+
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -11,6 +11,7 @@ SCRIPT_PATHS = [
     EXAMPLES_PATH,
     "noxfile.py",
     os.path.join(".", "tests"),
+    os.path.join(".", "benchmarks"),
 ]
 
 options.sessions = [
@@ -61,6 +62,15 @@ def pytest(session: nox.Session) -> None:
     session.run("pytest", "tests")
 
 
+@nox.session()
+def benchmark(session: nox.Session) -> None:
+    session.install("-U", ".[speedups]")
+    session.install("-Ur", "requirements/tests.txt")
+    session.run("python", "-m", "benchmarks.decoding")
+    session.run("python", "-m", "benchmarks.rest")
+    session.run("python", "-m", "benchmarks.queue")
+
+
 @nox.session()
 def docs(session: nox.Session) -> None:
     session.install("-Ur", "requirements/doc.txt")
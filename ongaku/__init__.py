@@ -19,6 +19,13 @@ from ongaku.abc.routeplanner import RoutePlannerType
 from ongaku.abc.session import SessionStatus
 from ongaku.abc.track import Track
 from ongaku.client import Client
+from ongaku.config import ConnectorConfig
+from ongaku.config import DispatchConfig
+from ongaku.config import IngestConfig
+from ongaku.config import PlayerConfig
+from ongaku.config import ReconnectConfig
+from ongaku.config import RequestConfig
+from ongaku.config import TrackCacheConfig
 from ongaku.errors import BuildError
 from ongaku.errors import ClientAliveError
 from ongaku.errors import ClientError
@@ -28,6 +35,7 @@ from ongaku.errors import PlayerConnectError
 from ongaku.errors import PlayerError
 from ongaku.errors import PlayerMissingError
 from ongaku.errors import PlayerQueueError
+from ongaku.errors import PlayerQueueLimitError
 from ongaku.errors import RestEmptyError
 from ongaku.errors import RestError
 from ongaku.errors import RestExceptionError
@@ -57,6 +65,7 @@ from ongaku.internal.about import __version__
 from ongaku.internal.logger import TRACE_LEVEL
 from ongaku.internal.logger import TRACE_NAME
 from ongaku.player import Player
+from ongaku.queue import Queue
 from ongaku.session import Session
 
 logging.addLevelName(TRACE_LEVEL, TRACE_NAME)
@@ -71,8 +80,18 @@ __all__ = (
     "__version__",
     # .client
     "Client",
+    # .config
+    "ConnectorConfig",
+    "DispatchConfig",
+    "IngestConfig",
+    "PlayerConfig",
+    "ReconnectConfig",
+    "RequestConfig",
+    "TrackCacheConfig",
     # .player
     "Player",
+    # .queue
+    "Queue",
     # .session
     "Session",
     # .enums
@@ -97,6 +116,7 @@ __all__ = (
     "PlayerError",
     "PlayerConnectError",
     "PlayerQueueError",
+    "PlayerQueueLimitError",
     "PlayerMissingError",
     "BuildError",
     "TimeoutError",
@@ -29,6 +29,7 @@ from ongaku.impl import routeplanner
 from ongaku.impl import session
 from ongaku.impl import statistics
 from ongaku.impl import track
+from ongaku.internal import structs
 from ongaku.internal.converters import DumpType
 from ongaku.internal.converters import LoadType
 from ongaku.internal.converters import json_dumps
@@ -48,15 +49,23 @@ class EntityBuilder:
 
     The class that allows for converting payloads (str, sequence, mapping, etc) into their respective classes.
 
+    !!! note
+        When the `msgspec` decoder is used, raw (`str` or `bytes`) payloads are decoded straight into typed structures,
+        instead of being loaded into a mapping first. Payloads that are already a mapping or sequence are built the same way
+        as the `json` decoder.
+
     Parameters
     ----------
     dumps
         The dumping method to use when dumping payloads.
     loads
         The loading method to use when loading payloads.
+    decoder
+        The decoder to use for raw payloads. Either `json` or `msgspec`.
     """
 
     __slots__: typing.Sequence[str] = (
+        "_decoder",
         "_dumps",
         "_loads",
     )
@@ -66,9 +75,40 @@ class EntityBuilder:
         *,
         dumps: DumpType = json_dumps,
         loads: LoadType = json_loads,
+        decoder: typing.Literal["json", "msgspec"] = "json",
     ) -> None:
         self._dumps = dumps
         self._loads = loads
+        self._decoder: typing.Literal["json", "msgspec"] = decoder
+
+    @property
+    def decoder(self) -> typing.Literal["json", "msgspec"]:
+        """The decoder used for raw payloads."""
+        return self._decoder
+
+    def dump_payload(
+        self, payload: typing.Mapping[str, typing.Any] | typing.Sequence[typing.Any]
+    ) -> bytes:
+        """Dump Payload.
+
+        Dumps a payload into json bytes, ready to be sent as a request body.
+
+        Parameters
+        ----------
+        payload
+            The payload you provide.
+
+        Returns
+        -------
+        bytes
+            The dumped payload.
+        """
+        return self._dumps(payload)
+
+    def _use_structs(
+        self, payload: types.PayloadMappingT | types.PayloadSequenceT
+    ) -> typing.TypeGuard[str | bytes]:
+        return self._decoder == "msgspec" and isinstance(payload, str | bytes)
 
     def _ensure_mapping(
         self, payload: types.PayloadMappingT
@@ -92,6 +132,83 @@ class EntityBuilder:
 
         return payload
 
+    def _track_from_struct(self, payload: structs.Track) -> track_.Track:
+        info = payload.info
+
+        return track.Track(
+            payload.encoded,
+            track.TrackInfo(
+                info.identifier,
+                info.is_seekable,
+                info.author,
+                info.length,
+                info.is_stream,
+                info.position,
+                info.title,
+                info.source_name,
+                info.uri,
+                info.artwork_url,
+                info.isrc,
+            ),
+            payload.plugin_info,
+            payload.user_data if payload.user_data else {},
+            None,
+        )
+
+    def _playlist_from_struct(self, payload: structs.Playlist) -> playlist_.Playlist:
+        return playlist.Playlist(
+            playlist.PlaylistInfo(payload.info.name, payload.info.selected_track),
+            [
+                self._track_from_struct(track_payload)
+                for track_payload in payload.tracks
+            ],
+            payload.plugin_info,
+        )
+
+    def _player_state_from_struct(self, payload: structs.State) -> player_.State:
+        return player.State(
+            datetime.datetime.fromtimestamp(payload.time / 1000, datetime.timezone.utc),
+            payload.position,
+            payload.connected,
+            payload.ping,
+        )
+
+    def _player_from_struct(self, payload: structs.Player) -> player_.Player:
+        return player.Player(
+            hikari.Snowflake(int(payload.guild_id)),
+            self._track_from_struct(payload.track) if payload.track else None,
+            payload.volume,
+            payload.paused,
+            self._player_state_from_struct(payload.state),
+            player.Voice(
+                payload.voice.token, payload.voice.endpoint, payload.voice.session_id
+            ),
+            payload.filters,
+        )
+
+    def _statistics_from_struct(self, payload: structs.Stats) -> statistics_.Statistics:
+        return statistics.Statistics(
+            payload.players,
+            payload.playing_players,
+            payload.uptime,
+            statistics.Memory(
+                payload.memory.free,
+                payload.memory.used,
+                payload.memory.allocated,
+                payload.memory.reservable,
+            ),
+            statistics.Cpu(
+                payload.cpu.cores, payload.cpu.system_load, payload.cpu.lavalink_load
+            ),
+            statistics.FrameStatistics(
+                payload.frame_stats.sent,
+                payload.frame_stats.nulled,
+                payload.frame_stats.deficit,
+            )
+            if payload.frame_stats is not None
+            else None,
+        )
+
     # errors
 
     def build_rest_error(self, payload: types.PayloadMappingT) -> RestRequestError:
@@ -167,6 +284,49 @@ class EntityBuilder:
 
     # Events
 
+    def build_websocket_op(
+        self, payload: types.PayloadMappingT
+    ) -> tuple[session_.WebsocketOPCode, session_.WebsocketEvent | None]:
+        """Build Websocket OP.
+
+        Builds the [`WebsocketOPCode`][ongaku.abc.session.WebsocketOPCode], and the [`WebsocketEvent`][ongaku.abc.session.WebsocketEvent] (if it is an event) from a websocket payload.
+
+        Parameters
+        ----------
+        payload
+            The payload you provide.
+
+        Returns
+        -------
+        tuple[session_.WebsocketOPCode, session_.WebsocketEvent | None]
+            The op code, and event type of the payload.
+
+        Raises
+        ------
+        TypeError
+            Raised when the payload could not be turned into a mapping.
+        KeyError
+            Raised when a value was not found in the payload.
+        ValueError
+            Raised when the op code or event type is unknown.
+        """
+        if self._use_structs(payload):
+            header = structs.decode(payload, structs.Header)
+
+            op_code, event_type = header.op, header.type
+
+        else:
+            data = self._ensure_mapping(payload)
+
+            op_code, event_type = data["op"], data.get("type", None)
+
+        if op_code == session_.WebsocketOPCode.EVENT:
+            return session_.WebsocketOPCode(op_code), session_.WebsocketEvent(
+                event_type
+            )
+
+        return session_.WebsocketOPCode(op_code), None
+
     def build_ready_event(
         self, payload: types.PayloadMappingT, session: Session
     ) -> events.ReadyEvent:
@@ -193,10 +353,17 @@ class EntityBuilder:
         KeyError
             Raised when a value was not found in the payload.
         """
-        data = self._ensure_mapping(payload)
-
         _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Ready")
 
+        if self._use_structs(payload):
+            ready = structs.decode(payload, structs.Ready)
+
+            return events.ReadyEvent.from_session(
+                session, ready.resumed, ready.session_id
+            )
+
+        data = self._ensure_mapping(payload)
+
         return events.ReadyEvent.from_session(
             session, data["resumed"], data["sessionId"]
         )
@@ -227,10 +394,19 @@ class EntityBuilder:
         KeyError
             Raised when a value was not found in the payload.
         """
-        data = self._ensure_mapping(payload)
-
         _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into PlayerUpdate")
 
+        if self._use_structs(payload):
+            player_update = structs.decode(payload, structs.PlayerUpdate)
+
+            return events.PlayerUpdateEvent.from_session(
+                session,
+                hikari.Snowflake(int(player_update.guild_id)),
+                self._player_state_from_struct(player_update.state),
+            )
+
+        data = self._ensure_mapping(payload)
+
         return events.PlayerUpdateEvent.from_session(
             session,
             hikari.Snowflake(int(data["guildId"])),
@@ -301,10 +477,19 @@ class EntityBuilder:
         KeyError
             Raised when a value was not found in the payload.
         """
-        data = self._ensure_mapping(payload)
-
         _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into TrackStart")
 
+        if self._use_structs(payload):
+            track_start = structs.decode(payload, structs.TrackStartEvent)
+
+            return events.TrackStartEvent.from_session(
+                session,
+                hikari.Snowflake(int(track_start.guild_id)),
+                self._track_from_struct(track_start.track),
+            )
+
+        data = self._ensure_mapping(payload)
+
         return events.TrackStartEvent.from_session(
             session,
             hikari.Snowflake(int(data["guildId"])),
@@ -337,10 +522,20 @@ class EntityBuilder:
         KeyError
             Raised when a value was not found in the payload.
         """
-        data = self._ensure_mapping(payload)
-
         _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into TrackEnd")
 
+        if self._use_structs(payload):
+            track_end = structs.decode(payload, structs.TrackEndEvent)
+
+            return events.TrackEndEvent.from_session(
+                session,
+                hikari.Snowflake(int(track_end.guild_id)),
+                self._track_from_struct(track_end.track),
+                events_.TrackEndReasonType(track_end.reason),
+            )
+
+        data = self._ensure_mapping(payload)
+
         return events.TrackEndEvent.from_session(
             session,
             hikari.Snowflake(int(data["guildId"])),
@@ -406,10 +601,24 @@ class EntityBuilder:
         KeyError
             Raised when a value was not found in the payload.
         """
-        data = self._ensure_mapping(payload)
-
         _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into TrackException")
 
+        if self._use_structs(payload):
+            track_exception = structs.decode(payload, structs.TrackExceptionEvent)
+
+            return events.TrackExceptionEvent.from_session(
+                session,
+                hikari.Snowflake(int(track_exception.guild_id)),
+                self._track_from_struct(track_exception.track),
+                events.TrackException(
+                    track_exception.exception.message,
+                    errors_.SeverityType(track_exception.exception.severity),
+                    track_exception.exception.cause,
+                ),
+            )
+
+        data = self._ensure_mapping(payload)
+
         return events.TrackExceptionEvent.from_session(
             session,
             hikari.Snowflake(int(data["guildId"])),
@@ -443,10 +652,20 @@ class EntityBuilder:
         KeyError
             Raised when a value was not found in the payload.
         """
-        data = self._ensure_mapping(payload)
-
         _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into TrackStuck")
 
+        if self._use_structs(payload):
+            track_stuck = structs.decode(payload, structs.TrackStuckEvent)
+
+            return events.TrackStuckEvent.from_session(
+                session,
+                hikari.Snowflake(int(track_stuck.guild_id)),
+                self._track_from_struct(track_stuck.track),
+                track_stuck.threshold_ms,
+            )
+
+        data = self._ensure_mapping(payload)
+
         return events.TrackStuckEvent.from_session(
             session,
             hikari.Snowflake(int(data["guildId"])),
@@ -480,10 +699,21 @@ class EntityBuilder:
         KeyError
             Raised when a value was not found in the payload.
         """
-        data = self._ensure_mapping(payload)
-
         _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into WebsocketClosed")
 
+        if self._use_structs(payload):
+            websocket_closed = structs.decode(payload, structs.WebSocketClosedEvent)
+
+            return events.WebsocketClosedEvent.from_session(
+                session,
+                hikari.Snowflake(int(websocket_closed.guild_id)),
+                websocket_closed.code,
+                websocket_closed.reason,
+                websocket_closed.by_remote,
+            )
+
+        data = self._ensure_mapping(payload)
+
         return events.WebsocketClosedEvent.from_session(
             session,
             hikari.Snowflake(int(data["guildId"])),
@@ -671,10 +901,13 @@ class EntityBuilder:
         KeyError
             Raised when a value was not found in the payload.
         """
-        data = self._ensure_mapping(payload)
-
         _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Player")
 
+        if self._use_structs(payload):
+            return self._player_from_struct(structs.decode(payload, structs.Player))
+
+        data = self._ensure_mapping(payload)
+
         return player.Player(
             hikari.Snowflake(int(data["guildId"])),
             self.build_track(data["track"]) if data.get("track", None) else None,
@@ -772,10 +1005,13 @@ class EntityBuilder:
         KeyError
             Raised when a value was not found in the payload.
         """
-        data = self._ensure_mapping(payload)
-
         _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Playlist")
 
+        if self._use_structs(payload):
+            return self._playlist_from_struct(structs.decode(payload, structs.Playlist))
+
+        data = self._ensure_mapping(payload)
+
         tracks: list[track_.Track] = []
 
         for track_payload in data["tracks"]:
@@ -1021,10 +1257,13 @@ class EntityBuilder:
         KeyError
             Raised when a value was not found in the payload.
         """
-        data = self._ensure_mapping(payload)
-
         _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Statistics")
 
+        if self._use_structs(payload):
+            return self._statistics_from_struct(structs.decode(payload, structs.Stats))
+
+        data = self._ensure_mapping(payload)
+
         return statistics.Statistics(
             data["players"],
             data["playingPlayers"],
@@ -1152,10 +1391,13 @@ class EntityBuilder:
         KeyError
             Raised when a value was not found in the payload.
         """
-        data = self._ensure_mapping(payload)
-
         _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Track")
 
+        if self._use_structs(payload):
+            return self._track_from_struct(structs.decode(payload, structs.Track))
+
+        data = self._ensure_mapping(payload)
+
         return track.Track(
             data["encoded"],
             self.build_track_info(data["info"]),
@@ -1204,6 +1446,86 @@ class EntityBuilder:
             data.get("isrc", None),
         )
 
+    # load result
+
+    def build_load_result(  # noqa: C901
+        self, payload: types.PayloadMappingT
+    ) -> track_.Track | typing.Sequence[track_.Track] | playlist_.Playlist | None:
+        """Build Load Result.
+
+        Builds the result of a track load, from a payload.
+
+        Parameters
+        ----------
+        payload
+            The payload you provide.
+
+        Returns
+        -------
+        track_.Track
+            When the load type was a track.
+        typing.Sequence[track_.Track]
+            When the load type was a search.
+        playlist_.Playlist
+            When the load type was a playlist.
+        None
+            When the load type was empty.
+
+        Raises
+        ------
+        RestExceptionError
+            Raised when the load type was an error.
+        TypeError
+            Raised when the payload could not be turned into a mapping.
+        KeyError
+            Raised when a value was not found in the payload.
+        ValueError
+            Raised when the load type is unknown.
+        """
+        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into LoadResult")
+
+        if self._use_structs(payload):
+            result = structs.decode_load_result(payload)
+
+            if isinstance(result, structs.EmptyLoadResult):
+                return
+
+            if isinstance(result, structs.ErrorLoadResult):
+                raise RestExceptionError(
+                    result.data.message,
+                    errors_.SeverityType(result.data.severity),
+                    result.data.cause,
+                )
+
+            if isinstance(result, structs.SearchLoadResult):
+                return [self._track_from_struct(track) for track in result.data]
+
+            if isinstance(result, structs.TrackLoadResult):
+                return self._track_from_struct(result.data)
+
+            return self._playlist_from_struct(result.data)
+
+        data = self._ensure_mapping(payload)
+
+        load_type: str = data["loadType"]
+
+        if load_type == "empty":
+            return
+
+        if load_type == "error":
+            raise self.build_exception_error(data["data"])
+
+        if load_type == "search":
+            return [self.build_track(track) for track in data["data"]]
+
+        if load_type == "track":
+            return self.build_track(data["data"])
+
+        if load_type == "playlist":
+            return self.build_playlist(data["data"])
+
+        raise ValueError(f"An unknown loadType was received: {load_type}")
+
 
 # MIT License
 
@@ -6,6 +6,7 @@ The base client for ongaku.
 
 from __future__ import annotations
 
+import functools
 import typing
 
 import aiohttp
@@ -13,6 +14,9 @@ import hikari
 
 from ongaku import errors
 from ongaku.builders import EntityBuilder
+from ongaku.config import DispatchConfig
+from ongaku.config import PlayerConfig
+from ongaku.config import RequestConfig
 from ongaku.impl.handlers import BasicSessionHandler
 from ongaku.internal.logger import TRACE_LEVEL
 from ongaku.internal.logger import logger
@@ -25,6 +29,10 @@ if typing.TYPE_CHECKING:
     import tanjun
 
     from ongaku.abc.handler import SessionHandler
+    from ongaku.config import ConnectorConfig
+    from ongaku.config import IngestConfig
+    from ongaku.config import ReconnectConfig
+    from ongaku.config import TrackCacheConfig
 
 
 _logger = logger.getChild("client")
@@ -58,11 +66,34 @@ class Client:
     logs
         The log level for ongaku.
     attempts
-        The amount of attempts a session will try to connect to the server.
+        The amount of consecutive failed attempts a session will make to connect to the server. If `None`, sessions will never stop trying to reconnect.
+    reconnect
+        How long sessions wait between connection attempts.
+    decoder
+        The decoder the entity builder uses for raw payloads. `msgspec` decodes payloads straight into typed structures.
+    dispatch
+        Which events are built and dispatched. By default, only events with listeners are dispatched.
+    ingest
+        How sessions queue received frames, before processing them.
+    connector
+        The connection pool shared by every session, that does not have its own.
+    request_config
+        The timeouts, and retry policy used for rest requests.
+    track_cache
+        If provided, the size and lifetimes of the in-memory cache of track load results. By default, results are not cached.
+    player_config
+        How players apply their changes, and send them to lavalink.
     """
 
     __slots__: typing.Sequence[str] = (
         "_attempts",
+        "_reconnect",
+        "_dispatch",
+        "_ingest",
+        "_connector",
+        "_request_config",
+        "_track_cache",
+        "_player_config",
         "_app",
         "_client_session",
         "_rest_client",
@@ -77,11 +108,25 @@ class Client:
         *,
         session_handler: typing.Type[SessionHandler] = BasicSessionHandler,
         logs: str | int = "INFO",
-        attempts: int = 3,
+        attempts: int | None = 3,
+        reconnect: ReconnectConfig | None = None,
+        decoder: typing.Literal["json", "msgspec"] = "json",
+        dispatch: DispatchConfig | None = None,
+        ingest: IngestConfig | None = None,
+        connector: ConnectorConfig | None = None,
+        request_config: RequestConfig | None = None,
+        track_cache: TrackCacheConfig | None = None,
+        player_config: PlayerConfig | None = None,
     ) -> None:
         _logger.setLevel(logs)
 
         self._attempts = attempts
+        self._reconnect = reconnect
+        self._ingest = ingest
+        self._connector = connector
+        self._request_config = request_config if request_config else RequestConfig()
+        self._track_cache = track_cache
+        self._player_config = player_config if player_config else PlayerConfig()
         self._app = app
         self._client_session: aiohttp.ClientSession | None = None
 
@@ -91,7 +136,9 @@ class Client:
 
         self._session_handler = session_handler(self)
 
-        self._entity_builder = EntityBuilder()
+        self._entity_builder = EntityBuilder(decoder=decoder)
+
+        self._dispatch = dispatch if dispatch else DispatchConfig()
 
         app.event_manager.subscribe(hikari.StartedEvent, self._start_event)
         app.event_manager.subscribe(hikari.StoppingEvent, self._stop_event)
@@ -103,7 +150,15 @@ class Client:
         *,
         session_handler: typing.Type[SessionHandler] = BasicSessionHandler,
         logs: str | int = "INFO",
-        attempts: int = 3,
+        attempts: int | None = 3,
+        reconnect: ReconnectConfig | None = None,
+        decoder: typing.Literal["json", "msgspec"] = "json",
+        dispatch: DispatchConfig | None = None,
+        ingest: IngestConfig | None = None,
+        connector: ConnectorConfig | None = None,
+        request_config: RequestConfig | None = None,
+        track_cache: TrackCacheConfig | None = None,
+        player_config: PlayerConfig | None = None,
     ) -> Client:
         """From Arc.
 
@@ -126,10 +181,37 @@ class Client:
         logs
             The log level for ongaku.
         attempts
-            The amount of attempts a session will try to connect to the server.
+            The amount of consecutive failed attempts a session will make to connect to the server. If `None`, sessions will never stop trying to reconnect.
+        reconnect
+            How long sessions wait between connection attempts.
+        decoder
+            The decoder the entity builder uses for raw payloads. `msgspec` decodes payloads straight into typed structures.
+        dispatch
+            Which events are built and dispatched. By default, only events with listeners are dispatched.
+        ingest
+            How sessions queue received frames, before processing them.
+        connector
+            The connection pool shared by every session, that does not have its own.
+        request_config
+            The timeouts, and retry policy used for rest requests.
+        track_cache
+            If provided, the size and lifetimes of the in-memory cache of track load results. By default, results are not cached.
+        player_config
+            How players apply their changes, and send them to lavalink.
         """
         cls = cls(
-            client.app, session_handler=session_handler, logs=logs, attempts=attempts
+            client.app,
+            session_handler=session_handler,
+            logs=logs,
+            attempts=attempts,
+            reconnect=reconnect,
+            decoder=decoder,
+            dispatch=dispatch,
+            ingest=ingest,
+            connector=connector,
+            request_config=request_config,
+            track_cache=track_cache,
+            player_config=player_config,
         )
 
         client.set_type_dependency(Client, cls)
@@ -145,7 +227,15 @@ class Client:
         *,
         session_handler: typing.Type[SessionHandler] = BasicSessionHandler,
         logs: str | int = "INFO",
-        attempts: int = 3,
+        attempts: int | None = 3,
+        reconnect: ReconnectConfig | None = None,
+        decoder: typing.Literal["json", "msgspec"] = "json",
+        dispatch: DispatchConfig | None = None,
+        ingest: IngestConfig | None = None,
+        connector: ConnectorConfig | None = None,
+        request_config: RequestConfig | None = None,
+        track_cache: TrackCacheConfig | None = None,
+        player_config: PlayerConfig | None = None,
     ) -> Client:
         """From Tanjun.
 
@@ -168,14 +258,43 @@ class Client:
         logs
             The log level for ongaku.
         attempts
-            The amount of attempts a session will try to connect to the server.
+            The amount of consecutive failed attempts a session will make to connect to the server. If `None`, sessions will never stop trying to reconnect.
+        reconnect
+            How long sessions wait between connection attempts.
+        decoder
+            The decoder the entity builder uses for raw payloads. `msgspec` decodes payloads straight into typed structures.
+        dispatch
+            Which events are built and dispatched. By default, only events with listeners are dispatched.
+        ingest
+            How sessions queue received frames, before processing them.
+        connector
+            The connection pool shared by every session, that does not have its own.
+        request_config
+            The timeouts, and retry policy used for rest requests.
+        track_cache
+            If provided, the size and lifetimes of the in-memory cache of track load results. By default, results are not cached.
+        player_config
+            How players apply their changes, and send them to lavalink.
         """
         try:
             app = client.get_type_dependency(hikari.GatewayBotAware)
         except KeyError:
             raise Exception("The gateway bot requested was not found.")
 
-        cls = cls(app, session_handler=session_handler, logs=logs, attempts=attempts)
+        cls = cls(
+            app,
+            session_handler=session_handler,
+            logs=logs,
+            attempts=attempts,
+            reconnect=reconnect,
+            decoder=decoder,
+            dispatch=dispatch,
+            ingest=ingest,
+            connector=connector,
+            request_config=request_config,
+            track_cache=track_cache,
+            player_config=player_config,
+        )
 
         client.set_type_dependency(Client, cls)
 
@@ -201,6 +320,26 @@ class Client:
         """
         return self.session_handler.is_alive
 
+    @property
+    def request_config(self) -> RequestConfig:
+        """The timeouts, and retry policy used for rest requests."""
+        return self._request_config
+
+    @property
+    def track_cache(self) -> TrackCacheConfig | None:
+        """The size and lifetimes of the in-memory cache of track load results, if enabled."""
+        return self._track_cache
+
+    @property
+    def player_config(self) -> PlayerConfig:
+        """How players apply their changes, and send them to lavalink."""
+        return self._player_config
+
+    @property
+    def dispatch(self) -> DispatchConfig:
+        """The dispatch config, for which events are built and dispatched."""
+        return self._dispatch
+
     @property
     def entity_builder(self) -> EntityBuilder:
         """The entity builder."""
@@ -219,11 +358,11 @@ class Client:
         return self._session_handler
 
     def _get_client_session(self) -> aiohttp.ClientSession:
-        if not self._client_session:
-            self._client_session = aiohttp.ClientSession()
-
-        if self._client_session.closed:
-            self._client_session = aiohttp.ClientSession()
+        if not self._client_session or self._client_session.closed:
+            if self._connector:
+                self._client_session = self._connector.create_client_session()
+            else:
+                self._client_session = aiohttp.ClientSession()
 
         return self._client_session
 
@@ -239,8 +378,33 @@ class Client:
         if self._client_session:
             await self._client_session.close()
 
+        if self.rest.disk_cache:
+            await self.rest.disk_cache.close()
+
         _logger.log(TRACE_LEVEL, "Successfully shut down ongaku.")
 
+    def _should_dispatch(self, event_type: typing.Type[hikari.Event]) -> bool:
+        if not self._dispatch.allows(event_type):
+            return False
+
+        if not self._dispatch.check_listeners:
+            return True
+
+        event_manager = self.app.event_manager
+
+        # Unlike get_listeners, this also includes anything waiting for the event. hikari has no public way
+        # to check for waiters, so this relies on the event manager of the pinned hikari (2.0.0.dev125 and up).
+        enabled_for_event: typing.Callable[[typing.Type[hikari.Event]], bool] | None = (
+            getattr(event_manager, "_enabled_for_event", None)
+        )
+
+        if enabled_for_event is not None:
+            return bool(enabled_for_event(event_type))
+
+        _warn_listeners_only()
+
+        return len(event_manager.get_listeners(event_type)) > 0
+
     async def _arc_player_injector(
         self, ctx: arc.GatewayContext, inj_ctx: arc.InjectorOverridingContext
     ) -> None:
@@ -267,6 +431,9 @@ class Client:
         host: str = "127.0.0.1",
         port: int = 2333,
         password: str = "youshallnotpass",
+        resume: bool = False,
+        resume_timeout: int = 60,
+        connector: ConnectorConfig | None = None,
     ) -> Session:
         """
         Create Session.
@@ -295,8 +462,12 @@ class Client:
             The port of the lavalink server.
         password
             The password of the lavalink server.
-        attempts
-            The attempts that the session is allowed to use, before completely shutting down.
+        resume
+            Whether to enable resuming, so that players survive a websocket disconnect.
+        resume_timeout
+            The amount of seconds lavalink will keep the session alive for, after a disconnect.
+        connector
+            If set, the session gets its own connection pool, instead of sharing the clients.
 
         Returns
         -------
@@ -315,6 +486,11 @@ class Client:
             port,
             password,
             self._attempts,
+            resume=resume,
+            resume_timeout=resume_timeout,
+            reconnect=self._reconnect,
+            ingest=self._ingest,
+            connector=connector,
         )
 
         return self.session_handler.add_session(new_session)
@@ -429,6 +605,37 @@ class Client:
         """
         return self.session_handler.fetch_player(guild)
 
+    def queue_sizes(self) -> typing.Mapping[hikari.Snowflake, int]:
+        """
+        Queue sizes.
+
+        Get the approximate size (in bytes) of the queue of every player, largest first.
+
+        The size of each queue is kept as tracks are added and removed, so this does not visit any tracks.
+
+        Example
+        -------
+        ```py
+        client = ongaku.Client(...)
+
+        for guild_id, size in client.queue_sizes().items():
+            if size > 50 * 1024 * 1024:
+                await client.delete_player(guild_id)
+        ```
+
+        Returns
+        -------
+        typing.Mapping[hikari.Snowflake, int]
+            The size of the queue of each player, by their guild id.
+        """
+        players = sorted(
+            self.session_handler.players,
+            key=lambda player: player.queue.size,
+            reverse=True,
+        )
+
+        return {player.guild_id: player.queue.size for player in players}
+
     async def delete_player(self, guild: hikari.SnowflakeishOr[hikari.Guild]) -> None:
         """
         Delete a player.
@@ -455,6 +662,13 @@ class Client:
         await self.session_handler.delete_player(guild)
 
 
+@functools.cache
+def _warn_listeners_only() -> None:
+    _logger.warning(
+        "The event manager cannot be checked for waiters, so events are only dispatched when they have listeners."
+    )
+
+
 # MIT License
 
 # Copyright (c) 2023-present MPlatypus
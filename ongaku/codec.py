@@ -0,0 +1,342 @@
+"""
+Codec.
+
+Decode, and encode lavalink tracks locally, without a rest request.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import struct
+import typing
+
+from ongaku import errors
+from ongaku.impl.track import Track
+from ongaku.impl.track import TrackInfo
+
+if typing.TYPE_CHECKING:
+    from ongaku.abc import track as track_
+
+__all__ = ("decode_track", "decode_tracks", "encode_track", "encode_tracks")
+
+VERSION: typing.Final[int] = 3
+"""The newest version of the track format, used when encoding."""
+
+_VERSIONED_FLAG: typing.Final[int] = 1
+"""The message flag, set when the message starts with a version."""
+
+_SIZE_MASK: typing.Final[int] = 0x3FFFFFFF
+"""The bits of the message header that hold the size of the message."""
+
+_HEADER: typing.Final[struct.Struct] = struct.Struct(">I")
+
+_SHORT: typing.Final[struct.Struct] = struct.Struct(">H")
+
+_LONG: typing.Final[struct.Struct] = struct.Struct(">q")
+
+
+class _Reader:
+    __slots__: typing.Sequence[str] = ("_data", "_offset")
+
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self._offset = 0
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    def read(self, size: int) -> bytes:
+        end = self._offset + size
+
+        if end > len(self._data):
+            raise ValueError("The track ended unexpectedly.")
+
+        data = self._data[self._offset : end]
+        self._offset = end
+
+        return data
+
+    def read_byte(self) -> int:
+        return self.read(1)[0]
+
+    def read_bool(self) -> bool:
+        return self.read_byte() != 0
+
+    def read_long(self) -> int:
+        return _LONG.unpack(self.read(_LONG.size))[0]
+
+    def read_text(self) -> str:
+        (size,) = _SHORT.unpack(self.read(_SHORT.size))
+
+        return _decode_text(self.read(size))
+
+    def read_nullable_text(self) -> str | None:
+        if not self.read_bool():
+            return None
+
+        return self.read_text()
+
+
+def _decode_text(data: bytes) -> str:
+    # Java writes text as modified UTF-8: null as two bytes, and characters outside the BMP as surrogate pairs.
+    if data.isascii():
+        return data.decode("ascii")
+
+    text = data.replace(b"\xc0\x80", b"\x00").decode("utf-8", "surrogatepass")
+
+    if b"\xed" in data:
+        text = text.encode("utf-16-be", "surrogatepass").decode("utf-16-be")
+
+    return text
+
+
+def _encode_text(text: str) -> bytes:
+    if text.isascii() and "\x00" not in text:
+        data = text.encode("ascii")
+    else:
+        units = text.encode("utf-16-be", "surrogatepass")
+        data = (
+            "".join(chr(unit) for (unit,) in struct.iter_unpack(">H", units))
+            .encode("utf-8", "surrogatepass")
+            .replace(b"\x00", b"\xc0\x80")
+        )
+
+    if len(data) > 0xFFFF:
+        raise ValueError("The text is too long to be encoded.")
+
+    return _SHORT.pack(len(data)) + data
+
+
+def _encode_nullable_text(text: str | None) -> bytes:
+    if text is None:
+        return b"\x00"
+
+    return b"\x01" + _encode_text(text)
+
+
+def _decode_info(encoded: str) -> TrackInfo:
+    try:
+        data = base64.b64decode(encoded, validate=True)
+    except binascii.Error as e:
+        raise errors.BuildError(e, "The track is not valid base64.")
+
+    try:
+        reader = _Reader(data)
+
+        (header,) = _HEADER.unpack(reader.read(_HEADER.size))
+
+        size = header & _SIZE_MASK
+        end = reader.offset + size
+
+        if end > len(data):
+            raise ValueError("The track is shorter than its header.")
+
+        version = reader.read_byte() if header >> 30 & _VERSIONED_FLAG else 1
+
+        if version > VERSION:
+            raise ValueError(f"Unknown track version: {version}")
+
+        title = reader.read_text()
+        author = reader.read_text()
+        length = reader.read_long()
+        identifier = reader.read_text()
+        is_stream = reader.read_bool()
+        uri = reader.read_nullable_text() if version >= 2 else None
+        artwork_url = reader.read_nullable_text() if version >= 3 else None
+        isrc = reader.read_nullable_text() if version >= 3 else None
+        source_name = reader.read_text()
+
+        # Any source specific data sits between the source name, and the position.
+        if end - _LONG.size < reader.offset:
+            raise ValueError("The track ended unexpectedly.")
+
+        (position,) = _LONG.unpack_from(data, end - _LONG.size)
+    except (ValueError, struct.error) as e:
+        raise errors.BuildError(e, "The track could not be decoded.")
+
+    return TrackInfo(
+        identifier,
+        not is_stream,
+        author,
+        length,
+        is_stream,
+        position,
+        title,
+        source_name,
+        uri,
+        artwork_url,
+        isrc,
+    )
+
+
+def decode_track(encoded: str) -> Track:
+    """
+    Decode track.
+
+    Decode a track from its encoded state, without a rest request.
+
+    !!! note
+        The encoded state does not hold any plugin info, so the track has none.
+        Whether the track is seekable is not stored either, so it is assumed that every track,
+        that is not a stream, is seekable.
+
+    Example
+    -------
+    ```py
+    from ongaku import codec
+
+    track = codec.decode_track(encoded)
+
+    await player.play(track)
+    ```
+
+    Parameters
+    ----------
+    encoded
+        The encoded track.
+
+    Raises
+    ------
+    BuildError
+        Raised when the track could not be decoded.
+
+    Returns
+    -------
+    Track
+        The decoded track.
+    """
+    return Track(encoded, _decode_info(encoded), {}, {}, None)
+
+
+def decode_tracks(encoded: typing.Sequence[str]) -> typing.Sequence[Track]:
+    """
+    Decode tracks.
+
+    Decode multiple tracks from their encoded state, without a rest request.
+
+    Each distinct track is only decoded once, however every returned track is its own object,
+    so it can be modified (for example, by setting its requestor) on its own.
+
+    Parameters
+    ----------
+    encoded
+        The encoded tracks.
+
+    Raises
+    ------
+    BuildError
+        Raised when a track could not be decoded.
+
+    Returns
+    -------
+    typing.Sequence[Track]
+        The decoded tracks, in the same order.
+    """
+    infos: dict[str, TrackInfo] = {}
+
+    tracks: list[Track] = []
+
+    for value in encoded:
+        info = infos.get(value)
+
+        if info is None:
+            info = infos[value] = _decode_info(value)
+
+        tracks.append(Track(value, info, {}, {}, None))
+
+    return tracks
+
+
+def encode_track(info: track_.TrackInfo) -> str:
+    """
+    Encode track.
+
+    Encode track information, into the encoded state lavalink uses.
+
+    !!! warning
+        Some sources (such as `http`) store extra data in the encoded state, that is not part of the track information.
+        Tracks from those sources must be loaded again, instead of encoded.
+
+    Parameters
+    ----------
+    info
+        The track information.
+
+    Raises
+    ------
+    ValueError
+        Raised when a field is too long to be encoded.
+
+    Returns
+    -------
+    str
+        The encoded track.
+    """
+    body = b"".join(
+        (
+            bytes((VERSION,)),
+            _encode_text(info.title),
+            _encode_text(info.author),
+            _LONG.pack(info.length),
+            _encode_text(info.identifier),
+            b"\x01" if info.is_stream else b"\x00",
+            _encode_nullable_text(info.uri),
+            _encode_nullable_text(info.artwork_url),
+            _encode_nullable_text(info.isrc),
+            _encode_text(info.source_name),
+            _LONG.pack(info.position),
+        )
+    )
+
+    header = _HEADER.pack(_VERSIONED_FLAG << 30 | len(body))
+
+    return base64.b64encode(header + body).decode("ascii")
+
+
+def encode_tracks(infos: typing.Sequence[track_.TrackInfo]) -> typing.Sequence[str]:
+    """
+    Encode tracks.
+
+    Encode multiple track informations, into the encoded state lavalink uses.
+
+    Parameters
+    ----------
+    infos
+        The track informations.
+
+    Raises
+    ------
+    ValueError
+        Raised when a field is too long to be encoded.
+
+    Returns
+    -------
+    typing.Sequence[str]
+        The encoded tracks, in the same order.
+    """
+    return [encode_track(info) for info in infos]
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -0,0 +1,890 @@
+"""
+Config.
+
+Configuration objects, for tuning how ongaku behaves.
+"""
+
+from __future__ import annotations
+
+import random
+import typing
+
+import aiohttp
+
+if typing.TYPE_CHECKING:
+    import os
+
+    import hikari
+
+__all__ = (
+    "ConnectorConfig",
+    "DispatchConfig",
+    "IngestConfig",
+    "PlayerConfig",
+    "ReconnectConfig",
+    "RequestConfig",
+    "TrackCacheConfig",
+)
+
+
+class ReconnectConfig:
+    """
+    Reconnect config.
+
+    How a session waits between websocket connection attempts.
+
+    The delay grows exponentially with each consecutive failure, and is capped at `max_delay`.
+    With jitter enabled, a random delay between zero and that value is used instead, so many
+    bots reconnecting to the same lavalink server do not all reconnect at the same moment.
+
+    Example
+    -------
+    ```py
+    client = ongaku.Client(
+        bot,
+        attempts=None,
+        reconnect=ongaku.ReconnectConfig(base_delay=1, max_delay=30),
+    )
+    ```
+
+    Parameters
+    ----------
+    base_delay
+        The delay (in seconds) used for the first reconnect.
+    max_delay
+        The maximum delay (in seconds) between reconnects.
+    multiplier
+        The amount the delay is multiplied by, after each consecutive failure.
+    jitter
+        Whether to randomise the delay between zero and the computed delay.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_base_delay",
+        "_jitter",
+        "_max_delay",
+        "_multiplier",
+    )
+
+    def __init__(
+        self,
+        *,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+    ) -> None:
+        if base_delay < 0 or max_delay < 0:
+            raise ValueError("Reconnect delays must not be negative.")
+
+        if multiplier < 1:
+            raise ValueError("The reconnect multiplier must be at least 1.")
+
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._multiplier = multiplier
+        self._jitter = jitter
+
+    @property
+    def base_delay(self) -> float:
+        """The delay (in seconds) used for the first reconnect."""
+        return self._base_delay
+
+    @property
+    def max_delay(self) -> float:
+        """The maximum delay (in seconds) between reconnects."""
+        return self._max_delay
+
+    @property
+    def multiplier(self) -> float:
+        """The amount the delay is multiplied by, after each consecutive failure."""
+        return self._multiplier
+
+    @property
+    def jitter(self) -> bool:
+        """Whether the delay is randomised between zero and the computed delay."""
+        return self._jitter
+
+    def compute_delay(self, failures: int) -> float:
+        """
+        Compute delay.
+
+        Compute the delay before the next connection attempt.
+
+        Parameters
+        ----------
+        failures
+            The amount of consecutive failed attempts so far. (Starting at 1)
+
+        Returns
+        -------
+        float
+            The delay in seconds.
+        """
+        if failures < 1:
+            return 0.0
+
+        try:
+            delay = self.base_delay * (self.multiplier ** (failures - 1))
+        except OverflowError:
+            delay = self.max_delay
+
+        delay = min(self.max_delay, delay)
+
+        if self.jitter:
+            return random.uniform(0, delay)
+
+        return delay
+
+
+class DispatchConfig:
+    """
+    Dispatch config.
+
+    Which events ongaku should build and dispatch.
+
+    By default, an event is only built and dispatched if something is listening (or waiting) for it.
+    Internal state, such as the session id, and the players state, is always updated.
+
+    Example
+    -------
+    ```py
+    client = ongaku.Client(
+        bot,
+        dispatch=ongaku.DispatchConfig(exclude=[ongaku.StatisticsEvent]),
+    )
+    ```
+
+    Parameters
+    ----------
+    include
+        If set, only these events (and their subclasses) will be dispatched.
+    exclude
+        The events (and their subclasses) that will never be dispatched.
+    check_listeners
+        Whether to skip events that have no listeners, or waiters.
+        Waiters are found through hikari's event manager. If a custom event manager cannot be checked for them,
+        only listeners are checked, and a warning is logged.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_check_listeners",
+        "_exclude",
+        "_include",
+    )
+
+    def __init__(
+        self,
+        *,
+        include: typing.Sequence[typing.Type[hikari.Event]] | None = None,
+        exclude: typing.Sequence[typing.Type[hikari.Event]] = (),
+        check_listeners: bool = True,
+    ) -> None:
+        self._include = tuple(include) if include is not None else None
+        self._exclude = tuple(exclude)
+        self._check_listeners = check_listeners
+
+    @property
+    def include(self) -> typing.Sequence[typing.Type[hikari.Event]] | None:
+        """The only events that will be dispatched. `None` if all events are allowed."""
+        return self._include
+
+    @property
+    def exclude(self) -> typing.Sequence[typing.Type[hikari.Event]]:
+        """The events that will never be dispatched."""
+        return self._exclude
+
+    @property
+    def check_listeners(self) -> bool:
+        """Whether events that have no listeners, or waiters are skipped."""
+        return self._check_listeners
+
+    def allows(self, event_type: typing.Type[hikari.Event]) -> bool:
+        """
+        Allows.
+
+        Whether the include and exclude lists allow this event to be dispatched.
+
+        !!! note
+            This does not check for listeners.
+
+        Parameters
+        ----------
+        event_type
+            The type of event.
+
+        Returns
+        -------
+        bool
+            Whether the event can be dispatched.
+        """
+        if self._exclude and issubclass(event_type, self._exclude):
+            return False
+
+        if self._include is not None:
+            return issubclass(event_type, self._include)
+
+        return True
+
+
+class IngestConfig:
+    """
+    Ingest config.
+
+    How websocket frames are queued, between being received and being processed.
+
+    A session reads frames from the websocket into a bounded queue, and decodes and dispatches
+    them separately, so that a slow listener does not stop the websocket from being read.
+
+    Overflow policies:
+
+    - `block`: Every frame is processed. When the queue is full, reading waits until there is space.
+    - `drop_stale`: A player update (for the same guild) or statistics frame still waiting in the
+        queue is dropped, when a newer one arrives. All other frames, such as track end events, are never dropped.
+
+    Example
+    -------
+    ```py
+    client = ongaku.Client(
+        bot,
+        ingest=ongaku.IngestConfig(max_size=500, overflow="block"),
+    )
+    ```
+
+    Parameters
+    ----------
+    max_size
+        The maximum amount of frames waiting to be processed.
+    overflow
+        The policy used for frames that have been superseded, before they were processed.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_max_size",
+        "_overflow",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 1000,
+        overflow: typing.Literal["block", "drop_stale"] = "drop_stale",
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("The ingest queue size must be at least 1.")
+
+        if overflow not in ("block", "drop_stale"):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+
+        self._max_size = max_size
+        self._overflow: typing.Literal["block", "drop_stale"] = overflow
+
+    @property
+    def max_size(self) -> int:
+        """The maximum amount of frames waiting to be processed."""
+        return self._max_size
+
+    @property
+    def overflow(self) -> typing.Literal["block", "drop_stale"]:
+        """The policy used for frames that have been superseded, before they were processed."""
+        return self._overflow
+
+
+class ConnectorConfig:
+    """
+    Connector config.
+
+    The connection pool used for http requests, and the websocket connection.
+
+    !!! note
+        `TCP_NODELAY` is always enabled by aiohttp, so it is not configurable here.
+
+    Example
+    -------
+    ```py
+    client.create_session(
+        "session",
+        host="127.0.0.1",
+        connector=ongaku.ConnectorConfig(limit_per_host=10, keepalive_timeout=30),
+    )
+    ```
+
+    Parameters
+    ----------
+    limit
+        The maximum amount of simultaneous connections. `0` means no limit.
+    limit_per_host
+        The maximum amount of simultaneous connections to the same host. `0` means no limit.
+    keepalive_timeout
+        The amount of seconds an idle connection is kept open for, to be reused.
+    use_dns_cache
+        Whether to cache dns lookups.
+    ttl_dns_cache
+        The amount of seconds dns lookups are cached for. If `None`, they are cached forever.
+    force_close
+        Whether to close connections after every request, instead of reusing them.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_force_close",
+        "_keepalive_timeout",
+        "_limit",
+        "_limit_per_host",
+        "_ttl_dns_cache",
+        "_use_dns_cache",
+    )
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        use_dns_cache: bool = True,
+        ttl_dns_cache: int | None = 10,
+        force_close: bool = False,
+    ) -> None:
+        if limit < 0 or limit_per_host < 0:
+            raise ValueError("Connection limits must not be negative.")
+
+        if keepalive_timeout < 0:
+            raise ValueError("The keepalive timeout must not be negative.")
+
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._use_dns_cache = use_dns_cache
+        self._ttl_dns_cache = ttl_dns_cache
+        self._force_close = force_close
+
+    @property
+    def limit(self) -> int:
+        """The maximum amount of simultaneous connections. `0` means no limit."""
+        return self._limit
+
+    @property
+    def limit_per_host(self) -> int:
+        """The maximum amount of simultaneous connections to the same host. `0` means no limit."""
+        return self._limit_per_host
+
+    @property
+    def keepalive_timeout(self) -> float:
+        """The amount of seconds an idle connection is kept open for, to be reused."""
+        return self._keepalive_timeout
+
+    @property
+    def use_dns_cache(self) -> bool:
+        """Whether dns lookups are cached."""
+        return self._use_dns_cache
+
+    @property
+    def ttl_dns_cache(self) -> int | None:
+        """The amount of seconds dns lookups are cached for. `None` if they are cached forever."""
+        return self._ttl_dns_cache
+
+    @property
+    def force_close(self) -> bool:
+        """Whether connections are closed after every request, instead of being reused."""
+        return self._force_close
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        """
+        Create connector.
+
+        Create a new connector from this config.
+
+        !!! note
+            This must be called while an event loop is running.
+
+        Returns
+        -------
+        aiohttp.TCPConnector
+            The new connector.
+        """
+        if self.force_close:
+            # aiohttp does not allow a keepalive timeout, when connections are never kept alive.
+            return aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                use_dns_cache=self.use_dns_cache,
+                ttl_dns_cache=self.ttl_dns_cache,
+                force_close=True,
+            )
+
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=self.use_dns_cache,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+
+    def create_client_session(self) -> aiohttp.ClientSession:
+        """
+        Create client session.
+
+        Create a new client session, which owns a new connector from this config.
+
+        Returns
+        -------
+        aiohttp.ClientSession
+            The new client session.
+        """
+        return aiohttp.ClientSession(connector=self.create_connector())
+
+
+class PlayerConfig:
+    """
+    Player config.
+
+    How players apply their changes, and send them to lavalink.
+
+    With `optimistic` enabled, a change (such as the volume, or pausing) is applied to the player straight away,
+    before lavalink has responded. Changes that would not change anything (such as pausing a paused player)
+    are not sent at all. The player is reconciled with the response from lavalink, and its position with every
+    player update event. If the update fails, the change is rolled back, and the error is raised.
+
+    With `mailbox` enabled, operations on a player (such as skipping, or autoplaying the next track) are run one at a time,
+    in the order they were called. Operations that are waiting together are merged into a single update,
+    so five skips called at once send one update, to the final track.
+
+    Each player keeps a history of the tracks it has played (or skipped while playing), so
+    [previous][ongaku.player.Player.previous] can play them again without loading them. The history is bounded by
+    both `history` and `history_bytes`, dropping the oldest tracks first.
+
+    The queue of each player can be limited, by its amount of tracks and their approximate size, both in total
+    and for each requestor. [add][ongaku.player.Player.add] raises a
+    [PlayerQueueLimitError][ongaku.errors.PlayerQueueLimitError] instead of going over a limit.
+
+    Example
+    -------
+    ```py
+    client = ongaku.Client(
+        bot, player_config=ongaku.PlayerConfig(optimistic=True, mailbox=True)
+    )
+    ```
+
+    Parameters
+    ----------
+    optimistic
+        Whether changes are applied straight away, and changes that would not change anything are skipped.
+    mailbox
+        Whether operations on a player are run one at a time, with waiting operations merged into a single update.
+    history
+        The maximum amount of played tracks each player keeps. If `0`, no history is kept.
+    history_bytes
+        The maximum approximate size (in bytes) of the played tracks each player keeps.
+    max_tracks
+        If provided, the maximum amount of tracks in the queue of each player.
+    max_bytes
+        If provided, the maximum approximate size (in bytes) of the tracks in the queue of each player.
+    max_requestor_tracks
+        If provided, the maximum amount of tracks each requestor can have in the queue of a player.
+    max_requestor_bytes
+        If provided, the maximum approximate size (in bytes) of the tracks each requestor can have in the queue of a player.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_history",
+        "_history_bytes",
+        "_mailbox",
+        "_max_bytes",
+        "_max_requestor_bytes",
+        "_max_requestor_tracks",
+        "_max_tracks",
+        "_optimistic",
+    )
+
+    def __init__(
+        self,
+        *,
+        optimistic: bool = False,
+        mailbox: bool = False,
+        history: int = 25,
+        history_bytes: int = 256 * 1024,
+        max_tracks: int | None = None,
+        max_bytes: int | None = None,
+        max_requestor_tracks: int | None = None,
+        max_requestor_bytes: int | None = None,
+    ) -> None:
+        if min(history, history_bytes) < 0:
+            raise ValueError("Player history limits must not be negative.")
+
+        limits = (max_tracks, max_bytes, max_requestor_tracks, max_requestor_bytes)
+
+        if any(limit is not None and limit < 1 for limit in limits):
+            raise ValueError("Player queue limits must be at least 1.")
+
+        self._optimistic = optimistic
+        self._mailbox = mailbox
+        self._history = history
+        self._history_bytes = history_bytes
+        self._max_tracks = max_tracks
+        self._max_bytes = max_bytes
+        self._max_requestor_tracks = max_requestor_tracks
+        self._max_requestor_bytes = max_requestor_bytes
+
+    @property
+    def optimistic(self) -> bool:
+        """Whether changes are applied straight away, and changes that would not change anything are skipped."""
+        return self._optimistic
+
+    @property
+    def mailbox(self) -> bool:
+        """Whether operations on a player are run one at a time, with waiting operations merged into a single update."""
+        return self._mailbox
+
+    @property
+    def history(self) -> int:
+        """The maximum amount of played tracks each player keeps."""
+        return self._history
+
+    @property
+    def history_bytes(self) -> int:
+        """The maximum approximate size (in bytes) of the played tracks each player keeps."""
+        return self._history_bytes
+
+    @property
+    def max_tracks(self) -> int | None:
+        """The maximum amount of tracks in the queue of each player."""
+        return self._max_tracks
+
+    @property
+    def max_bytes(self) -> int | None:
+        """The maximum approximate size (in bytes) of the tracks in the queue of each player."""
+        return self._max_bytes
+
+    @property
+    def max_requestor_tracks(self) -> int | None:
+        """The maximum amount of tracks each requestor can have in the queue of a player."""
+        return self._max_requestor_tracks
+
+    @property
+    def max_requestor_bytes(self) -> int | None:
+        """The maximum approximate size (in bytes) of the tracks each requestor can have in the queue of a player."""
+        return self._max_requestor_bytes
+
+
+class RequestConfig:
+    """
+    Request config.
+
+    The timeouts, and retry policy used for rest requests.
+
+    Requests are split into two classes:
+
+    - Idempotent requests (such as loading, or decoding tracks, and fetching info or statistics) are retried
+        after a timeout, a connection error, or one of the `retry_statuses`.
+    - All other requests (such as updating, or deleting a player) are only retried when the connection could not be made,
+        so the request never reached lavalink, and is safe to repeat.
+
+    Example
+    -------
+    ```py
+    client = ongaku.Client(
+        bot,
+        request_config=ongaku.RequestConfig(total_timeout=10, retries=2),
+    )
+
+    # A longer timeout, for a single slow search.
+    await client.rest.load_track(
+        "ytsearch:ajr",
+        request_config=ongaku.RequestConfig(total_timeout=60),
+    )
+    ```
+
+    Parameters
+    ----------
+    total_timeout
+        The amount of seconds a whole request (including reading the response) may take. If `None`, there is no limit.
+    connect_timeout
+        The amount of seconds making a connection may take. If `None`, there is no limit.
+    retries
+        The amount of times an idempotent request is retried.
+    unsafe_retries
+        The amount of times any other request is retried, when the connection could not be made, or timed out.
+        Those requests never reached lavalink, so they are safe to send again.
+    retry_statuses
+        The response statuses that an idempotent request is retried after.
+    backoff
+        How long to wait between retries.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_backoff",
+        "_connect_timeout",
+        "_retries",
+        "_retry_statuses",
+        "_timeout",
+        "_total_timeout",
+        "_unsafe_retries",
+    )
+
+    def __init__(
+        self,
+        *,
+        total_timeout: float | None = 30.0,
+        connect_timeout: float | None = 10.0,
+        retries: int = 2,
+        unsafe_retries: int = 1,
+        retry_statuses: typing.Sequence[int] = (502, 503, 504),
+        backoff: ReconnectConfig | None = None,
+    ) -> None:
+        if (total_timeout is not None and total_timeout <= 0) or (
+            connect_timeout is not None and connect_timeout <= 0
+        ):
+            raise ValueError("Request timeouts must be greater than 0.")
+
+        if retries < 0 or unsafe_retries < 0:
+            raise ValueError("Request retries must not be negative.")
+
+        self._total_timeout = total_timeout
+        self._connect_timeout = connect_timeout
+        self._retries = retries
+        self._unsafe_retries = unsafe_retries
+        self._retry_statuses = tuple(retry_statuses)
+        self._backoff = (
+            backoff if backoff else ReconnectConfig(base_delay=0.5, max_delay=5.0)
+        )
+        self._timeout = aiohttp.ClientTimeout(
+            total=total_timeout, connect=connect_timeout
+        )
+
+    @property
+    def total_timeout(self) -> float | None:
+        """The amount of seconds a whole request may take. `None` if there is no limit."""
+        return self._total_timeout
+
+    @property
+    def connect_timeout(self) -> float | None:
+        """The amount of seconds making a connection may take. `None` if there is no limit."""
+        return self._connect_timeout
+
+    @property
+    def retries(self) -> int:
+        """The amount of times an idempotent request is retried."""
+        return self._retries
+
+    @property
+    def unsafe_retries(self) -> int:
+        """The amount of times any other request is retried, when the connection could not be made, or timed out."""
+        return self._unsafe_retries
+
+    @property
+    def retry_statuses(self) -> typing.Sequence[int]:
+        """The response statuses that an idempotent request is retried after."""
+        return self._retry_statuses
+
+    @property
+    def backoff(self) -> ReconnectConfig:
+        """How long to wait between retries."""
+        return self._backoff
+
+    @property
+    def timeout(self) -> aiohttp.ClientTimeout:
+        """The aiohttp timeout, for a single request attempt."""
+        return self._timeout
+
+
+class TrackCacheConfig:
+    """
+    Track cache config.
+
+    The size, and lifetimes of the in-memory cache in front of [load_track][ongaku.rest.RESTClient.load_track].
+
+    Results are cached by their normalized query, and its source prefix (such as `ytsearch`),
+    so `ytsearch:AJR` and `ytsearch: ajr` share an entry. Links are only stripped of surrounding whitespace,
+    as their case is significant.
+
+    Each load type keeps its results for its own time to live. `empty` results are only kept briefly,
+    and `error` results are never cached. A time to live of `0` disables caching for that load type.
+
+    If a `path` is provided, results (and tracks decoded by [decode_tracks][ongaku.rest.RESTClient.decode_tracks])
+    are also kept in an SQLite database, behind the in-memory cache. The database survives restarts, and can be
+    shared by several processes (such as shards) on the same host. It is only opened once it is first needed,
+    and results found in it are copied into the in-memory cache.
+
+    Example
+    -------
+    ```py
+    client = ongaku.Client(
+        bot,
+        track_cache=ongaku.TrackCacheConfig(
+            max_entries=500, search_ttl=120, path="tracks.db"
+        ),
+    )
+    ```
+
+    Parameters
+    ----------
+    max_entries
+        The maximum amount of results kept, before the least recently used are evicted.
+    max_bytes
+        The maximum approximate size (in bytes) of the kept results, before the least recently used are evicted.
+    track_ttl
+        The amount of seconds a `track` result is kept.
+    playlist_ttl
+        The amount of seconds a `playlist` result is kept.
+    search_ttl
+        The amount of seconds a `search` result is kept.
+    empty_ttl
+        The amount of seconds an `empty` result is kept.
+    path
+        If provided, the path of the SQLite database to keep results in, as well as in memory.
+    max_disk_results
+        The maximum amount of results kept in the database, before the least recently used are evicted.
+    max_disk_tracks
+        The maximum amount of tracks kept in the database, before the least recently used are evicted.
+    disk_timeout
+        The amount of seconds to wait for another process to release the database, before giving up.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_disk_timeout",
+        "_empty_ttl",
+        "_max_bytes",
+        "_max_disk_results",
+        "_max_disk_tracks",
+        "_max_entries",
+        "_path",
+        "_playlist_ttl",
+        "_search_ttl",
+        "_track_ttl",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        track_ttl: float = 3600.0,
+        playlist_ttl: float = 900.0,
+        search_ttl: float = 300.0,
+        empty_ttl: float = 30.0,
+        path: str | os.PathLike[str] | None = None,
+        max_disk_results: int = 20_000,
+        max_disk_tracks: int = 100_000,
+        disk_timeout: float = 5.0,
+    ) -> None:
+        if min(max_entries, max_bytes, max_disk_results, max_disk_tracks) < 1:
+            raise ValueError("The track cache limits must be at least 1.")
+
+        if min(track_ttl, playlist_ttl, search_ttl, empty_ttl) < 0:
+            raise ValueError("Track cache lifetimes must not be negative.")
+
+        if disk_timeout < 0:
+            raise ValueError("The disk timeout must not be negative.")
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._track_ttl = track_ttl
+        self._playlist_ttl = playlist_ttl
+        self._search_ttl = search_ttl
+        self._empty_ttl = empty_ttl
+        self._path = path
+        self._max_disk_results = max_disk_results
+        self._max_disk_tracks = max_disk_tracks
+        self._disk_timeout = disk_timeout
+
+    @property
+    def max_entries(self) -> int:
+        """The maximum amount of results kept."""
+        return self._max_entries
+
+    @property
+    def max_bytes(self) -> int:
+        """The maximum approximate size (in bytes) of the kept results."""
+        return self._max_bytes
+
+    @property
+    def track_ttl(self) -> float:
+        """The amount of seconds a `track` result is kept."""
+        return self._track_ttl
+
+    @property
+    def playlist_ttl(self) -> float:
+        """The amount of seconds a `playlist` result is kept."""
+        return self._playlist_ttl
+
+    @property
+    def search_ttl(self) -> float:
+        """The amount of seconds a `search` result is kept."""
+        return self._search_ttl
+
+    @property
+    def empty_ttl(self) -> float:
+        """The amount of seconds an `empty` result is kept."""
+        return self._empty_ttl
+
+    @property
+    def path(self) -> str | os.PathLike[str] | None:
+        """The path of the SQLite database results are kept in, if enabled."""
+        return self._path
+
+    @property
+    def max_disk_results(self) -> int:
+        """The maximum amount of results kept in the database."""
+        return self._max_disk_results
+
+    @property
+    def max_disk_tracks(self) -> int:
+        """The maximum amount of tracks kept in the database."""
+        return self._max_disk_tracks
+
+    @property
+    def disk_timeout(self) -> float:
+        """The amount of seconds to wait for another process to release the database."""
+        return self._disk_timeout
+
+    def ttl(self, load_type: str) -> float:
+        """
+        TTL.
+
+        Get the time to live of a load type.
+
+        Parameters
+        ----------
+        load_type
+            The load type of the result.
+
+        Returns
+        -------
+        float
+            The amount of seconds the result is kept. `0` if it should not be cached.
+        """
+        if load_type == "track":
+            return self.track_ttl
+
+        if load_type == "playlist":
+            return self.playlist_ttl
+
+        if load_type == "search":
+            return self.search_ttl
+
+        if load_type == "empty":
+            return self.empty_ttl
+
+        return 0.0
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
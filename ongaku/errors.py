@@ -31,6 +31,7 @@ __all__ = (
     "PlayerError",
     "PlayerConnectError",
     "PlayerQueueError",
+    "PlayerQueueLimitError",
     "PlayerMissingError",
     "BuildError",
     "TimeoutError",
@@ -245,6 +246,10 @@ class PlayerQueueError(PlayerError):
         return self._reason
 
 
+class PlayerQueueLimitError(PlayerQueueError):
+    """Raised when adding tracks would go over a limit of the players queue."""
+
+
 class PlayerMissingError(PlayerError):
     """Raised when the player could not be found."""
 
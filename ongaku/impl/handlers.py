@@ -74,6 +74,9 @@ class BasicSessionHandler(handler_.SessionHandler):
         for session in self.sessions:
             await session.stop()
 
+        for player in self._players.values():
+            player._detach()
+
         self._players.clear()
 
         self._is_alive = False
@@ -141,6 +144,8 @@ class BasicSessionHandler(handler_.SessionHandler):
         except KeyError:
             raise errors.PlayerMissingError
 
+        player._detach()
+
         await player.disconnect()
 
 
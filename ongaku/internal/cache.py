@@ -0,0 +1,1014 @@
+"""
+Cache.
+
+The in-memory, and on-disk caches of track load results.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import re
+import sqlite3
+import threading
+import time
+import typing
+
+import msgspec
+
+from ongaku.internal import structs
+from ongaku.internal.logger import logger
+
+if typing.TYPE_CHECKING:
+    from ongaku.config import TrackCacheConfig
+
+_logger = logger.getChild("cache")
+
+__all__ = (
+    "CacheEntry",
+    "DiskTrackCache",
+    "TrackCache",
+    "cache_key",
+    "load_type",
+    "result_type",
+)
+
+CacheKeyT = tuple[str, str]
+"""The key of a cached load result. (source prefix, normalized query)"""
+
+_PREFIX_PATTERN: typing.Final[re.Pattern[str]] = re.compile(r"^([A-Za-z0-9]+):(?!//)")
+
+_WHITESPACE_PATTERN: typing.Final[re.Pattern[str]] = re.compile(r"\s+")
+
+_SCHEMA_VERSION: typing.Final[int] = 1
+
+_SCHEMA: typing.Final[str] = """
+CREATE TABLE IF NOT EXISTS tracks (
+    encoded TEXT PRIMARY KEY,
+    identifier TEXT NOT NULL,
+    is_seekable INTEGER NOT NULL,
+    author TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    is_stream INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    source_name TEXT NOT NULL,
+    uri TEXT,
+    artwork_url TEXT,
+    isrc TEXT,
+    plugin_info BLOB NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tracks_accessed ON tracks (accessed);
+CREATE TABLE IF NOT EXISTS results (
+    prefix TEXT NOT NULL,
+    query TEXT NOT NULL,
+    load_type TEXT NOT NULL,
+    tracks BLOB NOT NULL,
+    playlist BLOB,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (prefix, query)
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+_ReturnT = typing.TypeVar("_ReturnT")
+
+_MAX_VARIABLES: typing.Final[int] = 500
+"""The maximum amount of variables used in a single statement."""
+
+_ACCESS_BATCH: typing.Final[int] = 256
+"""The maximum amount of access times kept in memory, before they are written to the database."""
+
+_ACCESS_INTERVAL: typing.Final[float] = 30.0
+"""The maximum amount of seconds access times are kept in memory, before they are written to the database."""
+
+_COUNT_INTERVAL: typing.Final[float] = 60.0
+"""The amount of seconds between counting the rows of the database, and removing expired results."""
+
+
+class _PlaylistRow(structs.Struct):
+    info: structs.PlaylistInfo
+    plugin_info: dict[str, typing.Any]
+
+
+def cache_key(query: str) -> CacheKeyT:
+    """
+    Cache key.
+
+    Get the key a query is cached under.
+
+    Queries with a search prefix (such as `ytsearch:`) have their whitespace collapsed, and are case folded,
+    as searches are not case sensitive. Every other query (links, and identifiers) is only stripped,
+    as its case is significant.
+
+    Parameters
+    ----------
+    query
+        The query for the search/link.
+    """
+    query = query.strip()
+
+    match = _PREFIX_PATTERN.match(query)
+
+    if match is None:
+        return ("", query)
+
+    prefix = match.group(1).lower()
+    rest = query[match.end() :].strip()
+
+    if prefix.endswith("search"):
+        rest = _WHITESPACE_PATTERN.sub(" ", rest).casefold()
+
+    return (prefix, rest)
+
+
+def load_type(payload: bytes) -> str | None:
+    """
+    Load type.
+
+    Get the load type of a raw load result, or `None` if it could not be found.
+
+    Parameters
+    ----------
+    payload
+        The raw load result.
+    """
+    try:
+        return structs.decode(payload, structs.LoadResultHeader).load_type
+    except msgspec.DecodeError:
+        return None
+
+
+def result_type(result: structs.LoadResult) -> str:
+    """
+    Result type.
+
+    Get the load type of a decoded load result.
+
+    Parameters
+    ----------
+    result
+        The decoded load result.
+    """
+    return str(type(result).__struct_config__.tag)
+
+
+class CacheEntry:
+    """
+    Cache entry.
+
+    A raw load result, and when it expires.
+    """
+
+    __slots__: typing.Sequence[str] = ("_expires", "_load_type", "_payload")
+
+    def __init__(self, payload: bytes, load_type: str, expires: float) -> None:
+        self._payload = payload
+        self._load_type = load_type
+        self._expires = expires
+
+    @property
+    def payload(self) -> bytes:
+        """The raw load result."""
+        return self._payload
+
+    @property
+    def load_type(self) -> str:
+        """The load type of the result."""
+        return self._load_type
+
+    @property
+    def expires(self) -> float:
+        """The monotonic time the entry expires at."""
+        return self._expires
+
+
+class TrackCache:
+    """
+    Track cache.
+
+    A least recently used cache of raw load results, bounded by its amount of entries and their approximate size.
+
+    Raw payloads are cached, rather than the built tracks, so every hit builds new tracks that can be
+    modified (for example, by setting their requestor) without changing the cached result.
+
+    Parameters
+    ----------
+    config
+        The config for the size, and lifetimes of the cache.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_config",
+        "_entries",
+        "_evictions",
+        "_expirations",
+        "_hits",
+        "_misses",
+        "_size",
+    )
+
+    def __init__(self, config: TrackCacheConfig) -> None:
+        self._config = config
+        self._entries: collections.OrderedDict[CacheKeyT, CacheEntry] = (
+            collections.OrderedDict()
+        )
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def config(self) -> TrackCacheConfig:
+        """The config for the size, and lifetimes of the cache."""
+        return self._config
+
+    @property
+    def entries(self) -> int:
+        """The amount of results currently cached."""
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """The approximate size (in bytes) of the results currently cached."""
+        return self._size
+
+    @property
+    def hits(self) -> int:
+        """The total amount of lookups that found a result."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The total amount of lookups that did not find a result."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """The total amount of results removed to stay within the cache limits."""
+        return self._evictions
+
+    @property
+    def expirations(self) -> int:
+        """The total amount of results removed after their time to live."""
+        return self._expirations
+
+    def get(self, query: str) -> bytes | None:
+        """
+        Get.
+
+        Get the cached load result of a query.
+
+        Parameters
+        ----------
+        query
+            The query for the search/link.
+
+        Returns
+        -------
+        bytes
+            The raw load result.
+        None
+            The query is not cached, or its result has expired.
+        """
+        key = cache_key(query)
+
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if entry.expires <= time.monotonic():
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+
+        return entry.payload
+
+    def put(self, query: str, payload: bytes, *, expires: float | None = None) -> bool:
+        """
+        Put.
+
+        Cache the load result of a query, evicting the least recently used results if the cache is full.
+
+        Parameters
+        ----------
+        query
+            The query for the search/link.
+        payload
+            The raw load result.
+        expires
+            The monotonic time the result expires at, if it should expire before its time to live.
+            Such as a result from the [disk cache][ongaku.internal.cache.DiskTrackCache], which keeps the time it had left.
+
+        Returns
+        -------
+        bool
+            Whether the result was cached. Errors, results with a time to live of `0`, results that have already expired,
+            and results larger than the whole cache are not.
+        """
+        result_type = load_type(payload)
+
+        if result_type is None:
+            return False
+
+        ttl = self.config.ttl(result_type)
+
+        if ttl <= 0 or len(payload) > self.config.max_bytes:
+            return False
+
+        now = time.monotonic()
+
+        expires = now + ttl if expires is None else min(expires, now + ttl)
+
+        if expires <= now:
+            return False
+
+        key = cache_key(query)
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = CacheEntry(payload, result_type, expires)
+        self._size += len(payload)
+
+        while (
+            len(self._entries) > self.config.max_entries
+            or self._size > self.config.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+        return True
+
+    def remove(self, query: str) -> bool:
+        """
+        Remove.
+
+        Remove the cached load result of a query.
+
+        Parameters
+        ----------
+        query
+            The query for the search/link.
+
+        Returns
+        -------
+        bool
+            Whether the query was cached.
+        """
+        key = cache_key(query)
+
+        if key not in self._entries:
+            return False
+
+        self._remove(key)
+
+        return True
+
+    def clear(self) -> None:
+        """
+        Clear.
+
+        Remove every cached result.
+        """
+        self._entries.clear()
+        self._size = 0
+
+    def _remove(self, key: CacheKeyT) -> None:
+        entry = self._entries.pop(key)
+        self._size -= len(entry.payload)
+
+
+class DiskTrackCache:
+    """
+    Disk track cache.
+
+    An SQLite cache of load results, and decoded tracks, that survives restarts and is shared between processes.
+
+    Tracks are stored once, by their encoded value, with their information in separate columns.
+    Load results only store the encoded values of their tracks, so a track found by several queries is only kept once.
+
+    The database is opened in write-ahead logging mode, so several processes can read while another writes.
+    Every method runs in a worker thread, so the event loop is never blocked by the database.
+    Database errors are logged, and treated as a cache miss, so a broken cache never breaks a request.
+
+    Lookups do not write to the database. The times results and tracks were last used are kept in memory, and written
+    in batches, before anything is evicted, and when the cache is closed. The rows are counted as they are added and
+    removed, instead of on every write, and only counted again (to see the writes of other processes) every minute,
+    along with removing expired results.
+
+    Parameters
+    ----------
+    config
+        The config for the path, size, and lifetimes of the cache.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_accessed",
+        "_accessed_tracks",
+        "_config",
+        "_connection",
+        "_counted",
+        "_evictions",
+        "_flushed",
+        "_hits",
+        "_lock",
+        "_misses",
+        "_rows",
+    )
+
+    def __init__(self, config: TrackCacheConfig) -> None:
+        if config.path is None:
+            raise ValueError("A path is required for a disk track cache.")
+
+        self._config = config
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # The times results and tracks were last used, that have not been written yet.
+        self._accessed: dict[CacheKeyT, float] = {}
+        self._accessed_tracks: dict[str, float] = {}
+        self._flushed = 0.0
+        # The amount of rows in each table, as of the last count, plus the rows added and removed since.
+        self._rows: dict[str, int] = {}
+        self._counted = 0.0
+
+    @property
+    def config(self) -> TrackCacheConfig:
+        """The config for the path, size, and lifetimes of the cache."""
+        return self._config
+
+    @property
+    def hits(self) -> int:
+        """The total amount of lookups (results, or tracks) that were found."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The total amount of lookups (results, or tracks) that were not found."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """The total amount of results, and tracks removed by this process, to stay within the cache limits."""
+        return self._evictions
+
+    async def get(self, query: str) -> bytes | None:
+        """
+        Get.
+
+        Get the cached load result of a query.
+
+        Parameters
+        ----------
+        query
+            The query for the search/link.
+
+        Returns
+        -------
+        bytes
+            The raw load result.
+        None
+            The query is not cached, its result has expired, or one of its tracks has been evicted.
+        """
+        entry = await self.get_entry(query)
+
+        return None if entry is None else entry.payload
+
+    async def get_entry(self, query: str) -> CacheEntry | None:
+        """
+        Get entry.
+
+        Get the cached load result of a query, with when it expires.
+
+        Parameters
+        ----------
+        query
+            The query for the search/link.
+
+        Returns
+        -------
+        CacheEntry
+            The raw load result, and the monotonic time it expires at.
+        None
+            The query is not cached, its result has expired, or one of its tracks has been evicted.
+        """
+        return await asyncio.to_thread(self._run, None, self._get, cache_key(query))
+
+    async def put(self, query: str, payload: bytes) -> bool:
+        """
+        Put.
+
+        Cache the load result of a query, evicting the least recently used results and tracks if the cache is full.
+
+        Parameters
+        ----------
+        query
+            The query for the search/link.
+        payload
+            The raw load result.
+
+        Returns
+        -------
+        bool
+            Whether the result was cached. Errors, and results with a time to live of `0` are not.
+        """
+        try:
+            result = structs.decode_load_result(payload)
+        except msgspec.DecodeError:
+            return False
+
+        if isinstance(result, structs.ErrorLoadResult):
+            return False
+
+        ttl = self.config.ttl(result_type(result))
+
+        if ttl <= 0:
+            return False
+
+        return await asyncio.to_thread(
+            self._run, False, self._put, cache_key(query), result, ttl
+        )
+
+    async def remove(self, query: str) -> None:
+        """
+        Remove.
+
+        Remove the cached load result of a query. Its tracks are kept, as other results may share them.
+
+        Parameters
+        ----------
+        query
+            The query for the search/link.
+        """
+        await asyncio.to_thread(self._run, None, self._remove, cache_key(query))
+
+    async def get_tracks(
+        self, encoded: typing.Sequence[str]
+    ) -> typing.Mapping[str, bytes]:
+        """
+        Get tracks.
+
+        Get the cached tracks, of encoded tracks.
+
+        Parameters
+        ----------
+        encoded
+            The encoded tracks.
+
+        Returns
+        -------
+        typing.Mapping[str, bytes]
+            The raw tracks that were found, by their encoded value.
+        """
+        if not encoded:
+            return {}
+
+        return await asyncio.to_thread(self._run, {}, self._get_tracks, encoded)
+
+    async def put_tracks(self, payloads: typing.Sequence[typing.Any]) -> None:
+        """
+        Put tracks.
+
+        Cache decoded tracks, evicting the least recently used results and tracks if the cache is full.
+
+        Parameters
+        ----------
+        payloads
+            The decoded track payloads. Either raw, or already loaded from json.
+        """
+        try:
+            tracks = [
+                structs.decode(payload, structs.Track)
+                if isinstance(payload, str | bytes)
+                else msgspec.convert(payload, structs.Track)
+                for payload in payloads
+            ]
+        except (msgspec.DecodeError, msgspec.ValidationError) as e:
+            _logger.warning(f"Could not cache decoded tracks: {e}")
+            return
+
+        if not tracks:
+            return
+
+        await asyncio.to_thread(self._run, None, self._put_tracks, tracks)
+
+    async def close(self) -> None:
+        """
+        Close.
+
+        Close the database. It will be opened again, if the cache is used afterwards.
+        """
+        await asyncio.to_thread(self._run, None, self._close)
+
+    def _run(
+        self,
+        default: _ReturnT,
+        function: typing.Callable[..., _ReturnT],
+        *args: typing.Any,
+    ) -> _ReturnT:
+        with self._lock:
+            try:
+                return function(*args)
+            except sqlite3.Error as e:
+                _logger.warning(f"Track cache database error: {e}")
+                return default
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+
+        path = self.config.path
+
+        assert path is not None
+
+        connection = sqlite3.connect(
+            path,
+            timeout=self.config.disk_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+
+            if _schema_version(connection) != _SCHEMA_VERSION:
+                self._migrate(connection)
+
+            connection.executescript(_SCHEMA)
+        except BaseException:
+            connection.close()
+            raise
+
+        self._connection = connection
+        self._flushed = time.time()
+
+        return connection
+
+    def _migrate(self, connection: sqlite3.Connection) -> None:
+        with _transaction(connection):
+            # Another process may have migrated the database, while this one waited for the lock.
+            if _schema_version(connection) != _SCHEMA_VERSION:
+                connection.execute("DROP TABLE IF EXISTS tracks")
+                connection.execute("DROP TABLE IF EXISTS results")
+                connection.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+
+    def _close(self) -> None:
+        connection = self._connection
+
+        if connection is None:
+            return
+
+        try:
+            if self._accessed or self._accessed_tracks:
+                with _transaction(connection):
+                    self._flush(connection, time.time())
+        finally:
+            connection.close()
+            self._connection = None
+            # Other processes may write to the database while it is closed, so the rows are counted again.
+            self._rows.clear()
+
+    def _get(self, key: CacheKeyT) -> CacheEntry | None:
+        connection = self._connect()
+
+        now = time.time()
+
+        row = connection.execute(
+            "SELECT load_type, tracks, playlist, expires FROM results WHERE prefix = ? AND query = ?",
+            key,
+        ).fetchone()
+
+        if row is None:
+            self._misses += 1
+            return None
+
+        result_load_type, encoded_tracks, playlist, expires = row
+
+        if expires <= now:
+            self._remove(key)
+            self._misses += 1
+            return None
+
+        encoded: list[str] = msgspec.json.decode(encoded_tracks)
+
+        tracks = self._select_tracks(connection, encoded)
+
+        if len(tracks) != len(set(encoded)):
+            self._misses += 1
+            return None
+
+        self._access(connection, key, encoded, now)
+
+        self._hits += 1
+
+        ordered = [tracks[value] for value in encoded]
+
+        result: structs.LoadResult
+
+        if result_load_type == "track":
+            result = structs.TrackLoadResult(ordered[0])
+        elif result_load_type == "search":
+            result = structs.SearchLoadResult(ordered)
+        elif result_load_type == "playlist":
+            playlist_row = msgspec.json.decode(playlist, type=_PlaylistRow)
+            result = structs.PlaylistLoadResult(
+                structs.Playlist(playlist_row.info, playlist_row.plugin_info, ordered)
+            )
+        else:
+            result = structs.EmptyLoadResult()
+
+        # The expiry is stored as a wall clock time, so it can be shared, but entries expire on the monotonic clock.
+        return CacheEntry(
+            msgspec.json.encode(result),
+            result_load_type,
+            time.monotonic() + expires - now,
+        )
+
+    def _put(self, key: CacheKeyT, result: structs.LoadResult, ttl: float) -> bool:
+        connection = self._connect()
+
+        now = time.time()
+
+        tracks: list[structs.Track] = []
+        playlist: bytes | None = None
+
+        if isinstance(result, structs.TrackLoadResult):
+            tracks.append(result.data)
+        elif isinstance(result, structs.SearchLoadResult):
+            tracks.extend(result.data)
+        elif isinstance(result, structs.PlaylistLoadResult):
+            tracks.extend(result.data.tracks)
+            playlist = msgspec.json.encode(
+                _PlaylistRow(result.data.info, result.data.plugin_info)
+            )
+
+        with _transaction(connection):
+            self._flush(connection, now)
+            self._insert_tracks(connection, tracks, now)
+
+            exists = connection.execute(
+                "SELECT 1 FROM results WHERE prefix = ? AND query = ?", key
+            ).fetchone()
+
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    *key,
+                    result_type(result),
+                    msgspec.json.encode([track.encoded for track in tracks]),
+                    playlist,
+                    now + ttl,
+                    now,
+                ),
+            )
+
+            if exists is None:
+                self._adjust("results", 1)
+
+            self._evict(connection, now)
+
+        return True
+
+    def _remove(self, key: CacheKeyT) -> None:
+        connection = self._connect()
+
+        removed = connection.execute(
+            "DELETE FROM results WHERE prefix = ? AND query = ?", key
+        ).rowcount
+
+        self._adjust("results", -removed)
+
+    def _get_tracks(self, encoded: typing.Sequence[str]) -> typing.Mapping[str, bytes]:
+        connection = self._connect()
+
+        now = time.time()
+
+        tracks = self._select_tracks(connection, encoded)
+
+        self._access(connection, None, tracks, now)
+
+        unique = len(set(encoded))
+
+        self._hits += len(tracks)
+        self._misses += unique - len(tracks)
+
+        return {value: msgspec.json.encode(track) for value, track in tracks.items()}
+
+    def _put_tracks(self, tracks: typing.Sequence[structs.Track]) -> None:
+        connection = self._connect()
+
+        now = time.time()
+
+        with _transaction(connection):
+            self._flush(connection, now)
+            self._insert_tracks(connection, tracks, now)
+
+            self._evict(connection, now)
+
+    def _select_tracks(
+        self, connection: sqlite3.Connection, encoded: typing.Sequence[str]
+    ) -> typing.Mapping[str, structs.Track]:
+        unique = list(dict.fromkeys(encoded))
+
+        tracks: dict[str, structs.Track] = {}
+
+        for start in range(0, len(unique), _MAX_VARIABLES):
+            chunk = unique[start : start + _MAX_VARIABLES]
+            placeholders = ", ".join("?" * len(chunk))
+
+            for row in connection.execute(
+                f"SELECT * FROM tracks WHERE encoded IN ({placeholders})",
+                chunk,
+            ):
+                tracks[row[0]] = structs.Track(
+                    row[0],
+                    structs.TrackInfo(
+                        identifier=row[1],
+                        is_seekable=bool(row[2]),
+                        author=row[3],
+                        length=row[4],
+                        is_stream=bool(row[5]),
+                        position=row[6],
+                        title=row[7],
+                        source_name=row[8],
+                        uri=row[9],
+                        artwork_url=row[10],
+                        isrc=row[11],
+                    ),
+                    msgspec.json.decode(row[12]),
+                )
+
+        return tracks
+
+    def _access(
+        self,
+        connection: sqlite3.Connection,
+        key: CacheKeyT | None,
+        encoded: typing.Iterable[str],
+        now: float,
+    ) -> None:
+        if key is not None:
+            self._accessed[key] = now
+
+        self._accessed_tracks.update(dict.fromkeys(encoded, now))
+
+        if (
+            len(self._accessed) + len(self._accessed_tracks) >= _ACCESS_BATCH
+            or now - self._flushed >= _ACCESS_INTERVAL
+        ):
+            with _transaction(connection):
+                self._flush(connection, now)
+
+    def _flush(self, connection: sqlite3.Connection, now: float) -> None:
+        results = [(accessed, *key) for key, accessed in self._accessed.items()]
+        tracks = [
+            (accessed, encoded) for encoded, accessed in self._accessed_tracks.items()
+        ]
+
+        # Access times only guide eviction, so they are dropped instead of kept, if they can not be written.
+        self._accessed.clear()
+        self._accessed_tracks.clear()
+        self._flushed = now
+
+        connection.executemany(
+            "UPDATE results SET accessed = ? WHERE prefix = ? AND query = ?", results
+        )
+        connection.executemany(
+            "UPDATE tracks SET accessed = ? WHERE encoded = ?", tracks
+        )
+
+    def _insert_tracks(
+        self,
+        connection: sqlite3.Connection,
+        tracks: typing.Sequence[structs.Track],
+        now: float,
+    ) -> None:
+        unique = list(dict.fromkeys(track.encoded for track in tracks))
+        existing = 0
+
+        for start in range(0, len(unique), _MAX_VARIABLES):
+            chunk = unique[start : start + _MAX_VARIABLES]
+            placeholders = ", ".join("?" * len(chunk))
+
+            (count,) = connection.execute(
+                f"SELECT COUNT(*) FROM tracks WHERE encoded IN ({placeholders})",
+                chunk,
+            ).fetchone()
+            existing += count
+
+        connection.executemany(
+            "INSERT OR REPLACE INTO tracks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    track.encoded,
+                    track.info.identifier,
+                    track.info.is_seekable,
+                    track.info.author,
+                    track.info.length,
+                    track.info.is_stream,
+                    track.info.position,
+                    track.info.title,
+                    track.info.source_name,
+                    track.info.uri,
+                    track.info.artwork_url,
+                    track.info.isrc,
+                    msgspec.json.encode(track.plugin_info),
+                    now,
+                )
+                for track in tracks
+            ],
+        )
+
+        self._adjust("tracks", len(unique) - existing)
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        if not self._rows or now - self._counted >= _COUNT_INTERVAL:
+            self._count(connection, now)
+
+        for table, limit in (
+            ("results", self.config.max_disk_results),
+            ("tracks", self.config.max_disk_tracks),
+        ):
+            count = self._rows[table]
+
+            if count <= limit:
+                continue
+
+            evicted = connection.execute(
+                f"DELETE FROM {table} WHERE rowid IN (SELECT rowid FROM {table} ORDER BY accessed LIMIT ?)",
+                (count - limit,),
+            ).rowcount
+
+            self._evictions += evicted
+            self._rows[table] = count - evicted
+
+    def _count(self, connection: sqlite3.Connection, now: float) -> None:
+        self._evictions += connection.execute(
+            "DELETE FROM results WHERE expires <= ?", (now,)
+        ).rowcount
+
+        for table in ("results", "tracks"):
+            (self._rows[table],) = connection.execute(
+                f"SELECT COUNT(*) FROM {table}"
+            ).fetchone()
+
+        self._counted = now
+
+    def _adjust(self, table: str, amount: int) -> None:
+        # Until the rows are first counted, there is nothing to adjust.
+        if table in self._rows:
+            self._rows[table] += amount
+
+
+def _schema_version(connection: sqlite3.Connection) -> int:
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+@contextlib.contextmanager
+def _transaction(connection: sqlite3.Connection) -> typing.Generator[None, None, None]:
+    connection.execute("BEGIN IMMEDIATE")
+
+    try:
+        yield
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+
+    connection.execute("COMMIT")
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
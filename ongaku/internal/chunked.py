@@ -0,0 +1,533 @@
+"""
+Chunked.
+
+A list stored in chunks, with an index of their positions, and optionally their weights and keys.
+"""
+
+from __future__ import annotations
+
+import collections
+import itertools
+import typing
+
+from ongaku.internal.fenwick import FenwickTree
+
+__all__ = ("ChunkedList",)
+
+_T = typing.TypeVar("_T")
+
+LOAD: typing.Final[int] = 512
+"""The size of a chunk. Chunks are split when they reach twice this size."""
+
+WeightT = typing.Callable[[_T], int]
+"""A function, giving the weight of an item."""
+
+KeyT = typing.Callable[[_T], typing.Hashable]
+"""A function, giving the key of an item."""
+
+
+class ChunkedList(typing.Generic[_T]):
+    """
+    Chunked list.
+
+    A list stored in chunks, with a [FenwickTree][ongaku.internal.fenwick.FenwickTree] of their lengths.
+
+    Finding, inserting or removing an item at any position is `O(log n)`, plus shifting the items of a single chunk.
+    Slices only visit the items they return, and whole chunks can be moved between lists without copying them.
+
+    With a weight, the list also keeps the sum of the weights of each chunk, with a second tree of them,
+    so the weight of the items before any position is `O(log n)`, plus weighing part of a single chunk.
+
+    With a key, the list also counts the keys in each chunk, so [find][ongaku.internal.chunked.ChunkedList.find]
+    only searches the chunks that hold an item with the key.
+
+    Parameters
+    ----------
+    items
+        The items to start the list with.
+    weight
+        The function giving the weight of an item, if the list should keep track of their weights.
+    key
+        The function giving the key of an item, if the list should count their keys.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_chunks",
+        "_index",
+        "_key",
+        "_keys",
+        "_length",
+        "_sums",
+        "_weight",
+        "_weights",
+    )
+
+    def __init__(
+        self,
+        items: typing.Iterable[_T] = (),
+        *,
+        weight: WeightT[_T] | None = None,
+        key: KeyT[_T] | None = None,
+    ) -> None:
+        self._chunks: list[list[_T]] = []
+        self._index = FenwickTree()
+        self._key = key
+        # The keys in each chunk, which stay empty without a key.
+        self._keys: list[collections.Counter[typing.Hashable]] = []
+        self._length = 0
+        self._weight = weight
+        # The weight of each chunk, which stays at 0 without a weight.
+        self._sums: list[int] = []
+        self._weights = FenwickTree()
+
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> typing.Iterator[_T]:
+        return itertools.chain.from_iterable(self._chunks)
+
+    def __reversed__(self) -> typing.Iterator[_T]:
+        return itertools.chain.from_iterable(
+            reversed(chunk) for chunk in reversed(self._chunks)
+        )
+
+    def __contains__(self, value: object) -> bool:
+        return any(value in chunk for chunk in self._chunks)
+
+    def __getitem__(self, index: int) -> _T:
+        position, offset = self._locate(index)
+
+        return self._chunks[position][offset]
+
+    def __setitem__(self, index: int, value: _T) -> None:
+        position, offset = self._locate(index)
+
+        chunk = self._chunks[position]
+
+        self._reweigh(position, self._weigh(value) - self._weigh(chunk[offset]))
+        self._count(position, chunk[offset], -1)
+        self._count(position, value, 1)
+
+        chunk[offset] = value
+
+    @property
+    def weight(self) -> int:
+        """The sum of the weights of every item, or 0 without a weight."""
+        return self._weights.total
+
+    def prefix_weight(self, index: int) -> int:
+        """Get the sum of the weights of the items before a position, or 0 without a weight."""
+        if self._weight is None or index <= 0:
+            return 0
+
+        if index >= self._length:
+            return self._weights.total
+
+        position, offset = self._index.search(index)
+        chunk = self._chunks[position]
+
+        # Weigh whichever side of the position is smaller.
+        if offset <= len(chunk) // 2:
+            partial = self._measure(chunk[:offset])
+        else:
+            partial = self._sums[position] - self._measure(chunk[offset:])
+
+        return self._weights.prefix(position) + partial
+
+    def count(self, value: typing.Any) -> int:
+        """Get the amount of times an item is in the list."""
+        return sum(chunk.count(value) for chunk in self._chunks)
+
+    def index(self, value: typing.Any, start: int = 0, stop: int | None = None) -> int:
+        """
+        Index.
+
+        Get the position of the first occurrence of an item.
+
+        Raises
+        ------
+        ValueError
+            Raised when the item is not in the list.
+        """
+        start, stop, _ = slice(start, stop).indices(self._length)
+
+        if start < stop:
+            position, offset = self._locate(start)
+            index = start - offset
+
+            for chunk in itertools.islice(self._chunks, position, None):
+                if index >= stop:
+                    break
+
+                try:
+                    return index + chunk.index(value, offset, max(stop - index, offset))
+                except ValueError:
+                    index += len(chunk)
+                    offset = 0
+
+        raise ValueError(f"{value!r} is not in list")
+
+    def find(self, key: typing.Hashable) -> list[int]:
+        """Get the positions of every item with the key given, in order, or none without a key."""
+        positions: list[int] = []
+
+        if self._key is None:
+            return positions
+
+        start = 0
+
+        for chunk, keys in zip(self._chunks, self._keys):
+            if key in keys:
+                positions.extend(
+                    start + offset
+                    for offset, item in enumerate(chunk)
+                    if self._key(item) == key
+                )
+
+            start += len(chunk)
+
+        return positions
+
+    def slice(self, start: int, stop: int) -> list[_T]:
+        """Get the items between two positions, which must already be within the list."""
+        if start >= stop:
+            return []
+
+        position, offset = self._locate(start)
+        items = self._chunks[position][offset : offset + stop - start]
+
+        for chunk in itertools.islice(self._chunks, position + 1, None):
+            if len(items) >= stop - start:
+                break
+
+            items.extend(chunk[: stop - start - len(items)])
+
+        return items
+
+    def append(self, value: _T) -> None:
+        """Add an item to the end of the list."""
+        if not self._chunks or len(self._chunks[-1]) >= LOAD:
+            self._chunks.append([value])
+            self._sums.append(self._weigh(value))
+            self._keys.append(self._tally((value,)))
+            self._length += 1
+            self._reindex()
+            return
+
+        self._chunks[-1].append(value)
+        self._index.add(len(self._chunks) - 1, 1)
+        self._reweigh(len(self._chunks) - 1, self._weigh(value))
+        self._count(len(self._chunks) - 1, value, 1)
+        self._length += 1
+
+    def appendleft(self, value: _T) -> None:
+        """Add an item to the start of the list."""
+        if not self._chunks:
+            self.append(value)
+            return
+
+        self._chunks[0].insert(0, value)
+        self._index.add(0, 1)
+        self._reweigh(0, self._weigh(value))
+        self._count(0, value, 1)
+        self._length += 1
+
+        self._balance(0)
+
+    def extend(self, values: typing.Iterable[_T]) -> None:
+        """Add items to the end of the list."""
+        values = iter(values)
+
+        if self._chunks:
+            last = self._chunks[-1]
+            count = len(last)
+
+            last.extend(itertools.islice(values, max(LOAD - len(last), 0)))
+
+            self._sums[-1] += self._measure(last[count:])
+            self._keys[-1].update(self._tally(last[count:]))
+            self._length += len(last) - count
+
+        while chunk := list(itertools.islice(values, LOAD)):
+            self._chunks.append(chunk)
+            self._sums.append(self._measure(chunk))
+            self._keys.append(self._tally(chunk))
+            self._length += len(chunk)
+
+        self._reindex()
+
+    def insert(self, index: int, value: _T) -> None:
+        """Insert an item before the position given."""
+        if index < 0:
+            index = max(index + self._length, 0)
+
+        if index >= self._length:
+            self.append(value)
+            return
+
+        position, offset = self._locate(index)
+
+        self._chunks[position].insert(offset, value)
+        self._index.add(position, 1)
+        self._reweigh(position, self._weigh(value))
+        self._count(position, value, 1)
+        self._length += 1
+
+        self._balance(position)
+
+    def pop(self, index: int = -1) -> _T:
+        """
+        Pop.
+
+        Remove the item at the position given.
+
+        Raises
+        ------
+        IndexError
+            Raised when the list is empty, or the position is outside of the list.
+        """
+        if not self._chunks:
+            raise IndexError("pop from an empty list")
+
+        position, offset = self._locate(index)
+
+        value = self._chunks[position].pop(offset)
+        self._index.add(position, -1)
+        self._reweigh(position, -self._weigh(value))
+        self._count(position, value, -1)
+        self._length -= 1
+
+        self._balance(position)
+
+        return value
+
+    def popleft(self) -> _T:
+        """
+        Pop left.
+
+        Remove the first item.
+
+        Raises
+        ------
+        IndexError
+            Raised when the list is empty.
+        """
+        if not self._chunks:
+            raise IndexError("pop from an empty list")
+
+        value = self._chunks[0].pop(0)
+        self._index.add(0, -1)
+        self._reweigh(0, -self._weigh(value))
+        self._count(0, value, -1)
+        self._length -= 1
+
+        self._balance(0)
+
+        return value
+
+    def skip(self, amount: int) -> list[_T]:
+        """Remove up to the amount of items given from the start of the list, and return them."""
+        removed: list[_T] = []
+        dropped = False
+
+        # Whole chunks are dropped at once. This moves every other chunk, so the trees are rebuilt afterwards.
+        while self._chunks and amount - len(removed) >= len(self._chunks[0]):
+            removed.extend(self._chunks.pop(0))
+            self._sums.pop(0)
+            self._keys.pop(0)
+            dropped = True
+
+        if self._chunks and amount > len(removed):
+            first = self._chunks[0]
+            count = amount - len(removed)
+            taken = first[:count]
+
+            del first[:count]
+            removed.extend(taken)
+
+            self._keys[0] -= self._tally(taken)
+
+            if dropped:
+                self._sums[0] -= self._measure(taken)
+            else:
+                # Only the first chunk changed, so it is updated in place.
+                self._index.add(0, -count)
+                self._reweigh(0, -self._measure(taken))
+
+        self._length -= len(removed)
+
+        if dropped:
+            self._reindex()
+
+        return removed
+
+    def detach(self, start: int) -> ChunkedList[_T]:
+        """Remove every item from the position given onwards, and return them as a new list, without copying them."""
+        detached: ChunkedList[_T] = ChunkedList(weight=self._weight, key=self._key)
+
+        if start >= self._length:
+            return detached
+
+        position, offset = self._locate(max(start, 0))
+
+        head = self._chunks[position][:offset]
+        tail = self._chunks[position][offset:]
+
+        head_sum = self._measure(head)
+        tail_sum = self._sums[position] - head_sum
+        head_keys = self._tally(head)
+        tail_keys = self._keys[position] - head_keys
+
+        detached._chunks = [tail, *self._chunks[position + 1 :]]
+        detached._sums = [tail_sum, *self._sums[position + 1 :]]
+        detached._keys = [tail_keys, *self._keys[position + 1 :]]
+        detached._length = self._length - max(start, 0)
+        detached._reindex()
+
+        if head:
+            self._chunks = [*self._chunks[:position], head]
+            self._sums = [*self._sums[:position], head_sum]
+            self._keys = [*self._keys[:position], head_keys]
+        else:
+            self._chunks = self._chunks[:position]
+            self._sums = self._sums[:position]
+            self._keys = self._keys[:position]
+
+        self._length = max(start, 0)
+        self._reindex()
+
+        return detached
+
+    def join(self, other: ChunkedList[_T]) -> None:
+        """Move every item of another list, with the same weight and key, to the end of this one, without copying them."""
+        self._chunks.extend(other._chunks)
+        self._sums.extend(other._sums)
+        self._keys.extend(other._keys)
+        self._length += other._length
+        self._reindex()
+
+        other.clear()
+
+    def replace(self, items: typing.Sequence[_T]) -> None:
+        """Replace every item in the list."""
+        self._chunks = [
+            list(items[index : index + LOAD]) for index in range(0, len(items), LOAD)
+        ]
+        self._sums = [self._measure(chunk) for chunk in self._chunks]
+        self._keys = [self._tally(chunk) for chunk in self._chunks]
+        self._length = len(items)
+        self._reindex()
+
+    def clear(self) -> None:
+        """Remove every item."""
+        self._chunks = []
+        self._sums = []
+        self._keys = []
+        self._length = 0
+        self._reindex()
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("list index out of range")
+
+        return self._index.search(index)
+
+    def _balance(self, position: int) -> None:
+        chunk = self._chunks[position]
+
+        if len(chunk) > LOAD * 2:
+            head = self._measure(chunk[:LOAD])
+            head_keys = self._tally(chunk[:LOAD])
+
+            self._chunks[position : position + 1] = [chunk[:LOAD], chunk[LOAD:]]
+            self._sums[position : position + 1] = [head, self._sums[position] - head]
+            self._keys[position : position + 1] = [
+                head_keys,
+                self._keys[position] - head_keys,
+            ]
+        elif not chunk:
+            del self._chunks[position]
+            del self._sums[position]
+            del self._keys[position]
+        elif (
+            len(chunk) < LOAD // 2
+            and position + 1 < len(self._chunks)
+            and len(chunk) + len(self._chunks[position + 1]) <= LOAD
+        ):
+            chunk.extend(self._chunks.pop(position + 1))
+            self._sums[position] += self._sums.pop(position + 1)
+            self._keys[position] += self._keys.pop(position + 1)
+        else:
+            return
+
+        self._reindex()
+
+    def _weigh(self, item: _T) -> int:
+        return self._weight(item) if self._weight is not None else 0
+
+    def _measure(self, items: typing.Iterable[_T]) -> int:
+        if self._weight is None:
+            return 0
+
+        return sum(map(self._weight, items))
+
+    def _tally(
+        self, items: typing.Iterable[_T]
+    ) -> collections.Counter[typing.Hashable]:
+        if self._key is None:
+            return collections.Counter()
+
+        return collections.Counter(map(self._key, items))
+
+    def _count(self, position: int, item: _T, delta: int) -> None:
+        if self._key is None:
+            return
+
+        keys = self._keys[position]
+        key = self._key(item)
+        count = keys[key] + delta
+
+        # Keys are only kept while counted, so a chunk without one is skipped.
+        if count > 0:
+            keys[key] = count
+        else:
+            del keys[key]
+
+    def _reweigh(self, position: int, delta: int) -> None:
+        if delta:
+            self._sums[position] += delta
+            self._weights.add(position, delta)
+
+    def _reindex(self) -> None:
+        self._index = FenwickTree(len(chunk) for chunk in self._chunks)
+
+        if self._weight is not None:
+            self._weights = FenwickTree(self._sums)
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
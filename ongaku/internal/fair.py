@@ -0,0 +1,196 @@
+"""
+Fair.
+
+The state of a fair-share queue, taking turns between requestors.
+"""
+
+from __future__ import annotations
+
+import collections
+import heapq
+import itertools
+import typing
+
+if typing.TYPE_CHECKING:
+    import hikari
+
+    from ongaku.abc import track as track_
+    from ongaku.internal.chunked import WeightT
+
+__all__ = ("FairShare",)
+
+_EntryT = tuple[int, "track_.Track"]
+"""A track, and the order it was added in."""
+
+
+class FairShare:
+    """
+    Fair share.
+
+    The tracks of a fair-share queue that have not been drawn yet, in a queue for each requestor.
+
+    Requestors take turns, in the order they first added a track, so drawing the next track is `O(1)`
+    no matter how many tracks, or requestors there are. Tracks without a requestor share a turn.
+
+    Parameters
+    ----------
+    tracks
+        The tracks to start with, in the order they were added.
+    weight
+        The function giving the weight of a track, if the total weight of the waiting tracks should be kept.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_counter",
+        "_length",
+        "_queues",
+        "_total",
+        "_turns",
+        "_weight",
+    )
+
+    def __init__(
+        self,
+        tracks: typing.Iterable[track_.Track] = (),
+        *,
+        weight: WeightT[track_.Track] | None = None,
+    ) -> None:
+        self._queues: dict[hikari.Snowflake | None, collections.deque[_EntryT]] = {}
+        self._turns: collections.deque[hikari.Snowflake | None] = collections.deque()
+        self._counter = itertools.count()
+        self._length = 0
+        self._weight = weight
+        self._total = 0
+
+        self.extend(tracks)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> typing.Iterator[track_.Track]:
+        for queue in self._queues.values():
+            for _, track in queue:
+                yield track
+
+    def __contains__(self, value: object) -> bool:
+        return any(track == value for track in self)
+
+    @property
+    def requestors(self) -> typing.Sequence[hikari.Snowflake | None]:
+        """The requestors with tracks waiting, in the order of their turns."""
+        return self._turns
+
+    @property
+    def weight(self) -> int:
+        """The sum of the weights of every waiting track, or 0 without a weight."""
+        return self._total
+
+    def count(self, value: typing.Any) -> int:
+        """Get the amount of times a track is waiting."""
+        return sum(1 for track in self if track == value)
+
+    def append(self, track: track_.Track) -> None:
+        """Add a track to the queue of its requestor."""
+        queue = self._queues.get(track.requestor)
+
+        if queue is None:
+            queue = self._queues[track.requestor] = collections.deque()
+            self._turns.append(track.requestor)
+
+        queue.append((next(self._counter), track))
+        self._length += 1
+        self._total += self._measure(track)
+
+    def extend(self, tracks: typing.Iterable[track_.Track]) -> None:
+        """Add tracks to the queues of their requestors."""
+        for track in tracks:
+            self.append(track)
+
+    def remove(self, requestor: hikari.Snowflake | None) -> list[track_.Track]:
+        """Take every waiting track of a requestor, in the order they were added."""
+        queue = self._queues.pop(requestor, None)
+
+        if queue is None:
+            return []
+
+        self._turns.remove(requestor)
+        self._length -= len(queue)
+
+        tracks = [track for _, track in queue]
+
+        self._total -= sum(map(self._measure, tracks))
+
+        return tracks
+
+    def draw(self) -> track_.Track:
+        """
+        Draw.
+
+        Take the next track, from the requestor whose turn it is.
+
+        Raises
+        ------
+        IndexError
+            Raised when no tracks are waiting.
+        """
+        if not self._turns:
+            raise IndexError("draw from an empty fair share")
+
+        requestor = self._turns.popleft()
+        queue = self._queues[requestor]
+
+        _, track = queue.popleft()
+        self._length -= 1
+        self._total -= self._measure(track)
+
+        if queue:
+            self._turns.append(requestor)
+        else:
+            del self._queues[requestor]
+
+        return track
+
+    def restore(self) -> list[track_.Track]:
+        """
+        Restore.
+
+        Take every waiting track, in the order they were added.
+        """
+        tracks = [track for _, track in heapq.merge(*self._queues.values())]
+
+        self.clear()
+
+        return tracks
+
+    def clear(self) -> None:
+        """Remove every waiting track."""
+        self._queues.clear()
+        self._turns.clear()
+        self._length = 0
+        self._total = 0
+
+    def _measure(self, track: track_.Track) -> int:
+        return self._weight(track) if self._weight is not None else 0
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
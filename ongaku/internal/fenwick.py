@@ -0,0 +1,141 @@
+"""
+Fenwick.
+
+A binary indexed tree, for prefix sums that change one value at a time.
+"""
+
+from __future__ import annotations
+
+import typing
+
+__all__ = ("FenwickTree",)
+
+
+class FenwickTree:
+    """
+    Fenwick tree.
+
+    Holds a sequence of numbers, and answers the sum of any prefix of them in `O(log n)`.
+    Changing a single number is also `O(log n)`, while inserting or removing numbers needs a new tree.
+
+    Parameters
+    ----------
+    values
+        The numbers to start the tree with.
+    """
+
+    __slots__: typing.Sequence[str] = ("_tree",)
+
+    def __init__(self, values: typing.Iterable[int] = ()) -> None:
+        tree = [0, *values]
+
+        # Build in O(n), by pushing each node into its parent.
+        for index in range(1, len(tree)):
+            parent = index + (index & -index)
+
+            if parent < len(tree):
+                tree[parent] += tree[index]
+
+        self._tree = tree
+
+    def __len__(self) -> int:
+        return len(self._tree) - 1
+
+    @property
+    def total(self) -> int:
+        """The sum of every number."""
+        return self.prefix(len(self))
+
+    def add(self, index: int, delta: int) -> None:
+        """
+        Add.
+
+        Add to the number at a position.
+
+        Parameters
+        ----------
+        index
+            The position of the number.
+        delta
+            The amount to add to it.
+        """
+        index += 1
+
+        while index < len(self._tree):
+            self._tree[index] += delta
+            index += index & -index
+
+    def prefix(self, index: int) -> int:
+        """
+        Prefix.
+
+        Get the sum of the numbers before a position.
+
+        Parameters
+        ----------
+        index
+            The position to sum up to, not including the number at it.
+        """
+        total = 0
+
+        while index > 0:
+            total += self._tree[index]
+            index -= index & -index
+
+        return total
+
+    def search(self, value: int) -> tuple[int, int]:
+        """
+        Search.
+
+        Find the position of the number, that the running sum reaches the value in.
+
+        The numbers must not be negative.
+
+        Parameters
+        ----------
+        value
+            The value to find.
+
+        Returns
+        -------
+        tuple[int, int]
+            The position of the number, and how far past the sum of the numbers before it the value is.
+            If the value is not less than the total, the position is the length of the tree.
+        """
+        index = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+
+        while step:
+            next_index = index + step
+
+            if next_index < len(self._tree) and self._tree[next_index] <= value:
+                index = next_index
+                value -= self._tree[next_index]
+
+            step >>= 1
+
+        return index, value
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
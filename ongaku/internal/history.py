@@ -0,0 +1,129 @@
+"""
+History.
+
+The tracks a player has played, kept so they can be played again.
+"""
+
+from __future__ import annotations
+
+import collections
+import typing
+
+from ongaku.internal.memory import track_size
+
+if typing.TYPE_CHECKING:
+    from ongaku.abc import track as track_
+
+__all__ = ("History",)
+
+
+class History:
+    """
+    History.
+
+    The tracks a player has played, newest first.
+
+    The history is a ring buffer, bounded by both its amount of tracks and their approximate size,
+    so the oldest tracks are dropped once either limit is reached. The tracks are kept as they are,
+    so playing one again does not need it to be loaded, or encoded again.
+
+    Parameters
+    ----------
+    max_size
+        The maximum amount of tracks kept. If `0`, no tracks are kept.
+    max_bytes
+        The maximum approximate size (in bytes) of the tracks kept.
+    """
+
+    __slots__: typing.Sequence[str] = ("_entries", "_max_bytes", "_max_size", "_size")
+
+    def __init__(self, max_size: int, max_bytes: int) -> None:
+        self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._entries: collections.deque[tuple[track_.Track, int]] = collections.deque()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> typing.Iterator[track_.Track]:
+        for track, _ in self._entries:
+            yield track
+
+    @property
+    def size(self) -> int:
+        """The approximate size (in bytes) of the tracks kept."""
+        return self._size
+
+    def push(self, track: track_.Track) -> None:
+        """
+        Push.
+
+        Add a track as the newest track, dropping the oldest tracks if either limit is reached.
+
+        Parameters
+        ----------
+        track
+            The track that was played.
+        """
+        if self._max_size <= 0:
+            return
+
+        size = track_size(track)
+
+        if size > self._max_bytes:
+            return
+
+        self._entries.appendleft((track, size))
+        self._size += size
+
+        while len(self._entries) > self._max_size or self._size > self._max_bytes:
+            _, dropped = self._entries.pop()
+            self._size -= dropped
+
+    def pop(self) -> track_.Track:
+        """
+        Pop.
+
+        Remove the newest track.
+
+        Raises
+        ------
+        IndexError
+            Raised when the history is empty.
+        """
+        if not self._entries:
+            raise IndexError("pop from an empty history")
+
+        track, size = self._entries.popleft()
+        self._size -= size
+
+        return track
+
+    def clear(self) -> None:
+        """Remove every track."""
+        self._entries.clear()
+        self._size = 0
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
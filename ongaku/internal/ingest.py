@@ -0,0 +1,281 @@
+"""
+Ingest.
+
+The bounded queue, sitting between the websocket reader and the event processor.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import typing
+
+import msgspec
+
+from ongaku.abc import session as session_
+from ongaku.internal import structs
+
+if typing.TYPE_CHECKING:
+    from ongaku.config import IngestConfig
+
+__all__ = ("Frame", "IngestQueue", "frame_key")
+
+FrameKeyT = tuple[str, str | None]
+"""The key of a frame that can be superseded. (op code, guild id)"""
+
+
+def frame_key(data: str) -> FrameKeyT | None:
+    """
+    Frame key.
+
+    Get the key of a frame, that only holds the latest state of something.
+
+    Player updates are keyed by their guild, and statistics by the op code alone.
+    Every other frame (including track events) returns `None`, and is never superseded.
+
+    Parameters
+    ----------
+    data
+        The raw websocket payload.
+    """
+    try:
+        header = structs.decode(data, structs.Header)
+    except msgspec.DecodeError:
+        return None
+
+    if header.op == session_.WebsocketOPCode.PLAYER_UPDATE:
+        return (header.op, header.guild_id)
+
+    if header.op == session_.WebsocketOPCode.STATS:
+        return (header.op, None)
+
+    return None
+
+
+def _is_track_end(data: str) -> bool:
+    try:
+        header = structs.decode(data, structs.Header)
+    except msgspec.DecodeError:
+        return False
+
+    return (
+        header.op == session_.WebsocketOPCode.EVENT
+        and header.type == session_.WebsocketEvent.TRACK_END_EVENT
+    )
+
+
+class Frame:
+    """
+    Frame.
+
+    A raw websocket payload, waiting to be processed.
+    """
+
+    __slots__: typing.Sequence[str] = ("_data", "_key")
+
+    def __init__(self, data: str, key: FrameKeyT | None = None) -> None:
+        self._data = data
+        self._key = key
+
+    @property
+    def data(self) -> str:
+        """The raw websocket payload."""
+        return self._data
+
+    @property
+    def key(self) -> FrameKeyT | None:
+        """The key of the frame, if a newer frame can supersede it."""
+        return self._key
+
+
+class IngestQueue:
+    """
+    Ingest queue.
+
+    The bounded queue of websocket frames, waiting to be decoded and dispatched.
+
+    Parameters
+    ----------
+    config
+        The config for the size, and overflow policy of the queue.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_closed",
+        "_condition",
+        "_config",
+        "_dropped",
+        "_frames",
+        "_max_depth",
+        "_pending",
+        "_processed",
+        "_received",
+    )
+
+    def __init__(self, config: IngestConfig) -> None:
+        self._config = config
+        self._frames: collections.deque[Frame] = collections.deque()
+        self._pending: typing.MutableMapping[FrameKeyT, Frame] = {}
+        self._condition = asyncio.Condition()
+        self._closed = False
+        self._received = 0
+        self._processed = 0
+        self._dropped = 0
+        self._max_depth = 0
+
+    @property
+    def config(self) -> IngestConfig:
+        """The config for the size, and overflow policy of the queue."""
+        return self._config
+
+    @property
+    def depth(self) -> int:
+        """The amount of frames currently waiting to be processed."""
+        return len(self._frames)
+
+    @property
+    def max_depth(self) -> int:
+        """The highest amount of frames that have been waiting at once."""
+        return self._max_depth
+
+    @property
+    def received(self) -> int:
+        """The total amount of frames received."""
+        return self._received
+
+    @property
+    def processed(self) -> int:
+        """The total amount of frames taken from the queue to be processed."""
+        return self._processed
+
+    @property
+    def dropped(self) -> int:
+        """The total amount of stale frames dropped, before they were processed."""
+        return self._dropped
+
+    @property
+    def closed(self) -> bool:
+        """Whether the queue has been closed, and will accept no more frames."""
+        return self._closed
+
+    def open(self) -> None:
+        """
+        Open.
+
+        Open the queue for a new connection.
+
+        Track end events left behind by the last connection are kept, and processed first, so autoplay
+        still moves on to the next track. Every other frame left behind is stale, and is dropped.
+        """
+        kept = [frame for frame in self._frames if _is_track_end(frame.data)]
+
+        self._dropped += len(self._frames) - len(kept)
+
+        self._frames.clear()
+        self._frames.extend(kept)
+        self._pending.clear()
+        self._closed = False
+
+    async def close(self) -> None:
+        """
+        Close.
+
+        Close the queue. Frames already waiting will still be returned by [get][ongaku.internal.ingest.IngestQueue.get].
+        """
+        async with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    async def put(self, data: str) -> None:
+        """
+        Put.
+
+        Put a frame into the queue.
+
+        If the queue is full, this waits until there is space.
+        With the `drop_stale` policy, a frame that supersedes one that is still waiting
+        replaces it instead, so never has to wait.
+
+        Parameters
+        ----------
+        data
+            The raw websocket payload.
+        """
+        key = frame_key(data) if self.config.overflow == "drop_stale" else None
+
+        async with self._condition:
+            self._received += 1
+
+            stale = self._pending.get(key) if key else None
+
+            if stale is not None:
+                self._frames.remove(stale)
+                self._dropped += 1
+            else:
+                await self._condition.wait_for(
+                    lambda: len(self._frames) < self.config.max_size
+                )
+
+            frame = Frame(data, key)
+
+            self._frames.append(frame)
+
+            if key:
+                self._pending[key] = frame
+
+            self._max_depth = max(self._max_depth, len(self._frames))
+
+            self._condition.notify_all()
+
+    async def get(self) -> Frame | None:
+        """
+        Get.
+
+        Get the oldest frame from the queue, waiting for one if it is empty.
+
+        Returns
+        -------
+        Frame
+            The oldest frame.
+        None
+            The queue has been closed, and is empty.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._frames or self._closed)
+
+            if not self._frames:
+                return None
+
+            frame = self._frames.popleft()
+
+            if frame.key and self._pending.get(frame.key) is frame:
+                del self._pending[frame.key]
+
+            self._processed += 1
+
+            self._condition.notify_all()
+
+            return frame
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
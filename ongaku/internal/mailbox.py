@@ -0,0 +1,228 @@
+"""
+Mailbox.
+
+The queue of operations on a player, run one at a time, in order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import typing
+
+from ongaku.internal.logger import TRACE_LEVEL
+from ongaku.internal.logger import logger
+
+__all__ = ("Mailbox", "Operation")
+
+_logger = logger.getChild("mailbox")
+
+OperationT = typing.Callable[[], typing.Awaitable[typing.Any]]
+"""An operation, waiting to be run."""
+
+BatchT = typing.Callable[[], contextlib.AbstractAsyncContextManager[None]]
+"""The context manager, that merges the updates sent by operations inside it."""
+
+
+class Operation:
+    """
+    Operation.
+
+    An operation waiting in the mailbox, and the future its result is set on.
+    """
+
+    __slots__: typing.Sequence[str] = ("_batch", "_function", "_future")
+
+    def __init__(
+        self, function: OperationT, future: asyncio.Future[typing.Any], batch: bool
+    ) -> None:
+        self._function = function
+        self._future = future
+        self._batch = batch
+
+    @property
+    def function(self) -> OperationT:
+        """The operation."""
+        return self._function
+
+    @property
+    def future(self) -> asyncio.Future[typing.Any]:
+        """The future, the result of the operation is set on."""
+        return self._future
+
+    @property
+    def batch(self) -> bool:
+        """Whether the operation can be merged with the operations around it."""
+        return self._batch
+
+
+class Mailbox:
+    """
+    Mailbox.
+
+    Runs the operations submitted to it one at a time, in the order they were submitted.
+
+    Operations that were waiting together are run inside a single batch, so newer changes
+    replace older ones, and only one update is sent for all of them. Operations that cannot be
+    merged (such as disconnecting) are run on their own, after everything submitted before them.
+
+    Parameters
+    ----------
+    batch
+        The context manager, that merges the updates sent by operations inside it.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_batch",
+        "_batches",
+        "_operations",
+        "_submitted",
+        "_task",
+    )
+
+    def __init__(self, batch: BatchT) -> None:
+        self._batch = batch
+        self._operations: collections.deque[Operation] = collections.deque()
+        self._task: asyncio.Task[None] | None = None
+        self._submitted = 0
+        self._batches = 0
+
+    @property
+    def pending(self) -> int:
+        """The amount of operations waiting to be run."""
+        return len(self._operations)
+
+    @property
+    def submitted(self) -> int:
+        """The total amount of operations submitted."""
+        return self._submitted
+
+    @property
+    def batches(self) -> int:
+        """The total amount of batches that operations have been run in."""
+        return self._batches
+
+    async def submit(self, function: OperationT, *, batch: bool = True) -> typing.Any:
+        """
+        Submit.
+
+        Submit an operation, and wait for it to be run.
+
+        Operations submitted from inside another operation are run straight away, as part of it.
+
+        Parameters
+        ----------
+        function
+            The operation.
+        batch
+            Whether the operation can be merged with the operations around it.
+
+        Returns
+        -------
+        typing.Any
+            The result of the operation.
+        """
+        if self._task is not None and asyncio.current_task() is self._task:
+            return await function()
+
+        future: asyncio.Future[typing.Any] = asyncio.get_running_loop().create_future()
+
+        self._operations.append(Operation(function, future, batch))
+        self._submitted += 1
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        return await future
+
+    async def _run(self) -> None:
+        try:
+            while self._operations:
+                if not self._operations[0].batch:
+                    await self._run_single(self._operations.popleft())
+                    continue
+
+                operations: list[Operation] = []
+
+                while self._operations and self._operations[0].batch:
+                    operations.append(self._operations.popleft())
+
+                await self._run_batch(operations)
+        finally:
+            for operation in self._operations:
+                operation.future.cancel()
+
+            self._operations.clear()
+
+    async def _run_single(self, operation: Operation) -> None:
+        if operation.future.done():
+            return
+
+        try:
+            result = await operation.function()
+        except Exception as e:
+            _set_exception(operation.future, e)
+        else:
+            _set_result(operation.future, result)
+
+    async def _run_batch(self, operations: typing.Sequence[Operation]) -> None:
+        completed: list[tuple[Operation, typing.Any]] = []
+
+        self._batches += 1
+
+        _logger.log(TRACE_LEVEL, f"Running {len(operations)} operation(s) in a batch")
+
+        try:
+            async with self._batch():
+                for operation in operations:
+                    if operation.future.done():
+                        continue
+
+                    try:
+                        result = await operation.function()
+                    except Exception as e:
+                        _set_exception(operation.future, e)
+                    else:
+                        completed.append((operation, result))
+        except Exception as e:
+            for operation, _ in completed:
+                _set_exception(operation.future, e)
+
+            return
+
+        for operation, result in completed:
+            _set_result(operation.future, result)
+
+
+def _set_result(future: asyncio.Future[typing.Any], result: typing.Any) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future[typing.Any], exception: Exception) -> None:
+    if not future.done():
+        future.set_exception(exception)
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -0,0 +1,89 @@
+"""
+Memory.
+
+Estimates of the memory used by tracks.
+"""
+
+from __future__ import annotations
+
+import sys
+import typing
+
+if typing.TYPE_CHECKING:
+    from ongaku.abc import track as track_
+
+__all__ = ("track_size",)
+
+
+_MAPPING: typing.Final[int] = sys.getsizeof({})
+"""The size of an empty dictionary."""
+
+
+def track_size(track: track_.Track) -> int:
+    """
+    Track size.
+
+    Estimate the memory used by a track, in bytes.
+
+    This is the size of the track, its info, and their strings (including the encoded track),
+    and the top level of its plugin info and user data. Strings shared with other tracks are counted for each of them.
+
+    Parameters
+    ----------
+    track
+        The track to estimate the size of.
+    """
+    info = track.info
+
+    strings = (
+        track.encoded,
+        info.identifier,
+        info.author,
+        info.title,
+        info.source_name,
+        info.uri,
+        info.artwork_url,
+        info.isrc,
+    )
+
+    return (
+        type(track).__basicsize__
+        + type(info).__basicsize__
+        + sum(map(sys.getsizeof, strings))
+        + _mapping_size(track.plugin_info)
+        + _mapping_size(track.user_data)
+    )
+
+
+def _mapping_size(mapping: object) -> int:
+    if not isinstance(mapping, dict) or not mapping:
+        return _MAPPING
+
+    items = typing.cast("dict[object, object]", mapping)
+
+    return sys.getsizeof(items) + sum(
+        sys.getsizeof(key) + sys.getsizeof(value) for key, value in items.items()
+    )
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -0,0 +1,130 @@
+"""
+Pool.
+
+Statistics about a http connection pool.
+"""
+
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    import aiohttp
+
+__all__ = ("PoolStatistics",)
+
+
+class PoolStatistics:
+    """
+    Pool statistics.
+
+    A snapshot of the usage of a http connection pool.
+
+    Parameters
+    ----------
+    limit
+        The maximum amount of simultaneous connections. `0` means no limit.
+    limit_per_host
+        The maximum amount of simultaneous connections to the same host. `0` means no limit.
+    acquired
+        The amount of connections currently in use.
+    idle
+        The amount of open connections, waiting to be reused.
+    shared
+        Whether the pool is shared with other sessions.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_acquired",
+        "_idle",
+        "_limit",
+        "_limit_per_host",
+        "_shared",
+    )
+
+    def __init__(
+        self, limit: int, limit_per_host: int, acquired: int, idle: int, shared: bool
+    ) -> None:
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._acquired = acquired
+        self._idle = idle
+        self._shared = shared
+
+    @classmethod
+    def from_connector(
+        cls, connector: aiohttp.BaseConnector, *, shared: bool
+    ) -> PoolStatistics:
+        """
+        From connector.
+
+        Take a snapshot of the usage of a connector.
+
+        Parameters
+        ----------
+        connector
+            The connector to take a snapshot of.
+        shared
+            Whether the connector is shared with other sessions.
+        """
+        # aiohttp does not expose these publicly, so fall back to nothing if they change.
+        acquired: typing.Collection[typing.Any] = getattr(connector, "_acquired", ())
+        conns: typing.Mapping[typing.Any, typing.Collection[typing.Any]] = getattr(
+            connector, "_conns", {}
+        )
+
+        return cls(
+            connector.limit,
+            connector.limit_per_host,
+            len(acquired),
+            sum(len(idle) for idle in conns.values()),
+            shared,
+        )
+
+    @property
+    def limit(self) -> int:
+        """The maximum amount of simultaneous connections. `0` means no limit."""
+        return self._limit
+
+    @property
+    def limit_per_host(self) -> int:
+        """The maximum amount of simultaneous connections to the same host. `0` means no limit."""
+        return self._limit_per_host
+
+    @property
+    def acquired(self) -> int:
+        """The amount of connections currently in use."""
+        return self._acquired
+
+    @property
+    def idle(self) -> int:
+        """The amount of open connections, waiting to be reused."""
+        return self._idle
+
+    @property
+    def shared(self) -> bool:
+        """Whether the pool is shared with other sessions."""
+        return self._shared
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
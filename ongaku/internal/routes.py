@@ -19,12 +19,22 @@ class Route:
     Route.
 
     The route object that has mostly been built.
+
+    Only `GET` routes are idempotent by default, meaning they are safe to repeat after a failure.
     """
 
-    def __init__(self, method: str, path: str, *, include_version: bool = True) -> None:
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        *,
+        include_version: bool = True,
+        idempotent: bool | None = None,
+    ) -> None:
         self._method = method
         self._path = path
         self._include_version = include_version
+        self._idempotent = idempotent if idempotent is not None else method == GET
 
     @property
     def method(self) -> str:
@@ -41,6 +51,11 @@ class Route:
         """Whether to include the version."""
         return self._include_version
 
+    @property
+    def idempotent(self) -> bool:
+        """Whether the route is safe to repeat after a failure."""
+        return self._idempotent
+
     def build_url(self, uri: str) -> str:
         """Build the full url."""
         return uri + self.path
@@ -84,7 +99,7 @@ GET_LOAD_TRACKS: typing.Final[Route] = Route(GET, "/loadtracks")
 
 GET_DECODE_TRACK: typing.Final[Route] = Route(GET, "/decodetrack")
 
-POST_DECODE_TRACKS: typing.Final[Route] = Route(POST, "/decodetracks")
+POST_DECODE_TRACKS: typing.Final[Route] = Route(POST, "/decodetracks", idempotent=True)
 
 # Route Planner
 
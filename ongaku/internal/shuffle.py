@@ -0,0 +1,195 @@
+"""
+Shuffle.
+
+The state of a shuffled queue, drawn lazily as it is played or viewed.
+"""
+
+from __future__ import annotations
+
+import collections
+import random
+import typing
+
+if typing.TYPE_CHECKING:
+    from ongaku.abc import track as track_
+    from ongaku.internal.chunked import ChunkedList
+
+__all__ = ("Draw", "Shuffle")
+
+
+class Draw:
+    """
+    Draw.
+
+    A track drawn from the pool, and the position in the pool it was drawn from.
+    """
+
+    __slots__: typing.Sequence[str] = ("_position", "_track")
+
+    def __init__(self, track: track_.Track, position: int) -> None:
+        self._track: track_.Track | None = track
+        self._position = position
+
+    @property
+    def track(self) -> track_.Track | None:
+        """The track, or `None` if it has been removed from the queue."""
+        return self._track
+
+    @property
+    def position(self) -> int:
+        """The position in the pool, the track was drawn from."""
+        return self._position
+
+
+class Shuffle:
+    """
+    Shuffle.
+
+    The tracks of a shuffled queue that have not been drawn yet, kept in their original order.
+
+    Tracks are drawn one at a time, with an incremental Fisher-Yates shuffle, so only the tracks that
+    are played or viewed are ever drawn. Every draw remembers where it came from, so the original
+    order can be restored.
+
+    Parameters
+    ----------
+    pool
+        The tracks to shuffle, in their original order.
+    seed
+        The seed for the order of the tracks.
+    """
+
+    __slots__: typing.Sequence[str] = ("_draws", "_pool", "_random")
+
+    def __init__(
+        self, pool: ChunkedList[track_.Track], seed: int | None = None
+    ) -> None:
+        self._pool = pool
+        self._random = random.Random(seed)
+        self._draws: collections.deque[Draw] = collections.deque()
+
+    @property
+    def pool(self) -> ChunkedList[track_.Track]:
+        """The tracks that have not been drawn yet, in their original order."""
+        return self._pool
+
+    @property
+    def draws(self) -> typing.Sequence[Draw]:
+        """The draws that can still be undone, oldest first."""
+        return self._draws
+
+    def draw(self) -> Draw:
+        """
+        Draw.
+
+        Draw a random track from the pool.
+
+        Raises
+        ------
+        IndexError
+            Raised when the pool is empty.
+        """
+        position = self._random.randrange(len(self._pool))
+
+        draw = Draw(self._pool.pop(position), position)
+
+        self._draws.append(draw)
+
+        return draw
+
+    def remove(self, position: int) -> track_.Track:
+        """
+        Remove.
+
+        Remove a track from the pool, without drawing it.
+
+        The removal is kept as a discarded draw, so the positions of the earlier draws still line up when restored.
+
+        Parameters
+        ----------
+        position
+            The position of the track in the pool.
+        """
+        track = self._pool.pop(position)
+
+        draw = Draw(track, position)
+
+        self._draws.append(draw)
+        self.discard(draw)
+
+        return track
+
+    def discard(self, draw: Draw) -> None:
+        """
+        Discard.
+
+        Mark a drawn track as removed from the queue, so it is not restored.
+
+        Parameters
+        ----------
+        draw
+            The draw of the track.
+        """
+        draw._track = None
+
+        # The oldest draws are undone last, so removed ones no longer affect anything.
+        while self._draws and self._draws[0].track is None:
+            self._draws.popleft()
+
+    def restore(self) -> ChunkedList[track_.Track]:
+        """
+        Restore.
+
+        Put every drawn track that is still queued back into the pool, where it was drawn from.
+
+        Returns
+        -------
+        ChunkedList[Track]
+            The pool, in the original order.
+        """
+        pool = typing.cast("ChunkedList[track_.Track | None]", self._pool)
+        removed = False
+
+        # Undo the draws newest first. Removed tracks hold their place until the end, so every position still lines up.
+        for draw in reversed(self._draws):
+            pool.insert(draw.position, draw.track)
+            removed = removed or draw.track is None
+
+        if removed:
+            pool.replace([track for track in pool if track is not None])
+
+        self._draws.clear()
+
+        return self._pool
+
+    def clear(self) -> None:
+        """
+        Clear.
+
+        Remove every track, keeping the random state.
+        """
+        self._pool.clear()
+        self._draws.clear()
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -0,0 +1,265 @@
+"""
+Structs.
+
+The typed payload structures, used when decoding with msgspec.
+"""
+
+from __future__ import annotations
+
+import typing
+
+import msgspec
+
+__all__ = (
+    "Header",
+    "LoadResult",
+    "Player",
+    "PlayerUpdate",
+    "Playlist",
+    "Ready",
+    "Stats",
+    "Track",
+    "TrackEndEvent",
+    "TrackExceptionEvent",
+    "TrackStartEvent",
+    "TrackStuckEvent",
+    "WebSocketClosedEvent",
+    "decode",
+    "decode_load_result",
+)
+
+StructT = typing.TypeVar("StructT")
+
+
+class Struct(msgspec.Struct, rename="camel"):
+    """The base struct, which all lavalink payloads use."""
+
+
+# Header
+
+
+class Header(Struct):
+    """The fields required to know what a websocket payload is."""
+
+    op: str
+    type: str | None = None
+    guild_id: str | None = None
+
+
+class LoadResultHeader(Struct):
+    """The fields required to know what a load result is."""
+
+    load_type: str
+
+
+# Errors
+
+
+class TrackException(Struct, kw_only=True):
+    message: str | None = None
+    severity: str
+    cause: str
+
+
+# Track
+
+
+class TrackInfo(Struct):
+    identifier: str
+    is_seekable: bool
+    author: str
+    length: int
+    is_stream: bool
+    position: int
+    title: str
+    source_name: str
+    uri: str | None = None
+    artwork_url: str | None = None
+    isrc: str | None = None
+
+
+class Track(Struct):
+    encoded: str
+    info: TrackInfo
+    plugin_info: dict[str, typing.Any]
+    user_data: dict[str, typing.Any] | None = None
+
+
+# Playlist
+
+
+class PlaylistInfo(Struct):
+    name: str
+    selected_track: int
+
+
+class Playlist(Struct):
+    info: PlaylistInfo
+    plugin_info: dict[str, typing.Any]
+    tracks: list[Track]
+
+
+# Player
+
+
+class State(Struct):
+    time: int
+    position: int
+    connected: bool
+    ping: int
+
+
+class Voice(Struct):
+    token: str
+    endpoint: str
+    session_id: str
+
+
+class Player(Struct, kw_only=True):
+    guild_id: str
+    track: Track | None = None
+    volume: int
+    paused: bool
+    state: State
+    voice: Voice
+    filters: dict[str, typing.Any]
+
+
+# Statistics
+
+
+class Memory(Struct):
+    free: int
+    used: int
+    allocated: int
+    reservable: int
+
+
+class Cpu(Struct):
+    cores: int
+    system_load: float
+    lavalink_load: float
+
+
+class FrameStats(Struct):
+    sent: int
+    nulled: int
+    deficit: int
+
+
+class Stats(Struct):
+    players: int
+    playing_players: int
+    uptime: int
+    memory: Memory
+    cpu: Cpu
+    frame_stats: FrameStats | None = None
+
+
+# Websocket
+
+
+class Ready(Struct):
+    resumed: bool
+    session_id: str
+
+
+class PlayerUpdate(Struct):
+    guild_id: str
+    state: State
+
+
+class TrackStartEvent(Struct):
+    guild_id: str
+    track: Track
+
+
+class TrackEndEvent(Struct):
+    guild_id: str
+    track: Track
+    reason: str
+
+
+class TrackExceptionEvent(Struct):
+    guild_id: str
+    track: Track
+    exception: TrackException
+
+
+class TrackStuckEvent(Struct):
+    guild_id: str
+    track: Track
+    threshold_ms: int
+
+
+class WebSocketClosedEvent(Struct):
+    guild_id: str
+    code: int
+    reason: str
+    by_remote: bool
+
+
+# Load results
+
+
+class TrackLoadResult(Struct, tag_field="loadType", tag="track"):
+    data: Track
+
+
+class PlaylistLoadResult(Struct, tag_field="loadType", tag="playlist"):
+    data: Playlist
+
+
+class SearchLoadResult(Struct, tag_field="loadType", tag="search"):
+    data: list[Track]
+
+
+class EmptyLoadResult(Struct, tag_field="loadType", tag="empty"):
+    pass
+
+
+class ErrorLoadResult(Struct, tag_field="loadType", tag="error"):
+    data: TrackException
+
+
+LoadResult: typing.TypeAlias = (
+    TrackLoadResult
+    | PlaylistLoadResult
+    | SearchLoadResult
+    | EmptyLoadResult
+    | ErrorLoadResult
+)
+"""The result of a track load."""
+
+
+def decode(payload: str | bytes, type: typing.Type[StructT]) -> StructT:
+    """Decode a raw json payload, straight into the requested type."""
+    return msgspec.json.decode(payload, type=type)
+
+
+def decode_load_result(payload: str | bytes) -> LoadResult:
+    """Decode a raw json payload, into a load result."""
+    return msgspec.json.decode(payload, type=LoadResult)
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -17,6 +17,7 @@ __all__ = ("RequestT", "RequestorT", "PayloadMappingT", "PayloadSequenceT")
 RequestT = typing.TypeVar(
     "RequestT",
     str,
+    bytes,
     int,
     bool,
     float,
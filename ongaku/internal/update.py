@@ -0,0 +1,85 @@
+"""
+Update.
+
+The pending changes to a player, merged into a single update.
+"""
+
+from __future__ import annotations
+
+import typing
+
+__all__ = ("PlayerUpdate",)
+
+_TRACK_FIELDS: typing.Final[typing.Sequence[str]] = ("position", "end_time")
+"""The fields that only apply to the track they were set with."""
+
+
+class PlayerUpdate:
+    """
+    Player update.
+
+    The pending changes to a player, that are sent to lavalink in a single update.
+
+    Fields are named after the arguments of [update_player][ongaku.rest.RESTClient.update_player].
+    A newer value for a field replaces the older one, and setting a new track drops any
+    position, or end time set before it, as they applied to the previous track.
+    """
+
+    __slots__: typing.Sequence[str] = ("_fields",)
+
+    def __init__(self) -> None:
+        self._fields: typing.MutableMapping[str, typing.Any] = {}
+
+    @property
+    def fields(self) -> typing.Mapping[str, typing.Any]:
+        """The merged fields, to send to lavalink."""
+        return self._fields
+
+    def merge(self, fields: typing.Mapping[str, typing.Any]) -> None:
+        """
+        Merge.
+
+        Merge newer changes into the update.
+
+        Parameters
+        ----------
+        fields
+            The changes, named after the arguments of [update_player][ongaku.rest.RESTClient.update_player].
+        """
+        if "track" in fields:
+            for name in _TRACK_FIELDS:
+                self._fields.pop(name, None)
+
+        no_replace: bool | None = self._fields.get("no_replace")
+
+        self._fields.update(fields)
+
+        # A track that must replace the current one, always wins.
+        if no_replace is False:
+            self._fields["no_replace"] = False
+
+    def __bool__(self) -> bool:
+        return any(name != "no_replace" for name in self._fields)
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -6,10 +6,13 @@ The player function, for all player related things.
 
 from __future__ import annotations
 
-import random
+import contextlib
+import copy
+import functools
 import typing
 import typing as t
 from asyncio import TimeoutError
+from asyncio import current_task
 from asyncio import gather
 
 import hikari
@@ -19,14 +22,21 @@ from ongaku import events
 from ongaku.abc import playlist as playlist_
 from ongaku.abc import track as track_
 from ongaku.abc.events import TrackEndReasonType
-from ongaku.events import PlayerUpdateEvent
-from ongaku.events import TrackEndEvent
 from ongaku.impl.player import Voice
+from ongaku.internal.history import History
 from ongaku.internal.logger import TRACE_LEVEL
 from ongaku.internal.logger import logger
+from ongaku.internal.mailbox import Mailbox
+from ongaku.internal.memory import track_size
+from ongaku.internal.update import PlayerUpdate
+from ongaku.queue import Queue
 
 if t.TYPE_CHECKING:
+    from asyncio import Task
+
     from ongaku.abc import player as player_
+    from ongaku.events import PlayerUpdateEvent
+    from ongaku.events import TrackEndEvent
     from ongaku.internal.types import RequestorT
     from ongaku.session import Session
 
@@ -34,6 +44,74 @@ _logger = logger.getChild("player")
 
 __all__ = ("Player",)
 
+_LOCAL_FIELDS: typing.Final[typing.Mapping[str, str]] = {
+    "volume": "_volume",
+    "paused": "_is_paused",
+    "filters": "_filters",
+    "position": "_position",
+    "voice": "_voice",
+}
+"""The update fields that are applied to an optimistic player straight away, and the attribute each is stored in."""
+
+_SKIPPABLE_FIELDS: typing.Final[frozenset[str]] = frozenset(
+    ("volume", "paused", "filters")
+)
+"""The update fields that are not sent, when they already match the player."""
+
+_P = typing.ParamSpec("_P")
+_T = typing.TypeVar("_T")
+
+_MethodT = typing.Callable[
+    typing.Concatenate["Player", _P], typing.Coroutine[typing.Any, typing.Any, _T]
+]
+
+
+def _operation(
+    *, batch: bool = True
+) -> typing.Callable[[_MethodT[_P, _T]], _MethodT[_P, _T]]:
+    """
+    Operation.
+
+    Run the player method through the players mailbox, when it has one.
+
+    Methods called from inside a [batch][ongaku.player.Player.batch], are run straight away, as part of it.
+
+    Parameters
+    ----------
+    batch
+        Whether the method can be merged with the operations around it.
+    """
+
+    def decorator(function: _MethodT[_P, _T]) -> _MethodT[_P, _T]:
+        @functools.wraps(function)
+        async def wrapper(self: Player, *args: _P.args, **kwargs: _P.kwargs) -> _T:
+            if self._mailbox is None or current_task() in self._pending:
+                return await function(self, *args, **kwargs)
+
+            return await self._mailbox.submit(
+                functools.partial(function, self, *args, **kwargs), batch=batch
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def _check_limit(value: int, limit: int | None, reason: str) -> None:
+    if limit is not None and value > limit:
+        raise errors.PlayerQueueLimitError(reason)
+
+
+def _requested(track: track_.Track, requestor: hikari.Snowflake) -> track_.Track:
+    if track.requestor == requestor:
+        return track
+
+    # The same track can be shared, or already queued, so the requestor is set on a copy.
+    track = copy.copy(track)
+    track._requestor = requestor
+
+    return track
+
 
 class Player:
     """
@@ -41,6 +119,10 @@ class Player:
 
     The class that allows the player, to play songs, and more.
 
+    !!! note
+        The player registers itself with its session, so that only its own guild's
+        track end and player update events are routed to it.
+
     Parameters
     ----------
     session
@@ -64,6 +146,9 @@ class Player:
         "_volume",
         "_autoplay",
         "_position",
+        "_pending",
+        "_mailbox",
+        "_history",
     )
 
     def __init__(
@@ -78,16 +163,23 @@ class Player:
         self._is_paused = True
         self._voice: player_.Voice | None = None
         self._state: player_.State | None = None
-        self._queue: typing.MutableSequence[track_.Track] = []
+        self._queue = Queue()
         self._filters: typing.Mapping[str, typing.Any] = {}
         self._connected: bool = False
         self._session_id: str | None = None
         self._volume: int = -1
         self._autoplay: bool = True
         self._position: int = 0
+        self._pending: dict[Task[typing.Any], PlayerUpdate] = {}
+        self._mailbox = (
+            Mailbox(self.batch) if session.client.player_config.mailbox else None
+        )
+        self._history = History(
+            session.client.player_config.history,
+            session.client.player_config.history_bytes,
+        )
 
-        self.app.event_manager.subscribe(TrackEndEvent, self._track_end_event)
-        self.app.event_manager.subscribe(PlayerUpdateEvent, self._player_update_event)
+        session._players[self._guild_id] = self
 
     @property
     def session(self) -> Session:
@@ -158,10 +250,18 @@ class Player:
         return self._connected
 
     @property
-    def queue(self) -> t.Sequence[track_.Track]:
-        """The current queue of tracks."""
+    def queue(self) -> Queue:
+        """The current queue of tracks, with the current track first."""
         return self._queue
 
+    @property
+    def history(self) -> t.Sequence[track_.Track]:
+        """History.
+
+        The tracks that have been played, newest first.
+        """
+        return tuple(self._history)
+
     @property
     def voice(self) -> player_.Voice | None:
         """The player's voice state."""
@@ -177,6 +277,7 @@ class Player:
         """Filters for the player."""
         return self._filters
 
+    @_operation(batch=False)
     async def connect(
         self,
         channel: hikari.SnowflakeishOr[hikari.GuildVoiceChannel],
@@ -273,13 +374,7 @@ class Player:
 
         self._voice = new_voice
 
-        player = await self.session.client.rest.update_player(
-            session,
-            self.guild_id,
-            voice=new_voice,
-            no_replace=False,
-            session=self.session,
-        )
+        await self._update_player(session, voice=new_voice, no_replace=False)
 
         self._is_alive = True
 
@@ -288,8 +383,7 @@ class Player:
             f"Successfully connected, and sent data to lavalink for channel: {self.channel_id} in guild: {self.guild_id}",
         )
 
-        self._update(player)
-
+    @_operation(batch=False)
     async def disconnect(self) -> None:
         """
         Disconnect.
@@ -347,6 +441,7 @@ class Player:
             f"Successfully updated voice state for channel: {self.channel_id} in guild: {self.guild_id}",
         )
 
+    @_operation()
     async def play(
         self, track: track_.Track | None = None, requestor: RequestorT | None = None
     ) -> None:
@@ -365,7 +460,7 @@ class Player:
         track
             The track you wish to play. If none, pulls from the queue.
         requestor
-            The member who requested the track.
+            The member who requested the track. The requestor is set on a copy of the track, so the track given is not changed.
 
         Raises
         ------
@@ -392,36 +487,38 @@ class Player:
 
         if track:
             if requestor:
-                track._requestor = hikari.Snowflake(requestor)
+                track = _requested(track, hikari.Snowflake(requestor))
 
-            self._queue.insert(0, track)
+            self._queue.appendleft(track)
 
-        player = await self.session.client.rest.update_player(
-            session,
-            self.guild_id,
-            track=self.queue[0],
-            no_replace=False,
-            session=self.session,
-        )
+        await self._update_player(session, track=self.queue[0], no_replace=False)
 
         self._is_paused = False
 
-        self._update(player)
-
     def add(
         self,
         tracks: t.Sequence[track_.Track] | playlist_.Playlist | track_.Track,
         requestor: RequestorT | None = None,
+        *,
+        unique: bool = False,
     ) -> None:
         """
         Add tracks.
 
         Add tracks to the queue.
 
+        !!! tip
+            Set `unique` to skip tracks that are already queued. This is checked against the queue's index
+            of identifiers, so it does not search the queue.
+
         !!! note
             This will not automatically start playing the songs.
             please call `.play()` after, with no track, if the player is not already playing.
 
+        !!! note
+            If the [player config][ongaku.config.PlayerConfig] limits the queue, no tracks are added if any
+            limit would be gone over. Tracks skipped by `unique` still count towards the limits.
+
         Example
         -------
         ```py
@@ -433,35 +530,41 @@ class Player:
         tracks
             The list of tracks or a singular track you wish to add to the queue.
         requestor
-            The user/member who requested the song.
+            The user/member who requested the song. The requestor is set on copies of the tracks, so the tracks given are not changed.
+        unique
+            Whether to skip tracks with the same identifier as a track that is already queued.
+
+        Raises
+        ------
+        PlayerQueueLimitError
+            Raised when adding the tracks would go over a limit of the queue.
         """
         new_requestor = None
 
         if requestor:
             new_requestor = hikari.Snowflake(requestor)
 
-        track_count = 0
+        track_count = len(self._queue)
 
         if isinstance(tracks, track_.Track):
-            if new_requestor:
-                tracks._requestor = new_requestor
-            self._queue.append(tracks)
-            track_count = 1
-            return
+            tracks = [tracks]
 
         if isinstance(tracks, playlist_.Playlist):
             tracks = tracks.tracks
 
-        for track in tracks:
-            if new_requestor:
-                track._requestor = new_requestor
-            self._queue.append(track)
-            track_count += 1
+        if new_requestor:
+            tracks = [_requested(track, new_requestor) for track in tracks]
+
+        self._check_limits(tracks)
+
+        self._queue.extend(tracks, unique=unique)
+        track_count = len(self._queue) - track_count
 
         _logger.log(
             TRACE_LEVEL, f"Successfully added {track_count} track(s) to {self.guild_id}"
         )
 
+    @_operation()
     async def pause(self, value: bool | None = None) -> None:
         """
         Pause the player.
@@ -497,22 +600,16 @@ class Player:
         """
         session = self.session._get_session_id()
 
-        if value:
-            self._is_paused = value
-        else:
-            self._is_paused = not self.is_paused
+        paused = value if value is not None else not self.is_paused
 
-        player = await self.session.client.rest.update_player(
-            session, self.guild_id, paused=self.is_paused, session=self.session
-        )
+        await self._update_player(session, paused=paused)
 
         _logger.log(
             TRACE_LEVEL,
             f"Successfully set paused state to {self.is_paused} in guild {self.guild_id}",
         )
 
-        self._update(player)
-
+    @_operation()
     async def stop(self) -> None:
         """
         Stop current track.
@@ -543,17 +640,13 @@ class Player:
         """
         session = self.session._get_session_id()
 
-        player = await self.session.client.rest.update_player(
-            session, self.guild_id, track=None, no_replace=False, session=self.session
-        )
+        await self._update_player(session, track=None, no_replace=False)
 
         self._is_paused = True
 
         _logger.log(TRACE_LEVEL, f"Successfully stopped track in guild {self.guild_id}")
 
-        self._update(player)
-
-    def shuffle(self) -> None:
+    def shuffle(self, *, seed: int | None = None) -> None:
         """Shuffle.
 
         Shuffle the current queue.
@@ -561,6 +654,15 @@ class Player:
         !!! note
             This will not touch the first track.
 
+        !!! tip
+            The queue is shuffled as it is played, so this is instant for any size of queue.
+            To put the queue back in its original order, use [unshuffle][ongaku.queue.Queue.unshuffle].
+
+        Parameters
+        ----------
+        seed
+            The seed for the order of the tracks.
+
         Raises
         ------
         PlayerQueueError
@@ -571,20 +673,13 @@ class Player:
                 "Queue must have more than 2 tracks to shuffle."
             )
 
-        new_queue = list(self.queue)
-
-        first_track = new_queue.pop(0)
-
-        random.shuffle(new_queue)
-
-        new_queue.insert(0, first_track)
-
-        self._queue = new_queue
+        self._queue.shuffle(seed=seed)
 
         _logger.log(
             TRACE_LEVEL, f"Successfully shuffled queue in guild {self.guild_id}"
         )
 
+    @_operation()
     async def skip(self, amount: int = 1) -> None:
         """
         Skip songs.
@@ -624,43 +719,148 @@ class Player:
         if len(self.queue) == 0:
             raise errors.PlayerQueueError("Queue is empty.")
 
-        removed_tracks = 0
-        for _ in range(amount):
-            if len(self._queue) == 0:
-                break
-            else:
-                self._queue.pop(0)
-                removed_tracks += 1
+        removed_tracks = self._queue.skip(amount)
+
+        # Only the track that was playing has been played.
+        if removed_tracks:
+            self._history.push(removed_tracks[0])
 
         _logger.log(
             TRACE_LEVEL,
-            f"Successfully removed {removed_tracks} track(s) out of {amount} in guild {self.guild_id}",
+            f"Successfully removed {len(removed_tracks)} track(s) out of {amount} in guild {self.guild_id}",
         )
 
         session = self.session._get_session_id()
 
         if len(self.queue) <= 0:
-            player = await self.session.client.rest.update_player(
-                session,
-                self.guild_id,
-                track=None,
-                no_replace=False,
-                session=self.session,
-            )
-
-            self._update(player)
+            await self._update_player(session, track=None, no_replace=False)
         else:
-            player = await self.session.client.rest.update_player(
-                session,
-                self.guild_id,
-                track=self.queue[0],
-                no_replace=False,
-                session=self.session,
+            await self._update_player(session, track=self.queue[0], no_replace=False)
+
+        _logger.log(TRACE_LEVEL, f"Successfully skipped track in {self.guild_id}")
+
+    @_operation()
+    async def previous(self) -> None:
+        """
+        Previous.
+
+        Play the last track in the [history][ongaku.player.Player.history] again.
+
+        The track is put back at the start of the queue, before the current track, and played
+        with a single update, without loading it again.
+
+        Example
+        -------
+        ```py
+        await player.previous()
+        ```
+
+        Raises
+        ------
+        SessionStartError
+            Raised when the players session has not yet been started.
+        PlayerConnectError
+            Raised when the player is not connected to a channel.
+        PlayerQueueError
+            Raised when the history is empty.
+        RestEmptyError
+            Raised when a return type was requested, yet nothing was received.
+        RestStatusError
+            Raised when nothing was received, but a 4XX/5XX error was reported.
+        RestRequestError
+            Raised when a rest error is returned with a 4XX/5XX error.
+        BuildError
+            Raised when a construction of a ABC class fails.
+        """
+        session = self.session._get_session_id()
+
+        if self.channel_id is None:
+            raise errors.PlayerConnectError("Not connected to a channel.")
+
+        try:
+            track = self._history.pop()
+        except IndexError:
+            raise errors.PlayerQueueError("History is empty.") from None
+
+        self._queue.appendleft(track)
+
+        try:
+            await self._update_player(session, track=track, no_replace=False)
+        except BaseException:
+            # Nothing was played, so the track goes back to the history.
+            self._queue.popleft()
+            self._history.push(track)
+            raise
+
+        self._is_paused = False
+
+        _logger.log(
+            TRACE_LEVEL, f"Successfully played previous track in {self.guild_id}"
+        )
+
+    @_operation()
+    async def replay(self) -> None:
+        """
+        Replay.
+
+        Play the current track again, from the start.
+
+        If the queue is empty, the last track in the [history][ongaku.player.Player.history] is played again instead.
+        Either way, this is a single update, without loading the track again.
+
+        Example
+        -------
+        ```py
+        await player.replay()
+        ```
+
+        Raises
+        ------
+        SessionStartError
+            Raised when the players session has not yet been started.
+        PlayerConnectError
+            Raised when the player is not connected to a channel.
+        PlayerQueueError
+            Raised when the queue and history are empty.
+        RestEmptyError
+            Raised when a return type was requested, yet nothing was received.
+        RestStatusError
+            Raised when nothing was received, but a 4XX/5XX error was reported.
+        RestRequestError
+            Raised when a rest error is returned with a 4XX/5XX error.
+        BuildError
+            Raised when a construction of a ABC class fails.
+        """
+        session = self.session._get_session_id()
+
+        if self.channel_id is None:
+            raise errors.PlayerConnectError("Not connected to a channel.")
+
+        restored: track_.Track | None = None
+
+        if not self._queue:
+            try:
+                restored = self._history.pop()
+            except IndexError:
+                raise errors.PlayerQueueError("Queue and history are empty.") from None
+
+            self._queue.appendleft(restored)
+
+        try:
+            await self._update_player(
+                session, track=self._queue[0], position=0, no_replace=False
             )
+        except BaseException:
+            if restored is not None:
+                # Nothing was played, so the track goes back to the history.
+                self._queue.popleft()
+                self._history.push(restored)
 
-            self._update(player)
+            raise
 
-        _logger.log(TRACE_LEVEL, f"Successfully skipped track in {self.guild_id}")
+        self._is_paused = False
+
+        _logger.log(TRACE_LEVEL, f"Successfully replayed track in {self.guild_id}")
 
     def remove(self, value: track_.Track | int) -> None:
         """
@@ -718,6 +918,43 @@ class Player:
 
         _logger.log(TRACE_LEVEL, f"Successfully removed track in {self.guild_id}")
 
+    def remove_requestor(self, requestor: RequestorT) -> t.Sequence[track_.Track]:
+        """
+        Remove requestor.
+
+        Removes every track requested by someone.
+
+        !!! warning
+            This does not stop the track if its in the first position.
+
+        Example
+        -------
+        ```py
+        removed = player.remove_requestor(ctx.author)
+
+        await ctx.respond(f"Removed {len(removed)} of your tracks.")
+        ```
+
+        Parameters
+        ----------
+        requestor
+            The user/member who requested the tracks.
+
+        Returns
+        -------
+        typing.Sequence[Track]
+            The tracks that were removed.
+        """
+        removed = self._queue.remove_requestor(hikari.Snowflake(requestor))
+
+        _logger.log(
+            TRACE_LEVEL,
+            f"Successfully removed {len(removed)} track(s) from {requestor} in {self.guild_id}",
+        )
+
+        return removed
+
+    @_operation()
     async def clear(self) -> None:
         """
         Clear the queue.
@@ -747,11 +984,7 @@ class Player:
 
         session = self.session._get_session_id()
 
-        player = await self.session.client.rest.update_player(
-            session, self.guild_id, track=None, no_replace=False, session=self.session
-        )
-
-        self._update(player)
+        await self._update_player(session, track=None, no_replace=False)
 
         _logger.log(TRACE_LEVEL, f"Successfully cleared queue in {self.guild_id}")
 
@@ -780,6 +1013,76 @@ class Player:
 
         return self._autoplay
 
+    def set_fair(self, enable: bool | None = None) -> bool:
+        """
+        Set fair share.
+
+        With fair share, requestors take turns when the next track is picked, so one requestor adding a large playlist
+        does not hold up everyone else. See [set_fair][ongaku.queue.Queue.set_fair] for more.
+
+        Example
+        -------
+        ```py
+        player.set_fair(True)
+        ```
+
+        Parameters
+        ----------
+        enable
+            Whether or not to enable fair share. If left empty, it will toggle the current status.
+
+        Returns
+        -------
+        bool
+            Whether fair share is enabled.
+        """
+        fair = self._queue.set_fair(enable)
+
+        _logger.log(
+            TRACE_LEVEL, f"Set fair share to {fair} for queue in guild {self.guild_id}"
+        )
+
+        return fair
+
+    def time_until(self, position: int | None = None) -> int | None:
+        """
+        Time until.
+
+        The time until a track in the queue starts playing, in milliseconds, or until the queue ends.
+
+        This uses the last known [position][ongaku.player.Player.position] of the current track,
+        and the [duration][ongaku.queue.Queue.duration] of the queue, so it is `O(log n)`.
+
+        Example
+        -------
+        ```py
+        for index, track in enumerate(player.queue[10:20], 10):
+            print(track.info.title, player.time_until(index))
+        ```
+
+        Parameters
+        ----------
+        position
+            The position of the track in the queue. By default, the end of the queue.
+
+        Returns
+        -------
+        int
+            The time, in milliseconds.
+        None
+            A stream plays before it, so the time is unknown.
+        """
+        if position == 0 or not self._queue:
+            return 0
+
+        duration = self._queue.duration(position)
+
+        if duration is None:
+            return None
+
+        return max(duration - self._position, 0)
+
+    @_operation()
     async def set_volume(self, volume: int = 100) -> None:
         """
         Set the volume.
@@ -823,20 +1126,13 @@ class Player:
             if volume > 1000:
                 raise ValueError(f"Volume cannot be above 1000. Volume: {volume}")
 
-        player = await self.session.client.rest.update_player(
-            session,
-            self.guild_id,
-            volume=volume,
-            no_replace=False,
-            session=self.session,
-        )
-
-        self._update(player)
+        await self._update_player(session, volume=volume, no_replace=False)
 
         _logger.log(
             TRACE_LEVEL, f"Successfully set volume to {volume} in {self.guild_id}"
         )
 
+    @_operation()
     async def set_position(self, value: int) -> None:
         """
         Set the position.
@@ -884,21 +1180,123 @@ class Player:
                 "A value greater than the current tracks length is not allowed."
             )
 
-        player = await self.session.client.rest.update_player(
-            session,
-            self.guild_id,
-            position=value,
-            no_replace=False,
-            session=self.session,
+        await self._update_player(session, position=value, no_replace=False)
+
+        _logger.log(
+            TRACE_LEVEL,
+            f"Successfully set position ({value}) to track in {self.guild_id}",
         )
 
-        self._update(player)
+    @_operation()
+    async def set_filters(self, filters: typing.Mapping[str, typing.Any]) -> None:
+        """
+        Set the filters.
+
+        Replace the filters of the player.
+
+        Example
+        -------
+        ```py
+        await player.set_filters({"timescale": {"speed": 1.2}})
+        ```
+
+        Parameters
+        ----------
+        filters
+            The filters you wish to set. An empty mapping removes every filter.
+
+        Raises
+        ------
+        SessionStartError
+            Raised when the players session has not yet been started.
+        RestEmptyError
+            Raised when a return type was requested, yet nothing was received.
+        RestStatusError
+            Raised when nothing was received, but a 4XX/5XX error was reported.
+        RestRequestError
+            Raised when a rest error is returned with a 4XX/5XX error.
+        BuildError
+            Raised when a construction of a ABC class fails.
+        """
+        session = self.session._get_session_id()
+
+        await self._update_player(session, filters=filters)
+
+        _logger.log(TRACE_LEVEL, f"Successfully set filters in {self.guild_id}")
+
+    @contextlib.asynccontextmanager
+    async def batch(self) -> typing.AsyncGenerator[None, None]:
+        """
+        Batch.
+
+        Merge every change made inside the block, into a single update sent to lavalink when the block exits.
+
+        Inside the block, methods such as [pause][ongaku.player.Player.pause] and [set_volume][ongaku.player.Player.set_volume]
+        return straight away, and any errors from lavalink are raised when the block exits.
+        Newer changes replace older ones, so only the final state is sent.
+        If the block raises, nothing is sent.
+
+        Only changes made by the task that opened the block are merged, changes from other tasks are sent as usual.
+
+        With an [optimistic][ongaku.config.PlayerConfig.optimistic] player, changes are applied as they are made,
+        and rolled back if the block raises, or the update fails.
+
+        Example
+        -------
+        ```py
+        async with player.batch():
+            await player.set_volume(50)
+            await player.set_position(10000)
+            await player.pause(False)
+        ```
+
+        Raises
+        ------
+        RestEmptyError
+            Raised when a return type was requested, yet nothing was received.
+        RestStatusError
+            Raised when nothing was received, but a 4XX/5XX error was reported.
+        RestRequestError
+            Raised when a rest error is returned with a 4XX/5XX error.
+        BuildError
+            Raised when a construction of a ABC class fails.
+        """
+        task = current_task()
+
+        if task is None or task in self._pending:
+            # Nested batches join the outer batch.
+            yield
+            return
+
+        snapshot = (
+            self._snapshot() if self.session.client.player_config.optimistic else None
+        )
+
+        self._pending[task] = PlayerUpdate()
+
+        try:
+            yield
+        except BaseException:
+            update = self._pending.pop(task)
+
+            if snapshot is not None:
+                self._rollback(snapshot, update.fields)
+
+            raise
+
+        update = self._pending.pop(task)
+
+        if not update:
+            return
 
         _logger.log(
             TRACE_LEVEL,
-            f"Successfully set position ({value}) to track in {self.guild_id}",
+            f"Sending batched update ({', '.join(update.fields)}) in {self.guild_id}",
         )
 
+        await self._send_update(self.session._get_session_id(), update.fields, snapshot)
+
+    @_operation(batch=False)
     async def transfer(self, session: Session) -> Player:
         """Transfer.
 
@@ -925,6 +1323,9 @@ class Player:
         new_player = Player(session, self.guild_id)
 
         new_player.add(self.queue)
+        new_player._history = self._history
+
+        self._detach()
 
         if self.connected and self.channel_id:
             await self.disconnect()
@@ -941,6 +1342,161 @@ class Player:
 
         return new_player
 
+    async def _restore(self) -> None:
+        if not self.is_alive or self.voice is None:
+            return
+
+        session = self.session._get_session_id()
+
+        _logger.log(
+            TRACE_LEVEL,
+            f"Restoring player for channel: {self.channel_id} in guild: {self.guild_id}",
+        )
+
+        player = await self.session.client.rest.update_player(
+            session,
+            self.guild_id,
+            track=self.queue[0] if len(self.queue) > 0 else None,
+            position=self.state.position if self.state else hikari.UNDEFINED,
+            volume=self.volume if self.volume >= 0 else hikari.UNDEFINED,
+            paused=self.is_paused,
+            voice=self.voice,
+            no_replace=False,
+            session=self.session,
+        )
+
+        self._update(player)
+
+    async def _update_player(self, session_id: str, **fields: typing.Any) -> None:
+        snapshot: typing.Mapping[str, typing.Any] | None = None
+
+        if self.session.client.player_config.optimistic:
+            snapshot = self._snapshot()
+
+            fields = self._apply(fields)
+
+            if fields.keys() <= {"no_replace"}:
+                _logger.log(
+                    TRACE_LEVEL,
+                    f"Skipping update in {self.guild_id}, as nothing has changed",
+                )
+                return
+
+        task = current_task()
+
+        if task is not None and task in self._pending:
+            self._pending[task].merge(fields)
+            return
+
+        await self._send_update(session_id, fields, snapshot)
+
+    async def _send_update(
+        self,
+        session_id: str,
+        fields: typing.Mapping[str, typing.Any],
+        snapshot: typing.Mapping[str, typing.Any] | None,
+    ) -> None:
+        try:
+            player = await self.session.client.rest.update_player(
+                session_id, self.guild_id, **fields, session=self.session
+            )
+        except BaseException:
+            if snapshot is not None:
+                _logger.log(
+                    TRACE_LEVEL,
+                    f"Rolling back failed update ({', '.join(fields)}) in {self.guild_id}",
+                )
+                self._rollback(snapshot, fields)
+
+            raise
+
+        self._update(player)
+
+    def _apply(self, fields: typing.Mapping[str, typing.Any]) -> dict[str, typing.Any]:
+        changed: dict[str, typing.Any] = {}
+
+        for name, value in fields.items():
+            attribute = _LOCAL_FIELDS.get(name)
+
+            if attribute is None:
+                changed[name] = value
+                continue
+
+            if name in _SKIPPABLE_FIELDS and getattr(self, attribute) == value:
+                continue
+
+            setattr(self, attribute, value)
+            changed[name] = value
+
+        return changed
+
+    def _check_limits(self, tracks: t.Sequence[track_.Track]) -> None:
+        config = self.session.client.player_config
+
+        # Only weigh the tracks if there is a limit on their size.
+        if config.max_bytes is None and config.max_requestor_bytes is None:
+            sizes = [0] * len(tracks)
+        else:
+            sizes = [track_size(track) for track in tracks]
+
+        _check_limit(
+            len(self._queue) + len(tracks),
+            config.max_tracks,
+            f"The queue is limited to {config.max_tracks} tracks.",
+        )
+        _check_limit(
+            self._queue.size + sum(sizes),
+            config.max_bytes,
+            f"The queue is limited to {config.max_bytes} bytes.",
+        )
+
+        if config.max_requestor_tracks is None and config.max_requestor_bytes is None:
+            return
+
+        requested: dict[hikari.Snowflake, tuple[int, int]] = {}
+
+        for track, size in zip(tracks, sizes):
+            if track.requestor is not None:
+                count, total = requested.get(track.requestor, (0, 0))
+                requested[track.requestor] = (count + 1, total + size)
+
+        for requestor, (count, total) in requested.items():
+            _check_limit(
+                self._queue.count_requestor(requestor) + count,
+                config.max_requestor_tracks,
+                f"Requestors are limited to {config.max_requestor_tracks} tracks in the queue.",
+            )
+            _check_limit(
+                self._queue.requestor_size(requestor) + total,
+                config.max_requestor_bytes,
+                f"Requestors are limited to {config.max_requestor_bytes} bytes in the queue.",
+            )
+
+    def _snapshot(self) -> typing.Mapping[str, typing.Any]:
+        return {
+            attribute: getattr(self, attribute) for attribute in _LOCAL_FIELDS.values()
+        }
+
+    def _rollback(
+        self,
+        snapshot: typing.Mapping[str, typing.Any],
+        fields: typing.Mapping[str, typing.Any],
+    ) -> None:
+        for name, value in fields.items():
+            attribute = _LOCAL_FIELDS.get(name)
+
+            # Only fields still holding the value this update set are restored, so other updates made since are kept.
+            if (
+                attribute is not None
+                and attribute in snapshot
+                and getattr(self, attribute) == value
+            ):
+                setattr(self, attribute, snapshot[attribute])
+
+    def _detach(self) -> None:
+        if self.session._players.get(self.guild_id) is self:
+            self.session._players.pop(self.guild_id)
+
     def _update(self, player: player_.Player) -> None:
         _logger.log(
             TRACE_LEVEL,
@@ -954,16 +1510,27 @@ class Player:
         self._filters = player.filters
 
     async def _track_end_event(self, event: TrackEndEvent) -> None:
+        # The queue event is dispatched once the autoplay operation has left the
+        # mailbox, so listeners can call back into the player without deadlocking.
+        queue_event = await self._advance(event)
+
+        if queue_event is not None:
+            await self.app.event_manager.dispatch(queue_event)
+
+    @_operation()
+    async def _advance(
+        self, event: TrackEndEvent
+    ) -> events.QueueEmptyEvent | events.QueueNextEvent | None:
         self.session._get_session_id()
 
         if not self.autoplay:
-            return
+            return None
 
         if (
             event.reason != TrackEndReasonType.FINISHED
             and event.reason != TrackEndReasonType.LOADFAILED
         ):
-            return
+            return None
 
         _logger.log(
             TRACE_LEVEL,
@@ -971,27 +1538,32 @@ class Player:
         )
 
         if event.guild_id != self.guild_id:
-            return
+            return None
         _logger.log(
             TRACE_LEVEL,
             f"Removing current track from queue for channel: {self.channel_id} in guild: {self.guild_id}",
         )
 
         if len(self.queue) == 0:
-            return
+            return None
 
         if len(self.queue) == 1:
-            new_event = events.QueueEmptyEvent.from_session(
-                self.session, self.guild_id, self.queue[0]
-            )
+            last_track = self._queue.popleft()
 
-            self.remove(0)
+            if event.reason == TrackEndReasonType.FINISHED:
+                self._history.push(last_track)
 
-            await self.app.event_manager.dispatch(new_event)
+            if self.session.client._should_dispatch(events.QueueEmptyEvent):
+                return events.QueueEmptyEvent.from_session(
+                    self.session, self.guild_id, last_track
+                )
 
-            return
+            return None
 
-        self.remove(0)
+        finished_track = self._queue.popleft()
+
+        if event.reason == TrackEndReasonType.FINISHED:
+            self._history.push(finished_track)
 
         _logger.log(
             TRACE_LEVEL,
@@ -1000,17 +1572,18 @@ class Player:
 
         await self.play()
 
-        await self.app.event_manager.dispatch(
-            events.QueueNextEvent.from_session(
-                self.session, self.guild_id, self._queue[0], event.track
-            )
-        )
-
         _logger.log(
             TRACE_LEVEL,
             f"Auto-playing successfully completed for channel: {self.channel_id} in guild: {self.guild_id}",
         )
 
+        if self.session.client._should_dispatch(events.QueueNextEvent):
+            return events.QueueNextEvent.from_session(
+                self.session, self.guild_id, self._queue[0], event.track
+            )
+
+        return None
+
     async def _player_update_event(self, event: PlayerUpdateEvent) -> None:
         if event.guild_id != self.guild_id:
             return
@@ -1029,6 +1602,7 @@ class Player:
         )
 
         self._state = event.state
+        self._position = event.state.position
 
 
 # MIT License
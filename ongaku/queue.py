@@ -0,0 +1,951 @@
+"""
+Queue.
+
+The queue of tracks, waiting to be played by a player.
+"""
+
+from __future__ import annotations
+
+import collections
+import typing
+
+import hikari
+
+from ongaku.abc import track as track_
+from ongaku.internal.chunked import ChunkedList
+from ongaku.internal.fair import FairShare
+from ongaku.internal.memory import track_size
+from ongaku.internal.shuffle import Shuffle
+
+if typing.TYPE_CHECKING:
+    from ongaku.internal.shuffle import Draw
+
+__all__ = ("Queue",)
+
+_STREAM: typing.Final[int] = 1 << 48
+"""The weight of a stream. Streams have no length, so any total including one is at least this."""
+
+
+class Queue(typing.MutableSequence["track_.Track"]):
+    """
+    Queue.
+
+    The tracks waiting to be played by a player, with the current track first.
+
+    The queue can be used like a list of tracks. Tracks are stored in chunks, with an index of their positions, so
+    finding, inserting, removing or moving a track at any position is `O(log n)`, and a slice (such as a page of the
+    queue) only visits the tracks it returns. Taking tracks from (and adding them to) the start of it
+    only touches the first chunk, no matter how many tracks are queued.
+
+    The queue also counts its tracks by requestor, and by identifier, so checking whether a track is queued
+    (or how many tracks, and how much memory, someone has queued) is `O(1)`. The lengths of the tracks are summed per chunk too, so the
+    [duration][ongaku.queue.Queue.duration] of the queue, up to any position, is `O(log n)`.
+
+    Example
+    -------
+    ```py
+    queue = player.queue
+
+    print(queue.current)
+
+    for track in queue[1:10]:
+        print(track.info.title)
+
+    queue.move(742, 3)
+
+    if queue.count_identifier(track.info.identifier):
+        print("Already queued!")
+    ```
+
+    Parameters
+    ----------
+    tracks
+        The tracks to start the queue with.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_fair",
+        "_identifiers",
+        "_records",
+        "_requestors",
+        "_shuffle",
+        "_size",
+        "_sizes",
+        "_tracks",
+        "_weights",
+    )
+
+    def __init__(self, tracks: typing.Iterable[track_.Track] = ()) -> None:
+        self._tracks: ChunkedList[track_.Track] = ChunkedList(
+            tracks, weight=_duration, key=_requestor
+        )
+        self._shuffle: Shuffle | None = None
+        self._fair: FairShare | None = None
+        # The draw of each track in the queue while shuffled, or None for tracks that were placed.
+        self._records: ChunkedList[Draw | None] = ChunkedList()
+        # Every queued track, counted by requestor and by identifier, wherever it is waiting.
+        self._requestors: collections.Counter[hikari.Snowflake | None] = (
+            collections.Counter()
+        )
+        self._identifiers: collections.Counter[str] = collections.Counter()
+        # The approximate size (in bytes) of every queued track, and of each requestors tracks.
+        self._sizes: collections.Counter[hikari.Snowflake | None] = (
+            collections.Counter()
+        )
+        self._size = 0
+        # The size counted for each queued track (by id) when it was added, and how many times it is queued.
+        self._weights: dict[int, tuple[int, int]] = {}
+
+        self._index(self._tracks)
+
+    @property
+    def current(self) -> track_.Track | None:
+        """The current track, or `None` if the queue is empty."""
+        self._draw(1)
+
+        return self._tracks[0] if self._tracks else None
+
+    @property
+    def size(self) -> int:
+        """The approximate size (in bytes) of every track in the queue."""
+        return self._size
+
+    @property
+    def shuffled(self) -> bool:
+        """Whether the queue is shuffled."""
+        return self._shuffle is not None
+
+    @property
+    def fair(self) -> bool:
+        """Whether requestors take turns, with fair share."""
+        return self._fair is not None
+
+    def append(self, value: track_.Track, *, unique: bool = False) -> None:
+        """
+        Append.
+
+        Add a track to the end of the queue.
+
+        If the queue is shuffled, the track is shuffled in with the tracks that have not been played.
+        With fair share, the track waits for the next turn of its requestor.
+
+        Parameters
+        ----------
+        value
+            The track to add.
+        unique
+            Whether to skip the track, if a track with the same identifier is already queued.
+        """
+        if unique and value.info.identifier in self._identifiers:
+            return
+
+        self._index((value,))
+
+        if self._shuffle is not None:
+            self._shuffle.pool.append(value)
+            return
+
+        if self._fair is not None:
+            self._fair.append(value)
+            return
+
+        self._tracks.append(value)
+
+    def appendleft(self, value: track_.Track) -> None:
+        """
+        Append left.
+
+        Add a track to the start of the queue, making it the current track.
+
+        Parameters
+        ----------
+        value
+            The track to add.
+        """
+        self._tracks.appendleft(value)
+        self._index((value,))
+
+        if self._shuffle is not None:
+            self._records.appendleft(None)
+
+    def extend(
+        self, values: typing.Iterable[track_.Track], *, unique: bool = False
+    ) -> None:
+        """
+        Extend.
+
+        Add tracks to the end of the queue.
+
+        If the queue is shuffled, the tracks are shuffled in with the tracks that have not been played.
+        With fair share, the tracks wait for the next turns of their requestors.
+
+        Parameters
+        ----------
+        values
+            The tracks to add.
+        unique
+            Whether to skip tracks with the same identifier as a track that is already queued, or one added before it.
+        """
+        tracks: list[track_.Track] = []
+
+        for track in values:
+            # Checked one at a time, so duplicates within the tracks are skipped as well.
+            if not unique or track.info.identifier not in self._identifiers:
+                self._index((track,))
+                tracks.append(track)
+
+        values = tracks
+
+        if self._shuffle is not None:
+            self._shuffle.pool.extend(values)
+            return
+
+        if self._fair is not None:
+            self._fair.extend(values)
+            return
+
+        self._tracks.extend(values)
+
+    def insert(self, index: int, value: track_.Track) -> None:
+        """
+        Insert.
+
+        Insert a track before the position given.
+
+        Parameters
+        ----------
+        index
+            The position to insert the track at.
+        value
+            The track to insert.
+        """
+        if index < 0:
+            index = max(index + len(self), 0)
+
+        self._draw(index)
+        self._put(index, value, None)
+        self._index((value,))
+
+    def popleft(self) -> track_.Track:
+        """
+        Pop left.
+
+        Remove the current track.
+
+        Returns
+        -------
+        Track
+            The track that was removed.
+
+        Raises
+        ------
+        IndexError
+            Raised when the queue is empty.
+        """
+        if not self:
+            raise IndexError("pop from an empty queue")
+
+        return self._take(0)
+
+    def pop(self, index: int = -1) -> track_.Track:
+        """
+        Pop.
+
+        Remove the track at the position given.
+
+        Parameters
+        ----------
+        index
+            The position of the track. By default, the last track.
+
+        Returns
+        -------
+        Track
+            The track that was removed.
+
+        Raises
+        ------
+        IndexError
+            Raised when the queue is empty, or the position is outside of the queue.
+        """
+        if not self:
+            raise IndexError("pop from an empty queue")
+
+        return self._take(self._normalise(index))
+
+    def move(self, source: int, destination: int) -> None:
+        """
+        Move.
+
+        Move a track to another position.
+
+        Parameters
+        ----------
+        source
+            The position of the track.
+        destination
+            The position the track ends up at.
+
+        Raises
+        ------
+        IndexError
+            Raised when either position is outside of the queue.
+        """
+        source = self._normalise(source)
+        destination = self._normalise(destination)
+
+        self._draw(max(source, destination) + 1)
+
+        record = self._records.pop(source) if self._shuffle is not None else None
+
+        self._put(destination, self._tracks.pop(source), record)
+
+    def skip(self, amount: int = 1) -> typing.Sequence[track_.Track]:
+        """
+        Skip.
+
+        Remove tracks from the start of the queue.
+
+        Parameters
+        ----------
+        amount
+            The amount of tracks to remove.
+
+        Returns
+        -------
+        typing.Sequence[Track]
+            The tracks that were removed, which is less than the amount if the queue ran out.
+        """
+        self._draw(amount)
+
+        if self._shuffle is not None:
+            for record in self._records.skip(amount):
+                self._discard(record)
+
+        tracks = self._tracks.skip(amount)
+
+        self._unindex(tracks)
+
+        return tracks
+
+    def shuffle(self, *, seed: int | None = None) -> None:
+        """
+        Shuffle.
+
+        Shuffle every track in the queue, except the current track.
+
+        The queue is not shuffled all at once. Instead, each track is picked at random as it is played, or viewed,
+        so shuffling a large queue is instant. Tracks added while shuffled are shuffled in with the tracks that
+        have not been played, and [unshuffle][ongaku.queue.Queue.unshuffle] puts the queue back in its original order.
+
+        Shuffling a shuffled queue, shuffles it again. Shuffling turns off [fair share][ongaku.queue.Queue.set_fair].
+
+        Parameters
+        ----------
+        seed
+            The seed for the order of the tracks. The same seed, on the same queue, always gives the same order.
+        """
+        self.unshuffle()
+        self.set_fair(False)
+
+        pool = self._tracks.detach(1)
+
+        self._records.replace([None] * len(self._tracks))
+        self._shuffle = Shuffle(pool, seed)
+
+    def unshuffle(self) -> None:
+        """
+        Unshuffle.
+
+        Put the queue back in its original order, without the tracks that have been removed.
+
+        The current track stays first, followed by any tracks that were placed by position (such as with
+        [insert][ongaku.queue.Queue.insert]) while shuffled.
+        """
+        if self._shuffle is None:
+            return
+
+        if self._records:
+            # The current track keeps its place, instead of going back into the pool.
+            self._discard(self._records[0])
+            self._records[0] = None
+
+        pool = self._shuffle.restore()
+
+        self._tracks = ChunkedList(
+            (
+                track
+                for track, record in zip(self._tracks, self._records)
+                if record is None
+            ),
+            weight=_duration,
+            key=_requestor,
+        )
+        self._tracks.join(pool)
+
+        self._records.clear()
+        self._shuffle = None
+
+    def set_fair(self, enable: bool | None = None) -> bool:
+        """
+        Set fair share.
+
+        With fair share, requestors take turns. Each requestor gets the next track of their own,
+        in the order they first added a track, so one large playlist does not hold up everyone else.
+        Tracks without a requestor share a turn.
+
+        The next track is picked as it is played, or viewed, so tracks that have been viewed
+        (such as on a page of the queue) keep their place. Turning fair share off puts the tracks that have not been
+        picked back in the order they were added. Fair share turns off [shuffle][ongaku.queue.Queue.shuffle].
+
+        Example
+        -------
+        ```py
+        queue.set_fair(True)
+        ```
+
+        Parameters
+        ----------
+        enable
+            Whether or not to enable fair share. If left empty, it will toggle the current status.
+
+        Returns
+        -------
+        bool
+            Whether fair share is enabled.
+        """
+        enable = self._fair is None if enable is None else enable
+
+        if enable and self._fair is None:
+            self.unshuffle()
+            self._fair = FairShare(self._tracks.detach(1), weight=_duration)
+        elif not enable and self._fair is not None:
+            self._tracks.extend(self._fair.restore())
+            self._fair = None
+
+        return enable
+
+    def clear(self) -> None:
+        """
+        Clear.
+
+        Remove every track from the queue.
+        """
+        self._tracks.clear()
+        self._records.clear()
+
+        if self._shuffle is not None:
+            self._shuffle.clear()
+
+        if self._fair is not None:
+            self._fair.clear()
+
+        self._requestors.clear()
+        self._identifiers.clear()
+        self._sizes.clear()
+        self._size = 0
+        self._weights.clear()
+
+    def remove_requestor(
+        self, requestor: hikari.Snowflakeish | None
+    ) -> typing.Sequence[track_.Track]:
+        """
+        Remove requestor.
+
+        Remove every track requested by someone.
+
+        The queue counts the requestors in each of its chunks, so only the chunks holding tracks from the requestor are
+        searched, and nothing is searched if they have no tracks queued. With fair share, the tracks of the requestor
+        that are waiting for their turn are removed at once.
+
+        Example
+        -------
+        ```py
+        removed = queue.remove_requestor(ctx.author.id)
+        ```
+
+        Parameters
+        ----------
+        requestor
+            The requestor of the tracks, or `None` for tracks without a requestor.
+
+        Returns
+        -------
+        typing.Sequence[Track]
+            The tracks that were removed, in the order they were queued.
+        """
+        requestor = _snowflake(requestor)
+        if requestor not in self._requestors:
+            return []
+
+        # Remove from the end, so the positions found stay correct.
+        removed = [
+            self._take(index) for index in reversed(self._tracks.find(requestor))
+        ]
+        removed.reverse()
+
+        waiting: list[track_.Track] = []
+
+        if self._fair is not None:
+            waiting = self._fair.remove(requestor)
+        elif self._shuffle is not None:
+            shuffle = self._shuffle
+            positions = shuffle.pool.find(requestor)
+
+            waiting = [shuffle.remove(position) for position in reversed(positions)]
+            waiting.reverse()
+
+        self._unindex(waiting)
+
+        return removed + waiting
+
+    def dedupe(self) -> typing.Sequence[track_.Track]:
+        """
+        Dedupe.
+
+        Remove every track with the same identifier as a track before it.
+
+        If there are no duplicates, this returns straight away, without searching the queue.
+
+        Returns
+        -------
+        typing.Sequence[Track]
+            The tracks that were removed.
+        """
+        if len(self._identifiers) == len(self):
+            return []
+
+        seen: set[str] = set()
+        tracks: list[track_.Track] = []
+        removed: list[track_.Track] = []
+
+        for track in self:
+            if track.info.identifier in seen:
+                removed.append(track)
+            else:
+                seen.add(track.info.identifier)
+                tracks.append(track)
+
+        self._replace(tracks)
+
+        return removed
+
+    def duration(self, stop: int | None = None) -> int | None:
+        """
+        Duration.
+
+        Get the total length of the tracks before a position, in milliseconds.
+
+        This is `O(log n)`, so it can be used for every track on a page of the queue. The length of the whole queue
+        does not need any tracks to be picked, even if it is shuffled, or using fair share.
+
+        Example
+        -------
+        ```py
+        for index, track in enumerate(queue[10:20], 10):
+            print(track.info.title, queue.duration(index))
+        ```
+
+        Parameters
+        ----------
+        stop
+            The position to stop at, not including the track at it. By default, the end of the queue.
+
+        Returns
+        -------
+        int
+            The total length of the tracks.
+        None
+            One of the tracks is a stream, which has no length.
+        """
+        if stop is None or stop >= len(self):
+            total = self._tracks.weight
+
+            if self._shuffle is not None:
+                total += self._shuffle.pool.weight
+
+            if self._fair is not None:
+                total += self._fair.weight
+        else:
+            if stop < 0:
+                stop = max(stop + len(self), 0)
+
+            self._draw(stop)
+
+            total = self._tracks.prefix_weight(stop)
+
+        return total if total < _STREAM else None
+
+    def count_requestor(self, requestor: hikari.Snowflakeish | None) -> int:
+        """
+        Count requestor.
+
+        Get the amount of tracks in the queue, requested by someone.
+
+        Parameters
+        ----------
+        requestor
+            The requestor of the tracks, or `None` for tracks without a requestor.
+        """
+        return self._requestors.get(_snowflake(requestor), 0)
+
+    def requestor_size(self, requestor: hikari.Snowflakeish | None) -> int:
+        """
+        Requestor size.
+
+        Get the approximate size (in bytes) of the tracks in the queue, requested by someone.
+
+        Parameters
+        ----------
+        requestor
+            The requestor of the tracks, or `None` for tracks without a requestor.
+        """
+        return self._sizes.get(_snowflake(requestor), 0)
+
+    def count_identifier(self, identifier: str) -> int:
+        """
+        Count identifier.
+
+        Get the amount of tracks in the queue, with an identifier.
+
+        Parameters
+        ----------
+        identifier
+            The [identifier][ongaku.abc.track.TrackInfo.identifier] of the track.
+        """
+        return self._identifiers.get(identifier, 0)
+
+    def index(self, value: typing.Any, start: int = 0, stop: int | None = None) -> int:
+        """
+        Index.
+
+        Get the position of the first occurrence of a track.
+
+        Parameters
+        ----------
+        value
+            The track to find.
+        start
+            The position to start searching from.
+        stop
+            The position to stop searching at.
+
+        Returns
+        -------
+        int
+            The position of the track.
+
+        Raises
+        ------
+        ValueError
+            Raised when the track is not in the queue.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+
+        if not self._indexed(value):
+            raise ValueError(f"{value!r} is not in queue")
+
+        self._draw(stop)
+
+        try:
+            return self._tracks.index(value, start, stop)
+        except ValueError:
+            raise ValueError(f"{value!r} is not in queue") from None
+
+    def count(self, value: typing.Any) -> int:
+        """
+        Count.
+
+        Get the amount of times a track is in the queue.
+
+        Parameters
+        ----------
+        value
+            The track to count.
+        """
+        if not self._indexed(value):
+            return 0
+
+        count = self._tracks.count(value)
+
+        if self._shuffle is not None:
+            count += self._shuffle.pool.count(value)
+
+        if self._fair is not None:
+            count += self._fair.count(value)
+
+        return count
+
+    @typing.overload
+    def __getitem__(self, index: int) -> track_.Track: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> list[track_.Track]: ...
+
+    def __getitem__(self, index: int | slice) -> track_.Track | list[track_.Track]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+
+            if step == 1:
+                self._draw(stop)
+
+                return self._tracks.slice(start, stop)
+
+            return list(self)[index]
+
+        index = self._normalise(index)
+
+        self._draw(index + 1)
+
+        return self._tracks[index]
+
+    @typing.overload
+    def __setitem__(self, index: int, value: track_.Track) -> None: ...
+
+    @typing.overload
+    def __setitem__(
+        self, index: slice, value: typing.Iterable[track_.Track]
+    ) -> None: ...
+
+    def __setitem__(
+        self,
+        index: int | slice,
+        value: track_.Track | typing.Iterable[track_.Track],
+    ) -> None:
+        if isinstance(index, slice):
+            tracks = list(self)
+            tracks[index] = typing.cast("typing.Iterable[track_.Track]", value)
+
+            self._replace(tracks)
+            return
+
+        index = self._normalise(index)
+
+        self._draw(index + 1)
+
+        self._unindex((self._tracks[index],))
+        self._tracks[index] = typing.cast("track_.Track", value)
+        self._index((self._tracks[index],))
+
+        if self._shuffle is not None:
+            self._discard(self._records[index])
+            self._records[index] = None
+
+    def __delitem__(self, index: int | slice) -> None:
+        if isinstance(index, slice):
+            tracks = list(self)
+            del tracks[index]
+
+            self._replace(tracks)
+            return
+
+        self.pop(index)
+
+    def __len__(self) -> int:
+        if self._shuffle is not None:
+            return len(self._tracks) + len(self._shuffle.pool)
+
+        if self._fair is not None:
+            return len(self._tracks) + len(self._fair)
+
+        return len(self._tracks)
+
+    def __iter__(self) -> typing.Iterator[track_.Track]:
+        yield from self._tracks
+
+        # Only draw the rest of the queue, as far as it is iterated.
+        while self._draw_next():
+            yield self._tracks[-1]
+
+    def __reversed__(self) -> typing.Iterator[track_.Track]:
+        self._draw(len(self))
+
+        return reversed(self._tracks)
+
+    def __contains__(self, value: object) -> bool:
+        if not self._indexed(value):
+            return False
+
+        if self._shuffle is not None and value in self._shuffle.pool:
+            return True
+
+        if self._fair is not None and value in self._fair:
+            return True
+
+        return value in self._tracks
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, typing.Sequence) or isinstance(other, str):
+            return NotImplemented
+
+        tracks = typing.cast("typing.Sequence[object]", other)
+
+        return len(self) == len(tracks) and all(
+            track == other_track for track, other_track in zip(self, tracks)
+        )
+
+    def __repr__(self) -> str:
+        return f"Queue({list(self)!r})"
+
+    def _normalise(self, index: int) -> int:
+        length = len(self)
+
+        if index < 0:
+            index += length
+
+        if not 0 <= index < length:
+            raise IndexError("queue index out of range")
+
+        return index
+
+    def _draw(self, count: int) -> None:
+        if self._shuffle is None and self._fair is None:
+            return
+
+        while len(self._tracks) < count and self._draw_next():
+            pass
+
+    def _draw_next(self) -> bool:
+        if self._shuffle is not None and self._shuffle.pool:
+            draw = self._shuffle.draw()
+
+            self._tracks.append(typing.cast("track_.Track", draw.track))
+            self._records.append(draw)
+
+            return True
+
+        if self._fair is not None and self._fair:
+            self._tracks.append(self._fair.draw())
+
+            return True
+
+        return False
+
+    def _put(self, index: int, track: track_.Track, record: Draw | None) -> None:
+        self._tracks.insert(index, track)
+
+        if self._shuffle is not None:
+            self._records.insert(index, record)
+
+    def _take(self, index: int) -> track_.Track:
+        self._draw(index + 1)
+
+        if self._shuffle is not None:
+            self._discard(self._records.pop(index))
+
+        track = self._tracks.pop(index)
+
+        self._unindex((track,))
+
+        return track
+
+    def _discard(self, record: Draw | None) -> None:
+        if self._shuffle is not None and record is not None:
+            self._shuffle.discard(record)
+
+    def _replace(self, tracks: typing.Sequence[track_.Track]) -> None:
+        self._tracks.replace(tracks)
+
+        self._requestors.clear()
+        self._identifiers.clear()
+        self._sizes.clear()
+        self._size = 0
+        self._weights.clear()
+        self._index(tracks)
+
+        if self._shuffle is not None:
+            # Tracks placed by a slice are no longer drawn, so they stay where they are.
+            for record in self._records:
+                self._discard(record)
+
+            self._records.replace([None] * len(tracks))
+
+    def _index(self, tracks: typing.Iterable[track_.Track]) -> None:
+        for track in tracks:
+            key = id(track)
+            weight = self._weights.get(key)
+            # Each track is only weighed once, however many times it is queued.
+            size, count = weight if weight is not None else (track_size(track), 0)
+
+            self._weights[key] = (size, count + 1)
+
+            self._requestors[track.requestor] += 1
+            self._identifiers[track.info.identifier] += 1
+            self._sizes[track.requestor] += size
+            self._size += size
+
+    def _unindex(self, tracks: typing.Iterable[track_.Track]) -> None:
+        for track in tracks:
+            key = id(track)
+            # The size counted when the track was added, so later changes to the track cannot skew the totals.
+            size, count = self._weights[key]
+
+            if count == 1:
+                del self._weights[key]
+            else:
+                self._weights[key] = (size, count - 1)
+
+            _decrement(self._requestors, track.requestor)
+            _decrement(self._identifiers, track.info.identifier)
+            _decrement(self._sizes, track.requestor, size)
+            self._size -= size
+
+    def _indexed(self, value: object) -> bool:
+        # Only a track with a queued identifier can be in the queue, so anything else is not searched for.
+        return not isinstance(value, track_.Track) or (
+            value.info.identifier in self._identifiers
+        )
+
+
+_KeyT = typing.TypeVar("_KeyT")
+
+
+def _duration(track: track_.Track | None) -> int:
+    # Removed tracks can be held in place by None, while a shuffle is restored.
+    if track is None:
+        return 0
+
+    return _STREAM if track.info.is_stream else track.info.length
+
+
+def _requestor(track: track_.Track | None) -> hikari.Snowflake | None:
+    # Removed tracks held in place by None are counted with no requestor, until the shuffle is restored.
+    return None if track is None else track.requestor
+
+
+def _snowflake(value: hikari.Snowflakeish | None) -> hikari.Snowflake | None:
+    return None if value is None else hikari.Snowflake(value)
+
+
+def _decrement(
+    counter: collections.Counter[_KeyT], key: _KeyT, amount: int = 1
+) -> None:
+    count = counter[key] - amount
+
+    if count > 0:
+        counter[key] = count
+    else:
+        del counter[key]
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
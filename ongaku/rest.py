@@ -6,12 +6,16 @@ All REST based actions, happen in here.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import typing
 
 import hikari
 
 from ongaku import errors
 from ongaku.internal import routes
+from ongaku.internal.cache import DiskTrackCache
+from ongaku.internal.cache import TrackCache
 from ongaku.internal.logger import TRACE_LEVEL
 from ongaku.internal.logger import logger
 
@@ -24,6 +28,8 @@ if typing.TYPE_CHECKING:
     from ongaku.abc.routeplanner import RoutePlannerStatus
     from ongaku.abc.statistics import Statistics
     from ongaku.abc.track import Track
+    from ongaku.config import RequestConfig
+    from ongaku.internal import types
     from ongaku.session import Session
 
 _logger = logger.getChild("rest")
@@ -34,6 +40,11 @@ if typing.TYPE_CHECKING:
 
 __all__ = ("RESTClient",)
 
+_FlightKeyT = tuple[
+    str, str, str, type, tuple[tuple[str, typing.Any], ...], "RequestConfig | None"
+]
+"""The key of an in-flight request. (session name, method, path, return type, params, request config)"""
+
 
 class RESTClient:
     """
@@ -45,19 +56,140 @@ class RESTClient:
         Please do not create this on your own. Please use the rest attribute, in the base client object you created.
     """
 
-    __slots__: typing.Sequence[str] = "_client"
+    __slots__: typing.Sequence[str] = (
+        "_cache",
+        "_client",
+        "_coalesced",
+        "_disk_cache",
+        "_in_flight",
+    )
 
     def __init__(self, client: Client) -> None:
         self._client = client
+        self._cache = TrackCache(client.track_cache) if client.track_cache else None
+        self._disk_cache = (
+            DiskTrackCache(client.track_cache)
+            if client.track_cache and client.track_cache.path
+            else None
+        )
+        self._in_flight: typing.MutableMapping[
+            _FlightKeyT, asyncio.Task[typing.Any]
+        ] = {}
+        self._coalesced = 0
+
+    @property
+    def cache(self) -> TrackCache | None:
+        """The in-memory cache of track load results, if enabled."""
+        return self._cache
+
+    @property
+    def disk_cache(self) -> DiskTrackCache | None:
+        """The on-disk cache of track load results, and decoded tracks, if enabled."""
+        return self._disk_cache
+
+    @property
+    def in_flight(self) -> int:
+        """The amount of shareable requests currently waiting for a response."""
+        return len(self._in_flight)
+
+    @property
+    def coalesced(self) -> int:
+        """The total amount of requests that shared an identical request already in-flight, instead of being sent."""
+        return self._coalesced
+
+    async def _shared_request(
+        self,
+        session: Session,
+        route: routes.Route,
+        return_type: typing.Type[types.RequestT],
+        *,
+        params: typing.Mapping[str, typing.Any] = {},
+        request_config: RequestConfig | None = None,
+    ) -> types.RequestT | None:
+        # Identical idempotent requests share one in-flight request. The raw response is shared,
+        # and every caller builds its own entities, as tracks are modified once added to a queue.
+        # Only requests with the same request config are shared, so each caller keeps its own timeouts and retries.
+        key: _FlightKeyT = (
+            session.name,
+            route.method,
+            route.path,
+            return_type,
+            tuple(sorted(params.items())),
+            request_config,
+        )
+
+        task = self._in_flight.get(key)
+
+        if task is None:
+            task = asyncio.create_task(
+                session.request(
+                    route.method,
+                    route.path,
+                    return_type,
+                    params=params,
+                    idempotent=route.idempotent,
+                    request_config=request_config,
+                )
+            )
+
+            self._in_flight[key] = task
+
+            task.add_done_callback(functools.partial(self._request_done, key))
+        else:
+            self._coalesced += 1
+
+            _logger.log(TRACE_LEVEL, f"Sharing in-flight request {route}")
+
+        # Shielded, so one caller being cancelled does not cancel the request for the others.
+        return await asyncio.shield(task)
+
+    def _request_done(self, key: _FlightKeyT, task: asyncio.Task[typing.Any]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+        # Every caller may have been cancelled, so mark the exception as retrieved.
+        if not task.cancelled():
+            task.exception()
+
+    async def _cached(self, query: str) -> bytes | None:
+        cached = self.cache.get(query) if self.cache else None
+
+        if cached is None and self.disk_cache:
+            entry = await self.disk_cache.get_entry(query)
+
+            if entry is None:
+                return None
 
-    async def load_track(  # noqa: C901
-        self, query: str, *, session: Session | None = None
+            cached = entry.payload
+
+            if self.cache:
+                # The result keeps the time it had left on disk, instead of starting its time to live again.
+                self.cache.put(query, cached, expires=entry.expires)
+
+        return cached
+
+    async def _uncache(self, query: str) -> None:
+        if self.cache:
+            self.cache.remove(query)
+
+        if self.disk_cache:
+            await self.disk_cache.remove(query)
+
+    async def load_track(
+        self,
+        query: str,
+        *,
+        session: Session | None = None,
+        request_config: RequestConfig | None = None,
     ) -> Playlist | typing.Sequence[Track] | Track | None:
         """
         Load tracks.
 
         Loads tracks from a site, a playlist or a track, to play on a player.
 
+        If the client has a [track cache][ongaku.config.TrackCacheConfig], cached results (in memory, or on disk)
+        are returned without a request being made.
+
         ![Lavalink](../assets/lavalink_logo.png){ .twemoji } [Reference](https://lavalink.dev/api/rest#track-loading)
 
         Example
@@ -74,6 +206,8 @@ class RESTClient:
             The query for the search/link.
         session
             If provided, the session to use for this request.
+        request_config
+            If provided, the timeouts and retry policy to use for this request, instead of the clients.
 
         Raises
         ------
@@ -107,69 +241,68 @@ class RESTClient:
 
         _logger.log(TRACE_LEVEL, str(route))
 
+        cached = await self._cached(query)
+
+        if cached is not None:
+            _logger.log(TRACE_LEVEL, f"Using cached load result for: {query}")
+
+            try:
+                return self._client.entity_builder.build_load_result(cached)
+            except errors.RestExceptionError:
+                raise
+            except Exception as e:
+                # The cached result is dropped, so the next load fetches it again.
+                await self._uncache(query)
+
+                raise errors.BuildError(e)
+
         if not session:
             session = self._client.session_handler.fetch_session()
 
-        response = await session.request(
-            route.method, route.path, dict, params={"identifier": query}
+        response = await self._shared_request(
+            session,
+            route,
+            bytes,
+            params={"identifier": query},
+            request_config=request_config,
         )
 
         if response is None:
             raise ValueError("Response is required for this request.")
 
-        load_type: str = response["loadType"]
-
-        if load_type == "empty":
-            _logger.log(TRACE_LEVEL, "loadType is empty.")
-            return
-
-        elif load_type == "error":
-            _logger.log(TRACE_LEVEL, "loadType caused an error.")
-
-            raise errors.RestExceptionError.from_error(
-                self._client.entity_builder.build_exception_error(response["data"])
-            )
-
-        elif load_type == "search":
-            _logger.log(TRACE_LEVEL, "loadType was a search result.")
-            tracks: typing.Sequence[Track] = []
-            for track in response["data"]:
-                try:
-                    tracks.append(self._client.entity_builder.build_track(track))
-                except Exception as e:
-                    raise errors.BuildError(e)
-
-            build = tracks
-
-        elif load_type == "track":
-            _logger.log(TRACE_LEVEL, "loadType was a track link.")
-            try:
-                build = self._client.entity_builder.build_track(response["data"])
-            except Exception as e:
-                raise errors.BuildError(e)
+        try:
+            result = self._client.entity_builder.build_load_result(response)
+        except errors.RestExceptionError:
+            raise
+        except Exception as e:
+            raise errors.BuildError(e)
 
-        elif load_type == "playlist":
-            _logger.log(TRACE_LEVEL, "loadType was a playlist link.")
-            try:
-                build = self._client.entity_builder.build_playlist(response["data"])
-            except Exception as e:
-                raise errors.BuildError(e)
+        if self.cache:
+            self.cache.put(query, response)
 
-        else:
-            raise errors.BuildError(
-                None, f"An unknown loadType was received: {load_type}"
-            )
+        if self.disk_cache:
+            await self.disk_cache.put(query, response)
 
-        return build
+        return result
 
     async def decode_track(
-        self, track: str, *, session: Session | None = None
+        self,
+        track: str,
+        *,
+        session: Session | None = None,
+        request_config: RequestConfig | None = None,
     ) -> Track:
         """
         Decode a track.
 
         Decode a track from its encoded state.
 
+        If the client has an on-disk [track cache][ongaku.config.TrackCacheConfig], and the track is found in it,
+        no request is made.
+
+        !!! tip
+            Tracks can also be decoded locally, without lavalink, with [decode_track][ongaku.codec.decode_track].
+
         ![Lavalink](../assets/lavalink_logo.png){ .twemoji } [Reference](https://lavalink.dev/api/rest#track-decoding)
 
         Example
@@ -186,6 +319,8 @@ class RESTClient:
             The BASE64 code, from a previously encoded track.
         session
             If provided, the session to use for this request.
+        request_config
+            If provided, the timeouts and retry policy to use for this request, instead of the clients.
 
         Raises
         ------
@@ -213,29 +348,58 @@ class RESTClient:
 
         _logger.log(TRACE_LEVEL, str(route))
 
+        cached: typing.Mapping[str, bytes] = (
+            await self.disk_cache.get_tracks([track]) if self.disk_cache else {}
+        )
+
+        if track in cached:
+            return self._client.entity_builder.build_track(cached[track])
+
         if not session:
             session = self._client.session_handler.fetch_session()
 
-        response = await session.request(
-            route.method, route.path, dict, params={"encodedTrack": track}
+        response = await self._shared_request(
+            session,
+            route,
+            bytes,
+            params={"encodedTrack": track},
+            request_config=request_config,
         )
 
         if response is None:
             raise ValueError("Response is required for this request.")
 
+        if self.disk_cache:
+            await self.disk_cache.put_tracks([response])
+
         try:
             return self._client.entity_builder.build_track(response)
         except Exception as e:
             raise errors.BuildError(e)
 
     async def decode_tracks(
-        self, tracks: typing.Sequence[str], *, session: Session | None = None
+        self,
+        tracks: typing.Sequence[str],
+        *,
+        session: Session | None = None,
+        request_config: RequestConfig | None = None,
+        chunk_size: int = 100,
+        concurrency: int = 4,
     ) -> typing.Sequence[Track]:
         """
         Decode tracks.
 
         Decode multiple tracks from their encoded state.
 
+        Duplicate tracks are only sent once, and large lists are split into chunks, which are decoded concurrently.
+        The tracks are returned in the same order they were given, including any duplicates.
+
+        If the client has an on-disk [track cache][ongaku.config.TrackCacheConfig], tracks found in it
+        are not sent to lavalink.
+
+        !!! tip
+            Tracks can also be decoded locally, without lavalink, with [decode_tracks][ongaku.codec.decode_tracks].
+
         ![Lavalink](../assets/lavalink_logo.png){ .twemoji } [Reference](https://lavalink.dev/api/rest#track-decoding)
 
         Example
@@ -252,9 +416,17 @@ class RESTClient:
             The BASE64 codes, from all the previously encoded tracks.
         session
             If provided, the session to use for this request.
+        request_config
+            If provided, the timeouts and retry policy to use for this request, instead of the clients.
+        chunk_size
+            The maximum amount of tracks sent in a single request.
+        concurrency
+            The maximum amount of requests running at once.
 
         Raises
         ------
+        ValueError
+            Raised when the chunk size, or concurrency is less than 1.
         NoSessionsError
             Raised when there is no available sessions for this request to take place.
         TimeoutError
@@ -264,7 +436,7 @@ class RESTClient:
         RestStatusError
             Raised when a 4XX or a 5XX status is received.
         BuildError
-            Raised when the tracks could not be built.
+            Raised when the tracks could not be built, or lavalink did not decode every track in a chunk.
         RestRequestError
             Raised when a 4XX or a 5XX status is received, and lavalink gives more information.
         RestError
@@ -279,23 +451,43 @@ class RESTClient:
 
         _logger.log(TRACE_LEVEL, str(route))
 
-        if not session:
-            session = self._client.session_handler.fetch_session()
+        if chunk_size < 1 or concurrency < 1:
+            raise ValueError("The chunk size, and concurrency must be at least 1.")
 
-        response = await session.request(
-            route.method,
-            route.path,
-            list,
-            headers={"Content-Type": "application/json"},
-            json=tracks,
+        unique = list(dict.fromkeys(tracks))
+
+        cached: typing.Mapping[str, bytes] = (
+            await self.disk_cache.get_tracks(unique) if self.disk_cache else {}
         )
 
-        if response is None:
-            raise ValueError("Response is required for this request.")
+        missing = [track for track in unique if track not in cached]
+
+        fetched: typing.Mapping[str, typing.Any] = {}
+
+        if missing:
+            if not session:
+                session = self._client.session_handler.fetch_session()
+
+            fetched = await self._decode_chunks(
+                session,
+                route,
+                missing,
+                request_config=request_config,
+                chunk_size=chunk_size,
+                concurrency=concurrency,
+            )
+
+            if self.disk_cache:
+                await self.disk_cache.put_tracks(list(fetched.values()))
 
         new_tracks: list[Track] = []
 
-        for track in response:
+        for encoded in tracks:
+            track = cached[encoded] if encoded in cached else fetched.get(encoded)
+
+            if track is None:
+                continue
+
             try:
                 new_tracks.append(self._client.entity_builder.build_track(track))
             except Exception as e:
@@ -303,8 +495,71 @@ class RESTClient:
 
         return new_tracks
 
+    async def _decode_chunks(
+        self,
+        session: Session,
+        route: routes.Route,
+        tracks: typing.Sequence[str],
+        *,
+        request_config: RequestConfig | None,
+        chunk_size: int,
+        concurrency: int,
+    ) -> typing.Mapping[str, typing.Any]:
+        chunks = [
+            tracks[start : start + chunk_size]
+            for start in range(0, len(tracks), chunk_size)
+        ]
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def decode_chunk(
+            chunk: typing.Sequence[str],
+        ) -> typing.Sequence[typing.Any]:
+            async with semaphore:
+                response = await session.request(
+                    route.method,
+                    route.path,
+                    list,
+                    json=chunk,
+                    idempotent=route.idempotent,
+                    request_config=request_config,
+                )
+
+            if response is None:
+                raise ValueError("Response is required for this request.")
+
+            # Tracks are matched to the chunk by position, so a missing (or extra) track would match them all wrongly.
+            if len(response) != len(chunk):
+                raise errors.BuildError(
+                    None,
+                    f"Received {len(response)} decoded tracks, for a chunk of {len(chunk)} tracks.",
+                )
+
+            return response
+
+        tasks = [asyncio.ensure_future(decode_chunk(chunk)) for chunk in chunks]
+
+        try:
+            responses = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+
+            raise
+
+        fetched: dict[str, typing.Any] = {}
+
+        for chunk, response in zip(chunks, responses):
+            fetched.update(zip(chunk, response))
+
+        return fetched
+
     async def fetch_players(
-        self, session_id: str, *, session: Session | None = None
+        self,
+        session_id: str,
+        *,
+        session: Session | None = None,
+        request_config: RequestConfig | None = None,
     ) -> typing.Sequence[Player]:
         """
         Fetch all players.
@@ -328,6 +583,8 @@ class RESTClient:
             The Session ID that the players are attached too.
         session
             If provided, the session to use for this request.
+        request_config
+            If provided, the timeouts and retry policy to use for this request, instead of the clients.
 
         Raises
         ------
@@ -362,6 +619,8 @@ class RESTClient:
             route.method,
             route.path.format(session_id=session_id),
             list,
+            idempotent=route.idempotent,
+            request_config=request_config,
         )
 
         if response is None:
@@ -380,6 +639,7 @@ class RESTClient:
         guild: hikari.SnowflakeishOr[hikari.Guild],
         *,
         session: Session | None = None,
+        request_config: RequestConfig | None = None,
     ) -> Player:
         """
         Fetch a player.
@@ -404,6 +664,8 @@ class RESTClient:
             The `guild` or `guild id` that the player is attached to.
         session
             If provided, the session to use for this request.
+        request_config
+            If provided, the timeouts and retry policy to use for this request, instead of the clients.
 
         Raises
         ------
@@ -437,13 +699,18 @@ class RESTClient:
         response = await session.request(
             route.method,
             route.path.format(session_id=session_id, guild_id=hikari.Snowflake(guild)),
-            dict,
+            bytes,
+            idempotent=route.idempotent,
+            request_config=request_config,
         )
 
         if response is None:
             raise ValueError("Response is required for this request.")
 
-        return self._client.entity_builder.build_player(response)
+        try:
+            return self._client.entity_builder.build_player(response)
+        except Exception as e:
+            raise errors.BuildError(e)
 
     async def update_player(  # noqa: C901
         self,
@@ -456,8 +723,10 @@ class RESTClient:
         volume: hikari.UndefinedOr[int] = hikari.UNDEFINED,
         paused: hikari.UndefinedOr[bool] = hikari.UNDEFINED,
         voice: hikari.UndefinedOr[Voice] = hikari.UNDEFINED,
+        filters: hikari.UndefinedOr[typing.Mapping[str, typing.Any]] = hikari.UNDEFINED,
         no_replace: bool = True,
         session: Session | None = None,
+        request_config: RequestConfig | None = None,
     ) -> Player:
         """
         Fetch a player.
@@ -497,10 +766,14 @@ class RESTClient:
             Whether or not to pause the player.
         voice
             The player voice object you wish to set.
+        filters
+            The filters you wish to set. An empty mapping removes every filter.
         no_replace
             Whether or not the track can be replaced.
         session
             If provided, the session to use for this request.
+        request_config
+            If provided, the timeouts and retry policy to use for this request, instead of the clients.
 
         Raises
         ------
@@ -533,7 +806,7 @@ class RESTClient:
             and volume is hikari.UNDEFINED
             and paused is hikari.UNDEFINED
             and voice is hikari.UNDEFINED
-            and position is hikari.UNDEFINED
+            and filters is hikari.UNDEFINED
         ):
             raise ValueError("Update requires at least one change.")
 
@@ -580,6 +853,9 @@ class RESTClient:
                 }
             )
 
+        if filters != hikari.UNDEFINED:
+            patch_data.update({"filters": filters})
+
         route = routes.PATCH_PLAYER_UPDATE
 
         _logger.log(
@@ -593,22 +869,27 @@ class RESTClient:
         response = await session.request(
             route.method,
             route.path.format(session_id=session_id, guild_id=hikari.Snowflake(guild)),
-            dict,
-            headers={"Content-Type": "application/json"},
+            bytes,
             json=patch_data,
             params={"noReplace": "true" if no_replace else "false"},
+            idempotent=route.idempotent,
+            request_config=request_config,
         )
 
         if response is None:
             raise ValueError("Response is required for this request.")
 
-        return self._client.entity_builder.build_player(response)
+        try:
+            return self._client.entity_builder.build_player(response)
+        except Exception as e:
+            raise errors.BuildError(e)
 
     async def delete_player(
         self,
         session_id: str,
         guild: hikari.SnowflakeishOr[hikari.Guild],
         session: Session | None = None,
+        request_config: RequestConfig | None = None,
     ) -> None:
         """
         Delete a player.
@@ -631,6 +912,8 @@ class RESTClient:
             The `guild` or `guild id` that the player is attached to.
         session
             If provided, the session to use for this request.
+        request_config
+            If provided, the timeouts and retry policy to use for this request, instead of the clients.
 
         Raises
         ------
@@ -658,6 +941,8 @@ class RESTClient:
             route.method,
             route.path.format(session_id=session_id, guild_id=hikari.Snowflake(guild)),
             None,
+            idempotent=route.idempotent,
+            request_config=request_config,
         )
 
     async def update_session(
@@ -667,6 +952,7 @@ class RESTClient:
         resuming: bool | None = None,
         timeout: int | None = None,
         session: Session | None = None,
+        request_config: RequestConfig | None = None,
     ) -> session_.Session:
         """
         Update Lavalink session.
@@ -691,6 +977,8 @@ class RESTClient:
             The timeout in seconds (default is 60s)
         session
             If provided, the session to use for this request.
+        request_config
+            If provided, the timeouts and retry policy to use for this request, instead of the clients.
 
         Raises
         ------
@@ -733,8 +1021,9 @@ class RESTClient:
             route.method,
             route.path.format(session_id=session_id),
             dict,
-            headers={"Content-Type": "application/json"},
             json=data,
+            idempotent=route.idempotent,
+            request_config=request_config,
         )
 
         if response is None:
@@ -742,7 +1031,12 @@ class RESTClient:
 
         return self._client.entity_builder.build_session(response)
 
-    async def fetch_info(self, *, session: Session | None = None) -> Info:
+    async def fetch_info(
+        self,
+        *,
+        session: Session | None = None,
+        request_config: RequestConfig | None = None,
+    ) -> Info:
         """
         Get information.
 
@@ -762,6 +1056,8 @@ class RESTClient:
         ----------
         session
             If provided, the session to use for this request.
+        request_config
+            If provided, the timeouts and retry policy to use for this request, instead of the clients.
 
         Raises
         ------
@@ -792,10 +1088,11 @@ class RESTClient:
         if not session:
             session = self._client.session_handler.fetch_session()
 
-        response = await session.request(
-            route.method,
-            route.path,
+        response = await self._shared_request(
+            session,
+            route,
             dict,
+            request_config=request_config,
         )
 
         if response is None:
@@ -803,7 +1100,12 @@ class RESTClient:
 
         return self._client.entity_builder.build_info(response)
 
-    async def fetch_version(self, *, session: Session | None = None) -> str:
+    async def fetch_version(
+        self,
+        *,
+        session: Session | None = None,
+        request_config: RequestConfig | None = None,
+    ) -> str:
         """
         Get version.
 
@@ -823,6 +1125,8 @@ class RESTClient:
         ----------
         session
             If provided, the session to use for this request.
+        request_config
+            If provided, the timeouts and retry policy to use for this request, instead of the clients.
 
         Raises
         ------
@@ -851,14 +1155,26 @@ class RESTClient:
         if not session:
             session = self._client.session_handler.fetch_session()
 
-        response = await session.request(route.method, route.path, str, version=False)
+        response = await session.request(
+            route.method,
+            route.path,
+            str,
+            version=False,
+            idempotent=route.idempotent,
+            request_config=request_config,
+        )
 
         if response is None:
             raise ValueError("Response is required for this request.")
 
         return response
 
-    async def fetch_stats(self, *, session: Session | None = None) -> Statistics:
+    async def fetch_stats(
+        self,
+        *,
+        session: Session | None = None,
+        request_config: RequestConfig | None = None,
+    ) -> Statistics:
         """
         Get statistics.
 
@@ -881,6 +1197,8 @@ class RESTClient:
         ----------
         session
             If provided, the session to use for this request.
+        request_config
+            If provided, the timeouts and retry policy to use for this request, instead of the clients.
 
         Raises
         ------
@@ -911,19 +1229,26 @@ class RESTClient:
         if not session:
             session = self._client.session_handler.fetch_session()
 
-        response = await session.request(
-            route.method,
-            route.path,
-            dict,
+        response = await self._shared_request(
+            session,
+            route,
+            bytes,
+            request_config=request_config,
         )
 
         if response is None:
             raise ValueError("Response is required for this request.")
 
-        return self._client.entity_builder.build_statistics(response)
+        try:
+            return self._client.entity_builder.build_statistics(response)
+        except Exception as e:
+            raise errors.BuildError(e)
 
     async def fetch_routeplanner_status(
-        self, *, session: Session | None = None
+        self,
+        *,
+        session: Session | None = None,
+        request_config: RequestConfig | None = None,
     ) -> RoutePlannerStatus | None:
         """
         Fetch routeplanner status.
@@ -945,6 +1270,8 @@ class RESTClient:
         ----------
         session
             If provided, the session to use for this request.
+        request_config
+            If provided, the timeouts and retry policy to use for this request, instead of the clients.
 
         Raises
         ------
@@ -978,10 +1305,11 @@ class RESTClient:
             session = self._client.session_handler.fetch_session()
 
         try:
-            response = await session.request(
-                route.method,
-                route.path,
+            response = await self._shared_request(
+                session,
+                route,
                 dict,
+                request_config=request_config,
             )
         except errors.RestEmptyError:
             response = None
@@ -992,7 +1320,11 @@ class RESTClient:
         return self._client.entity_builder.build_routeplanner_status(response)
 
     async def update_routeplanner_address(
-        self, address: str, *, session: Session | None = None
+        self,
+        address: str,
+        *,
+        session: Session | None = None,
+        request_config: RequestConfig | None = None,
     ) -> None:
         """
         Free routeplanner address.
@@ -1013,6 +1345,8 @@ class RESTClient:
             The address you wish to free.
         session
             If provided, the session to use for this request.
+        request_config
+            If provided, the timeouts and retry policy to use for this request, instead of the clients.
 
         Raises
         ------
@@ -1036,10 +1370,20 @@ class RESTClient:
         if not session:
             session = self._client.session_handler.fetch_session()
 
-        await session.request(route.method, route.path, None, json={"address": address})
+        await session.request(
+            route.method,
+            route.path,
+            None,
+            json={"address": address},
+            idempotent=route.idempotent,
+            request_config=request_config,
+        )
 
     async def update_all_routeplanner_addresses(
-        self, *, session: Session | None = None
+        self,
+        *,
+        session: Session | None = None,
+        request_config: RequestConfig | None = None,
     ) -> None:
         """
         Free all routeplanner addresses.
@@ -1058,6 +1402,8 @@ class RESTClient:
         ----------
         session
             If provided, the session to use for this request.
+        request_config
+            If provided, the timeouts and retry policy to use for this request, instead of the clients.
 
         Raises
         ------
@@ -1085,6 +1431,8 @@ class RESTClient:
             route.method,
             route.path,
             None,
+            idempotent=route.idempotent,
+            request_config=request_config,
         )
 
 
@@ -7,6 +7,8 @@ Session related objects.
 from __future__ import annotations
 
 import asyncio
+import datetime
+import functools
 import typing
 
 import aiohttp
@@ -14,10 +16,16 @@ import aiohttp
 from ongaku import errors
 from ongaku import events
 from ongaku.abc import session as session_
+from ongaku.config import ConnectorConfig
+from ongaku.config import IngestConfig
+from ongaku.config import ReconnectConfig
+from ongaku.config import RequestConfig
 from ongaku.internal.about import __version__
 from ongaku.internal.converters import json_loads
+from ongaku.internal.ingest import IngestQueue
 from ongaku.internal.logger import TRACE_LEVEL
 from ongaku.internal.logger import logger
+from ongaku.internal.pool import PoolStatistics
 
 _logger = logger.getChild("session")
 
@@ -31,6 +39,25 @@ if typing.TYPE_CHECKING:
 
 __all__ = ("Session",)
 
+_EVENT_TYPES: typing.Mapping[str, typing.Type[hikari.Event]] = {
+    session_.WebsocketOPCode.READY: events.ReadyEvent,
+    session_.WebsocketOPCode.PLAYER_UPDATE: events.PlayerUpdateEvent,
+    session_.WebsocketOPCode.STATS: events.StatisticsEvent,
+    session_.WebsocketEvent.TRACK_START_EVENT: events.TrackStartEvent,
+    session_.WebsocketEvent.TRACK_END_EVENT: events.TrackEndEvent,
+    session_.WebsocketEvent.TRACK_EXCEPTION_EVENT: events.TrackExceptionEvent,
+    session_.WebsocketEvent.TRACK_STUCK_EVENT: events.TrackStuckEvent,
+    session_.WebsocketEvent.WEBSOCKET_CLOSED_EVENT: events.WebsocketClosedEvent,
+}
+"""The event each op code (or event type) is built into."""
+
+_INTERNAL_EVENTS: typing.Sequence[str] = (
+    session_.WebsocketOPCode.READY,
+    session_.WebsocketOPCode.PLAYER_UPDATE,
+    session_.WebsocketEvent.TRACK_END_EVENT,
+)
+"""The op codes (or event types) that update internal state, so are always built."""
+
 
 class Session:
     """
@@ -53,7 +80,17 @@ class Session:
     password
         The password of the lavalink server.
     attempts
-        The attempts that the session is allowed to use, before completely shutting down.
+        The amount of consecutive failed connection attempts allowed, before completely shutting down. If `None`, the session will never stop trying to reconnect.
+    resume
+        Whether to enable resuming, so that players survive a websocket disconnect.
+    resume_timeout
+        The amount of seconds lavalink will keep the session alive for, after a disconnect.
+    reconnect
+        How long to wait between connection attempts. Defaults to [ReconnectConfig][ongaku.config.ReconnectConfig] with its default values.
+    ingest
+        How received frames are queued, before being processed. Defaults to [IngestConfig][ongaku.config.IngestConfig] with its default values.
+    connector
+        If set, the session gets its own connection pool, created when the session starts, and closed when it stops. Otherwise the clients pool is shared.
     """
 
     __slots__: typing.Sequence[str] = (
@@ -64,14 +101,26 @@ class Session:
         "_port",
         "_password",
         "_attempts",
-        "_remaining_attempts",
+        "_failures",
+        "_resume",
+        "_resume_timeout",
+        "_reconnect",
+        "_reconnects",
+        "_last_connected",
+        "_last_disconnected",
+        "_last_delay",
+        "_ingest",
+        "_connector",
+        "_client_session",
         "_base_uri",
         "_session_id",
         "_session_task",
         "_status",
         "_players",
+        "_handlers",
         "_websocket_headers",
         "_authorization_headers",
+        "_json_headers",
     )
 
     def __init__(
@@ -82,7 +131,13 @@ class Session:
         host: str,
         port: int,
         password: str,
-        attempts: int,
+        attempts: int | None,
+        *,
+        resume: bool = False,
+        resume_timeout: int = 60,
+        reconnect: ReconnectConfig | None = None,
+        ingest: IngestConfig | None = None,
+        connector: ConnectorConfig | None = None,
     ) -> None:
         self._client = client
         self._name = name
@@ -91,16 +146,32 @@ class Session:
         self._port = port
         self._password = password
         self._attempts = attempts
-        self._remaining_attempts = attempts
+        self._failures = 0
+        self._resume = resume
+        self._resume_timeout = resume_timeout
+        self._reconnect = reconnect if reconnect else ReconnectConfig()
+        self._reconnects = 0
+        self._last_connected: datetime.datetime | None = None
+        self._last_disconnected: datetime.datetime | None = None
+        self._last_delay: float | None = None
+        self._ingest = IngestQueue(ingest if ingest else IngestConfig())
+        self._connector = connector
+        self._client_session: aiohttp.ClientSession | None = None
         self._base_uri = f"http{'s' if ssl else ''}://{host}:{port}"
         self._session_id: str | None = None
         self._session_task: asyncio.Task[None] | None = None
         self._status = session_.SessionStatus.NOT_CONNECTED
         self._players: typing.MutableMapping[hikari.Snowflake, Player] = {}
+        # The latest event handler of each player, which the next one waits on.
+        self._handlers: typing.MutableMapping[hikari.Snowflake, asyncio.Task[None]] = {}
         self._websocket_headers: typing.MutableMapping[str, typing.Any] = {}
         self._authorization_headers: typing.Mapping[str, typing.Any] = {
             "Authorization": password
         }
+        self._json_headers: typing.Mapping[str, typing.Any] = {
+            "Authorization": password,
+            "Content-Type": "application/json",
+        }
 
     @property
     def client(self) -> Client:
@@ -147,6 +218,80 @@ class Session:
         """The headers required for authorization."""
         return self._authorization_headers
 
+    @property
+    def resume(self) -> bool:
+        """Whether resuming is enabled for this session."""
+        return self._resume
+
+    @property
+    def resume_timeout(self) -> int:
+        """The amount of seconds lavalink will wait for this session to resume."""
+        return self._resume_timeout
+
+    @property
+    def attempts(self) -> int | None:
+        """The amount of consecutive failed connection attempts allowed. `None` if unlimited."""
+        return self._attempts
+
+    @property
+    def reconnect(self) -> ReconnectConfig:
+        """The reconnect config for this session."""
+        return self._reconnect
+
+    @property
+    def reconnects(self) -> int:
+        """The amount of times this session has attempted to reconnect to the websocket."""
+        return self._reconnects
+
+    @property
+    def failures(self) -> int:
+        """The amount of consecutive connection attempts that have not received a ready payload."""
+        return self._failures
+
+    @property
+    def last_connected(self) -> datetime.datetime | None:
+        """When the websocket last connected. `None` if it has never connected."""
+        return self._last_connected
+
+    @property
+    def last_disconnected(self) -> datetime.datetime | None:
+        """When the websocket last disconnected. `None` if it has never disconnected."""
+        return self._last_disconnected
+
+    @property
+    def last_delay(self) -> float | None:
+        """The last delay (in seconds) waited before reconnecting. `None` if it has never reconnected."""
+        return self._last_delay
+
+    @property
+    def ingest(self) -> IngestQueue:
+        """The queue of received frames waiting to be processed, and its depth and drop metrics."""
+        return self._ingest
+
+    @property
+    def connector(self) -> ConnectorConfig | None:
+        """The config of this sessions own connection pool. `None` if the clients pool is shared."""
+        return self._connector
+
+    @property
+    def pool(self) -> PoolStatistics | None:
+        """The usage of the connection pool this session uses. `None` if the pool has not been created yet."""
+        if self.connector:
+            client_session = self._client_session
+        else:
+            client_session = self.client._client_session
+
+        if (
+            client_session is None
+            or client_session.closed
+            or client_session.connector is None
+        ):
+            return None
+
+        return PoolStatistics.from_connector(
+            client_session.connector, shared=self.connector is None
+        )
+
     @property
     def status(self) -> session_.SessionStatus:
         """The current status of the session."""
@@ -169,10 +314,14 @@ class Session:
         return_type: typing.Type[types.RequestT] | None,
         *,
         headers: typing.Mapping[str, typing.Any] = {},
-        json: typing.Mapping[str, typing.Any] | typing.Sequence[typing.Any] = {},
+        json: typing.Mapping[str, typing.Any]
+        | typing.Sequence[typing.Any]
+        | None = None,
         params: typing.Mapping[str, typing.Any] = {},
         ignore_default_headers: bool = False,
         version: bool = True,
+        idempotent: bool | None = None,
+        request_config: RequestConfig | None = None,
     ) -> types.RequestT | None:
         """Request.
 
@@ -189,13 +338,17 @@ class Session:
         headers
             The headers to send.
         json
-            The json data to send.
+            The json data to send. If `None`, no body is sent.
         params
             The parameters to send.
         ignore_default_headers
             Whether to ignore the default headers or not.
         version
             Whether or not to include the version in the path.
+        idempotent
+            Whether the request is safe to repeat after a failure. If `None`, only `GET` requests are.
+        request_config
+            The timeouts and retry policy to use. If `None`, the clients is used.
 
         Returns
         -------
@@ -217,36 +370,71 @@ class Session:
         RestError
             Raised when an unknown error is caught.
         """
-        session = self.client._get_client_session()
-
-        new_headers: typing.MutableMapping[str, typing.Any] = dict(headers)
+        session = self._get_client_session()
+
+        # The default headers are built once, and only copied when extra headers are given.
+        if ignore_default_headers:
+            request_headers = headers
+        elif json is not None:
+            request_headers = (
+                {**headers, **self._json_headers} if headers else self._json_headers
+            )
+        else:
+            request_headers = (
+                {**headers, **self.auth_headers} if headers else self.auth_headers
+            )
 
-        if ignore_default_headers is False:
-            new_headers.update(self.auth_headers)
+        body = (
+            self.client.entity_builder.dump_payload(json) if json is not None else None
+        )
 
-        new_params: typing.MutableMapping[str, typing.Any] = dict(params)
+        url = f"{self.base_uri}{'/v4' if version else ''}{path}"
 
         if _logger.isEnabledFor(TRACE_LEVEL):
-            new_params.update({"trace": "true"})
+            params = {**params, "trace": "true"}
 
-        _logger.log(
-            TRACE_LEVEL,
-            f"Making request to {self.base_uri}{'/v4' if version else ''}{path} with headers: {new_headers} and json: {json} and params: {new_params}",
-        )
+            _logger.log(
+                TRACE_LEVEL,
+                f"Making request to {url} with headers: {request_headers} and json: {json} and params: {params}",
+            )
 
-        response = await session.request(
+        payload = await self._send(
+            session,
             method,
-            f"{self.base_uri}{'/v4' if version else ''}{path}",
-            headers=new_headers,
-            json=json,
-            params=new_params,
+            url,
+            idempotent if idempotent is not None else method.upper() == "GET",
+            request_config if request_config else self.client.request_config,
+            return_type is not None,
+            headers=request_headers,
+            data=body,
+            params=params,
         )
 
-        if response.status == 204 and return_type is not None:
+        if return_type is None or payload is None:
+            return None
+
+        if issubclass(return_type, bytes):
+            # bytes() returns the same object for bytes, so this does not copy.
+            return return_type(payload)
+
+        if issubclass(return_type, str | int | bool | float):
+            return return_type(payload.decode())
+
+        try:
+            json_payload = json_loads(payload)
+        except Exception as e:
+            raise errors.BuildError(e)
+
+        return return_type(json_payload)
+
+    async def _read_response(
+        self, response: aiohttp.ClientResponse, required: bool
+    ) -> bytes | None:
+        if response.status == 204 and required:
             raise errors.RestEmptyError
 
         if response.status >= 400:
-            payload = await response.text()
+            payload = await response.read()
 
             if len(payload) == 0:
                 raise errors.RestStatusError(response.status, response.reason)
@@ -257,22 +445,72 @@ class Session:
                 raise errors.RestStatusError(response.status, response.reason)
             raise rest_error
 
-        if return_type is None:
-            return
+        if not required:
+            return None
 
-        payload = await response.text()
+        return await response.read()
 
-        if issubclass(return_type, str | int | bool | float):
-            return return_type(payload)
+    async def _send(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        idempotent: bool,
+        request_config: RequestConfig,
+        required: bool,
+        **kwargs: typing.Any,
+    ) -> bytes | None:
+        retries = (
+            request_config.retries if idempotent else request_config.unsafe_retries
+        )
 
-        try:
-            json_payload = json_loads(payload)
-        except Exception as e:
-            raise errors.BuildError(e)
+        attempt = 0
 
-        return return_type(json_payload)
+        while True:
+            try:
+                response = await session.request(
+                    method, url, timeout=request_config.timeout, **kwargs
+                )
+
+                if (
+                    not idempotent
+                    or attempt >= retries
+                    or response.status not in request_config.retry_statuses
+                ):
+                    # The body is read here, so timeouts and errors while reading are retried and mapped too.
+                    try:
+                        return await self._read_response(response, required)
+                    finally:
+                        response.release()
+
+                response.release()
+            except aiohttp.ClientConnectorError:
+                # The connection was never made, so the request never reached lavalink.
+                if attempt >= retries:
+                    raise
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                # Timing out while connecting is the same, but any later timeout may have been after lavalink got it.
+                if (not idempotent and not _connect_timeout(e)) or attempt >= retries:
+                    if isinstance(e, asyncio.TimeoutError):
+                        raise errors.TimeoutError from e
+
+                    raise
+
+            attempt += 1
+
+            delay = request_config.backoff.compute_delay(attempt)
+
+            _logger.log(
+                TRACE_LEVEL,
+                f"Retrying {method} {url} in {delay:.2f}s (retry {attempt} of {retries})",
+            )
+
+            await asyncio.sleep(delay)
+
+    def _load_ws_payload(self, data: str) -> types.PayloadMappingT:
+        if self.client.entity_builder.decoder == "msgspec":
+            return data
 
-    def _handle_op_code(self, data: str) -> hikari.Event:
         mapped_data = json_loads(data)
 
         if isinstance(mapped_data, typing.Sequence):
@@ -281,59 +519,65 @@ class Session:
                 "Invalid data received. Must be of type 'typing.Mapping' and not 'typing.Sequence'",
             )
 
-        op_code = session_.WebsocketOPCode(mapped_data["op"])
+        return mapped_data
+
+    def _wants_event(
+        self,
+        op_code: session_.WebsocketOPCode,
+        event_type: session_.WebsocketEvent | None,
+    ) -> bool:
+        key = event_type if event_type else op_code
+
+        if key in _INTERNAL_EVENTS:
+            return True
+
+        return self.client._should_dispatch(_EVENT_TYPES[key])
+
+    def _handle_op_code(self, data: str) -> hikari.Event | None:
+        builder = self.client.entity_builder
+
+        payload = self._load_ws_payload(data)
+
+        try:
+            op_code, event_type = builder.build_websocket_op(payload)
+        except Exception as e:
+            raise errors.BuildError(e)
+
+        if not self._wants_event(op_code, event_type):
+            return None
 
         if op_code == session_.WebsocketOPCode.READY:
-            event = self.client.entity_builder.build_ready_event(mapped_data, self)
+            event = builder.build_ready_event(payload, self)
 
             self._session_id = event.session_id
 
         elif op_code == session_.WebsocketOPCode.PLAYER_UPDATE:
-            event = self.client.entity_builder.build_player_update_event(
-                mapped_data, self
-            )
+            event = builder.build_player_update_event(payload, self)
 
         elif op_code == session_.WebsocketOPCode.STATS:
-            event = self.client.entity_builder.build_statistics_event(mapped_data, self)
+            event = builder.build_statistics_event(payload, self)
 
-        else:
-            event_type = session_.WebsocketEvent(mapped_data["type"])
+        elif event_type == session_.WebsocketEvent.TRACK_START_EVENT:
+            event = builder.build_track_start_event(payload, self)
 
-            if event_type == session_.WebsocketEvent.TRACK_START_EVENT:
-                event = self.client.entity_builder.build_track_start_event(
-                    mapped_data, self
-                )
-
-            elif event_type == session_.WebsocketEvent.TRACK_END_EVENT:
-                event = self.client.entity_builder.build_track_end_event(
-                    mapped_data, self
-                )
+        elif event_type == session_.WebsocketEvent.TRACK_END_EVENT:
+            event = builder.build_track_end_event(payload, self)
 
-            elif event_type == session_.WebsocketEvent.TRACK_EXCEPTION_EVENT:
-                event = self.client.entity_builder.build_track_exception_event(
-                    mapped_data, self
-                )
+        elif event_type == session_.WebsocketEvent.TRACK_EXCEPTION_EVENT:
+            event = builder.build_track_exception_event(payload, self)
 
-            elif event_type == session_.WebsocketEvent.TRACK_STUCK_EVENT:
-                event = self.client.entity_builder.build_track_stuck_event(
-                    mapped_data, self
-                )
+        elif event_type == session_.WebsocketEvent.TRACK_STUCK_EVENT:
+            event = builder.build_track_stuck_event(payload, self)
 
-            else:
-                event = self.client.entity_builder.build_websocket_closed_event(
-                    mapped_data, self
-                )
+        else:
+            event = builder.build_websocket_closed_event(payload, self)
 
         return event
 
     async def _handle_ws_message(self, msg: aiohttp.WSMessage) -> bool:
         """Returns false if failure or closure, true otherwise."""
         if msg.type == aiohttp.WSMsgType.TEXT:
-            payload_event = events.PayloadEvent.from_session(self, msg.data)
-            event = self._handle_op_code(msg.data)
-
-            await self.app.event_manager.dispatch(payload_event)
-            await self.app.event_manager.dispatch(event)
+            await self._handle_payload(msg.data)
 
             return True
 
@@ -347,6 +591,194 @@ class Session:
 
         return False
 
+    async def _handle_payload(self, data: str) -> None:
+        if self.client._should_dispatch(events.PayloadEvent):
+            await self.app.event_manager.dispatch(
+                events.PayloadEvent.from_session(self, data)
+            )
+
+        event = self._handle_op_code(data)
+
+        if event is None:
+            return
+
+        await self._handle_event(event)
+
+        if self.client._should_dispatch(type(event)):
+            await self.app.event_manager.dispatch(event)
+
+    async def _process(self) -> None:
+        while True:
+            frame = await self._ingest.get()
+
+            if frame is None:
+                return
+
+            try:
+                await self._handle_payload(frame.data)
+            except Exception as e:
+                _logger.warning(f"Failed to handle payload on session {self.name}: {e}")
+
+    async def _handle_event(self, event: hikari.Event) -> None:
+        if isinstance(event, events.ReadyEvent):
+            await self._handle_ready(event)
+            return
+
+        if not isinstance(event, events.TrackEndEvent | events.PlayerUpdateEvent):
+            return
+
+        player = self._players.get(event.guild_id)
+
+        if player is None:
+            return
+
+        # Players handle their events in their own tasks, so one slow player does not hold up the others.
+        if isinstance(event, events.TrackEndEvent):
+            self._schedule(player, player._track_end_event(event))
+        else:
+            self._schedule(player, player._player_update_event(event))
+
+    def _schedule(
+        self, player: Player, handler: typing.Coroutine[typing.Any, typing.Any, None]
+    ) -> None:
+        previous = self._handlers.get(player.guild_id)
+
+        task = asyncio.create_task(self._run_handler(player, previous, handler))
+
+        self._handlers[player.guild_id] = task
+
+        task.add_done_callback(functools.partial(self._handler_done, player.guild_id))
+
+    async def _run_handler(
+        self,
+        player: Player,
+        previous: asyncio.Task[None] | None,
+        handler: typing.Coroutine[typing.Any, typing.Any, None],
+    ) -> None:
+        try:
+            # Events of the same player are still handled in order.
+            if previous is not None:
+                await asyncio.wait((previous,))
+        except asyncio.CancelledError:
+            handler.close()
+            raise
+
+        try:
+            await handler
+        except Exception as e:
+            _logger.warning(
+                f"Failed to handle event for player in guild {player.guild_id} on session {self.name}: {e}"
+            )
+
+    def _handler_done(
+        self, guild_id: hikari.Snowflake, task: asyncio.Task[None]
+    ) -> None:
+        if self._handlers.get(guild_id) is task:
+            del self._handlers[guild_id]
+
+    async def _handle_ready(self, event: events.ReadyEvent) -> None:
+        self._failures = 0
+
+        if event.resumed:
+            _logger.log(
+                TRACE_LEVEL,
+                f"Session {self.name} resumed with {len(self._players)} player(s) intact.",
+            )
+            return
+
+        if self.resume:
+            await self.client.rest.update_session(
+                event.session_id,
+                resuming=True,
+                timeout=self.resume_timeout,
+                session=self,
+            )
+
+            _logger.log(
+                TRACE_LEVEL,
+                f"Enabled resuming for session {self.name} with a timeout of {self.resume_timeout}s",
+            )
+
+        players = tuple(self._players.values())
+
+        results = await asyncio.gather(
+            *(player._restore() for player in players), return_exceptions=True
+        )
+
+        for player, result in zip(players, results):
+            if isinstance(result, Exception):
+                _logger.warning(
+                    f"Failed to restore player in guild {player.guild_id} on session {self.name}: {result}"
+                )
+            elif isinstance(result, BaseException):
+                raise result
+
+    def _has_attempts(self) -> bool:
+        return self._attempts is None or self._failures < self._attempts
+
+    async def _wait_for_reconnect(self) -> None:
+        self._reconnects += 1
+
+        delay = self.reconnect.compute_delay(max(self._failures, 1))
+        self._last_delay = delay
+
+        _logger.log(
+            TRACE_LEVEL,
+            f"Waiting {delay:.2f}s before reconnecting to session {self.name} (attempt {self._failures + 1})",
+        )
+
+        await asyncio.sleep(delay)
+
+    def _get_client_session(self) -> aiohttp.ClientSession:
+        if self.connector is None:
+            return self.client._get_client_session()
+
+        if not self._client_session or self._client_session.closed:
+            self._client_session = self.connector.create_client_session()
+
+        return self._client_session
+
+    async def _close_client_session(self) -> None:
+        if self._client_session:
+            await self._client_session.close()
+
+            self._client_session = None
+
+    async def _connect(self, headers: typing.Mapping[str, typing.Any]) -> None:
+        session = self._get_client_session()
+        async with session.ws_connect(
+            self.base_uri + "/v4/websocket",
+            headers=headers,
+            autoclose=False,
+        ) as ws:
+            _logger.log(
+                TRACE_LEVEL,
+                f"Successfully made connection to session {self.name}",
+            )
+            self._status = session_.SessionStatus.CONNECTED
+            self._last_connected = datetime.datetime.now(datetime.timezone.utc)
+
+            self._ingest.open()
+            processor = asyncio.create_task(self._process())
+
+            try:
+                while True:
+                    msg = await ws.receive()
+
+                    if msg.type == aiohttp.WSMsgType.TEXT:
+                        await self._ingest.put(msg.data)
+                        continue
+
+                    if await self._handle_ws_message(msg) is False:
+                        break
+
+                await self._ingest.close()
+                await processor
+            finally:
+                processor.cancel()
+
+        self._last_disconnected = datetime.datetime.now(datetime.timezone.utc)
+
     async def _websocket(self) -> None:
         bot = self.app.get_me()
 
@@ -356,7 +788,7 @@ class Session:
         )
 
         if not bot:
-            if self._remaining_attempts > 0:
+            if self._has_attempts():
                 self._status = session_.SessionStatus.NOT_CONNECTED
 
                 _logger.warning(
@@ -381,39 +813,43 @@ class Session:
         new_headers.update(self._websocket_headers)
 
         new_headers.update(self.auth_headers)
-        while self._remaining_attempts >= 1:
-            if self._remaining_attempts != self._attempts:
-                await asyncio.sleep(2.5)
 
-            self._remaining_attempts -= 1
+        first_attempt = True
+
+        while self._has_attempts():
+            if not first_attempt:
+                await self._wait_for_reconnect()
+
+            first_attempt = False
+            self._failures += 1
+
+            if self.resume and self.session_id:
+                new_headers["Session-Id"] = self.session_id
+
             try:
-                session = self.client._get_client_session()
-                async with session.ws_connect(
-                    self.base_uri + "/v4/websocket",
-                    headers=new_headers,
-                    autoclose=False,
-                ) as ws:
-                    _logger.log(
-                        TRACE_LEVEL,
-                        f"Successfully made connection to session {self.name}",
+                await self._connect(new_headers)
+
+                if self.resume:
+                    _logger.warning(
+                        f"Session {self.name} disconnected, attempting to resume."
                     )
-                    self._status = session_.SessionStatus.CONNECTED
-                    while True:
-                        msg = await ws.receive()
+                    self._status = session_.SessionStatus.NOT_CONNECTED
+                    continue
+
+                self._status = session_.SessionStatus.FAILURE
+                await self.transfer(self.client.session_handler)
+                return
 
-                        if await self._handle_ws_message(msg) is False:
-                            self._status = session_.SessionStatus.FAILURE
-                            await self.transfer(self.client.session_handler)
-                            return
+            except asyncio.CancelledError:
+                raise
 
             except Exception as e:
                 _logger.warning(f"Websocket connection failure: {e}")
                 self._status = session_.SessionStatus.NOT_CONNECTED
-                break
+                self._last_disconnected = datetime.datetime.now(datetime.timezone.utc)
 
-        else:
-            _logger.warning(f"Session {self.name} has no more attempts.")
-            self._status = session_.SessionStatus.NOT_CONNECTED
+        _logger.warning(f"Session {self.name} has no more attempts.")
+        self._status = session_.SessionStatus.NOT_CONNECTED
 
     def _get_session_id(self) -> str:
         if self.session_id:
@@ -442,7 +878,7 @@ class Session:
             f"Attempting transfer players from session {self.name} to {session.name}",
         )
 
-        for player in self._players.values():
+        for player in tuple(self._players.values()):
             player = await player.transfer(session)
 
             session_handler.add_player(player)
@@ -464,6 +900,11 @@ class Session:
             TRACE_LEVEL,
             f"Starting up session {self.name}",
         )
+        self._failures = 0
+
+        if self.connector:
+            self._get_client_session()
+
         self._session_task = asyncio.create_task(self._websocket())
         _logger.log(
             TRACE_LEVEL,
@@ -488,12 +929,31 @@ class Session:
             except asyncio.CancelledError:
                 self._session_task = None
 
+        for task in tuple(self._handlers.values()):
+            task.cancel()
+
+        await self._close_client_session()
+
         _logger.log(
             TRACE_LEVEL,
             f"Successfully shut down session {self.name}",
         )
 
 
+def _connect_timeout(error: BaseException) -> bool:
+    # aiohttp 3.10 added ConnectionTimeoutError. Before it, timeouts while connecting only differ by their message.
+    connection_timeout: type[BaseException] | None = getattr(
+        aiohttp, "ConnectionTimeoutError", None
+    )
+
+    if connection_timeout is not None:
+        return isinstance(error, connection_timeout)
+
+    return isinstance(error, aiohttp.ServerTimeoutError) and str(error).startswith(
+        "Connection timeout"
+    )
+
+
 # MIT License
 
 # Copyright (c) 2023-present MPlatypusPlatypus
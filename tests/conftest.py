@@ -42,6 +42,7 @@ def ongaku_session(
         port=1234,
         password="password",
         attempts=3,
+        _players={},
     )
 
 
@@ -4,6 +4,7 @@ import datetime
 import typing
 
 import hikari
+import msgspec
 import orjson
 import pytest
 
@@ -11,7 +12,10 @@ from ongaku.abc.errors import SeverityType
 from ongaku.abc.events import TrackEndReasonType
 from ongaku.abc.routeplanner import IPBlockType
 from ongaku.abc.routeplanner import RoutePlannerType
+from ongaku.abc.session import WebsocketEvent
+from ongaku.abc.session import WebsocketOPCode
 from ongaku.builders import EntityBuilder
+from ongaku.errors import RestExceptionError
 from ongaku.session import Session
 from tests import payloads
 
@@ -28,6 +32,12 @@ def test_properties():
     assert builder._loads == orjson.loads
 
 
+def test_dump_payload(builder: EntityBuilder):
+    assert builder.dump_payload({"volume": 50}) == b'{"volume":50}'
+
+    assert builder.dump_payload(["encoded"]) == b'["encoded"]'
+
+
 class TestBuilderErrors:
     def test_build_rest_error(self, builder: EntityBuilder):
         parsed_result = builder.build_rest_error(payloads.REST_ERROR_PAYLOAD)
@@ -384,3 +394,137 @@ class TestBuilderTrack:
         assert parsed_result.uri == "uri"
         assert parsed_result.artwork_url == "artwork_url"
         assert parsed_result.isrc == "isrc"
+
+
+class TestBuilderLoadResult:
+    def test_build_load_result_track(self, builder: EntityBuilder):
+        parsed_result = builder.build_load_result(
+            {"loadType": "track", "data": payloads.TRACK_PAYLOAD}
+        )
+
+        assert parsed_result == builder.build_track(payloads.TRACK_PAYLOAD)
+
+    def test_build_load_result_playlist(self, builder: EntityBuilder):
+        parsed_result = builder.build_load_result(
+            {"loadType": "playlist", "data": payloads.PLAYLIST_PAYLOAD}
+        )
+
+        assert parsed_result == builder.build_playlist(payloads.PLAYLIST_PAYLOAD)
+
+    def test_build_load_result_search(self, builder: EntityBuilder):
+        parsed_result = builder.build_load_result(
+            {"loadType": "search", "data": [payloads.TRACK_PAYLOAD]}
+        )
+
+        assert parsed_result == [builder.build_track(payloads.TRACK_PAYLOAD)]
+
+    def test_build_load_result_empty(self, builder: EntityBuilder):
+        assert builder.build_load_result({"loadType": "empty", "data": {}}) is None
+
+    def test_build_load_result_error(self, builder: EntityBuilder):
+        with pytest.raises(RestExceptionError):
+            builder.build_load_result(
+                {"loadType": "error", "data": payloads.EXCEPTION_ERROR_PAYLOAD}
+            )
+
+    def test_build_load_result_unknown(self, builder: EntityBuilder):
+        with pytest.raises(ValueError):
+            builder.build_load_result({"loadType": "unknown", "data": {}})
+
+
+class TestBuilderMsgspec:
+    @pytest.fixture
+    def msgspec_builder(self) -> EntityBuilder:
+        return EntityBuilder(decoder="msgspec")
+
+    def test_properties(self, builder: EntityBuilder, msgspec_builder: EntityBuilder):
+        assert builder.decoder == "json"
+        assert msgspec_builder.decoder == "msgspec"
+
+    @pytest.mark.parametrize(
+        ("method", "payload"),
+        [
+            ("build_ready_event", payloads.READY_PAYLOAD),
+            ("build_player_update_event", payloads.PLAYER_UPDATE_PAYLOAD),
+            ("build_statistics_event", payloads.STATISTICS_PAYLOAD),
+            ("build_track_start_event", payloads.TRACK_START_PAYLOAD),
+            ("build_track_end_event", payloads.TRACK_END_PAYLOAD),
+            ("build_track_exception_event", payloads.TRACK_EXCEPTION_PAYLOAD),
+            ("build_track_stuck_event", payloads.TRACK_STUCK_PAYLOAD),
+            ("build_websocket_closed_event", payloads.WEBSOCKET_CLOSED_PAYLOAD),
+        ],
+    )
+    def test_build_events(
+        self,
+        ongaku_session: Session,
+        builder: EntityBuilder,
+        msgspec_builder: EntityBuilder,
+        method: str,
+        payload: typing.Mapping[str, typing.Any],
+    ):
+        raw_payload = orjson.dumps(payload)
+
+        assert getattr(msgspec_builder, method)(raw_payload, ongaku_session) == getattr(
+            builder, method
+        )(payload, ongaku_session)
+
+    @pytest.mark.parametrize(
+        ("method", "payload"),
+        [
+            ("build_player", payloads.PLAYER_PAYLOAD),
+            ("build_playlist", payloads.PLAYLIST_PAYLOAD),
+            ("build_statistics", payloads.STATISTICS_PAYLOAD),
+            ("build_track", payloads.TRACK_PAYLOAD),
+        ],
+    )
+    def test_build_entities(
+        self,
+        builder: EntityBuilder,
+        msgspec_builder: EntityBuilder,
+        method: str,
+        payload: typing.Mapping[str, typing.Any],
+    ):
+        raw_payload = orjson.dumps(payload).decode()
+
+        assert getattr(msgspec_builder, method)(raw_payload) == getattr(
+            builder, method
+        )(payload)
+
+    def test_build_websocket_op(
+        self, builder: EntityBuilder, msgspec_builder: EntityBuilder
+    ):
+        for current_builder in (builder, msgspec_builder):
+            assert current_builder.build_websocket_op(
+                orjson.dumps(payloads.READY_PAYLOAD)
+            ) == (WebsocketOPCode.READY, None)
+
+            assert current_builder.build_websocket_op(
+                orjson.dumps(payloads.TRACK_END_PAYLOAD)
+            ) == (WebsocketOPCode.EVENT, WebsocketEvent.TRACK_END_EVENT)
+
+    def test_build_load_result(
+        self, builder: EntityBuilder, msgspec_builder: EntityBuilder
+    ):
+        payload = {"loadType": "search", "data": [payloads.TRACK_PAYLOAD]}
+
+        assert msgspec_builder.build_load_result(
+            orjson.dumps(payload)
+        ) == builder.build_load_result(payload)
+
+        assert (
+            msgspec_builder.build_load_result(
+                orjson.dumps({"loadType": "empty", "data": {}})
+            )
+            is None
+        )
+
+        with pytest.raises(RestExceptionError):
+            msgspec_builder.build_load_result(
+                orjson.dumps(
+                    {"loadType": "error", "data": payloads.EXCEPTION_ERROR_PAYLOAD}
+                )
+            )
+
+    def test_build_malformed(self, msgspec_builder: EntityBuilder):
+        with pytest.raises(msgspec.ValidationError):
+            msgspec_builder.build_track(orjson.dumps({"encoded": "encoded"}))
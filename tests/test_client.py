@@ -1,5 +1,8 @@
 # ruff: noqa: D100, D101, D102, D103
 
+import asyncio
+
+import hikari
 import mock
 import pytest
 from aiohttp import ClientSession
@@ -10,9 +13,13 @@ from tanjun.clients import Client as TanjunClient
 
 from ongaku import Player
 from ongaku import errors
+from ongaku import events
+from ongaku.abc.events import OngakuEvent
 from ongaku.abc.handler import SessionHandler
 from ongaku.builders import EntityBuilder
 from ongaku.client import Client
+from ongaku.config import ConnectorConfig
+from ongaku.config import DispatchConfig
 from ongaku.rest import RESTClient
 from ongaku.session import Session
 
@@ -59,6 +66,21 @@ class TestClient:
 
         assert isinstance(client._get_client_session(), ClientSession)
 
+    @pytest.mark.asyncio
+    async def test_get_client_session_connector(
+        self, gateway_bot: gateway_bot_.GatewayBot
+    ):
+        client = Client(gateway_bot, connector=ConnectorConfig(limit=5))
+
+        client_session = client._get_client_session()
+
+        assert client_session.connector is not None
+        assert client_session.connector.limit == 5
+
+        await client_session.close()
+
+        assert client._get_client_session() is not client_session
+
     @pytest.mark.asyncio
     async def test_create_session(
         self, gateway_bot: gateway_bot_.GatewayBot, ongaku_session: Session
@@ -154,6 +176,23 @@ class TestClient:
         with pytest.raises(errors.PlayerMissingError):
             client.fetch_player(1234567890)
 
+    def test_queue_sizes(self, gateway_bot: gateway_bot_.GatewayBot):
+        client = Client(gateway_bot)
+
+        players = [
+            mock.Mock(guild_id=Snowflake(guild_id), queue=mock.Mock(size=size))
+            for guild_id, size in ((1, 2048), (2, 0), (3, 1 << 20))
+        ]
+
+        with mock.patch.object(client, "_session_handler", mock.Mock(players=players)):
+            sizes = client.queue_sizes()
+
+        assert list(sizes.items()) == [
+            (Snowflake(3), 1 << 20),
+            (Snowflake(1), 2048),
+            (Snowflake(2), 0),
+        ]
+
     @pytest.mark.asyncio
     async def test_player_delete(self, gateway_bot: gateway_bot_.GatewayBot):
         client = Client(gateway_bot)
@@ -170,3 +209,97 @@ class TestClient:
             await client.session_handler.delete_player(Snowflake(1234567890))
 
             patched_delete_player.assert_called_once_with(Snowflake(1234567890))
+
+    def test_should_dispatch(self):
+        bot = hikari.GatewayBot("fake_token", banner=None)
+
+        client = Client(bot)
+
+        assert isinstance(client.dispatch, DispatchConfig)
+
+        assert client._should_dispatch(events.PayloadEvent) is False
+        assert client._should_dispatch(events.StatisticsEvent) is False
+
+        async def callback(_: events.PayloadEvent) -> None: ...
+
+        bot.event_manager.subscribe(events.PayloadEvent, callback)
+
+        assert client._should_dispatch(events.PayloadEvent) is True
+        assert client._should_dispatch(events.StatisticsEvent) is False
+
+        bot.event_manager.unsubscribe(events.PayloadEvent, callback)
+
+        assert client._should_dispatch(events.PayloadEvent) is False
+
+    def test_should_dispatch_polymorphic(self):
+        bot = hikari.GatewayBot("fake_token", banner=None)
+
+        client = Client(bot)
+
+        async def callback(_: hikari.Event) -> None: ...
+
+        bot.event_manager.subscribe(OngakuEvent, callback)
+
+        assert client._should_dispatch(events.StatisticsEvent) is True
+        assert client._should_dispatch(events.PayloadEvent) is True
+
+    @pytest.mark.asyncio
+    async def test_should_dispatch_waiter(self):
+        bot = hikari.GatewayBot("fake_token", banner=None)
+
+        client = Client(bot)
+
+        waiter = asyncio.create_task(
+            bot.event_manager.wait_for(events.StatisticsEvent, timeout=None)
+        )
+
+        await asyncio.sleep(0)
+
+        # Waiters are only found through this private method, of the pinned hikari version.
+        assert hasattr(bot.event_manager, "_enabled_for_event")
+
+        assert client._should_dispatch(events.StatisticsEvent) is True
+
+        waiter.cancel()
+
+    def test_should_dispatch_listeners_only(self, caplog: pytest.LogCaptureFixture):
+        bot = hikari.GatewayBot("fake_token", banner=None)
+
+        client = Client(bot)
+
+        event_manager = mock.Mock(spec=["get_listeners"])
+        event_manager.get_listeners.return_value = []
+
+        with mock.patch.object(client, "_app", mock.Mock(event_manager=event_manager)):
+            assert client._should_dispatch(events.StatisticsEvent) is False
+
+            event_manager.get_listeners.return_value = [mock.Mock()]
+
+            assert client._should_dispatch(events.StatisticsEvent) is True
+
+        event_manager.get_listeners.assert_called_with(events.StatisticsEvent)
+
+        assert "cannot be checked for waiters" in caplog.text
+
+    def test_should_dispatch_config(self):
+        bot = hikari.GatewayBot("fake_token", banner=None)
+
+        client = Client(
+            bot,
+            dispatch=DispatchConfig(
+                exclude=[events.StatisticsEvent], check_listeners=False
+            ),
+        )
+
+        assert client._should_dispatch(events.StatisticsEvent) is False
+        assert client._should_dispatch(events.PayloadEvent) is True
+
+        client = Client(
+            bot,
+            dispatch=DispatchConfig(
+                include=[events.TrackStartEvent], check_listeners=False
+            ),
+        )
+
+        assert client._should_dispatch(events.TrackStartEvent) is True
+        assert client._should_dispatch(events.PayloadEvent) is False
@@ -0,0 +1,155 @@
+# ruff: noqa: D100, D101, D102, D103
+
+import base64
+import struct
+
+import pytest
+
+from ongaku import codec
+from ongaku.errors import BuildError
+from ongaku.impl.track import TrackInfo
+from tests.conftest import ENCODED_TRACK
+
+
+def _info(
+    *,
+    identifier: str = "identifier",
+    title: str = "title",
+    artwork_url: str | None = None,
+    isrc: str | None = None,
+) -> TrackInfo:
+    return TrackInfo(
+        identifier,
+        True,
+        "author",
+        1000,
+        False,
+        500,
+        title,
+        "youtube",
+        "https://youtube.com/watch?v=identifier",
+        artwork_url,
+        isrc,
+    )
+
+
+def _text(text: str) -> bytes:
+    return struct.pack(">H", len(text)) + text.encode()
+
+
+def test_decode_track():
+    track = codec.decode_track(ENCODED_TRACK)
+
+    assert track.encoded == ENCODED_TRACK
+    assert track.plugin_info == {}
+    assert track.user_data == {}
+    assert track.requestor is None
+
+    assert track.info.title == "DEAD AHEAD | Dredge Song!"
+    assert track.info.author == "The Stupendium"
+    assert track.info.length == 313000
+    assert track.info.identifier == "d3BQ-UZh0a8"
+    assert track.info.is_stream is False
+    assert track.info.is_seekable is True
+    assert track.info.uri == "https://www.youtube.com/watch?v=d3BQ-UZh0a8"
+    assert (
+        track.info.artwork_url == "https://i.ytimg.com/vi/d3BQ-UZh0a8/maxresdefault.jpg"
+    )
+    assert track.info.isrc is None
+    assert track.info.source_name == "youtube"
+    assert track.info.position == 0
+
+
+def test_decode_track_version_1():
+    body = (
+        _text("title")
+        + _text("author")
+        + struct.pack(">q", 1000)
+        + _text("identifier")
+        + b"\x01"
+        + _text("http")
+        # Source specific data, which is skipped.
+        + _text("probe")
+        + struct.pack(">q", 20)
+    )
+
+    encoded = base64.b64encode(struct.pack(">I", len(body)) + body).decode()
+
+    info = codec.decode_track(encoded).info
+
+    assert info.title == "title"
+    assert info.is_stream is True
+    assert info.is_seekable is False
+    assert info.uri is None
+    assert info.source_name == "http"
+    assert info.position == 20
+
+
+def test_decode_track_invalid():
+    with pytest.raises(BuildError):
+        codec.decode_track("not base64!")
+
+    with pytest.raises(BuildError):
+        codec.decode_track(ENCODED_TRACK[:40])
+
+    # An unknown version.
+    with pytest.raises(BuildError):
+        codec.decode_track(base64.b64encode(b"\x40\x00\x00\x01\x09").decode())
+
+
+def test_decode_tracks():
+    tracks = codec.decode_tracks([ENCODED_TRACK, ENCODED_TRACK])
+
+    assert len(tracks) == 2
+
+    # Duplicates are decoded once, but are still separate tracks.
+    assert tracks[0] is not tracks[1]
+    assert tracks[0].info is tracks[1].info
+
+
+def test_encode_track():
+    assert codec.encode_track(codec.decode_track(ENCODED_TRACK).info) == ENCODED_TRACK
+
+    info = _info(
+        title="null \x00 and emoji \U0001f3b5 and ü",
+        artwork_url="https://example.com/artwork.png",
+        isrc="isrc",
+    )
+
+    decoded = codec.decode_track(codec.encode_track(info)).info
+
+    assert decoded.title == info.title
+    assert decoded.author == info.author
+    assert decoded.length == info.length
+    assert decoded.identifier == info.identifier
+    assert decoded.is_stream == info.is_stream
+    assert decoded.position == info.position
+    assert decoded.source_name == info.source_name
+    assert decoded.uri == info.uri
+    assert decoded.artwork_url == info.artwork_url
+    assert decoded.isrc == info.isrc
+
+
+def test_encode_track_modified_utf8():
+    encoded = codec.encode_track(_info(title="\x00\U0001f3b5"))
+
+    data = base64.b64decode(encoded)
+
+    # Java encodes null as two bytes, and characters outside the BMP as a surrogate pair.
+    assert b"\x00\x08\xc0\x80\xed\xa0\xbc\xed\xbe\xb5" in data
+
+
+def test_encode_track_too_long():
+    with pytest.raises(ValueError):
+        codec.encode_track(_info(title="a" * 70000))
+
+
+def test_encode_tracks():
+    infos = [_info(identifier="first"), _info(identifier="second")]
+
+    encoded = codec.encode_tracks(infos)
+
+    assert [track.info.identifier for track in codec.decode_tracks(encoded)] == [
+        "first",
+        "second",
+    ]
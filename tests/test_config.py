@@ -0,0 +1,311 @@
+# ruff: noqa: D100, D101, D102, D103
+
+import aiohttp
+import pytest
+
+from ongaku import events
+from ongaku.abc.events import OngakuEvent
+from ongaku.config import ConnectorConfig
+from ongaku.config import DispatchConfig
+from ongaku.config import IngestConfig
+from ongaku.config import PlayerConfig
+from ongaku.config import ReconnectConfig
+from ongaku.config import RequestConfig
+from ongaku.config import TrackCacheConfig
+
+
+class TestReconnectConfig:
+    def test_properties(self):
+        config = ReconnectConfig(
+            base_delay=0.5, max_delay=10, multiplier=3, jitter=False
+        )
+
+        assert config.base_delay == 0.5
+        assert config.max_delay == 10
+        assert config.multiplier == 3
+        assert config.jitter is False
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            ReconnectConfig(base_delay=-1)
+
+        with pytest.raises(ValueError):
+            ReconnectConfig(multiplier=0.5)
+
+    def test_compute_delay(self):
+        config = ReconnectConfig(base_delay=1, max_delay=10, jitter=False)
+
+        assert config.compute_delay(0) == 0
+        assert config.compute_delay(1) == 1
+        assert config.compute_delay(2) == 2
+        assert config.compute_delay(3) == 4
+        assert config.compute_delay(5) == 10
+        assert config.compute_delay(10_000) == 10
+
+    def test_compute_delay_jitter(self):
+        config = ReconnectConfig(base_delay=1, max_delay=10)
+
+        for failures in range(1, 20):
+            delay = config.compute_delay(failures)
+
+            assert 0 <= delay <= min(10, 2 ** (failures - 1))
+
+
+class TestDispatchConfig:
+    def test_properties(self):
+        config = DispatchConfig(
+            include=[events.TrackStartEvent],
+            exclude=[events.PayloadEvent],
+            check_listeners=False,
+        )
+
+        assert config.include == (events.TrackStartEvent,)
+        assert config.exclude == (events.PayloadEvent,)
+        assert config.check_listeners is False
+
+    def test_allows(self):
+        config = DispatchConfig()
+
+        assert config.allows(events.PayloadEvent) is True
+        assert config.allows(events.StatisticsEvent) is True
+
+    def test_allows_exclude(self):
+        config = DispatchConfig(exclude=[OngakuEvent])
+
+        assert config.allows(events.PayloadEvent) is False
+        assert config.allows(events.QueueEmptyEvent) is False
+
+    def test_allows_include(self):
+        config = DispatchConfig(
+            include=[events.TrackStartEvent, events.TrackEndEvent],
+            exclude=[events.TrackEndEvent],
+        )
+
+        assert config.allows(events.TrackStartEvent) is True
+        assert config.allows(events.TrackEndEvent) is False
+        assert config.allows(events.PayloadEvent) is False
+
+
+class TestIngestConfig:
+    def test_properties(self):
+        config = IngestConfig(max_size=10, overflow="block")
+
+        assert config.max_size == 10
+        assert config.overflow == "block"
+
+    def test_defaults(self):
+        config = IngestConfig()
+
+        assert config.max_size == 1000
+        assert config.overflow == "drop_stale"
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            IngestConfig(max_size=0)
+
+        with pytest.raises(ValueError):
+            IngestConfig(overflow="drop_everything")  # type: ignore
+
+
+class TestConnectorConfig:
+    def test_properties(self):
+        config = ConnectorConfig(
+            limit=10,
+            limit_per_host=2,
+            keepalive_timeout=30,
+            use_dns_cache=False,
+            ttl_dns_cache=None,
+            force_close=True,
+        )
+
+        assert config.limit == 10
+        assert config.limit_per_host == 2
+        assert config.keepalive_timeout == 30
+        assert config.use_dns_cache is False
+        assert config.ttl_dns_cache is None
+        assert config.force_close is True
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            ConnectorConfig(limit=-1)
+
+        with pytest.raises(ValueError):
+            ConnectorConfig(limit_per_host=-1)
+
+        with pytest.raises(ValueError):
+            ConnectorConfig(keepalive_timeout=-1)
+
+    @pytest.mark.asyncio
+    async def test_create_connector(self):
+        connector = ConnectorConfig(limit=10, limit_per_host=2).create_connector()
+
+        assert isinstance(connector, aiohttp.TCPConnector)
+        assert connector.limit == 10
+        assert connector.limit_per_host == 2
+        assert connector.force_close is False
+
+        await connector.close()
+
+    @pytest.mark.asyncio
+    async def test_create_connector_force_close(self):
+        connector = ConnectorConfig(force_close=True).create_connector()
+
+        assert connector.force_close is True
+
+        await connector.close()
+
+    @pytest.mark.asyncio
+    async def test_create_client_session(self):
+        client_session = ConnectorConfig(limit=3).create_client_session()
+
+        assert client_session.connector is not None
+        assert client_session.connector.limit == 3
+
+        await client_session.close()
+
+
+class TestRequestConfig:
+    def test_properties(self):
+        backoff = ReconnectConfig(base_delay=0)
+
+        config = RequestConfig(
+            total_timeout=5,
+            connect_timeout=None,
+            retries=4,
+            unsafe_retries=0,
+            retry_statuses=[500],
+            backoff=backoff,
+        )
+
+        assert config.total_timeout == 5
+        assert config.connect_timeout is None
+        assert config.retries == 4
+        assert config.unsafe_retries == 0
+        assert config.retry_statuses == (500,)
+        assert config.backoff == backoff
+
+    def test_defaults(self):
+        config = RequestConfig()
+
+        assert config.total_timeout == 30
+        assert config.connect_timeout == 10
+        assert config.retries == 2
+        assert config.unsafe_retries == 1
+        assert config.retry_statuses == (502, 503, 504)
+        assert config.backoff.max_delay == 5
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            RequestConfig(total_timeout=0)
+
+        with pytest.raises(ValueError):
+            RequestConfig(connect_timeout=-1)
+
+        with pytest.raises(ValueError):
+            RequestConfig(retries=-1)
+
+    def test_timeout(self):
+        timeout = RequestConfig(total_timeout=5, connect_timeout=2).timeout
+
+        assert timeout.total == 5
+        assert timeout.connect == 2
+
+
+class TestPlayerConfig:
+    def test_properties(self):
+        config = PlayerConfig(
+            optimistic=True,
+            mailbox=True,
+            history=5,
+            history_bytes=1024,
+            max_tracks=100,
+            max_bytes=4096,
+            max_requestor_tracks=10,
+            max_requestor_bytes=512,
+        )
+
+        assert config.optimistic is True
+        assert config.mailbox is True
+        assert config.history == 5
+        assert config.history_bytes == 1024
+        assert config.max_tracks == 100
+        assert config.max_bytes == 4096
+        assert config.max_requestor_tracks == 10
+        assert config.max_requestor_bytes == 512
+
+    def test_defaults(self):
+        config = PlayerConfig()
+
+        assert config.optimistic is False
+        assert config.mailbox is False
+        assert config.history == 25
+        assert config.history_bytes == 256 * 1024
+        assert config.max_tracks is None
+        assert config.max_bytes is None
+        assert config.max_requestor_tracks is None
+        assert config.max_requestor_bytes is None
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            PlayerConfig(history=-1)
+
+        with pytest.raises(ValueError):
+            PlayerConfig(history_bytes=-1)
+
+        with pytest.raises(ValueError):
+            PlayerConfig(max_tracks=0)
+
+        with pytest.raises(ValueError):
+            PlayerConfig(max_requestor_bytes=0)
+
+
+class TestTrackCacheConfig:
+    def test_properties(self):
+        config = TrackCacheConfig(
+            max_entries=10,
+            max_bytes=2048,
+            track_ttl=1,
+            playlist_ttl=2,
+            search_ttl=3,
+            empty_ttl=0,
+            path="tracks.db",
+            max_disk_results=20,
+            max_disk_tracks=30,
+            disk_timeout=1,
+        )
+
+        assert config.max_entries == 10
+        assert config.max_bytes == 2048
+        assert config.track_ttl == 1
+        assert config.playlist_ttl == 2
+        assert config.search_ttl == 3
+        assert config.empty_ttl == 0
+        assert config.path == "tracks.db"
+        assert config.max_disk_results == 20
+        assert config.max_disk_tracks == 30
+        assert config.disk_timeout == 1
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            TrackCacheConfig(max_entries=0)
+
+        with pytest.raises(ValueError):
+            TrackCacheConfig(max_bytes=0)
+
+        with pytest.raises(ValueError):
+            TrackCacheConfig(empty_ttl=-1)
+
+        with pytest.raises(ValueError):
+            TrackCacheConfig(max_disk_tracks=0)
+
+        with pytest.raises(ValueError):
+            TrackCacheConfig(disk_timeout=-1)
+
+    def test_ttl(self):
+        config = TrackCacheConfig()
+
+        assert config.ttl("track") == config.track_ttl
+        assert config.ttl("playlist") == config.playlist_ttl
+        assert config.ttl("search") == config.search_ttl
+        assert config.ttl("empty") == config.empty_ttl
+        assert config.ttl("error") == 0
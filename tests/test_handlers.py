@@ -256,4 +256,6 @@ class TestBasicSessionHandler:
 
             assert len(handler.players) == 0
 
+            assert Snowflake(1234567890) not in ongaku_session._players
+
             patched_player.assert_called_once()
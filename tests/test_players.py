@@ -1,5 +1,6 @@
 # ruff: noqa: D100, D101, D102, D103
 
+import asyncio
 import datetime
 import typing
 
@@ -15,11 +16,13 @@ from ongaku import errors
 from ongaku import events
 from ongaku.abc.events import TrackEndReasonType
 from ongaku.client import Client
+from ongaku.config import PlayerConfig
 from ongaku.impl import player as player_
 from ongaku.impl import playlist
 from ongaku.impl.player import Voice
 from ongaku.impl.track import Track
 from ongaku.impl.track import TrackInfo
+from ongaku.internal.memory import track_size
 from ongaku.player import Player
 from ongaku.session import Session
 
@@ -248,7 +251,7 @@ class TestPlayer:
             patched_update.assert_called_once_with(
                 ongaku_session._get_session_id(),
                 Snowflake(1234567890),
-                track=track,
+                track=new_player.queue[0],
                 no_replace=False,
                 session=ongaku_session,
             )
@@ -345,6 +348,40 @@ class TestPlayer:
         assert new_player.queue[4].requestor == Snowflake(333)
         assert new_player.queue[5].requestor is None
 
+    @pytest.mark.asyncio
+    async def test_add_unique(self, ongaku_session: Session, track_info: TrackInfo):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        other_info = TrackInfo(
+            "other_identifier",
+            False,
+            "author",
+            100,
+            False,
+            0,
+            "title",
+            "source_name",
+            None,
+            None,
+            None,
+        )
+
+        tracks = [
+            Track("encoded_1", track_info, {}, {}, None),
+            Track("encoded_2", track_info, {}, {}, None),
+            Track("encoded_3", other_info, {}, {}, None),
+        ]
+
+        new_player.add(tracks[0])
+        new_player.add(tracks[1:], unique=True)
+
+        # Tracks with an identifier that is already queued are skipped.
+        assert new_player.queue == [tracks[0], tracks[2]]
+
+        new_player.add(tracks[1])
+
+        assert len(new_player.queue) == 3
+
     @pytest.mark.asyncio
     async def test_pause(self, ongaku_session: Session, track: Track):
         new_player = Player(ongaku_session, Snowflake(1234567890))
@@ -439,7 +476,7 @@ class TestPlayer:
 
         # Queue has 1 track
 
-        new_player._queue = []
+        new_player._queue.clear()
 
         new_player.add(track)
 
@@ -448,7 +485,7 @@ class TestPlayer:
 
         # Queue has 2 tracks
 
-        new_player._queue = []
+        new_player._queue.clear()
 
         new_player.add([mock.Mock(), mock.Mock()])
 
@@ -514,6 +551,40 @@ class TestPlayer:
 
             assert len(new_player.queue) == 0
 
+    @pytest.mark.asyncio
+    async def test_skip_fair(self, ongaku_session: Session, track_info: TrackInfo):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        assert new_player.set_fair(True) is True
+
+        tracks = [Track(f"encoded_{i}", track_info, {}, {}, None) for i in range(3)]
+
+        new_player.add(tracks[:2], requestor=Snowflake(1))
+        new_player.add(tracks[2], requestor=Snowflake(2))
+
+        with (
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch("ongaku.rest.RESTClient.update_player") as patched_update,
+        ):
+            await new_player.skip()
+
+            # The second requestor gets their turn, before the rest of the playlist.
+            patched_update.assert_called_once_with(
+                "session_id",
+                Snowflake(1234567890),
+                track=new_player.queue[0],
+                no_replace=False,
+                session=ongaku_session,
+            )
+
+        assert [track.encoded for track in new_player.queue] == [
+            tracks[2].encoded,
+            tracks[1].encoded,
+        ]
+        assert new_player.set_fair() is False
+
     @pytest.mark.asyncio
     async def test_remove(self, ongaku_session: Session, track: Track):
         new_player = Player(ongaku_session, Snowflake(1234567890))
@@ -545,7 +616,7 @@ class TestPlayer:
 
         # Test empty queue
 
-        new_player._queue = []
+        new_player._queue.clear()
 
         with pytest.raises(errors.PlayerQueueError):
             new_player.remove(0)
@@ -560,6 +631,86 @@ class TestPlayer:
         with pytest.raises(errors.PlayerQueueError):
             new_player.remove(track)
 
+    @pytest.mark.asyncio
+    async def test_remove_requestor(
+        self, ongaku_session: Session, track_info: TrackInfo
+    ):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        tracks = [Track(f"encoded_{i}", track_info, {}, {}, None) for i in range(5)]
+
+        new_player.add(tracks[:3], Snowflake(1))
+        new_player.add(tracks[3:], Snowflake(2))
+
+        removed = new_player.remove_requestor(Snowflake(1))
+
+        assert [track.encoded for track in removed] == [
+            track.encoded for track in tracks[:3]
+        ]
+        assert new_player.remove_requestor(Snowflake(1)) == []
+        assert [track.encoded for track in new_player.queue] == [
+            track.encoded for track in tracks[3:]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_add_shared(self, ongaku_session: Session, track_info: TrackInfo):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        track = Track("encoded", track_info, {}, {}, None)
+
+        # The same track, requested by two people, keeps each requestor.
+        new_player.add(track, Snowflake(1))
+        new_player.add(track, Snowflake(2))
+
+        assert track.requestor is None
+        assert [queued.requestor for queued in new_player.queue] == [
+            Snowflake(1),
+            Snowflake(2),
+        ]
+        assert new_player.queue.count_requestor(Snowflake(1)) == 1
+        assert new_player.queue.count_requestor(Snowflake(2)) == 1
+
+        assert len(new_player.remove_requestor(Snowflake(1))) == 1
+        assert new_player.queue.count_requestor(Snowflake(1)) == 0
+        assert new_player.queue.count_requestor(Snowflake(2)) == 1
+
+    @pytest.mark.asyncio
+    async def test_time_until(self, ongaku_session: Session, track_info: TrackInfo):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        assert new_player.time_until() == 0
+
+        info = TrackInfo(
+            "identifier",
+            True,
+            "author",
+            60000,
+            False,
+            0,
+            "title",
+            "source_name",
+            None,
+            None,
+            None,
+        )
+
+        tracks = [Track(f"encoded_{i}", info, {}, {}, None) for i in range(3)]
+
+        new_player.add(tracks)
+        new_player._position = 15000
+
+        assert new_player.time_until(0) == 0
+        assert new_player.time_until(2) == 105000
+        assert new_player.time_until() == 165000
+
+        # Streams have no length.
+        new_player.add(Track("encoded_stream", track_info, {}, {}, None))
+        new_player.add(tracks[0])
+
+        assert new_player.time_until(3) == 165000
+        assert new_player.time_until(4) is None
+        assert new_player.time_until() is None
+
     @pytest.mark.asyncio
     async def test_clear(self, ongaku_session: Session, track: Track):
         new_player = Player(ongaku_session, Snowflake(1234567890))
@@ -732,7 +883,7 @@ class TestPlayer:
 
         # Queue is empty
 
-        new_player._queue = []
+        new_player._queue.clear()
 
         with (
             mock.patch.object(
@@ -889,6 +1040,738 @@ class TestPlayer:
         await new_player._player_update_event(event)
 
         assert new_player.state == state
+        assert new_player.position == 1
+
+
+class TestPlayerBatch:
+    @pytest.mark.asyncio
+    async def test_batch(self, ongaku_session: Session, track: Track):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        new_player.add(track)
+
+        with (
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch(
+                "ongaku.rest.RESTClient.update_player",
+                return_value=player_.Player(
+                    Snowflake(1234567890),
+                    track,
+                    50,
+                    False,
+                    mock.Mock(),
+                    mock.Mock(),
+                    {"volume": 0.5},
+                ),
+            ) as patched_update,
+        ):
+            async with new_player.batch():
+                await new_player.set_volume(20)
+                await new_player.set_volume(50)
+                await new_player.set_position(10)
+                await new_player.pause(False)
+                await new_player.set_filters({"volume": 0.5})
+
+                patched_update.assert_not_called()
+
+            patched_update.assert_called_once_with(
+                "session_id",
+                Snowflake(1234567890),
+                volume=50,
+                position=10,
+                paused=False,
+                filters={"volume": 0.5},
+                no_replace=False,
+                session=ongaku_session,
+            )
+
+        assert new_player.volume == 50
+        assert new_player.is_paused is False
+        assert new_player.filters == {"volume": 0.5}
+
+    @pytest.mark.asyncio
+    async def test_batch_new_track(self, ongaku_session: Session, track: Track):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        new_player.add([track, track])
+
+        new_player._channel_id = Snowflake(987654321)
+
+        with (
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch("ongaku.rest.RESTClient.update_player") as patched_update,
+        ):
+            async with new_player.batch():
+                await new_player.set_position(10)
+                await new_player.skip()
+
+                # Nested batches join the outer batch.
+                async with new_player.batch():
+                    await new_player.pause(True)
+
+            # The position applied to the previous track, so it is not sent.
+            patched_update.assert_called_once_with(
+                "session_id",
+                Snowflake(1234567890),
+                track=track,
+                paused=True,
+                no_replace=False,
+                session=ongaku_session,
+            )
+
+    @pytest.mark.asyncio
+    async def test_batch_error(self, ongaku_session: Session):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        with (
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch("ongaku.rest.RESTClient.update_player") as patched_update,
+        ):
+            with pytest.raises(RuntimeError):
+                async with new_player.batch():
+                    await new_player.set_volume(20)
+
+                    raise RuntimeError
+
+            # Empty batches send nothing.
+            async with new_player.batch():
+                pass
+
+            patched_update.assert_not_called()
+
+        assert new_player._pending == {}
+
+    @pytest.mark.asyncio
+    async def test_batch_other_task(self, ongaku_session: Session):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        with (
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch("ongaku.rest.RESTClient.update_player") as patched_update,
+        ):
+            async with new_player.batch():
+                await new_player.pause(True)
+
+                # Changes from other tasks are not merged into this batch.
+                await asyncio.create_task(new_player.set_volume(20))
+
+                patched_update.assert_called_once_with(
+                    "session_id",
+                    Snowflake(1234567890),
+                    volume=20,
+                    no_replace=False,
+                    session=ongaku_session,
+                )
+
+            assert patched_update.call_args_list[1] == mock.call(
+                "session_id",
+                Snowflake(1234567890),
+                paused=True,
+                session=ongaku_session,
+            )
+
+        assert new_player._pending == {}
+
+
+class TestPlayerOptimistic:
+    @pytest.mark.asyncio
+    async def test_applied(self, ongaku_session: Session):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        async def update_player(*args: typing.Any, **kwargs: typing.Any):
+            # The change is visible before lavalink has responded.
+            assert new_player.volume == 50
+
+            return player_.Player(
+                Snowflake(1234567890), None, 40, True, mock.Mock(), mock.Mock(), {}
+            )
+
+        with (
+            mock.patch.object(
+                ongaku_session.client,
+                "_player_config",
+                PlayerConfig(optimistic=True),
+            ),
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch(
+                "ongaku.rest.RESTClient.update_player", side_effect=update_player
+            ) as patched_update,
+        ):
+            await new_player.set_volume(50)
+
+            patched_update.assert_called_once_with(
+                "session_id",
+                Snowflake(1234567890),
+                volume=50,
+                no_replace=False,
+                session=ongaku_session,
+            )
+
+        # Reconciled with the response.
+        assert new_player.volume == 40
+
+    @pytest.mark.asyncio
+    async def test_skipped(self, ongaku_session: Session):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        new_player._volume = 50
+
+        with (
+            mock.patch.object(
+                ongaku_session.client,
+                "_player_config",
+                PlayerConfig(optimistic=True),
+            ),
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch("ongaku.rest.RESTClient.update_player") as patched_update,
+        ):
+            await new_player.set_volume(50)
+            await new_player.pause(True)
+            await new_player.set_filters({})
+
+            patched_update.assert_not_called()
+
+            await new_player.pause(False)
+
+            patched_update.assert_called_once_with(
+                "session_id",
+                Snowflake(1234567890),
+                paused=False,
+                session=ongaku_session,
+            )
+
+    @pytest.mark.asyncio
+    async def test_rollback(self, ongaku_session: Session):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        new_player._volume = 50
+
+        with (
+            mock.patch.object(
+                ongaku_session.client,
+                "_player_config",
+                PlayerConfig(optimistic=True),
+            ),
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch(
+                "ongaku.rest.RESTClient.update_player",
+                side_effect=errors.RestEmptyError,
+            ),
+        ):
+            with pytest.raises(errors.RestEmptyError):
+                await new_player.set_volume(20)
+
+            assert new_player.volume == 50
+
+            with pytest.raises(errors.RestEmptyError):
+                async with new_player.batch():
+                    await new_player.set_volume(30)
+                    await new_player.pause(False)
+                    await new_player.set_filters({"volume": 0.5})
+
+                    assert new_player.volume == 30
+                    assert new_player.is_paused is False
+                    assert new_player.filters == {"volume": 0.5}
+
+        assert new_player.volume == 50
+        assert new_player.is_paused is True
+        assert new_player.filters == {}
+
+    @pytest.mark.asyncio
+    async def test_rollback_overlapping(self, ongaku_session: Session):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        new_player._volume = 50
+        new_player._is_paused = False
+
+        release = asyncio.Event()
+
+        async def update_player(*args: typing.Any, **kwargs: typing.Any):
+            if "volume" in kwargs:
+                await release.wait()
+
+                raise errors.RestEmptyError
+
+            return player_.Player(
+                Snowflake(1234567890), None, 50, True, mock.Mock(), mock.Mock(), {}
+            )
+
+        with (
+            mock.patch.object(
+                ongaku_session.client,
+                "_player_config",
+                PlayerConfig(optimistic=True),
+            ),
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch(
+                "ongaku.rest.RESTClient.update_player", side_effect=update_player
+            ),
+        ):
+            volume = asyncio.create_task(new_player.set_volume(20))
+
+            await asyncio.sleep(0)
+
+            await new_player.pause(True)
+
+            release.set()
+
+            with pytest.raises(errors.RestEmptyError):
+                await volume
+
+        # Only the failed update is rolled back, the pause that succeeded in the meantime is kept.
+        assert new_player.is_paused is True
+        assert new_player.volume == 50
+
+
+class TestPlayerMailbox:
+    @pytest.mark.asyncio
+    async def test_collapsed(self, ongaku_session: Session, track_info: TrackInfo):
+        with mock.patch.object(
+            ongaku_session.client, "_player_config", PlayerConfig(mailbox=True)
+        ):
+            new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        assert new_player._mailbox is not None
+
+        tracks = [Track(f"encoded_{i}", track_info, {}, {}, None) for i in range(6)]
+
+        new_player.add(tracks)
+
+        with (
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch("ongaku.rest.RESTClient.update_player") as patched_update,
+        ):
+            await asyncio.gather(*(new_player.skip() for _ in range(5)))
+
+            patched_update.assert_called_once_with(
+                "session_id",
+                Snowflake(1234567890),
+                track=tracks[5],
+                no_replace=False,
+                session=ongaku_session,
+            )
+
+        assert new_player.queue == [tracks[5]]
+        assert new_player._mailbox.submitted == 5
+        assert new_player._mailbox.batches == 1
+        assert new_player._mailbox.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_errors(self, ongaku_session: Session, track: Track):
+        with mock.patch.object(
+            ongaku_session.client, "_player_config", PlayerConfig(mailbox=True)
+        ):
+            new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        new_player.add([track, track])
+
+        with (
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch(
+                "ongaku.rest.RESTClient.update_player",
+                side_effect=[errors.RestEmptyError(), mock.Mock()],
+            ) as patched_update,
+            mock.patch("ongaku.rest.RESTClient.delete_player") as patched_delete,
+            mock.patch.object(
+                ongaku_session.client.app,
+                "update_voice_state",
+                new_callable=mock.AsyncMock,
+            ),
+        ):
+            results = await asyncio.gather(
+                new_player.skip(0),
+                new_player.set_volume(10),
+                new_player.disconnect(),
+                return_exceptions=True,
+            )
+
+            # The batched volume is sent before the player is cleared, and deleted.
+            assert patched_update.call_args_list == [
+                mock.call(
+                    "session_id",
+                    Snowflake(1234567890),
+                    volume=10,
+                    no_replace=False,
+                    session=ongaku_session,
+                ),
+                mock.call(
+                    "session_id",
+                    Snowflake(1234567890),
+                    track=None,
+                    no_replace=False,
+                    session=ongaku_session,
+                ),
+            ]
+            patched_delete.assert_called_once()
+
+        assert isinstance(results[0], ValueError)
+        assert isinstance(results[1], errors.RestEmptyError)
+        assert results[2] is None
+        assert new_player._mailbox is not None
+        assert new_player._mailbox.batches == 1
+
+    @pytest.mark.asyncio
+    async def test_nested(self, ongaku_session: Session, track: Track):
+        with mock.patch.object(
+            ongaku_session.client, "_player_config", PlayerConfig(mailbox=True)
+        ):
+            new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        new_player._channel_id = Snowflake(987654321)
+
+        new_player.add([track, track])
+
+        event = events.TrackEndEvent.from_session(
+            ongaku_session,
+            Snowflake(1234567890),
+            track=track,
+            reason=TrackEndReasonType.FINISHED,
+        )
+
+        with (
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch.object(
+                ongaku_session.client.app.event_manager,
+                "dispatch",
+                new_callable=mock.AsyncMock,
+            ),
+            mock.patch("ongaku.rest.RESTClient.update_player") as patched_update,
+        ):
+            # Autoplay calls play from inside the operation, without waiting on the mailbox.
+            await new_player._track_end_event(event)
+
+            patched_update.assert_called_once_with(
+                "session_id",
+                Snowflake(1234567890),
+                track=track,
+                no_replace=False,
+                session=ongaku_session,
+            )
+
+        assert len(new_player.queue) == 1
+
+    @pytest.mark.asyncio
+    async def test_track_end_listener(self, ongaku_session: Session, track: Track):
+        with mock.patch.object(
+            ongaku_session.client, "_player_config", PlayerConfig(mailbox=True)
+        ):
+            new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        new_player._channel_id = Snowflake(987654321)
+
+        new_player.add([track])
+
+        event = events.TrackEndEvent.from_session(
+            ongaku_session,
+            Snowflake(1234567890),
+            track=track,
+            reason=TrackEndReasonType.FINISHED,
+        )
+
+        dispatched: list[Event] = []
+
+        async def dispatch(queue_event: Event) -> None:
+            # Listeners run in their own tasks, so they have to queue on the mailbox.
+            dispatched.append(queue_event)
+            await asyncio.create_task(new_player.stop())
+
+        with (
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch.object(
+                ongaku_session.client.app.event_manager,
+                "dispatch",
+                side_effect=dispatch,
+            ),
+            mock.patch("ongaku.rest.RESTClient.update_player") as patched_update,
+        ):
+            await asyncio.wait_for(new_player._track_end_event(event), 2)
+
+            patched_update.assert_called_once_with(
+                "session_id",
+                Snowflake(1234567890),
+                track=None,
+                no_replace=False,
+                session=ongaku_session,
+            )
+
+        assert len(dispatched) == 1
+        assert isinstance(dispatched[0], events.QueueEmptyEvent)
+        assert len(new_player.queue) == 0
+
+
+class TestPlayerHistory:
+    @pytest.mark.asyncio
+    async def test_previous(self, ongaku_session: Session, track_info: TrackInfo):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+        new_player._channel_id = Snowflake(987654321)
+
+        tracks = [Track(f"encoded_{i}", track_info, {}, {}, None) for i in range(4)]
+
+        new_player.add(tracks)
+
+        with (
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch("ongaku.rest.RESTClient.update_player") as patched_update,
+        ):
+            await new_player.skip(2)
+            await new_player.skip()
+
+            # Only the tracks that were playing are kept, newest first.
+            assert new_player.history == (tracks[2], tracks[0])
+
+            patched_update.reset_mock()
+
+            await new_player.previous()
+
+            patched_update.assert_called_once_with(
+                "session_id",
+                Snowflake(1234567890),
+                track=tracks[2],
+                no_replace=False,
+                session=ongaku_session,
+            )
+
+            assert new_player.queue == [tracks[2], tracks[3]]
+            assert new_player.history == (tracks[0],)
+
+            await new_player.previous()
+
+            with pytest.raises(errors.PlayerQueueError):
+                await new_player.previous()
+
+        assert new_player.queue == [tracks[0], tracks[2], tracks[3]]
+
+    @pytest.mark.asyncio
+    async def test_replay(self, ongaku_session: Session, track: Track):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+        new_player._channel_id = Snowflake(987654321)
+
+        with (
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch("ongaku.rest.RESTClient.update_player") as patched_update,
+        ):
+            with pytest.raises(errors.PlayerQueueError):
+                await new_player.replay()
+
+            new_player.add(track)
+
+            await new_player.replay()
+
+            # With an empty queue, the last track played is replayed.
+            await new_player.skip()
+            await new_player.replay()
+
+            assert patched_update.call_args_list == [
+                mock.call(
+                    "session_id",
+                    Snowflake(1234567890),
+                    track=track,
+                    position=0,
+                    no_replace=False,
+                    session=ongaku_session,
+                ),
+                mock.call(
+                    "session_id",
+                    Snowflake(1234567890),
+                    track=None,
+                    no_replace=False,
+                    session=ongaku_session,
+                ),
+                mock.call(
+                    "session_id",
+                    Snowflake(1234567890),
+                    track=track,
+                    position=0,
+                    no_replace=False,
+                    session=ongaku_session,
+                ),
+            ]
+
+        assert new_player.queue == [track]
+        assert new_player.history == ()
+
+    @pytest.mark.asyncio
+    async def test_failed(self, ongaku_session: Session, track_info: TrackInfo):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+        new_player._channel_id = Snowflake(987654321)
+
+        tracks = [Track(f"encoded_{i}", track_info, {}, {}, None) for i in range(2)]
+
+        new_player.add(tracks)
+
+        with (
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch("ongaku.rest.RESTClient.update_player") as patched_update,
+        ):
+            await new_player.skip(2)
+
+            patched_update.side_effect = errors.RestStatusError(500, "error")
+
+            # The queue and history are left as they were, when the update fails.
+            with pytest.raises(errors.RestStatusError):
+                await new_player.previous()
+
+            assert new_player.queue == []
+            assert new_player.history == (tracks[0],)
+
+            with pytest.raises(errors.RestStatusError):
+                await new_player.replay()
+
+            assert new_player.queue == []
+            assert new_player.history == (tracks[0],)
+
+    @pytest.mark.asyncio
+    async def test_track_end(self, ongaku_session: Session, track_info: TrackInfo):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+        new_player._channel_id = Snowflake(987654321)
+
+        tracks = [Track(f"encoded_{i}", track_info, {}, {}, None) for i in range(2)]
+
+        new_player.add(tracks)
+
+        with (
+            mock.patch.object(
+                ongaku_session, "_get_session_id", return_value="session_id"
+            ),
+            mock.patch.object(
+                ongaku_session.client.app.event_manager,
+                "dispatch",
+                new_callable=mock.AsyncMock,
+            ),
+            mock.patch("ongaku.rest.RESTClient.update_player"),
+        ):
+            for reason in (TrackEndReasonType.FINISHED, TrackEndReasonType.LOADFAILED):
+                await new_player._track_end_event(
+                    events.TrackEndEvent.from_session(
+                        ongaku_session,
+                        Snowflake(1234567890),
+                        track=new_player.queue[0],
+                        reason=reason,
+                    )
+                )
+
+        # Tracks that failed to load were never played.
+        assert new_player.history == (tracks[0],)
+        assert len(new_player.queue) == 0
+
+    @pytest.mark.asyncio
+    async def test_limits(self, ongaku_session: Session, track_info: TrackInfo):
+        tracks = [Track(f"encoded_{i}", track_info, {}, {}, None) for i in range(5)]
+
+        with mock.patch.object(
+            ongaku_session.client, "_player_config", PlayerConfig(history=3)
+        ):
+            new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        for item in tracks:
+            new_player._history.push(item)
+
+        assert new_player.history == (tracks[4], tracks[3], tracks[2])
+
+        size = new_player._history.size
+
+        with mock.patch.object(
+            ongaku_session.client,
+            "_player_config",
+            PlayerConfig(history_bytes=size // 3 * 2),
+        ):
+            new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        for item in tracks:
+            new_player._history.push(item)
+
+        assert new_player.history == (tracks[4], tracks[3])
+
+        with mock.patch.object(
+            ongaku_session.client, "_player_config", PlayerConfig(history=0)
+        ):
+            new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        new_player._history.push(tracks[0])
+
+        assert new_player.history == ()
+
+
+class TestPlayerLimits:
+    @pytest.mark.asyncio
+    async def test_tracks(self, ongaku_session: Session, track_info: TrackInfo):
+        tracks = [Track(f"encoded_{i}", track_info, {}, {}, None) for i in range(6)]
+
+        with mock.patch.object(
+            ongaku_session.client,
+            "_player_config",
+            PlayerConfig(max_tracks=5, max_requestor_tracks=3),
+        ):
+            new_player = Player(ongaku_session, Snowflake(1234567890))
+
+            new_player.add(tracks[:3], Snowflake(1))
+
+            with pytest.raises(errors.PlayerQueueLimitError):
+                new_player.add(tracks[3], Snowflake(1))
+
+            new_player.add(tracks[3:5], Snowflake(2))
+
+            # Nothing is added, if any of the tracks would go over a limit.
+            with pytest.raises(errors.PlayerQueueError):
+                new_player.add(tracks[5])
+
+        assert [track.encoded for track in new_player.queue] == [
+            track.encoded for track in tracks[:5]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bytes(self, ongaku_session: Session, track_info: TrackInfo):
+        tracks = [Track(f"encoded_{i}", track_info, {}, {}, None) for i in range(4)]
+        size = track_size(tracks[0])
+
+        with mock.patch.object(
+            ongaku_session.client,
+            "_player_config",
+            PlayerConfig(max_bytes=size * 3, max_requestor_bytes=size * 2),
+        ):
+            new_player = Player(ongaku_session, Snowflake(1234567890))
+
+            with pytest.raises(errors.PlayerQueueLimitError):
+                new_player.add(tracks[:3], Snowflake(1))
+
+            new_player.add(tracks[:2], Snowflake(1))
+            new_player.add(tracks[2], Snowflake(2))
+
+            with pytest.raises(errors.PlayerQueueLimitError):
+                new_player.add(tracks[3], Snowflake(3))
+
+        assert new_player.queue.size == size * 3
+        assert new_player.queue.requestor_size(Snowflake(1)) == size * 2
 
 
 class TestPlayerTrackEndEvent:
@@ -0,0 +1,592 @@
+# ruff: noqa: D100, D101, D102, D103
+
+import random
+
+import pytest
+from hikari.snowflakes import Snowflake
+
+from ongaku.impl.track import Track
+from ongaku.impl.track import TrackInfo
+from ongaku.internal.memory import track_size
+from ongaku.queue import Queue
+
+
+def _tracks(track_info: TrackInfo, amount: int) -> list[Track]:
+    return [Track(f"encoded_{i}", track_info, {}, {}, None) for i in range(amount)]
+
+
+def _song(
+    identifier: str,
+    requestor: int | None = None,
+    *,
+    length: int = 100,
+    stream: bool = False,
+) -> Track:
+    info = TrackInfo(
+        identifier,
+        False,
+        "author",
+        length,
+        stream,
+        0,
+        "title",
+        "source_name",
+        None,
+        None,
+        None,
+    )
+
+    return Track(
+        f"encoded_{identifier}",
+        info,
+        {},
+        {},
+        Snowflake(requestor) if requestor is not None else None,
+    )
+
+
+class TestQueue:
+    def test_sequence(self, track_info: TrackInfo):
+        tracks = _tracks(track_info, 5)
+
+        queue = Queue(tracks)
+
+        assert len(queue) == 5
+        assert queue == tracks
+        assert queue == Queue(tracks)
+        assert queue != tracks[1:]
+        assert queue[0] == tracks[0]
+        assert queue[-1] == tracks[4]
+        assert queue[1:3] == tracks[1:3]
+        assert list(queue) == tracks
+        assert list(reversed(queue)) == tracks[::-1]
+        assert tracks[2] in queue
+        assert queue.index(tracks[3]) == 3
+        assert queue.count(tracks[3]) == 1
+
+    def test_current(self, track_info: TrackInfo):
+        tracks = _tracks(track_info, 2)
+
+        queue = Queue()
+
+        assert queue.current is None
+
+        queue.append(tracks[0])
+        queue.appendleft(tracks[1])
+
+        assert queue.current == tracks[1]
+        assert queue.popleft() == tracks[1]
+        assert queue.current == tracks[0]
+
+    def test_mutate(self, track_info: TrackInfo):
+        tracks = _tracks(track_info, 6)
+
+        queue = Queue(tracks[:3])
+
+        queue.extend(tracks[3:5])
+        queue.insert(1, tracks[5])
+
+        assert queue == [
+            tracks[0],
+            tracks[5],
+            tracks[1],
+            tracks[2],
+            tracks[3],
+            tracks[4],
+        ]
+
+        assert queue.pop() == tracks[4]
+        assert queue.pop(1) == tracks[5]
+        assert queue.pop(0) == tracks[0]
+
+        queue[0] = tracks[5]
+        del queue[1]
+
+        assert queue == [tracks[5], tracks[3]]
+
+        queue.remove(tracks[3])
+        queue.clear()
+
+        assert queue == []
+
+        with pytest.raises(IndexError):
+            queue.popleft()
+
+    def test_skip(self, track_info: TrackInfo):
+        tracks = _tracks(track_info, 5)
+
+        queue = Queue(tracks)
+
+        assert queue.skip(2) == tracks[:2]
+        assert queue.current == tracks[2]
+
+        # Skipping past the end, only removes what is left.
+        assert queue.skip(10) == tracks[2:]
+        assert queue == []
+
+    def test_move(self, track_info: TrackInfo):
+        tracks = _tracks(track_info, 5)
+
+        queue = Queue(tracks)
+
+        queue.move(4, 1)
+
+        assert queue == [tracks[0], tracks[4], tracks[1], tracks[2], tracks[3]]
+
+        queue.move(0, -1)
+
+        assert queue == [tracks[4], tracks[1], tracks[2], tracks[3], tracks[0]]
+
+        with pytest.raises(IndexError):
+            queue.move(0, 5)
+
+        with pytest.raises(IndexError):
+            queue.move(5, 0)
+
+        assert len(queue) == 5
+
+    def test_large(self, track_info: TrackInfo):
+        tracks = _tracks(track_info, 5000)
+
+        queue = Queue(tracks)
+        expected = list(tracks)
+
+        generator = random.Random(0)
+
+        for _ in range(2000):
+            index = generator.randrange(len(expected))
+            action = generator.randrange(5)
+            track = generator.choice(tracks)
+
+            if action == 0:
+                queue.insert(index, track)
+                expected.insert(index, track)
+            elif action == 1:
+                assert queue.pop(index) == expected.pop(index)
+            elif action == 2:
+                destination = generator.randrange(len(expected))
+
+                queue.move(index, destination)
+                expected.insert(destination, expected.pop(index))
+            elif action == 3:
+                assert queue.popleft() == expected.pop(0)
+            else:
+                queue.appendleft(track)
+                expected.insert(0, track)
+
+            assert queue[index // 2] == expected[index // 2]
+
+        assert len(queue) == len(expected)
+        assert queue == expected
+        assert queue[1000:1010] == expected[1000:1010]
+        assert queue[500:1600] == expected[500:1600]
+        assert queue[::-7] == expected[::-7]
+        assert list(reversed(queue)) == expected[::-1]
+        assert queue.index(expected[3000]) == expected.index(expected[3000])
+
+        assert queue.skip(1500) == expected[:1500]
+        assert queue == expected[1500:]
+
+    def test_shuffle(self, track_info: TrackInfo):
+        tracks = _tracks(track_info, 50)
+
+        queue = Queue(tracks)
+
+        queue.shuffle()
+
+        assert queue.shuffled is True
+        assert queue.current == tracks[0]
+        assert queue != tracks
+        assert sorted(track.encoded for track in queue) == sorted(
+            track.encoded for track in tracks
+        )
+
+    def test_shuffle_seed(self, track_info: TrackInfo):
+        tracks = _tracks(track_info, 50)
+
+        queue = Queue(tracks)
+        other = Queue(tracks)
+
+        queue.shuffle(seed=10)
+        other.shuffle(seed=10)
+
+        assert queue == list(other)
+
+    def test_shuffle_lazy(self, track_info: TrackInfo):
+        tracks = _tracks(track_info, 5000)
+
+        queue = Queue(tracks)
+
+        queue.shuffle(seed=1)
+
+        # Only the tracks that are viewed are drawn.
+        page = queue[0:10]
+
+        assert page[0] == tracks[0]
+        assert len(queue) == 5000
+        assert len(queue._tracks) == 10
+
+        queue.skip(5)
+
+        assert len(queue._tracks) == 5
+        assert queue[0] == page[5]
+
+    def test_unshuffle(self, track_info: TrackInfo):
+        tracks = _tracks(track_info, 10)
+        extra = _tracks(track_info, 12)[10:]
+
+        queue = Queue(tracks)
+
+        queue.shuffle(seed=3)
+
+        removed = queue.pop(4)
+
+        queue.popleft()
+        queue.append(extra[0])
+        queue.appendleft(extra[1])
+
+        queue.unshuffle()
+
+        assert queue.shuffled is False
+        assert queue == [
+            extra[1],
+            *(track for track in tracks[1:] if track is not removed),
+            extra[0],
+        ]
+
+        # Unshuffling a queue that is not shuffled does nothing.
+        queue.unshuffle()
+
+        assert len(queue) == 10
+
+    def test_unshuffle_current(self, track_info: TrackInfo):
+        tracks = _tracks(track_info, 6)
+
+        queue = Queue(tracks)
+
+        queue.shuffle(seed=1)
+        queue.popleft()
+
+        current = queue.current
+
+        queue.unshuffle()
+
+        assert queue.current is current
+        assert queue == [
+            current,
+            *(track for track in tracks[1:] if track is not current),
+        ]
+
+        # Shuffling again keeps the current track first too.
+        queue.shuffle(seed=2)
+
+        assert queue.current is current
+        assert len(queue) == 5
+
+    def test_fair(self, track_info: TrackInfo):
+        first = _tracks(track_info, 4)
+        second = _tracks(track_info, 6)[4:]
+        anonymous = _tracks(track_info, 7)[6:]
+
+        for track in first:
+            track._requestor = Snowflake(1)
+
+        for track in second:
+            track._requestor = Snowflake(2)
+
+        queue = Queue()
+
+        assert queue.set_fair(True) is True
+        assert queue.fair is True
+
+        queue.extend(first)
+        queue.extend(second)
+        queue.append(anonymous[0])
+
+        assert len(queue) == 7
+        assert second[1] in queue
+        assert queue.count(first[2]) == 1
+
+        # Requestors take turns, in the order they first added a track.
+        assert queue.current == first[0]
+        assert queue.skip(1) == [first[0]]
+        assert queue[0:4] == [second[0], anonymous[0], first[1], second[1]]
+
+        assert queue.popleft() == second[0]
+        assert list(queue) == [anonymous[0], first[1], second[1], first[2], first[3]]
+
+    def test_fair_disable(self, track_info: TrackInfo):
+        tracks = _tracks(track_info, 6)
+
+        for index, track in enumerate(tracks):
+            track._requestor = Snowflake(index % 2 or 2)
+
+        queue = Queue(tracks[:4])
+
+        queue.set_fair()
+        queue.extend(tracks[4:])
+
+        # Viewed tracks keep their place.
+        assert queue[1] == tracks[1]
+
+        queue.shuffle()
+
+        # Shuffling turns off fair share, putting the waiting tracks back in order.
+        assert queue.fair is False
+
+        queue.unshuffle()
+
+        assert queue == tracks
+
+        assert queue.set_fair() is True
+        assert queue.set_fair() is False
+        assert queue == tracks
+
+    def test_index(self):
+        tracks = [_song(str(index), index % 3) for index in range(9)]
+
+        queue = Queue(tracks[:6])
+
+        assert queue.count_requestor(1) == 2
+        assert queue.count_requestor(None) == 0
+        assert queue.count_identifier("4") == 1
+        assert _song("7") not in queue
+        assert queue.count(_song("7")) == 0
+
+        with pytest.raises(ValueError):
+            queue.index(_song("7"))
+
+        queue.extend(tracks[6:])
+        queue.popleft()
+        queue[0] = tracks[0]
+        queue.skip(2)
+
+        assert queue.count_requestor(0) == 2
+        assert queue.count_identifier("1") == 0
+        assert queue.count_identifier("0") == 0
+
+        del queue[1:3]
+
+        assert queue.count_identifier("4") == 0
+        assert queue.count_requestor(2) == 1
+
+        queue.clear()
+
+        assert queue.count_requestor(0) == 0
+        assert queue.count_identifier("8") == 0
+
+    def test_unique(self):
+        tracks = [_song(str(index)) for index in range(4)]
+
+        queue = Queue(tracks[:2])
+
+        queue.append(_song("1"), unique=True)
+        queue.extend([tracks[2], _song("0"), tracks[3], _song("3")], unique=True)
+
+        assert queue == tracks
+
+        queue.append(_song("1"))
+        queue.insert(4, _song("3"))
+
+        assert queue.count_identifier("3") == 2
+        assert queue.dedupe() == [_song("3"), _song("1")]
+        assert queue == tracks
+        assert queue.dedupe() == []
+
+    def test_remove_requestor(self):
+        tracks = [_song(str(index), index % 2) for index in range(10)]
+
+        queue = Queue(tracks)
+
+        assert queue.remove_requestor(1) == tracks[1::2]
+        assert queue.remove_requestor(1) == []
+        assert queue == tracks[::2]
+        assert queue.count_requestor(1) == 0
+
+    def test_remove_requestor_chunks(self):
+        tracks = [
+            _song(str(index), 1 if index % 700 == 3 else 0) for index in range(3000)
+        ]
+
+        queue = Queue(tracks)
+
+        queue.move(3, 2500)
+        queue.insert(1200, _song("moved", 1))
+        queue.skip(2)
+
+        removed = queue.remove_requestor(1)
+
+        assert [track.info.identifier for track in removed] == [
+            "703",
+            "moved",
+            "1403",
+            "2103",
+            "3",
+            "2803",
+        ]
+        assert len(queue) == 2993
+        assert queue.count_requestor(1) == 0
+        assert all(track.requestor == 0 for track in queue)
+
+    def test_remove_requestor_shuffle(self):
+        tracks = [_song(str(index), index % 3) for index in range(30)]
+
+        queue = Queue(tracks)
+
+        queue.shuffle(seed=2)
+
+        viewed = queue[0:8]
+        removed = queue.remove_requestor(2)
+
+        assert sorted(int(track.info.identifier) for track in removed) == list(
+            range(2, 30, 3)
+        )
+        assert len(queue) == 20
+        assert queue[0:5] == [track for track in viewed if track.requestor != 2][:5]
+
+        queue.unshuffle()
+
+        assert queue == [track for track in tracks if track.requestor != 2]
+
+    def test_remove_requestor_fair(self):
+        tracks = [_song(str(index), index % 3) for index in range(12)]
+
+        queue = Queue(tracks[:3])
+
+        queue.set_fair(True)
+        queue.extend(tracks[3:])
+
+        assert queue[0:2] == tracks[0:2]
+        assert queue.remove_requestor(1) == tracks[1::3]
+        assert list(queue) == [
+            tracks[0],
+            tracks[2],
+            tracks[3],
+            tracks[5],
+            tracks[6],
+            tracks[8],
+            tracks[9],
+            tracks[11],
+        ]
+
+    def test_duration(self):
+        tracks = [_song(str(index), length=index * 1000) for index in range(1, 2001)]
+        lengths = [track.info.length for track in tracks]
+
+        queue = Queue(tracks[:1500])
+
+        assert queue.duration() == sum(lengths[:1500])
+        assert queue.duration(0) == 0
+        assert queue.duration(700) == sum(lengths[:700])
+        assert queue.duration(-1) == sum(lengths[:1499])
+
+        queue.extend(tracks[1500:])
+        queue.move(1999, 0)
+        queue.pop(10)
+        queue.skip(3)
+
+        expected = [tracks[1999], *tracks[:1999]]
+        del expected[10]
+        del expected[:3]
+
+        assert queue.duration() == sum(track.info.length for track in expected)
+        assert queue.duration(1200) == sum(
+            track.info.length for track in expected[:1200]
+        )
+
+        queue.shuffle(seed=1)
+
+        # The whole queue does not need to be drawn.
+        assert queue.duration() == sum(track.info.length for track in expected)
+        assert queue._shuffle is not None
+        assert len(queue._shuffle.pool) == len(expected) - 1
+        assert queue.duration(20) == sum(track.info.length for track in queue[:20])
+
+        queue.set_fair(True)
+
+        assert queue.duration() == sum(track.info.length for track in expected)
+
+    def test_duration_skip(self):
+        tracks = [_song(str(index), length=index * 10) for index in range(1, 2001)]
+
+        queue = Queue(tracks)
+        expected = list(tracks)
+
+        # Skips within the first chunk, and skips that drop whole chunks.
+        for amount in (3, 1, 200, 700, 5, 1000):
+            assert queue.skip(amount) == expected[:amount]
+            del expected[:amount]
+
+            assert queue[len(expected) // 2] == expected[len(expected) // 2]
+            assert queue.duration() == sum(track.info.length for track in expected)
+            assert queue.duration(50) == sum(
+                track.info.length for track in expected[:50]
+            )
+
+    def test_duration_stream(self):
+        tracks = [_song("0"), _song("1", stream=True), _song("2")]
+
+        queue = Queue(tracks)
+
+        assert queue.duration(1) == 100
+        assert queue.duration(2) is None
+        assert queue.duration() is None
+
+        queue.pop(1)
+
+        assert queue.duration() == 200
+
+    def test_extend_large_chunk(self, track_info: TrackInfo):
+        tracks = _tracks(track_info, 1200)
+
+        queue = Queue(tracks[:600])
+
+        # Grow the last chunk past its usual size, before extending it.
+        for track in tracks[600:1100]:
+            queue.insert(550, track)
+
+        queue.extend(tracks[1100:])
+
+        assert len(queue) == 1200
+        assert queue[-100:] == tracks[1100:]
+
+    def test_size(self):
+        tracks = [_song(str(index), index % 2) for index in range(10)]
+        sizes = [track_size(track) for track in tracks]
+
+        queue = Queue(tracks[:6])
+
+        queue.set_fair(True)
+        queue.extend(tracks[6:])
+
+        assert queue.size == sum(sizes)
+        assert queue.requestor_size(1) == sum(sizes[1::2])
+
+        queue.skip(2)
+        queue.remove_requestor(0)
+
+        assert queue.size == sum(sizes[3::2])
+        assert queue.requestor_size(0) == 0
+
+        queue.clear()
+
+        assert queue.size == 0
+
+    def test_size_at_insert(self):
+        track = _song("1", 1)
+        size = track_size(track)
+
+        queue = Queue([track, track])
+
+        # Changing a queued track does not change what it was counted as.
+        track._user_data = {"notes": "x" * 1000}
+
+        queue.popleft()
+
+        assert queue.size == size
+        assert queue.requestor_size(1) == size
+
+        queue.popleft()
+
+        assert queue.size == 0
+        assert queue.requestor_size(1) == 0
@@ -1,8 +1,12 @@
 # ruff: noqa: D100, D101, D102, D103
 
+import asyncio
+import pathlib
+import sqlite3
 import typing
 
 import mock
+import orjson
 import pytest
 from hikari.snowflakes import Snowflake
 
@@ -10,7 +14,12 @@ from ongaku import Playlist
 from ongaku import errors
 from ongaku.abc.track import Track
 from ongaku.client import Client
+from ongaku.config import RequestConfig
+from ongaku.config import TrackCacheConfig
 from ongaku.impl import player as player
+from ongaku.internal.cache import DiskTrackCache
+from ongaku.internal.cache import TrackCache
+from ongaku.internal.cache import cache_key
 from ongaku.rest import RESTClient
 from ongaku.session import Session
 from tests import payloads
@@ -21,6 +30,11 @@ def test_properties(ongaku_client: Client):
 
     assert rest._client == ongaku_client
 
+    assert rest.in_flight == 0
+    assert rest.coalesced == 0
+    assert rest.cache is None
+    assert rest.disk_cache is None
+
 
 class TestRestTrack:
     @pytest.mark.asyncio
@@ -52,8 +66,10 @@ class TestRestTrack:
             patched_request.assert_called_with(
                 "GET",
                 "/loadtracks",
-                dict,
+                bytes,
                 params={"identifier": "https://youtube.com/watch?v=video"},
+                idempotent=True,
+                request_config=None,
             )
 
             assert isinstance(new_track, Track)
@@ -87,8 +103,10 @@ class TestRestTrack:
             patched_request.assert_called_once_with(
                 "GET",
                 "/loadtracks",
-                dict,
+                bytes,
                 params={"identifier": "https://youtube.com/watch?v=video"},
+                idempotent=True,
+                request_config=None,
             )
 
             assert isinstance(new_track, Track)
@@ -123,8 +141,10 @@ class TestRestTrack:
         patched_request.assert_called_once_with(
             "GET",
             "/loadtracks",
-            dict,
+            bytes,
             params={"identifier": "ytsearch:malformed-track"},
+            idempotent=True,
+            request_config=None,
         )
 
         assert isinstance(build_error.value, errors.BuildError)
@@ -161,10 +181,12 @@ class TestRestTrack:
             patched_request.assert_called_with(
                 "GET",
                 "/loadtracks",
-                dict,
+                bytes,
                 params={
                     "identifier": "https://www.youtube.com/watch?v=video&list=playlist"
                 },
+                idempotent=True,
+                request_config=None,
             )
 
             assert isinstance(playlist, Playlist)
@@ -199,8 +221,10 @@ class TestRestTrack:
         patched_request.assert_called_once_with(
             "GET",
             "/loadtracks",
-            dict,
+            bytes,
             params={"identifier": "ytsearch:malformed-playlist"},
+            idempotent=True,
+            request_config=None,
         )
 
         assert isinstance(build_error.value, errors.BuildError)
@@ -230,7 +254,12 @@ class TestRestTrack:
             patched_fetch_session.assert_called_once()
 
             patched_request.assert_called_with(
-                "GET", "/loadtracks", dict, params={"identifier": "ytsearch:a-track"}
+                "GET",
+                "/loadtracks",
+                bytes,
+                params={"identifier": "ytsearch:a-track"},
+                idempotent=True,
+                request_config=None,
             )
 
             assert isinstance(search, typing.Sequence)
@@ -265,8 +294,10 @@ class TestRestTrack:
         patched_request.assert_called_once_with(
             "GET",
             "/loadtracks",
-            dict,
+            bytes,
             params={"identifier": "ytsearch:malformed-search"},
+            idempotent=True,
+            request_config=None,
         )
 
         assert isinstance(build_error.value, errors.BuildError)
@@ -298,8 +329,10 @@ class TestRestTrack:
             patched_request.assert_called_with(
                 "GET",
                 "/loadtracks",
-                dict,
+                bytes,
                 params={"identifier": "ytsearch:not-a-track"},
+                idempotent=True,
+                request_config=None,
             )
 
             assert no_result is None
@@ -335,8 +368,10 @@ class TestRestTrack:
         patched_request.assert_called_with(
             "GET",
             "/loadtracks",
-            dict,
+            bytes,
             params={"identifier": "https://youtube.com/watch?v=a-broken-video"},
+            idempotent=True,
+            request_config=None,
         )
 
         assert isinstance(rest_exception_error.value, errors.RestExceptionError)
@@ -366,7 +401,12 @@ class TestRestTrack:
             patched_fetch_session.assert_not_called()
 
             patched_request.assert_called_once_with(
-                "GET", "/decodetrack", dict, params={"encodedTrack": "encoded"}
+                "GET",
+                "/decodetrack",
+                bytes,
+                params={"encodedTrack": "encoded"},
+                idempotent=True,
+                request_config=None,
             )
 
         assert isinstance(new_track, Track)
@@ -396,7 +436,12 @@ class TestRestTrack:
             patched_fetch_session.assert_called_once()
 
             patched_request.assert_called_once_with(
-                "GET", "/decodetrack", dict, params={"encodedTrack": "encoded"}
+                "GET",
+                "/decodetrack",
+                bytes,
+                params={"encodedTrack": "encoded"},
+                idempotent=True,
+                request_config=None,
             )
 
         assert isinstance(new_track, Track)
@@ -426,7 +471,12 @@ class TestRestTrack:
         patched_fetch_session.assert_called_once()
 
         patched_request.assert_called_once_with(
-            "GET", "/decodetrack", dict, params={"encodedTrack": "encoded"}
+            "GET",
+            "/decodetrack",
+            bytes,
+            params={"encodedTrack": "encoded"},
+            idempotent=True,
+            request_config=None,
         )
 
     @pytest.mark.asyncio
@@ -457,8 +507,9 @@ class TestRestTrack:
                 "POST",
                 "/decodetracks",
                 list,
-                headers={"Content-Type": "application/json"},
                 json=["encoded"],
+                idempotent=True,
+                request_config=None,
             )
 
         assert isinstance(tracks, typing.Sequence)
@@ -492,8 +543,9 @@ class TestRestTrack:
                 "POST",
                 "/decodetracks",
                 list,
-                headers={"Content-Type": "application/json"},
                 json=["encoded"],
+                idempotent=True,
+                request_config=None,
             )
 
         assert isinstance(tracks, typing.Sequence)
@@ -530,10 +582,127 @@ class TestRestTrack:
             "POST",
             "/decodetracks",
             list,
-            headers={"Content-Type": "application/json"},
             json=["encoded"],
+            idempotent=True,
+            request_config=None,
         )
 
+    @pytest.mark.asyncio
+    async def test_decode_tracks_chunked(
+        self, ongaku_client: Client, ongaku_session: Session
+    ):
+        rest = RESTClient(ongaku_client)
+
+        running = 0
+        max_running = 0
+
+        async def request(*args: typing.Any, json: list[str], **kwargs: typing.Any):
+            nonlocal running, max_running
+
+            running += 1
+            max_running = max(max_running, running)
+
+            await asyncio.sleep(0)
+
+            running -= 1
+
+            return [_track(encoded) for encoded in json]
+
+        encoded = [str(value) for value in range(10)]
+
+        with mock.patch.object(
+            ongaku_session, "request", new_callable=mock.AsyncMock, side_effect=request
+        ) as patched_request:
+            tracks = await rest.decode_tracks(
+                [*encoded, "0", "5"],
+                session=ongaku_session,
+                chunk_size=3,
+                concurrency=2,
+            )
+
+            assert patched_request.call_count == 4
+
+            # Duplicates were only sent once.
+            sent = [call.kwargs["json"] for call in patched_request.call_args_list]
+
+            assert sent == [["0", "1", "2"], ["3", "4", "5"], ["6", "7", "8"], ["9"]]
+
+        assert max_running == 2
+
+        assert [track.encoded for track in tracks] == [*encoded, "0", "5"]
+
+        # Every duplicate is its own track.
+        assert tracks[0] is not tracks[10]
+
+    @pytest.mark.asyncio
+    async def test_decode_tracks_chunk_error(
+        self, ongaku_client: Client, ongaku_session: Session
+    ):
+        rest = RESTClient(ongaku_client)
+
+        async def request(*args: typing.Any, json: list[str], **kwargs: typing.Any):
+            if json == ["second"]:
+                raise errors.RestStatusError(500, "Internal Server Error")
+
+            await asyncio.sleep(1)
+
+            return [_track(encoded) for encoded in json]
+
+        with (
+            mock.patch.object(
+                ongaku_session,
+                "request",
+                new_callable=mock.AsyncMock,
+                side_effect=request,
+            ),
+            pytest.raises(errors.RestStatusError),
+        ):
+            await rest.decode_tracks(
+                ["first", "second"], session=ongaku_session, chunk_size=1
+            )
+
+    @pytest.mark.asyncio
+    async def test_decode_tracks_chunk_length(
+        self, ongaku_client: Client, ongaku_session: Session
+    ):
+        rest = RESTClient(ongaku_client)
+
+        async def request(*args: typing.Any, json: list[str], **kwargs: typing.Any):
+            # One track of the second chunk is missing, so the rest would be matched to the wrong tracks.
+            return [_track(encoded) for encoded in json if encoded != "third"]
+
+        with (
+            mock.patch.object(
+                ongaku_session,
+                "request",
+                new_callable=mock.AsyncMock,
+                side_effect=request,
+            ),
+            pytest.raises(errors.BuildError) as exc_info,
+        ):
+            await rest.decode_tracks(
+                ["first", "second", "third", "fourth"],
+                session=ongaku_session,
+                chunk_size=2,
+            )
+
+        assert (
+            exc_info.value.reason
+            == "Received 1 decoded tracks, for a chunk of 2 tracks."
+        )
+
+    @pytest.mark.asyncio
+    async def test_decode_tracks_invalid(
+        self, ongaku_client: Client, ongaku_session: Session
+    ):
+        rest = RESTClient(ongaku_client)
+
+        with pytest.raises(ValueError):
+            await rest.decode_tracks(["encoded"], session=ongaku_session, chunk_size=0)
+
+        with pytest.raises(ValueError):
+            await rest.decode_tracks(["encoded"], session=ongaku_session, concurrency=0)
+
 
 class TestRestPlayer:
     @pytest.mark.asyncio
@@ -563,7 +732,11 @@ class TestRestPlayer:
             patched_fetch_session.assert_not_called()
 
             patched_request.assert_called_once_with(
-                "GET", "/sessions/session_id/players", list
+                "GET",
+                "/sessions/session_id/players",
+                list,
+                idempotent=True,
+                request_config=None,
             )
 
     @pytest.mark.asyncio
@@ -593,7 +766,11 @@ class TestRestPlayer:
             patched_fetch_session.assert_called_once()
 
             patched_request.assert_called_once_with(
-                "GET", "/sessions/session_id/players", list
+                "GET",
+                "/sessions/session_id/players",
+                list,
+                idempotent=True,
+                request_config=None,
             )
 
     @pytest.mark.asyncio
@@ -625,7 +802,11 @@ class TestRestPlayer:
             patched_fetch_session.assert_not_called()
 
             patched_request.assert_called_once_with(
-                "GET", "/sessions/session_id/players/1234567890", dict
+                "GET",
+                "/sessions/session_id/players/1234567890",
+                bytes,
+                idempotent=True,
+                request_config=None,
             )
 
     @pytest.mark.asyncio
@@ -655,7 +836,11 @@ class TestRestPlayer:
             patched_fetch_session.assert_called_once()
 
             patched_request.assert_called_once_with(
-                "GET", "/sessions/session_id/players/1234567890", dict
+                "GET",
+                "/sessions/session_id/players/1234567890",
+                bytes,
+                idempotent=True,
+                request_config=None,
             )
 
     @pytest.mark.asyncio
@@ -698,8 +883,7 @@ class TestRestPlayer:
             patched_request.assert_called_once_with(
                 "PATCH",
                 "/sessions/session_id/players/1234567890",
-                dict,
-                headers={"Content-Type": "application/json"},
+                bytes,
                 json={
                     "track": {"encoded": "encoded"},
                     "position": 1,
@@ -713,6 +897,8 @@ class TestRestPlayer:
                     },
                 },
                 params={"noReplace": "false"},
+                idempotent=False,
+                request_config=None,
             )
 
     @pytest.mark.asyncio
@@ -746,6 +932,7 @@ class TestRestPlayer:
                 volume=3,
                 paused=False,
                 voice=player.Voice("token", "endpoint", "session_id"),
+                filters={"volume": 0.5},
                 no_replace=False,
             )
 
@@ -754,8 +941,7 @@ class TestRestPlayer:
             patched_request.assert_called_once_with(
                 "PATCH",
                 "/sessions/session_id/players/1234567890",
-                dict,
-                headers={"Content-Type": "application/json"},
+                bytes,
                 json={
                     "track": {"encoded": "encoded"},
                     "position": 1,
@@ -767,8 +953,11 @@ class TestRestPlayer:
                         "endpoint": "endpoint",
                         "sessionId": "session_id",
                     },
+                    "filters": {"volume": 0.5},
                 },
                 params={"noReplace": "false"},
+                idempotent=False,
+                request_config=None,
             )
 
     @pytest.mark.asyncio
@@ -800,7 +989,11 @@ class TestRestPlayer:
             patched_fetch_session.assert_not_called()
 
             patched_request.assert_called_once_with(
-                "DELETE", "/sessions/session_id/players/1234567890", None
+                "DELETE",
+                "/sessions/session_id/players/1234567890",
+                None,
+                idempotent=False,
+                request_config=None,
             )
 
     @pytest.mark.asyncio
@@ -830,7 +1023,11 @@ class TestRestPlayer:
             patched_fetch_session.assert_called_once()
 
             patched_request.assert_called_once_with(
-                "DELETE", "/sessions/session_id/players/1234567890", None
+                "DELETE",
+                "/sessions/session_id/players/1234567890",
+                None,
+                idempotent=False,
+                request_config=None,
             )
 
 
@@ -865,8 +1062,9 @@ class TestRestSession:
                 "PATCH",
                 "/sessions/session_id",
                 dict,
-                headers={"Content-Type": "application/json"},
                 json={"resuming": False, "timeout": 230},
+                idempotent=False,
+                request_config=None,
             )
 
     @pytest.mark.asyncio
@@ -895,8 +1093,9 @@ class TestRestSession:
                 "PATCH",
                 "/sessions/session_id",
                 dict,
-                headers={"Content-Type": "application/json"},
                 json={"resuming": False, "timeout": 230},
+                idempotent=False,
+                request_config=None,
             )
 
 
@@ -926,9 +1125,7 @@ class TestRestInformation:
             patched_fetch_session.assert_not_called()
 
             patched_request.assert_called_once_with(
-                "GET",
-                "/info",
-                dict,
+                "GET", "/info", dict, params={}, idempotent=True, request_config=None
             )
 
     @pytest.mark.asyncio
@@ -954,9 +1151,7 @@ class TestRestInformation:
             patched_fetch_session.assert_called_once()
 
             patched_request.assert_called_once_with(
-                "GET",
-                "/info",
-                dict,
+                "GET", "/info", dict, params={}, idempotent=True, request_config=None
             )
 
     @pytest.mark.asyncio
@@ -984,7 +1179,12 @@ class TestRestInformation:
             patched_fetch_session.assert_not_called()
 
             patched_request.assert_called_once_with(
-                "GET", "/version", str, version=False
+                "GET",
+                "/version",
+                str,
+                version=False,
+                idempotent=True,
+                request_config=None,
             )
 
     @pytest.mark.asyncio
@@ -1010,7 +1210,12 @@ class TestRestInformation:
             patched_fetch_session.assert_called_once()
 
             patched_request.assert_called_once_with(
-                "GET", "/version", str, version=False
+                "GET",
+                "/version",
+                str,
+                version=False,
+                idempotent=True,
+                request_config=None,
             )
 
     @pytest.mark.asyncio
@@ -1038,9 +1243,7 @@ class TestRestInformation:
             patched_fetch_session.assert_not_called()
 
             patched_request.assert_called_once_with(
-                "GET",
-                "/stats",
-                dict,
+                "GET", "/stats", bytes, params={}, idempotent=True, request_config=None
             )
 
     @pytest.mark.asyncio
@@ -1066,9 +1269,7 @@ class TestRestInformation:
             patched_fetch_session.assert_called_once()
 
             patched_request.assert_called_once_with(
-                "GET",
-                "/stats",
-                dict,
+                "GET", "/stats", bytes, params={}, idempotent=True, request_config=None
             )
 
 
@@ -1103,6 +1304,9 @@ class TestRestRoutePlanner:
                 "GET",
                 "/routeplanner/status",
                 dict,
+                params={},
+                idempotent=True,
+                request_config=None,
             )
 
     @pytest.mark.asyncio
@@ -1133,6 +1337,9 @@ class TestRestRoutePlanner:
                 "GET",
                 "/routeplanner/status",
                 dict,
+                params={},
+                idempotent=True,
+                request_config=None,
             )
 
     @pytest.mark.asyncio
@@ -1163,6 +1370,9 @@ class TestRestRoutePlanner:
                 "GET",
                 "/routeplanner/status",
                 dict,
+                params={},
+                idempotent=True,
+                request_config=None,
             )
 
     @pytest.mark.asyncio
@@ -1191,7 +1401,12 @@ class TestRestRoutePlanner:
             patched_fetch_session.assert_not_called()
 
             patched_request.assert_called_once_with(
-                "POST", "/routeplanner/free/address", None, json={"address": "1.0.0.1"}
+                "POST",
+                "/routeplanner/free/address",
+                None,
+                json={"address": "1.0.0.1"},
+                idempotent=False,
+                request_config=None,
             )
 
     @pytest.mark.asyncio
@@ -1220,7 +1435,12 @@ class TestRestRoutePlanner:
             patched_fetch_session.assert_called_once()
 
             patched_request.assert_called_once_with(
-                "POST", "/routeplanner/free/address", None, json={"address": "1.0.0.1"}
+                "POST",
+                "/routeplanner/free/address",
+                None,
+                json={"address": "1.0.0.1"},
+                idempotent=False,
+                request_config=None,
             )
 
     @pytest.mark.asyncio
@@ -1251,6 +1471,8 @@ class TestRestRoutePlanner:
                 "POST",
                 "/routeplanner/free/all",
                 None,
+                idempotent=False,
+                request_config=None,
             )
 
         await ongaku_client._stop_event(mock.Mock())
@@ -1283,4 +1505,742 @@ class TestRestRoutePlanner:
                 "POST",
                 "/routeplanner/free/all",
                 None,
+                idempotent=False,
+                request_config=None,
+            )
+
+
+class TestRestSharedRequests:
+    @pytest.mark.asyncio
+    async def test_coalesced(self, ongaku_client: Client, ongaku_session: Session):
+        rest = RESTClient(ongaku_client)
+
+        release = asyncio.Event()
+
+        async def request(*args: typing.Any, **kwargs: typing.Any):
+            await release.wait()
+
+            return {"loadType": "track", "data": payloads.TRACK_PAYLOAD}
+
+        with mock.patch.object(
+            ongaku_session, "request", new_callable=mock.AsyncMock, side_effect=request
+        ) as patched_request:
+            tasks = [
+                asyncio.create_task(
+                    rest.load_track("ytsearch:ajr", session=ongaku_session)
+                )
+                for _ in range(3)
+            ]
+
+            other = asyncio.create_task(
+                rest.load_track("ytsearch:other", session=ongaku_session)
+            )
+
+            # A different request config is not shared, as it has its own timeouts and retries.
+            configured = asyncio.create_task(
+                rest.load_track(
+                    "ytsearch:ajr",
+                    session=ongaku_session,
+                    request_config=RequestConfig(retries=0),
+                )
             )
+
+            await asyncio.sleep(0)
+
+            assert rest.in_flight == 3
+
+            release.set()
+
+            tracks = await asyncio.gather(*tasks)
+
+            await other
+            await configured
+
+            assert patched_request.call_count == 3
+
+        assert rest.coalesced == 2
+        assert rest.in_flight == 0
+
+        for track in tracks:
+            assert isinstance(track, Track)
+
+        # Every caller builds its own track, so setting a requestor only affects that caller.
+        assert tracks[0] is not tracks[1]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller(
+        self, ongaku_client: Client, ongaku_session: Session
+    ):
+        rest = RESTClient(ongaku_client)
+
+        release = asyncio.Event()
+
+        async def request(*args: typing.Any, **kwargs: typing.Any):
+            await release.wait()
+
+            return payloads.STATISTICS_PAYLOAD
+
+        with mock.patch.object(
+            ongaku_session, "request", new_callable=mock.AsyncMock, side_effect=request
+        ) as patched_request:
+            first = asyncio.create_task(rest.fetch_stats(session=ongaku_session))
+            second = asyncio.create_task(rest.fetch_stats(session=ongaku_session))
+
+            await asyncio.sleep(0)
+
+            first.cancel()
+
+            release.set()
+
+            statistics = await second
+
+            patched_request.assert_called_once()
+
+        assert first.cancelled() is True
+        assert statistics.players == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_error(self, ongaku_client: Client, ongaku_session: Session):
+        rest = RESTClient(ongaku_client)
+
+        with mock.patch.object(
+            ongaku_session,
+            "request",
+            new_callable=mock.AsyncMock,
+            side_effect=errors.RestStatusError(503, "Service Unavailable"),
+        ):
+            results = await asyncio.gather(
+                rest.fetch_info(session=ongaku_session),
+                rest.fetch_info(session=ongaku_session),
+                return_exceptions=True,
+            )
+
+        for result in results:
+            assert isinstance(result, errors.RestStatusError)
+
+        assert rest.in_flight == 0
+
+
+TRACK_RESULT: typing.Final[bytes] = orjson.dumps(
+    {"loadType": "track", "data": payloads.TRACK_PAYLOAD}
+)
+
+
+class TestTrackCache:
+    def test_cache_key(self):
+        assert cache_key("ytsearch:  AJR   Bang ") == ("ytsearch", "ajr bang")
+        assert cache_key(" YTSearch:ajr bang") == ("ytsearch", "ajr bang")
+        assert cache_key("https://youtube.com/watch?v=AbC ") == (
+            "",
+            "https://youtube.com/watch?v=AbC",
+        )
+        assert cache_key("spotify:track:AbC") == ("spotify", "track:AbC")
+
+    def test_get_put(self):
+        cache = TrackCache(TrackCacheConfig())
+
+        assert cache.get("ytsearch:ajr") is None
+
+        assert cache.put("ytsearch:ajr", TRACK_RESULT) is True
+
+        assert cache.get("ytsearch: AJR") == TRACK_RESULT
+
+        assert cache.entries == 1
+        assert cache.size == len(TRACK_RESULT)
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+        assert cache.remove("ytsearch:ajr") is True
+        assert cache.remove("ytsearch:ajr") is False
+
+        assert cache.entries == 0
+        assert cache.size == 0
+
+        cache.put("ytsearch:ajr", TRACK_RESULT)
+        cache.clear()
+
+        assert cache.entries == 0
+        assert cache.size == 0
+
+    def test_not_cached(self):
+        cache = TrackCache(TrackCacheConfig(empty_ttl=0))
+
+        error = orjson.dumps(
+            {
+                "loadType": "error",
+                "data": {"message": "message", "severity": "common", "cause": "cause"},
+            }
+        )
+
+        assert cache.put("error", error) is False
+        assert cache.put("empty", orjson.dumps({"loadType": "empty"})) is False
+        assert cache.put("invalid", b"{}") is False
+
+        assert cache.entries == 0
+
+    def test_expired(self):
+        cache = TrackCache(TrackCacheConfig(track_ttl=10))
+
+        with mock.patch("ongaku.internal.cache.time.monotonic", return_value=100):
+            cache.put("ytsearch:ajr", TRACK_RESULT)
+
+        with mock.patch("ongaku.internal.cache.time.monotonic", return_value=110):
+            assert cache.get("ytsearch:ajr") is None
+
+        assert cache.expirations == 1
+        assert cache.entries == 0
+        assert cache.size == 0
+
+    def test_expires(self):
+        cache = TrackCache(TrackCacheConfig(track_ttl=10))
+
+        with mock.patch("ongaku.internal.cache.time.monotonic", return_value=100):
+            assert cache.put("first", TRACK_RESULT, expires=105) is True
+            # The time to live is still the longest a result is kept.
+            assert cache.put("second", TRACK_RESULT, expires=200) is True
+            assert cache.put("third", TRACK_RESULT, expires=100) is False
+
+        with mock.patch("ongaku.internal.cache.time.monotonic", return_value=105):
+            assert cache.get("first") is None
+            assert cache.get("second") is not None
+
+        with mock.patch("ongaku.internal.cache.time.monotonic", return_value=110):
+            assert cache.get("second") is None
+
+    def test_evict_entries(self):
+        cache = TrackCache(TrackCacheConfig(max_entries=2))
+
+        cache.put("first", TRACK_RESULT)
+        cache.put("second", TRACK_RESULT)
+
+        # Using the first entry, makes the second the least recently used.
+        cache.get("first")
+
+        cache.put("third", TRACK_RESULT)
+
+        assert cache.evictions == 1
+        assert cache.get("second") is None
+        assert cache.get("first") == TRACK_RESULT
+        assert cache.get("third") == TRACK_RESULT
+
+    def test_evict_bytes(self):
+        cache = TrackCache(TrackCacheConfig(max_bytes=len(TRACK_RESULT) * 2))
+
+        for query in ("first", "second", "third"):
+            cache.put(query, TRACK_RESULT)
+
+        assert cache.entries == 2
+        assert cache.evictions == 1
+        assert cache.size == len(TRACK_RESULT) * 2
+
+        assert cache.put("large", TRACK_RESULT * 3) is False
+
+
+class TestRestTrackCache:
+    @pytest.mark.asyncio
+    async def test_load_track(self, gateway_bot: typing.Any, ongaku_session: Session):
+        client = Client(gateway_bot, track_cache=TrackCacheConfig())
+
+        rest = RESTClient(client)
+
+        assert isinstance(rest.cache, TrackCache)
+
+        with mock.patch.object(
+            ongaku_session,
+            "request",
+            new_callable=mock.AsyncMock,
+            return_value=TRACK_RESULT,
+        ) as patched_request:
+            first = await rest.load_track("ytsearch:ajr", session=ongaku_session)
+            second = await rest.load_track("ytsearch: AJR", session=ongaku_session)
+
+            patched_request.assert_called_once()
+
+        assert isinstance(first, Track)
+        assert isinstance(second, Track)
+
+        # Every hit builds a new track, so the cached result is never modified.
+        assert first is not second
+
+        assert rest.cache.hits == 1
+        assert rest.cache.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_load_track_error(
+        self, gateway_bot: typing.Any, ongaku_session: Session
+    ):
+        client = Client(gateway_bot, track_cache=TrackCacheConfig())
+
+        rest = RESTClient(client)
+
+        error = orjson.dumps(
+            {
+                "loadType": "error",
+                "data": {"message": "message", "severity": "common", "cause": "cause"},
+            }
+        )
+
+        with mock.patch.object(
+            ongaku_session,
+            "request",
+            new_callable=mock.AsyncMock,
+            return_value=error,
+        ) as patched_request:
+            for _ in range(2):
+                with pytest.raises(errors.RestExceptionError):
+                    await rest.load_track("ytsearch:ajr", session=ongaku_session)
+
+            assert patched_request.call_count == 2
+
+        assert rest.cache is not None
+        assert rest.cache.entries == 0
+
+    @pytest.mark.asyncio
+    async def test_load_track_corrupt(
+        self, gateway_bot: typing.Any, ongaku_session: Session
+    ):
+        client = Client(gateway_bot, track_cache=TrackCacheConfig())
+
+        rest = RESTClient(client)
+
+        assert rest.cache is not None
+
+        rest.cache.put("ytsearch:ajr", orjson.dumps({"loadType": "track", "data": {}}))
+
+        with mock.patch.object(
+            ongaku_session,
+            "request",
+            new_callable=mock.AsyncMock,
+            return_value=TRACK_RESULT,
+        ) as patched_request:
+            # A cached result that cannot be built is dropped, and loaded again next time.
+            with pytest.raises(errors.BuildError):
+                await rest.load_track("ytsearch:ajr", session=ongaku_session)
+
+            assert rest.cache.entries == 0
+
+            track = await rest.load_track("ytsearch:ajr", session=ongaku_session)
+
+            patched_request.assert_called_once()
+
+        assert isinstance(track, Track)
+
+
+def _track(encoded: str) -> typing.Mapping[str, typing.Any]:
+    return {**payloads.TRACK_PAYLOAD, "encoded": encoded}
+
+
+class TestDiskTrackCache:
+    def test_path_required(self):
+        with pytest.raises(ValueError):
+            DiskTrackCache(TrackCacheConfig())
+
+    @pytest.mark.asyncio
+    async def test_get_put(self, tmp_path: pathlib.Path):
+        cache = DiskTrackCache(TrackCacheConfig(path=tmp_path / "tracks.db"))
+
+        assert await cache.get("ytsearch:ajr") is None
+
+        search = orjson.dumps(
+            {"loadType": "search", "data": [_track("first"), _track("second")]}
+        )
+        playlist = orjson.dumps(
+            {"loadType": "playlist", "data": payloads.PLAYLIST_PAYLOAD}
+        )
+        empty = orjson.dumps({"loadType": "empty", "data": {}})
+
+        assert await cache.put("ytsearch:ajr", search) is True
+        assert await cache.put("playlist", playlist) is True
+        assert await cache.put("track", TRACK_RESULT) is True
+        assert await cache.put("empty", empty) is True
+
+        result = await cache.get("ytsearch: AJR")
+
+        assert result is not None
+
+        data = orjson.loads(result)
+
+        assert data["loadType"] == "search"
+        assert [track["encoded"] for track in data["data"]] == ["first", "second"]
+        assert data["data"][0]["info"] == payloads.TRACK_INFO_PAYLOAD
+
+        result = await cache.get("playlist")
+
+        assert result is not None
+        assert orjson.loads(result)["data"]["info"] == payloads.PLAYLIST_INFO_PAYLOAD
+
+        result = await cache.get("track")
+
+        assert result is not None
+        assert orjson.loads(result)["data"]["encoded"] == "encoded"
+
+        result = await cache.get("empty")
+
+        assert result is not None
+        assert orjson.loads(result)["loadType"] == "empty"
+
+        assert cache.hits == 4
+        assert cache.misses == 1
+
+        await cache.remove("track")
+
+        assert await cache.get("track") is None
+
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_not_cached(self, tmp_path: pathlib.Path):
+        cache = DiskTrackCache(
+            TrackCacheConfig(path=tmp_path / "tracks.db", track_ttl=0)
+        )
+
+        error = orjson.dumps(
+            {
+                "loadType": "error",
+                "data": {"message": "message", "severity": "common", "cause": "cause"},
+            }
+        )
+
+        assert await cache.put("error", error) is False
+        assert await cache.put("track", TRACK_RESULT) is False
+        assert await cache.put("invalid", b"{}") is False
+
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_expired(self, tmp_path: pathlib.Path):
+        cache = DiskTrackCache(
+            TrackCacheConfig(path=tmp_path / "tracks.db", track_ttl=10)
+        )
+
+        with mock.patch("ongaku.internal.cache.time.time", return_value=100):
+            await cache.put("track", TRACK_RESULT)
+
+        with mock.patch("ongaku.internal.cache.time.time", return_value=110):
+            assert await cache.get("track") is None
+
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_shared(self, tmp_path: pathlib.Path):
+        config = TrackCacheConfig(path=tmp_path / "tracks.db")
+
+        first = DiskTrackCache(config)
+        second = DiskTrackCache(config)
+
+        await first.put("track", TRACK_RESULT)
+
+        assert await second.get("track") is not None
+
+        await first.close()
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_migrated_while_waiting(self, tmp_path: pathlib.Path):
+        config = TrackCacheConfig(path=tmp_path / "tracks.db")
+
+        first = DiskTrackCache(config)
+
+        await first.put("track", TRACK_RESULT)
+
+        class StaleConnection(sqlite3.Connection):
+            stale = True
+
+            def execute(self, sql: str, *args: typing.Any) -> sqlite3.Cursor:
+                # The first version is read as if the other cache had not migrated the database yet.
+                if sql == "PRAGMA user_version" and StaleConnection.stale:
+                    StaleConnection.stale = False
+                    sql = "SELECT 0"
+
+                return super().execute(sql, *args)
+
+        connect = sqlite3.connect
+
+        def connect_stale(
+            path: pathlib.Path, **kwargs: typing.Any
+        ) -> sqlite3.Connection:
+            return connect(path, factory=StaleConnection, **kwargs)
+
+        second = DiskTrackCache(config)
+
+        with mock.patch(
+            "ongaku.internal.cache.sqlite3.connect", side_effect=connect_stale
+        ):
+            assert await second.get("track") is not None
+
+        await first.close()
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_tracks(self, tmp_path: pathlib.Path):
+        cache = DiskTrackCache(TrackCacheConfig(path=tmp_path / "tracks.db"))
+
+        await cache.put_tracks([_track("first"), orjson.dumps(_track("second"))])
+
+        tracks = await cache.get_tracks(["first", "second", "third", "first"])
+
+        assert list(tracks) == ["first", "second"]
+        assert orjson.loads(tracks["first"])["info"] == payloads.TRACK_INFO_PAYLOAD
+
+        assert cache.hits == 2
+        assert cache.misses == 1
+
+        # Invalid tracks are not cached, instead of raising.
+        await cache.put_tracks([{"encoded": "invalid"}])
+
+        assert await cache.get_tracks(["invalid"]) == {}
+
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_evict(self, tmp_path: pathlib.Path):
+        cache = DiskTrackCache(
+            TrackCacheConfig(
+                path=tmp_path / "tracks.db", max_disk_results=1, max_disk_tracks=2
+            )
+        )
+
+        with mock.patch("ongaku.internal.cache.time.time", return_value=100):
+            await cache.put("first", TRACK_RESULT)
+
+        with mock.patch("ongaku.internal.cache.time.time", return_value=101):
+            await cache.put_tracks([_track("second"), _track("third")])
+
+        with mock.patch("ongaku.internal.cache.time.time", return_value=102):
+            # The least recently used result, and track were evicted.
+            assert await cache.get("first") is None
+            assert list(await cache.get_tracks(["encoded", "second", "third"])) == [
+                "second",
+                "third",
+            ]
+
+        assert cache.evictions == 1
+
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_accessed_batched(self, tmp_path: pathlib.Path):
+        cache = DiskTrackCache(TrackCacheConfig(path=tmp_path / "tracks.db"))
+
+        def accessed() -> tuple[float, float]:
+            with sqlite3.connect(tmp_path / "tracks.db") as connection:
+                return (
+                    connection.execute("SELECT accessed FROM results").fetchone()[0],
+                    connection.execute("SELECT accessed FROM tracks").fetchone()[0],
+                )
+
+        with mock.patch("ongaku.internal.cache.time.time", return_value=100):
+            await cache.put("track", TRACK_RESULT)
+
+        with mock.patch("ongaku.internal.cache.time.time", return_value=110):
+            assert await cache.get("track") is not None
+
+        # Lookups are not written straight away.
+        assert accessed() == (100, 100)
+
+        with mock.patch("ongaku.internal.cache.time.time", return_value=130):
+            assert await cache.get("track") is not None
+
+        assert accessed() == (130, 130)
+
+        with mock.patch("ongaku.internal.cache.time.time", return_value=140):
+            assert await cache.get_tracks(["encoded"]) != {}
+
+        await cache.close()
+
+        assert accessed() == (130, 140)
+
+    @pytest.mark.asyncio
+    async def test_rows_counted(self, tmp_path: pathlib.Path):
+        config = TrackCacheConfig(
+            path=tmp_path / "tracks.db", max_disk_results=3, max_disk_tracks=10
+        )
+
+        cache = DiskTrackCache(config)
+        other = DiskTrackCache(config)
+
+        with mock.patch("ongaku.internal.cache.time.time", return_value=100):
+            await cache.put("first", TRACK_RESULT)
+
+        assert cache._connection is not None
+
+        statements: list[str] = []
+        cache._connection.set_trace_callback(statements.append)
+
+        with mock.patch("ongaku.internal.cache.time.time", return_value=101):
+            # Replacing a result does not add a row.
+            await cache.put("first", TRACK_RESULT)
+
+        with mock.patch("ongaku.internal.cache.time.time", return_value=102):
+            await cache.put("second", TRACK_RESULT)
+
+        assert not any(
+            statement.startswith("SELECT COUNT(*) FROM results")
+            for statement in statements
+        )
+
+        with mock.patch("ongaku.internal.cache.time.time", return_value=103):
+            await other.put("third", TRACK_RESULT)
+
+        with mock.patch("ongaku.internal.cache.time.time", return_value=104):
+            await cache.put("fourth", TRACK_RESULT)
+
+        assert cache.evictions == 0
+
+        # The result added by the other cache is seen, once the rows are counted again.
+        with mock.patch("ongaku.internal.cache.time.time", return_value=200):
+            await cache.put_tracks([_track("fifth")])
+
+            assert await cache.get("first") is None
+            assert await cache.get("second") is not None
+
+        assert cache.evictions == 1
+
+        await cache.close()
+        await other.close()
+
+    @pytest.mark.asyncio
+    async def test_database_error(self, tmp_path: pathlib.Path):
+        cache = DiskTrackCache(TrackCacheConfig(path=tmp_path))
+
+        # The path is a directory, so the database can not be opened.
+        assert await cache.get("track") is None
+        assert await cache.put("track", TRACK_RESULT) is False
+        assert await cache.get_tracks(["encoded"]) == {}
+
+
+class TestRestDiskTrackCache:
+    @pytest.mark.asyncio
+    async def test_load_track(
+        self,
+        gateway_bot: typing.Any,
+        ongaku_session: Session,
+        tmp_path: pathlib.Path,
+    ):
+        config = TrackCacheConfig(path=tmp_path / "tracks.db")
+
+        rest = RESTClient(Client(gateway_bot, track_cache=config))
+
+        with mock.patch.object(
+            ongaku_session,
+            "request",
+            new_callable=mock.AsyncMock,
+            return_value=TRACK_RESULT,
+        ) as patched_request:
+            await rest.load_track("ytsearch:ajr", session=ongaku_session)
+
+            patched_request.assert_called_once()
+
+        # A new client (after a restart, or in another process) starts with an empty in-memory cache.
+        rest = RESTClient(Client(gateway_bot, track_cache=config))
+
+        with mock.patch.object(
+            ongaku_session, "request", new_callable=mock.AsyncMock
+        ) as patched_request:
+            track = await rest.load_track("ytsearch:ajr", session=ongaku_session)
+
+            patched_request.assert_not_called()
+
+        assert isinstance(track, Track)
+
+        assert rest.cache is not None
+        assert rest.cache.entries == 1
+
+        assert rest.disk_cache is not None
+
+        await rest.disk_cache.close()
+
+    @pytest.mark.asyncio
+    async def test_load_track_expires(
+        self,
+        gateway_bot: typing.Any,
+        ongaku_session: Session,
+        tmp_path: pathlib.Path,
+    ):
+        config = TrackCacheConfig(path=tmp_path / "tracks.db", track_ttl=100)
+
+        rest = RESTClient(Client(gateway_bot, track_cache=config))
+
+        with (
+            mock.patch("ongaku.internal.cache.time.time", return_value=1000),
+            mock.patch.object(
+                ongaku_session,
+                "request",
+                new_callable=mock.AsyncMock,
+                return_value=TRACK_RESULT,
+            ),
+        ):
+            await rest.load_track("ytsearch:ajr", session=ongaku_session)
+
+        assert rest.disk_cache is not None
+
+        await rest.disk_cache.close()
+
+        rest = RESTClient(Client(gateway_bot, track_cache=config))
+
+        with (
+            mock.patch("ongaku.internal.cache.time.time", return_value=1090),
+            mock.patch("ongaku.internal.cache.time.monotonic", return_value=50),
+        ):
+            await rest.load_track("ytsearch:ajr", session=ongaku_session)
+
+        # The result only has the 10 seconds it had left on disk.
+        with mock.patch("ongaku.internal.cache.time.monotonic", return_value=59):
+            assert rest.cache is not None
+            assert rest.cache.get("ytsearch:ajr") is not None
+
+        with mock.patch("ongaku.internal.cache.time.monotonic", return_value=60):
+            assert rest.cache.get("ytsearch:ajr") is None
+
+        assert rest.disk_cache is not None
+
+        await rest.disk_cache.close()
+
+    @pytest.mark.asyncio
+    async def test_decode_tracks(
+        self,
+        gateway_bot: typing.Any,
+        ongaku_session: Session,
+        tmp_path: pathlib.Path,
+    ):
+        rest = RESTClient(
+            Client(
+                gateway_bot, track_cache=TrackCacheConfig(path=tmp_path / "tracks.db")
+            )
+        )
+
+        assert rest.disk_cache is not None
+
+        await rest.disk_cache.put_tracks([_track("first"), _track("third")])
+
+        with mock.patch.object(
+            ongaku_session,
+            "request",
+            new_callable=mock.AsyncMock,
+            return_value=[_track("second")],
+        ) as patched_request:
+            tracks = await rest.decode_tracks(
+                ["first", "second", "third"], session=ongaku_session
+            )
+
+            patched_request.assert_called_once_with(
+                "POST",
+                "/decodetracks",
+                list,
+                json=["second"],
+                idempotent=True,
+                request_config=None,
+            )
+
+        assert [track.encoded for track in tracks] == ["first", "second", "third"]
+
+        with mock.patch.object(
+            ongaku_session, "request", new_callable=mock.AsyncMock
+        ) as patched_request:
+            track = await rest.decode_track("second", session=ongaku_session)
+
+            patched_request.assert_not_called()
+
+        assert track.encoded == "second"
+
+        await rest.disk_cache.close()
@@ -5,6 +5,7 @@ import datetime
 import typing
 
 import aiohttp
+import hikari
 import mock
 import orjson
 import pytest
@@ -16,8 +17,16 @@ from hikari.snowflakes import Snowflake
 import ongaku
 from ongaku import errors
 from ongaku import events
+from ongaku.abc.events import TrackEndReasonType
 from ongaku.abc.session import SessionStatus
+from ongaku.builders import EntityBuilder
 from ongaku.client import Client
+from ongaku.config import ConnectorConfig
+from ongaku.config import IngestConfig
+from ongaku.config import ReconnectConfig
+from ongaku.config import RequestConfig
+from ongaku.internal.ingest import IngestQueue
+from ongaku.internal.ingest import frame_key
 from ongaku.player import Player
 from ongaku.session import Session
 from tests import payloads
@@ -188,6 +197,252 @@ class TestSession:
 
             patched_transfer.assert_called_once_with(ongaku_client.session_handler)
 
+    @pytest.mark.asyncio
+    async def test_websocket_resume(
+        self,
+        gateway_bot: gateway_bot_.GatewayBot,
+        bot_user: OwnUser,
+        aiohttp_client: typing.Any,
+    ):
+        ongaku_client = Client(gateway_bot)
+
+        session = Session(
+            ongaku_client,
+            "test_session",
+            False,
+            "host",
+            2333,
+            "password",
+            2,
+            resume=True,
+            resume_timeout=30,
+        )
+
+        assert session.resume is True
+        assert session.resume_timeout == 30
+
+        connections: list[str | None] = []
+
+        async def handler(request: web.Request):
+            connections.append(request.headers.get("Session-Id", None))
+
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+
+            if len(connections) == 1:
+                await ws.send_str(orjson.dumps(payloads.READY_PAYLOAD).decode())
+            elif len(connections) == 2:
+                payload = dict(payloads.READY_PAYLOAD)
+                payload.update({"resumed": True})
+                await ws.send_str(orjson.dumps(payload).decode())
+
+            await ws.close()
+
+            return ws
+
+        app = web.Application()
+        app.router.add_route("GET", "/v4/websocket", handler)
+
+        client = await aiohttp_client(app)
+
+        player = Player(session, Snowflake(1234567890))
+
+        with (
+            mock.patch.object(gateway_bot, "get_me", return_value=bot_user),
+            mock.patch("ongaku.client.Client._get_client_session", return_value=client),
+            mock.patch.object(
+                session,
+                "_base_uri",
+                new_callable=mock.PropertyMock(return_value=""),
+            ),
+            mock.patch.object(
+                gateway_bot.event_manager,
+                "dispatch",
+                new_callable=mock.AsyncMock,
+                return_value=None,
+            ),
+            mock.patch("ongaku.session.asyncio.sleep", new_callable=mock.AsyncMock),
+            mock.patch(
+                "ongaku.rest.RESTClient.update_session", new_callable=mock.AsyncMock
+            ) as patched_update_session,
+            mock.patch(
+                "ongaku.player.Player._restore", new_callable=mock.AsyncMock
+            ) as patched_restore,
+            mock.patch("ongaku.session.Session.transfer") as patched_transfer,
+        ):
+            await session._websocket()
+
+            assert connections == [None, "session_id", "session_id", "session_id"]
+
+            patched_update_session.assert_called_once_with(
+                "session_id", resuming=True, timeout=30, session=session
+            )
+
+            patched_restore.assert_called_once()
+
+            patched_transfer.assert_not_called()
+
+            assert session._players == {player.guild_id: player}
+
+    @pytest.mark.asyncio
+    async def test_websocket_backoff(
+        self, gateway_bot: gateway_bot_.GatewayBot, bot_user: OwnUser
+    ):
+        ongaku_client = Client(gateway_bot)
+
+        session = Session(
+            ongaku_client,
+            "test_session",
+            False,
+            "host",
+            2333,
+            "password",
+            4,
+            reconnect=ReconnectConfig(base_delay=1, max_delay=3, jitter=False),
+        )
+
+        client_session = mock.Mock()
+        client_session.ws_connect.side_effect = aiohttp.ClientConnectionError("refused")
+
+        with (
+            mock.patch.object(gateway_bot, "get_me", return_value=bot_user),
+            mock.patch(
+                "ongaku.client.Client._get_client_session",
+                return_value=client_session,
+            ),
+            mock.patch(
+                "ongaku.session.asyncio.sleep", new_callable=mock.AsyncMock
+            ) as patched_sleep,
+        ):
+            await session._websocket()
+
+        assert client_session.ws_connect.call_count == 4
+
+        assert patched_sleep.call_args_list == [
+            mock.call(1),
+            mock.call(2),
+            mock.call(3),
+        ]
+
+        assert session.status == SessionStatus.NOT_CONNECTED
+        assert session.reconnects == 3
+        assert session.failures == 4
+        assert session.last_delay == 3
+        assert session.last_connected is None
+        assert isinstance(session.last_disconnected, datetime.datetime)
+
+    @pytest.mark.asyncio
+    async def test_websocket_unlimited_attempts(
+        self, gateway_bot: gateway_bot_.GatewayBot, bot_user: OwnUser
+    ):
+        ongaku_client = Client(gateway_bot)
+
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", None
+        )
+
+        assert session.attempts is None
+
+        client_session = mock.Mock()
+        client_session.ws_connect.side_effect = [
+            aiohttp.ClientConnectionError("refused"),
+            RuntimeError("unexpected"),
+            aiohttp.ClientConnectionError("refused"),
+            asyncio.CancelledError,
+        ]
+
+        with (
+            mock.patch.object(gateway_bot, "get_me", return_value=bot_user),
+            mock.patch(
+                "ongaku.client.Client._get_client_session",
+                return_value=client_session,
+            ),
+            mock.patch(
+                "ongaku.session.asyncio.sleep", new_callable=mock.AsyncMock
+            ) as patched_sleep,
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await session._websocket()
+
+        assert client_session.ws_connect.call_count == 4
+        assert patched_sleep.call_count == 3
+        assert session.reconnects == 3
+
+    @pytest.mark.asyncio
+    async def test_websocket_slow_processing(
+        self,
+        gateway_bot: gateway_bot_.GatewayBot,
+        bot_user: OwnUser,
+        aiohttp_client: typing.Any,
+    ):
+        ongaku_client = Client(gateway_bot)
+
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", 3
+        )
+
+        frames = [
+            payloads.READY_PAYLOAD,
+            payloads.PLAYER_UPDATE_PAYLOAD,
+            payloads.PLAYER_UPDATE_PAYLOAD,
+            payloads.PLAYER_UPDATE_PAYLOAD,
+            payloads.TRACK_END_PAYLOAD,
+        ]
+
+        async def handler(request: web.Request):
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+
+            for frame in frames:
+                await ws.send_str(orjson.dumps(frame).decode())
+
+            await ws.close()
+
+            return ws
+
+        handled: list[str] = []
+
+        async def slow_handle_payload(data: str):
+            # The reader must be able to receive every frame, while the first is still being processed.
+            async with session.ingest._condition:
+                await session.ingest._condition.wait_for(
+                    lambda: session.ingest.received == len(frames)
+                )
+
+            handled.append(data)
+
+        app = web.Application()
+        app.router.add_route("GET", "/v4/websocket", handler)
+
+        client = await aiohttp_client(app)
+
+        with (
+            mock.patch.object(gateway_bot, "get_me", return_value=bot_user),
+            mock.patch("ongaku.client.Client._get_client_session", return_value=client),
+            mock.patch.object(
+                session,
+                "_base_uri",
+                new_callable=mock.PropertyMock(return_value=""),
+            ),
+            mock.patch(
+                "ongaku.session.Session._handle_payload",
+                side_effect=slow_handle_payload,
+            ),
+            mock.patch("ongaku.session.Session.transfer"),
+        ):
+            await session._websocket()
+
+        assert [orjson.loads(data)["op"] for data in handled] == [
+            "ready",
+            "playerUpdate",
+            "event",
+        ]
+
+        assert session.ingest.received == 5
+        assert session.ingest.processed == 3
+        assert session.ingest.dropped == 2
+        assert session.ingest.depth == 0
+
     @pytest.mark.asyncio
     async def test_start(self, ongaku_client: Client):
         session = Session(
@@ -222,6 +477,59 @@ class TestSession:
 
             assert session._session_task is None
 
+    @pytest.mark.asyncio
+    async def test_connector(self, ongaku_client: Client):
+        session = Session(
+            ongaku_client,
+            "test_session",
+            False,
+            "host",
+            2333,
+            "password",
+            3,
+            connector=ConnectorConfig(limit=10, limit_per_host=2),
+        )
+
+        assert session.pool is None
+
+        with mock.patch(
+            "ongaku.session.Session._websocket", new_callable=mock.AsyncMock
+        ):
+            await session.start()
+
+            client_session = session._get_client_session()
+
+            assert client_session is not ongaku_client._get_client_session()
+
+            pool = session.pool
+
+            assert pool is not None
+            assert pool.limit == 10
+            assert pool.limit_per_host == 2
+            assert pool.acquired == 0
+            assert pool.idle == 0
+            assert pool.shared is False
+
+            await session.stop()
+
+        assert client_session.closed is True
+        assert session.pool is None
+
+    @pytest.mark.asyncio
+    async def test_shared_connector(self, ongaku_client: Client):
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", 3
+        )
+
+        assert session.connector is None
+
+        assert session._get_client_session() is ongaku_client._get_client_session()
+
+        pool = session.pool
+
+        assert pool is not None
+        assert pool.shared is True
+
 
 class TestRequest:
     @pytest.mark.asyncio
@@ -238,8 +546,8 @@ class TestRequest:
                 cs,
                 "request",
                 new_callable=mock.AsyncMock,
-                return_value=mock.AsyncMock(
-                    status=200, text=mock.AsyncMock(return_value="text")
+                return_value=mock.Mock(
+                    status=200, read=mock.AsyncMock(return_value=b"text")
                 ),
             ) as patched_request,
         ):
@@ -249,8 +557,9 @@ class TestRequest:
                 "GET",
                 session.base_uri + "/v4/string",
                 headers=session.auth_headers,
-                json={},
+                data=None,
                 params={},
+                timeout=session.client.request_config.timeout,
             )
 
             assert response == "text"
@@ -271,8 +580,8 @@ class TestRequest:
                 cs,
                 "request",
                 new_callable=mock.AsyncMock,
-                return_value=mock.AsyncMock(
-                    status=200, text=mock.AsyncMock(return_value=1234567890)
+                return_value=mock.Mock(
+                    status=200, read=mock.AsyncMock(return_value=b"1234567890")
                 ),
             ) as patched_request,
         ):
@@ -282,8 +591,9 @@ class TestRequest:
                 "GET",
                 session.base_uri + "/v4/integer",
                 headers=session.auth_headers,
-                json={},
+                data=None,
                 params={},
+                timeout=session.client.request_config.timeout,
             )
 
             assert isinstance(response, int)
@@ -305,8 +615,8 @@ class TestRequest:
                 cs,
                 "request",
                 new_callable=mock.AsyncMock,
-                return_value=mock.AsyncMock(
-                    status=200, text=mock.AsyncMock(return_value=4.2)
+                return_value=mock.Mock(
+                    status=200, read=mock.AsyncMock(return_value=b"4.2")
                 ),
             ) as patched_request,
         ):
@@ -316,8 +626,9 @@ class TestRequest:
                 "GET",
                 session.base_uri + "/v4/float",
                 headers=session.auth_headers,
-                json={},
+                data=None,
                 params={},
+                timeout=session.client.request_config.timeout,
             )
 
             assert isinstance(response, float)
@@ -339,8 +650,8 @@ class TestRequest:
                 cs,
                 "request",
                 new_callable=mock.AsyncMock,
-                return_value=mock.AsyncMock(
-                    status=200, text=mock.AsyncMock(return_value=True)
+                return_value=mock.Mock(
+                    status=200, read=mock.AsyncMock(return_value=b"true")
                 ),
             ) as patched_request,
         ):
@@ -350,8 +661,9 @@ class TestRequest:
                 "GET",
                 session.base_uri + "/v4/boolean",
                 headers=session.auth_headers,
-                json={},
+                data=None,
                 params={},
+                timeout=session.client.request_config.timeout,
             )
 
             assert isinstance(response, bool)
@@ -375,11 +687,9 @@ class TestRequest:
                 cs,
                 "request",
                 new_callable=mock.AsyncMock,
-                return_value=mock.AsyncMock(
+                return_value=mock.Mock(
                     status=200,
-                    text=mock.AsyncMock(
-                        return_value=orjson.dumps(return_dict).decode()
-                    ),
+                    read=mock.AsyncMock(return_value=orjson.dumps(return_dict)),
                 ),
             ) as patched_request,
         ):
@@ -389,8 +699,9 @@ class TestRequest:
                 "GET",
                 session.base_uri + "/v4/dict",
                 headers=session.auth_headers,
-                json={},
+                data=None,
                 params={},
+                timeout=session.client.request_config.timeout,
             )
 
             assert isinstance(response, dict)
@@ -414,11 +725,9 @@ class TestRequest:
                 cs,
                 "request",
                 new_callable=mock.AsyncMock,
-                return_value=mock.AsyncMock(
+                return_value=mock.Mock(
                     status=200,
-                    text=mock.AsyncMock(
-                        return_value=orjson.dumps(return_list).decode()
-                    ),
+                    read=mock.AsyncMock(return_value=orjson.dumps(return_list)),
                 ),
             ) as patched_request,
         ):
@@ -428,8 +737,9 @@ class TestRequest:
                 "GET",
                 session.base_uri + "/v4/list",
                 headers=session.auth_headers,
-                json={},
+                data=None,
                 params={},
+                timeout=session.client.request_config.timeout,
             )
 
             assert isinstance(response, list)
@@ -453,11 +763,9 @@ class TestRequest:
                 cs,
                 "request",
                 new_callable=mock.AsyncMock,
-                return_value=mock.AsyncMock(
+                return_value=mock.Mock(
                     status=200,
-                    text=mock.AsyncMock(
-                        return_value=orjson.dumps(return_tuple).decode()
-                    ),
+                    read=mock.AsyncMock(return_value=orjson.dumps(return_tuple)),
                 ),
             ) as patched_request,
         ):
@@ -467,8 +775,9 @@ class TestRequest:
                 "GET",
                 session.base_uri + "/v4/tuple",
                 headers=session.auth_headers,
-                json={},
+                data=None,
                 params={},
+                timeout=session.client.request_config.timeout,
             )
 
             assert isinstance(response, tuple)
@@ -490,8 +799,8 @@ class TestRequest:
                 cs,
                 "request",
                 new_callable=mock.AsyncMock,
-                return_value=mock.AsyncMock(
-                    status=204, text=mock.AsyncMock(return_value="")
+                return_value=mock.Mock(
+                    status=204, read=mock.AsyncMock(return_value=b"")
                 ),
             ) as patched_request,
         ):
@@ -501,8 +810,9 @@ class TestRequest:
                 "GET",
                 session.base_uri + "/v4/none",
                 headers=session.auth_headers,
-                json={},
+                data=None,
                 params={},
+                timeout=session.client.request_config.timeout,
             )
 
             assert response is None
@@ -525,8 +835,8 @@ class TestRequest:
                 cs,
                 "request",
                 new_callable=mock.AsyncMock,
-                return_value=mock.AsyncMock(
-                    status=204, text=mock.AsyncMock(return_value="")
+                return_value=mock.Mock(
+                    status=204, read=mock.AsyncMock(return_value=b"")
                 ),
             ) as patched_request,
         ):
@@ -542,8 +852,9 @@ class TestRequest:
                 "GET",
                 session.base_uri + "/v4/headers",
                 headers=headers,
-                json={},
+                data=None,
                 params={},
+                timeout=session.client.request_config.timeout,
             )
 
             assert response is None
@@ -555,9 +866,10 @@ class TestRequest:
             patched_request.assert_called_with(
                 "GET",
                 session.base_uri + "/v4/json",
-                headers=session.auth_headers,
-                json=test_dict,
+                headers={**session.auth_headers, "Content-Type": "application/json"},
+                data=orjson.dumps(test_dict),
                 params={},
+                timeout=session.client.request_config.timeout,
             )
 
             assert response is None
@@ -574,14 +886,79 @@ class TestRequest:
                 "GET",
                 session.base_uri + "/v4/params",
                 headers=session.auth_headers,
-                json={},
+                data=None,
                 params=params,
+                timeout=session.client.request_config.timeout,
             )
 
             assert response is None
 
         await cs.close()
 
+    @pytest.mark.asyncio
+    async def test_bytes(self, ongaku_client: Client):
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", 3
+        )
+
+        cs = aiohttp.ClientSession()
+
+        response_mock = mock.Mock(
+            status=200, read=mock.AsyncMock(return_value=b'{"fruit":"banana"}')
+        )
+
+        with (
+            mock.patch.object(session.client, "_client_session", cs),
+            mock.patch.object(
+                cs,
+                "request",
+                new_callable=mock.AsyncMock,
+                return_value=response_mock,
+            ),
+        ):
+            response = await session.request("GET", "/bytes", bytes)
+
+            assert response == b'{"fruit":"banana"}'
+
+            response_mock.read.assert_called_once()
+            response_mock.release.assert_called_once()
+
+        await cs.close()
+
+    @pytest.mark.asyncio
+    async def test_release(self, ongaku_client: Client):
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", 3
+        )
+
+        cs = aiohttp.ClientSession()
+
+        empty_response = mock.Mock(status=204)
+
+        error_response = mock.Mock(
+            status=500, reason="reason", read=mock.AsyncMock(return_value=b"")
+        )
+
+        with (
+            mock.patch.object(session.client, "_client_session", cs),
+            mock.patch.object(
+                cs,
+                "request",
+                new_callable=mock.AsyncMock,
+                side_effect=[empty_response, error_response],
+            ),
+        ):
+            assert await session.request("DELETE", "/none", None) is None
+
+            empty_response.release.assert_called_once()
+
+            with pytest.raises(errors.RestStatusError):
+                await session.request("DELETE", "/none", None)
+
+            error_response.release.assert_called_once()
+
+        await cs.close()
+
     @pytest.mark.asyncio
     async def test_errors(self, ongaku_client: Client):
         session = Session(
@@ -598,8 +975,8 @@ class TestRequest:
                 cs,
                 "request",
                 new_callable=mock.AsyncMock,
-                return_value=mock.AsyncMock(
-                    status=204, text=mock.AsyncMock(return_value="")
+                return_value=mock.Mock(
+                    status=204, read=mock.AsyncMock(return_value=b"")
                 ),
             ),
             pytest.raises(errors.RestEmptyError),
@@ -614,8 +991,8 @@ class TestRequest:
                 cs,
                 "request",
                 new_callable=mock.AsyncMock,
-                return_value=mock.AsyncMock(
-                    status=400, reason="reason", text=mock.AsyncMock(return_value="")
+                return_value=mock.Mock(
+                    status=400, reason="reason", read=mock.AsyncMock(return_value=b"")
                 ),
             ),
             pytest.raises(errors.RestStatusError) as rest_status_error_1,
@@ -635,10 +1012,10 @@ class TestRequest:
                 cs,
                 "request",
                 new_callable=mock.AsyncMock,
-                return_value=mock.AsyncMock(
+                return_value=mock.Mock(
                     status=400,
                     reason="reason",
-                    text=mock.AsyncMock(return_value="not a rest error payload"),
+                    read=mock.AsyncMock(return_value=b"not a rest error payload"),
                 ),
             ),
             pytest.raises(errors.RestStatusError) as rest_status_error_2,
@@ -658,11 +1035,11 @@ class TestRequest:
                 cs,
                 "request",
                 new_callable=mock.AsyncMock,
-                return_value=mock.AsyncMock(
+                return_value=mock.Mock(
                     status=400,
                     reason="reason",
-                    text=mock.AsyncMock(
-                        return_value=orjson.dumps(payloads.REST_ERROR_PAYLOAD).decode()
+                    read=mock.AsyncMock(
+                        return_value=orjson.dumps(payloads.REST_ERROR_PAYLOAD)
                     ),
                 ),
             ),
@@ -689,8 +1066,8 @@ class TestRequest:
                 cs,
                 "request",
                 new_callable=mock.AsyncMock,
-                return_value=mock.AsyncMock(
-                    status=200, text=mock.AsyncMock("I am malformed.")
+                return_value=mock.Mock(
+                    status=200, read=mock.AsyncMock(return_value=b"I am malformed.")
                 ),
             ),
             pytest.raises(errors.BuildError) as build_error,
@@ -702,56 +1079,356 @@ class TestRequest:
         await cs.close()
 
 
-class TestHandleOPCode:
-    @pytest.mark.asyncio
-    async def test_ready_event(self, ongaku_client: Client):
-        session = Session(
-            ongaku_client, "test_session", False, "host", 2333, "password", 3
+class TestRequestRetries:
+    @staticmethod
+    def _config(retries: int = 2, unsafe_retries: int = 1) -> RequestConfig:
+        return RequestConfig(
+            retries=retries,
+            unsafe_retries=unsafe_retries,
+            backoff=ReconnectConfig(base_delay=0, jitter=False),
         )
 
-        event = session._handle_op_code(orjson.dumps(payloads.READY_PAYLOAD).decode())
-
-        assert isinstance(event, events.ReadyEvent)
+    @staticmethod
+    def _connector_error() -> aiohttp.ClientConnectorError:
+        return aiohttp.ClientConnectorError(mock.Mock(), OSError(111, "refused"))
 
     @pytest.mark.asyncio
-    async def test_player_update_event(self, ongaku_client: Client):
+    async def test_retry_status(self, ongaku_client: Client):
         session = Session(
             ongaku_client, "test_session", False, "host", 2333, "password", 3
         )
 
-        event = session._handle_op_code(
-            orjson.dumps(payloads.PLAYER_UPDATE_PAYLOAD).decode()
-        )
+        cs = aiohttp.ClientSession()
 
-        assert isinstance(event, events.PlayerUpdateEvent)
+        unavailable = mock.Mock(status=503)
 
-    @pytest.mark.asyncio
-    async def test_statistics_event(self, ongaku_client: Client):
-        session = Session(
-            ongaku_client, "test_session", False, "host", 2333, "password", 3
-        )
+        with (
+            mock.patch.object(session.client, "_client_session", cs),
+            mock.patch.object(
+                cs,
+                "request",
+                new_callable=mock.AsyncMock,
+                side_effect=[
+                    unavailable,
+                    mock.Mock(status=200, read=mock.AsyncMock(return_value=b"text")),
+                ],
+            ) as patched_request,
+        ):
+            response = await session.request(
+                "GET", "/string", str, request_config=self._config()
+            )
 
-        payload = dict(payloads.STATISTICS_PAYLOAD)
+            assert response == "text"
 
-        payload.update({"op": "stats"})
+            assert patched_request.call_count == 2
 
-        event = session._handle_op_code(orjson.dumps(payload).decode())
+            unavailable.release.assert_called_once()
 
-        assert isinstance(event, events.StatisticsEvent)
+        await cs.close()
 
     @pytest.mark.asyncio
-    async def test_track_start_event(self, ongaku_client: Client):
+    async def test_retry_status_not_idempotent(self, ongaku_client: Client):
         session = Session(
             ongaku_client, "test_session", False, "host", 2333, "password", 3
         )
 
-        event = session._handle_op_code(
-            orjson.dumps(payloads.TRACK_START_PAYLOAD).decode()
-        )
-
-        assert isinstance(event, events.TrackStartEvent)
+        cs = aiohttp.ClientSession()
 
-    @pytest.mark.asyncio
+        with (
+            mock.patch.object(session.client, "_client_session", cs),
+            mock.patch.object(
+                cs,
+                "request",
+                new_callable=mock.AsyncMock,
+                return_value=mock.Mock(
+                    status=503,
+                    reason="Service Unavailable",
+                    read=mock.AsyncMock(return_value=b""),
+                ),
+            ) as patched_request,
+        ):
+            with pytest.raises(errors.RestStatusError):
+                await session.request(
+                    "PATCH", "/string", None, request_config=self._config()
+                )
+
+            patched_request.assert_called_once()
+
+        await cs.close()
+
+    @pytest.mark.asyncio
+    async def test_retry_connection_error(self, ongaku_client: Client):
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", 3
+        )
+
+        cs = aiohttp.ClientSession()
+
+        with (
+            mock.patch.object(session.client, "_client_session", cs),
+            mock.patch.object(
+                cs,
+                "request",
+                new_callable=mock.AsyncMock,
+                side_effect=[
+                    self._connector_error(),
+                    mock.Mock(status=204),
+                ],
+            ) as patched_request,
+        ):
+            await session.request(
+                "DELETE", "/string", None, request_config=self._config()
+            )
+
+            assert patched_request.call_count == 2
+
+        await cs.close()
+
+    @pytest.mark.asyncio
+    async def test_retry_connection_error_exhausted(self, ongaku_client: Client):
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", 3
+        )
+
+        cs = aiohttp.ClientSession()
+
+        with (
+            mock.patch.object(session.client, "_client_session", cs),
+            mock.patch.object(
+                cs,
+                "request",
+                new_callable=mock.AsyncMock,
+                side_effect=self._connector_error(),
+            ) as patched_request,
+        ):
+            with pytest.raises(aiohttp.ClientConnectorError):
+                await session.request(
+                    "PATCH",
+                    "/string",
+                    None,
+                    request_config=self._config(unsafe_retries=2),
+                )
+
+            assert patched_request.call_count == 3
+
+        await cs.close()
+
+    @pytest.mark.asyncio
+    async def test_retry_connect_timeout(self, ongaku_client: Client):
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", 3
+        )
+
+        cs = aiohttp.ClientSession()
+
+        with (
+            mock.patch.object(session.client, "_client_session", cs),
+            mock.patch.object(
+                cs,
+                "request",
+                new_callable=mock.AsyncMock,
+                side_effect=[
+                    aiohttp.ConnectionTimeoutError("Connection timeout to host"),
+                    mock.Mock(status=204),
+                ],
+            ) as patched_request,
+        ):
+            # The request was never sent, so even a request that is not idempotent is retried.
+            await session.request(
+                "PATCH", "/string", None, request_config=self._config()
+            )
+
+            assert patched_request.call_count == 2
+
+        with (
+            mock.patch.object(session.client, "_client_session", cs),
+            mock.patch.object(
+                cs,
+                "request",
+                new_callable=mock.AsyncMock,
+                side_effect=aiohttp.ConnectionTimeoutError(
+                    "Connection timeout to host"
+                ),
+            ) as patched_request,
+        ):
+            with pytest.raises(errors.TimeoutError):
+                await session.request(
+                    "PATCH",
+                    "/string",
+                    None,
+                    request_config=self._config(unsafe_retries=2),
+                )
+
+            assert patched_request.call_count == 3
+
+        await cs.close()
+
+    @pytest.mark.asyncio
+    async def test_retry_connect_timeout_message(self, ongaku_client: Client):
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", 3
+        )
+
+        cs = aiohttp.ClientSession()
+
+        # Before aiohttp 3.10, timeouts while connecting were only told apart by their message.
+        with (
+            mock.patch("ongaku.session.aiohttp.ConnectionTimeoutError", None),
+            mock.patch.object(session.client, "_client_session", cs),
+            mock.patch.object(
+                cs,
+                "request",
+                new_callable=mock.AsyncMock,
+                side_effect=[
+                    aiohttp.ServerTimeoutError("Connection timeout to host"),
+                    aiohttp.ServerTimeoutError("Timeout on reading data from socket"),
+                ],
+            ) as patched_request,
+        ):
+            with pytest.raises(errors.TimeoutError):
+                await session.request(
+                    "PATCH", "/string", None, request_config=self._config()
+                )
+
+            assert patched_request.call_count == 2
+
+        await cs.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, ongaku_client: Client):
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", 3
+        )
+
+        cs = aiohttp.ClientSession()
+
+        with (
+            mock.patch.object(session.client, "_client_session", cs),
+            mock.patch.object(
+                cs,
+                "request",
+                new_callable=mock.AsyncMock,
+                side_effect=asyncio.TimeoutError,
+            ) as patched_request,
+        ):
+            with pytest.raises(errors.TimeoutError):
+                await session.request(
+                    "GET", "/string", str, request_config=self._config(retries=1)
+                )
+
+            assert patched_request.call_count == 2
+
+            patched_request.reset_mock()
+
+            with pytest.raises(errors.TimeoutError):
+                await session.request(
+                    "PATCH", "/string", None, request_config=self._config()
+                )
+
+            patched_request.assert_called_once()
+
+        await cs.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_reading(self, ongaku_client: Client):
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", 3
+        )
+
+        cs = aiohttp.ClientSession()
+
+        slow = mock.Mock(
+            status=200, read=mock.AsyncMock(side_effect=asyncio.TimeoutError)
+        )
+
+        with (
+            mock.patch.object(session.client, "_client_session", cs),
+            mock.patch.object(
+                cs,
+                "request",
+                new_callable=mock.AsyncMock,
+                side_effect=[
+                    slow,
+                    mock.Mock(status=200, read=mock.AsyncMock(return_value=b"text")),
+                ],
+            ) as patched_request,
+        ):
+            # Timing out while reading the body is retried, like any other timeout.
+            response = await session.request(
+                "GET", "/string", str, request_config=self._config()
+            )
+
+            assert response == "text"
+            assert patched_request.call_count == 2
+
+            slow.release.assert_called_once()
+
+        with (
+            mock.patch.object(session.client, "_client_session", cs),
+            mock.patch.object(
+                cs, "request", new_callable=mock.AsyncMock, return_value=slow
+            ) as patched_request,
+        ):
+            with pytest.raises(errors.TimeoutError):
+                await session.request(
+                    "PATCH", "/string", str, request_config=self._config()
+                )
+
+            patched_request.assert_called_once()
+
+        await cs.close()
+
+
+class TestHandleOPCode:
+    @pytest.mark.asyncio
+    async def test_ready_event(self, ongaku_client: Client):
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", 3
+        )
+
+        event = session._handle_op_code(orjson.dumps(payloads.READY_PAYLOAD).decode())
+
+        assert isinstance(event, events.ReadyEvent)
+
+    @pytest.mark.asyncio
+    async def test_player_update_event(self, ongaku_client: Client):
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", 3
+        )
+
+        event = session._handle_op_code(
+            orjson.dumps(payloads.PLAYER_UPDATE_PAYLOAD).decode()
+        )
+
+        assert isinstance(event, events.PlayerUpdateEvent)
+
+    @pytest.mark.asyncio
+    async def test_statistics_event(self, ongaku_client: Client):
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", 3
+        )
+
+        payload = dict(payloads.STATISTICS_PAYLOAD)
+
+        payload.update({"op": "stats"})
+
+        event = session._handle_op_code(orjson.dumps(payload).decode())
+
+        assert isinstance(event, events.StatisticsEvent)
+
+    @pytest.mark.asyncio
+    async def test_track_start_event(self, ongaku_client: Client):
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", 3
+        )
+
+        event = session._handle_op_code(
+            orjson.dumps(payloads.TRACK_START_PAYLOAD).decode()
+        )
+
+        assert isinstance(event, events.TrackStartEvent)
+
+    @pytest.mark.asyncio
     async def test_track_end_event(self, ongaku_client: Client):
         session = Session(
             ongaku_client, "test_session", False, "host", 2333, "password", 3
@@ -799,6 +1476,45 @@ class TestHandleOPCode:
 
         assert isinstance(event, events.WebsocketClosedEvent)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("payload", "event_type"),
+        [
+            (payloads.READY_PAYLOAD, events.ReadyEvent),
+            (payloads.PLAYER_UPDATE_PAYLOAD, events.PlayerUpdateEvent),
+            ({**payloads.STATISTICS_PAYLOAD, "op": "stats"}, events.StatisticsEvent),
+            (payloads.TRACK_START_PAYLOAD, events.TrackStartEvent),
+            (payloads.TRACK_END_PAYLOAD, events.TrackEndEvent),
+            (payloads.TRACK_EXCEPTION_PAYLOAD, events.TrackExceptionEvent),
+            (payloads.TRACK_STUCK_PAYLOAD, events.TrackStuckEvent),
+            (payloads.WEBSOCKET_CLOSED_PAYLOAD, events.WebsocketClosedEvent),
+        ],
+    )
+    async def test_msgspec_decoder(
+        self,
+        gateway_bot: gateway_bot_.GatewayBot,
+        payload: typing.Mapping[str, typing.Any],
+        event_type: typing.Type[hikari.Event],
+    ):
+        ongaku_client = Client(gateway_bot, decoder="msgspec")
+
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", 3
+        )
+
+        event = session._handle_op_code(orjson.dumps(payload).decode())
+
+        assert isinstance(event, event_type)
+
+    @pytest.mark.asyncio
+    async def test_unknown_op_code(self, ongaku_client: Client):
+        session = Session(
+            ongaku_client, "test_session", False, "host", 2333, "password", 3
+        )
+
+        with pytest.raises(errors.BuildError):
+            session._handle_op_code(orjson.dumps({"op": "unknown"}).decode())
+
 
 class TestHandleWSMessage:
     @pytest.mark.asyncio
@@ -862,3 +1578,358 @@ class TestHandleWSMessage:
         )
 
         assert await session._handle_ws_message(message) is False
+
+    @pytest.mark.asyncio
+    async def test_text_without_listeners(self):
+        bot = hikari.GatewayBot("fake_token", banner=None)
+
+        session = Session(
+            Client(bot), "test_session", False, "host", 2333, "password", 3
+        )
+
+        stats_message = aiohttp.WSMessage(
+            aiohttp.WSMsgType.TEXT,
+            orjson.dumps({**payloads.STATISTICS_PAYLOAD, "op": "stats"}).decode(),
+            None,
+        )
+
+        ready_message = aiohttp.WSMessage(
+            aiohttp.WSMsgType.TEXT, orjson.dumps(payloads.READY_PAYLOAD).decode(), None
+        )
+
+        async def callback(_: events.StatisticsEvent) -> None: ...
+
+        with (
+            mock.patch(
+                "hikari.impl.event_manager.EventManagerImpl.dispatch",
+                new_callable=mock.AsyncMock,
+                return_value=None,
+            ) as event_dispatched,
+            mock.patch.object(
+                EntityBuilder,
+                "build_statistics_event",
+                autospec=True,
+                side_effect=EntityBuilder.build_statistics_event,
+            ) as patched_build_statistics_event,
+        ):
+            assert session._handle_op_code(stats_message.data) is None
+
+            assert await session._handle_ws_message(stats_message) is True
+
+            patched_build_statistics_event.assert_not_called()
+
+            assert await session._handle_ws_message(ready_message) is True
+
+            assert session.session_id == "session_id"
+
+            event_dispatched.assert_not_called()
+
+            bot.event_manager.subscribe(events.StatisticsEvent, callback)
+
+            assert await session._handle_ws_message(stats_message) is True
+
+            patched_build_statistics_event.assert_called_once()
+
+            event_dispatched.assert_called_once()
+
+            assert isinstance(
+                event_dispatched.call_args.args[0], events.StatisticsEvent
+            )
+
+    @pytest.mark.asyncio
+    async def test_event_routing(self):
+        bot = hikari.GatewayBot("fake_token", banner=None)
+
+        session = Session(
+            Client(bot), "test_session", False, "host", 2333, "password", 3
+        )
+
+        player_1 = Player(session, Snowflake(1234567890))
+        player_2 = Player(session, Snowflake(1234567891))
+
+        assert session._players == {
+            player_1.guild_id: player_1,
+            player_2.guild_id: player_2,
+        }
+
+        track_end_message = aiohttp.WSMessage(
+            aiohttp.WSMsgType.TEXT,
+            orjson.dumps(payloads.TRACK_END_PAYLOAD).decode(),
+            None,
+        )
+
+        player_update_event = events.PlayerUpdateEvent.from_session(
+            session, Snowflake(1234567891), mock.Mock()
+        )
+
+        missing_event = events.PlayerUpdateEvent.from_session(
+            session, Snowflake(1), mock.Mock()
+        )
+
+        with (
+            mock.patch(
+                "hikari.impl.event_manager.EventManagerImpl.dispatch",
+                new_callable=mock.AsyncMock,
+                return_value=None,
+            ) as event_dispatched,
+            mock.patch(
+                "ongaku.player.Player._track_end_event", new_callable=mock.AsyncMock
+            ) as patched_track_end,
+            mock.patch(
+                "ongaku.player.Player._player_update_event",
+                new_callable=mock.AsyncMock,
+            ) as patched_player_update,
+        ):
+            assert await session._handle_ws_message(track_end_message) is True
+
+            await asyncio.gather(*session._handlers.values())
+
+            patched_track_end.assert_called_once()
+
+            assert patched_track_end.call_args.args[0].guild_id == player_1.guild_id
+
+            event_dispatched.assert_not_called()
+
+            await session._handle_event(player_update_event)
+
+            patched_player_update.assert_called_once_with(player_update_event)
+
+            await session._handle_event(missing_event)
+
+            patched_player_update.assert_called_once()
+
+        player_1._detach()
+
+        assert session._players == {player_2.guild_id: player_2}
+
+    @pytest.mark.asyncio
+    async def test_event_handlers(self):
+        bot = hikari.GatewayBot("fake_token", banner=None)
+
+        session = Session(
+            Client(bot), "test_session", False, "host", 2333, "password", 3
+        )
+
+        player_1 = Player(session, Snowflake(1234567890))
+        player_2 = Player(session, Snowflake(1234567891))
+
+        release = asyncio.Event()
+        handled: list[tuple[Snowflake, str]] = []
+
+        async def track_end(player: Player, event: events.TrackEndEvent) -> None:
+            await release.wait()
+
+            handled.append((event.guild_id, "track end"))
+
+        async def player_update(
+            player: Player, event: events.PlayerUpdateEvent
+        ) -> None:
+            handled.append((event.guild_id, "player update"))
+
+        with (
+            mock.patch.object(
+                Player, "_track_end_event", autospec=True, side_effect=track_end
+            ),
+            mock.patch.object(
+                Player,
+                "_player_update_event",
+                autospec=True,
+                side_effect=player_update,
+            ),
+        ):
+            await session._handle_event(
+                events.TrackEndEvent.from_session(
+                    session,
+                    player_1.guild_id,
+                    mock.Mock(),
+                    TrackEndReasonType.FINISHED,
+                )
+            )
+            await session._handle_event(
+                events.PlayerUpdateEvent.from_session(
+                    session, player_1.guild_id, mock.Mock()
+                )
+            )
+            await session._handle_event(
+                events.PlayerUpdateEvent.from_session(
+                    session, player_2.guild_id, mock.Mock()
+                )
+            )
+
+            await asyncio.wait_for(session._handlers[player_2.guild_id], 1)
+
+            # A slow player does not hold up the others.
+            assert handled == [(player_2.guild_id, "player update")]
+
+            release.set()
+
+            await asyncio.gather(*session._handlers.values())
+
+        # Events of the same player are still handled in order.
+        assert handled == [
+            (player_2.guild_id, "player update"),
+            (player_1.guild_id, "track end"),
+            (player_1.guild_id, "player update"),
+        ]
+        assert session._handlers == {}
+
+
+def _dumps(payload: typing.Mapping[str, typing.Any]) -> str:
+    return orjson.dumps(payload).decode()
+
+
+class TestIngestQueue:
+    def test_frame_key(self):
+        stats = dict(payloads.STATISTICS_PAYLOAD)
+        stats.update({"op": "stats"})
+
+        assert frame_key(_dumps(payloads.PLAYER_UPDATE_PAYLOAD)) == (
+            "playerUpdate",
+            payloads.GUILD_ID,
+        )
+        assert frame_key(_dumps(stats)) == ("stats", None)
+        assert frame_key(_dumps(payloads.TRACK_END_PAYLOAD)) is None
+        assert frame_key(_dumps(payloads.READY_PAYLOAD)) is None
+        assert frame_key("not json") is None
+
+    @pytest.mark.asyncio
+    async def test_block(self):
+        queue = IngestQueue(IngestConfig(overflow="block"))
+
+        for _ in range(3):
+            await queue.put(_dumps(payloads.PLAYER_UPDATE_PAYLOAD))
+
+        assert queue.depth == 3
+
+        for _ in range(3):
+            frame = await queue.get()
+
+            assert frame is not None
+            assert frame.key is None
+
+        assert queue.received == 3
+        assert queue.processed == 3
+        assert queue.dropped == 0
+        assert queue.max_depth == 3
+
+    @pytest.mark.asyncio
+    async def test_drop_stale(self):
+        queue = IngestQueue(IngestConfig(overflow="drop_stale"))
+
+        other_guild = dict(payloads.PLAYER_UPDATE_PAYLOAD)
+        other_guild.update({"guildId": "1"})
+
+        stats = dict(payloads.STATISTICS_PAYLOAD)
+        stats.update({"op": "stats"})
+
+        newer_update = dict(payloads.PLAYER_UPDATE_PAYLOAD)
+        newer_update.update({"state": {**payloads.PLAYER_STATE_PAYLOAD, "time": 2}})
+
+        sent = [
+            payloads.PLAYER_UPDATE_PAYLOAD,
+            payloads.TRACK_END_PAYLOAD,
+            stats,
+            other_guild,
+            payloads.TRACK_END_PAYLOAD,
+            newer_update,
+            stats,
+        ]
+
+        for payload in sent:
+            await queue.put(_dumps(payload))
+
+        assert queue.received == 7
+        assert queue.dropped == 2
+        assert queue.depth == 5
+
+        received: list[str] = []
+
+        while queue.depth:
+            frame = await queue.get()
+
+            assert frame is not None
+
+            received.append(frame.data)
+
+        assert received == [
+            _dumps(payloads.TRACK_END_PAYLOAD),
+            _dumps(other_guild),
+            _dumps(payloads.TRACK_END_PAYLOAD),
+            _dumps(newer_update),
+            _dumps(stats),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_full(self):
+        queue = IngestQueue(IngestConfig(max_size=1, overflow="drop_stale"))
+
+        await queue.put(_dumps(payloads.TRACK_END_PAYLOAD))
+
+        task = asyncio.create_task(queue.put(_dumps(payloads.TRACK_END_PAYLOAD)))
+
+        await asyncio.sleep(0.01)
+
+        assert task.done() is False
+
+        assert await queue.get() is not None
+
+        await asyncio.wait_for(task, 1)
+
+        assert queue.depth == 1
+        assert queue.dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_close(self):
+        queue = IngestQueue(IngestConfig())
+
+        await queue.put(_dumps(payloads.READY_PAYLOAD))
+
+        await queue.close()
+
+        assert queue.closed is True
+
+        frame = await queue.get()
+
+        assert frame is not None
+        assert frame.data == _dumps(payloads.READY_PAYLOAD)
+
+        assert await queue.get() is None
+
+        queue.open()
+
+        assert queue.closed is False
+
+    @pytest.mark.asyncio
+    async def test_open(self):
+        queue = IngestQueue(IngestConfig(overflow="drop_stale"))
+
+        for payload in (
+            payloads.PLAYER_UPDATE_PAYLOAD,
+            payloads.TRACK_END_PAYLOAD,
+            payloads.READY_PAYLOAD,
+            payloads.TRACK_END_PAYLOAD,
+        ):
+            await queue.put(_dumps(payload))
+
+        # Only the track end events left behind by the last connection are kept.
+        queue.open()
+
+        assert queue.depth == 2
+        assert queue.dropped == 2
+
+        await queue.put(_dumps(payloads.PLAYER_UPDATE_PAYLOAD))
+
+        received: list[str] = []
+
+        while queue.depth:
+            frame = await queue.get()
+
+            assert frame is not None
+
+            received.append(frame.data)
+
+        assert received == [
+            _dumps(payloads.TRACK_END_PAYLOAD),
+            _dumps(payloads.TRACK_END_PAYLOAD),
+            _dumps(payloads.PLAYER_UPDATE_PAYLOAD),
+        ]